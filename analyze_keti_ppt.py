@@ -5,16 +5,16 @@ from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.dml.color import RGBColor
+import io
 import os
+from sdv_package import save_presentation
+from sdv_slide_import import import_slides
+from sdv_slides import add_placeholder_slide
+from sdv_template import new_presentation
 
-def read_existing_ppt(filename):
-    """Read and analyze existing PowerPoint presentation"""
-    prs = Presentation(filename)
-    
+def slide_records(prs):
+    """{'index', 'layout', 'title', 'content'} for every slide of a presentation"""
     slides_info = []
-    print(f"Total slides: {len(prs.slides)}")
-    print("=" * 80)
-    
     for i, slide in enumerate(prs.slides):
         slide_info = {
             'index': i + 1,
@@ -34,7 +34,17 @@ def read_existing_ppt(filename):
                     slide_info['content'].append(shape.text)
                     
         slides_info.append(slide_info)
-        
+    return slides_info
+
+def read_existing_ppt(filename):
+    """Read and analyze existing PowerPoint presentation"""
+    prs = Presentation(filename)
+    
+    slides_info = slide_records(prs)
+    print(f"Total slides: {len(prs.slides)}")
+    print("=" * 80)
+    
+    for i, slide_info in enumerate(slides_info):
         # Print slide information
         print(f"Slide {i+1}: {slide_info['title']}")
         if slide_info['content']:
@@ -48,36 +58,22 @@ def read_existing_ppt(filename):
 
 def create_modified_presentation(original_info):
     """Create a modified and enhanced version of the presentation"""
-    prs = Presentation()
+    # 원본과 같은 16:9 크기여야 원본 슬라이드를 그대로 가져올 수 있음
+    prs = new_presentation("corporate")
     
     # Enhanced Title Slide
-    slide = prs.slides.add_slide(prs.slide_layouts[0])
-    title = slide.shapes.title
-    subtitle = slide.placeholders[1]
-    
-    title.text = "중국 SDV 표준 소개"
-    subtitle.text = "Software-Defined Vehicle 표준화 현황 및 기술 분석\nKETI 박부식 | 2024.08.26 (수정판)"
+    add_placeholder_slide(prs, 0, "중국 SDV 표준 소개", subtitle="Software-Defined Vehicle 표준화 현황 및 기술 분석\nKETI 박부식 | 2024.08.26 (수정판)")
     
     # Executive Summary (새로 추가)
-    slide = prs.slides.add_slide(prs.slide_layouts[1])
-    title = slide.shapes.title
-    content = slide.placeholders[1]
-    
-    title.text = "Executive Summary"
-    content.text = """주요 내용:
+    add_placeholder_slide(prs, 1, "Executive Summary", """주요 내용:
 • 중국 SDV 표준화 현황 및 로드맵
 • Intelligent Connected Vehicle (ICV) 서비스 인터페이스 사양
 • Atomic Service API 및 Device Abstraction API 상세
 • 한중독일 표준화 비교 분석
-• 국내 대응 전략 제언"""
+• 국내 대응 전략 제언""")
     
     # Table of Contents (목차 개선)
-    slide = prs.slides.add_slide(prs.slide_layouts[1])
-    title = slide.shapes.title
-    content = slide.placeholders[1]
-    
-    title.text = "목차"
-    content.text = """1. SDV 개요 및 배경
+    add_placeholder_slide(prs, 1, "목차", """1. SDV 개요 및 배경
    - SDV 정의 및 핵심 기술
    - 글로벌 시장 동향
 
@@ -92,112 +88,12 @@ def create_modified_presentation(original_info):
 4. 국제 표준화 비교
    - 중국 vs 독일(AUTOSAR) vs 일본
    
-5. 시사점 및 대응 방안"""
-    
-    # Add content slides based on original presentation
-    # This is a simplified version - you can add more detailed slides
-    
-    # SDV Overview
-    slide = prs.slides.add_slide(prs.slide_layouts[1])
-    title = slide.shapes.title
-    content = slide.placeholders[1]
-    
-    title.text = "SDV (Software-Defined Vehicle) 개요"
-    content.text = """정의:
-• 차량의 기능이 소프트웨어에 의해 정의되고 제어되는 차량
-• 하드웨어와 소프트웨어의 분리 (Decoupling)
-
-핵심 특징:
-• OTA (Over-The-Air) 업데이트
-• 서비스 지향 아키텍처 (SOA)
-• 클라우드 연결성
-• AI/ML 기반 기능
-
-시장 전망:
-• 2030년까지 전체 차량의 95%가 SDV로 전환 예상
-• 소프트웨어 가치 비중 60% 이상"""
-    
-    # Chinese Standards
-    slide = prs.slides.add_slide(prs.slide_layouts[1])
-    title = slide.shapes.title
-    content = slide.placeholders[1]
-    
-    title.text = "중국 SDV 표준화 체계"
-    content.text = """표준화 주도 기관:
-• CATARC (중국자동차기술연구센터)
-• CAAM (중국자동차제조협회)
-• MIIT (공업정보화부)
-
-주요 표준 문서:
-• GB/T 40429-2021: ICV 용어 및 정의
-• GB/T 40857-2021: 기능 안전 요구사항
-• T/CSAE 234-2021: 서비스 인터페이스 사양
-
-특징:
-• 정부 주도의 Top-down 방식
-• 빠른 표준화 진행
-• 자국 산업 보호 정책과 연계"""
+5. 시사점 및 대응 방안""")
     
-    # Technical Details
-    slide = prs.slides.add_slide(prs.slide_layouts[1])
-    title = slide.shapes.title
-    content = slide.placeholders[1]
-    
-    title.text = "ICV 서비스 인터페이스 아키텍처"
-    content.text = """계층 구조:
-
-Application Layer
-    ↓
-Service Interface Layer
-• Atomic Service API
-• Composite Service API
-    ↓
-Device Abstraction Layer
-• Sensor Abstraction
-• Actuator Abstraction
-    ↓
-Hardware Layer
-
-핵심 설계 원칙:
-• 모듈화 (Modularity)
-• 재사용성 (Reusability)
-• 확장성 (Scalability)"""
-    
-    # API Details
-    slide = prs.slides.add_slide(prs.slide_layouts[1])
-    title = slide.shapes.title
-    content = slide.placeholders[1]
-    
-    title.text = "Atomic Service API 상세"
-    content.text = """주요 서비스 카테고리:
-
-1. Vehicle Control Services
-   • 파워트레인 제어
-   • 섀시 제어
-   • 바디 제어
-
-2. Perception Services
-   • 센서 데이터 수집
-   • 환경 인지
-   • 객체 검출
-
-3. Communication Services
-   • V2X 통신
-   • 클라우드 연결
-   • OTA 업데이트
-
-4. Safety & Security Services
-   • 기능 안전
-   • 사이버 보안
-   • 진단 및 모니터링"""
+    # 본문은 원본 슬라이드를 그대로 가져옴 (build에서 ORIGINAL_SLIDES를 이 위치에 삽입)
     
     # Comparison
-    slide = prs.slides.add_slide(prs.slide_layouts[1])
-    title = slide.shapes.title
-    content = slide.placeholders[1]
-    
-    title.text = "국제 표준 비교 분석"
-    content.text = """중국 vs AUTOSAR Adaptive Platform:
+    add_placeholder_slide(prs, 1, "국제 표준 비교 분석", """중국 vs AUTOSAR Adaptive Platform:
 
 중국:
 • 정부 주도, 빠른 표준화
@@ -212,15 +108,10 @@ AUTOSAR (독일/유럽):
 일본:
 • 기업 주도 (Toyota, Honda)
 • 실용적 접근
-• 안전성 최우선"""
+• 안전성 최우선""")
     
     # Recommendations
-    slide = prs.slides.add_slide(prs.slide_layouts[1])
-    title = slide.shapes.title
-    content = slide.placeholders[1]
-    
-    title.text = "국내 대응 전략 제언"
-    content.text = """단기 전략:
+    add_placeholder_slide(prs, 1, "국내 대응 전략 제언", """단기 전략:
 • 중국 표준 모니터링 및 분석 강화
 • AUTOSAR 표준과의 호환성 확보
 • 핵심 기술 확보 및 인력 양성
@@ -233,15 +124,10 @@ AUTOSAR (독일/유럽):
 장기 전략:
 • 글로벌 표준화 참여 확대
 • 독자적 기술 경쟁력 확보
-• K-SDV 플랫폼 개발"""
+• K-SDV 플랫폼 개발""")
     
     # Conclusion
-    slide = prs.slides.add_slide(prs.slide_layouts[1])
-    title = slide.shapes.title
-    content = slide.placeholders[1]
-    
-    title.text = "결론 및 향후 과제"
-    content.text = """주요 시사점:
+    add_placeholder_slide(prs, 1, "결론 및 향후 과제", """주요 시사점:
 • SDV는 미래 자동차 산업의 핵심
 • 중국의 빠른 표준화 진행 주목
 • 국제 표준 호환성 확보 필수
@@ -255,33 +141,50 @@ AUTOSAR (독일/유럽):
 Action Items:
 • SDV 표준화 TF 구성
 • 정기적인 기술 교류회 개최
-• 표준 문서 번역 및 분석"""
+• 표준 문서 번역 및 분석""")
     
     # Q&A Slide
-    slide = prs.slides.add_slide(prs.slide_layouts[1])
-    title = slide.shapes.title
-    content = slide.placeholders[1]
-    
-    title.text = "Q&A"
-    content.text = "감사합니다.\n\n문의사항:\nKETI 박부식\nEmail: [email]\nTel: [phone]"
+    add_placeholder_slide(prs, 1, "Q&A", "감사합니다.\n\n문의사항:\nKETI 박부식\nEmail: [email]\nTel: [phone]")
     
+    for slide in prs.slides:
+        widen_placeholders(prs, slide)
     return prs
 
+def widen_placeholders(prs, slide):
+    """Stretch placeholders of the 10"-wide default layouts across the wide slide"""
+    scale = prs.slide_width / Inches(10)
+    for shape in slide.placeholders:
+        shape.left, shape.width = int(shape.left * scale), int(shape.width * scale)
+
+SOURCE_DIR = os.path.dirname(os.path.abspath(__file__))
+ORIGINAL_FILE = os.path.join(SOURCE_DIR, "중국SDV표준 소개_KETI 박부식0826.pptx")
+# 원본 본문 슬라이드 (SDV 개념 ~ 한국 자동차 산업에 주는 시사점, 섹션 구분 슬라이드 포함)
+ORIGINAL_SLIDES = range(3, 22)
+# 수정본에서 원본 슬라이드가 들어갈 위치 (표지, Executive Summary, 목차 다음)
+ORIGINAL_POSITION = 4
+
+def build(output_dir="."):
+    """Build the modified deck into output_dir and return the written paths"""
+    if not os.path.exists(ORIGINAL_FILE):
+        print(f"File not found: {os.path.basename(ORIGINAL_FILE)}")
+        return []
+    
+    slides_info = read_existing_ppt(ORIGINAL_FILE)
+    
+    print("\nCreating modified presentation...")
+    modified_prs = create_modified_presentation(slides_info)
+    
+    output_file = os.path.join(output_dir, "중국SDV표준_소개_KETI_박부식0826_수정본.pptx")
+    generated = io.BytesIO()
+    save_presentation(modified_prs, generated)
+    report = import_slides(generated.getvalue(), ORIGINAL_FILE, ORIGINAL_SLIDES, output_file, ORIGINAL_POSITION)
+    print(f"Carried over {report.slides} original slides in {report.seconds * 1000:.1f} ms")
+    return [output_file]
+
 def main():
     print("Analyzing existing presentation...")
-    original_file = "중국SDV표준 소개_KETI 박부식0826.pptx"
-    
-    if os.path.exists(original_file):
-        slides_info = read_existing_ppt(original_file)
-        
-        print("\nCreating modified presentation...")
-        modified_prs = create_modified_presentation(slides_info)
-        
-        output_file = "중국SDV표준_소개_KETI_박부식0826_수정본.pptx"
-        modified_prs.save(output_file)
-        print(f"\nModified presentation saved as: {output_file}")
-    else:
-        print(f"File not found: {original_file}")
+    for output_file in build():
+        print(f"\nModified presentation saved as: {os.path.basename(output_file)}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
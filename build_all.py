@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Build every deck in one command.
+
+All generator modules are imported once, then their build() functions run
+concurrently in a bounded process pool forked from this process. The
+full-suite build time therefore approaches the slowest generator instead of
+the sum of all nine scripts run one after another.
+
+Usage:
+    python build_all.py [-j JOBS] [-o OUTPUT_DIR]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from sdv_build import BASE_DIR, DECKS, build
+from sdv_package import count_slides
+
+
+def format_size(num_bytes):
+    if num_bytes >= 1024 * 1024:
+        return f"{num_bytes / (1024 * 1024):.1f} MB"
+    return f"{num_bytes / 1024:.0f} KB"
+
+
+def print_report(results, wall_time):
+    """Print per-deck wall time, slide count and output size"""
+    print()
+    print(f"{'Deck':<48} {'Time':>8} {'Slides':>7} {'Size':>9}")
+    print("-" * 75)
+    total = 0.0
+    for deck in DECKS:
+        if deck.name not in results:
+            continue
+        paths, elapsed = results[deck.name]
+        total += elapsed
+        for i, path in enumerate(paths):
+            label = os.path.basename(path)
+            shown = f"{elapsed:.2f}s" if i == 0 else ""
+            print(f"{label:<48} {shown:>8} {count_slides(path):>7} {format_size(os.path.getsize(path)):>9}")
+    print("-" * 75)
+    print(f"Sum of deck times: {total:.2f}s | Wall time: {wall_time:.2f}s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build all decks concurrently")
+    parser.add_argument("-j", "--jobs", type=int, help="worker processes (default: CPU count)")
+    parser.add_argument("-o", "--output-dir", default=BASE_DIR)
+    args = parser.parse_args(argv)
+
+    output_dir = os.path.abspath(args.output_dir)
+    os.makedirs(output_dir, exist_ok=True)
+
+    start = time.perf_counter()
+    results = build(jobs=args.jobs, force=True, output_dir=output_dir)
+    wall_time = time.perf_counter() - start
+
+    print_report(results, wall_time)
+    return 0 if len(results) == len(DECKS) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,67 +1,48 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR, MSO_AUTO_SIZE
 from pptx.enum.shapes import MSO_SHAPE
-from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION, XL_LABEL_POSITION
-from pptx.chart.data import CategoryChartData
+from pptx.enum.chart import XL_CHART_TYPE, XL_LABEL_POSITION
 from datetime import datetime
+import os
+from sdv_components import COMPONENTS
+from sdv_layout import ADVANCED_LAYERS, ADVANCED_PROCESS
+from sdv_market_data import MARKET
+from sdv_package import save_presentation
+from sdv_template import new_presentation
+from sdv_slides import TextStyle, WHITE, add_box, add_chart, add_line, add_table, add_text, rgb
+
+TITLE_COLOR = rgb(0, 84, 159)
+
+TITLE_STYLE = TextStyle(size=32, bold=True, color=TITLE_COLOR)
+HEADER_STYLE = TextStyle(size=14, bold=True, color=WHITE, align=PP_ALIGN.CENTER)
+CELL_STYLE = TextStyle(size=12, align=PP_ALIGN.LEFT)
+LAYER_STYLE = TextStyle(size=14, bold=True, color=WHITE, align=PP_ALIGN.CENTER)
+HUB_STYLE = TextStyle(size=18, bold=True, color=WHITE, align=PP_ALIGN.CENTER)
+NODE_STYLE = TextStyle(size=12, bold=True, color=WHITE, align=PP_ALIGN.CENTER)
+YEAR_STYLE = TextStyle(size=14, bold=True, align=PP_ALIGN.CENTER)
+CAPTION_STYLE = TextStyle(size=11, align=PP_ALIGN.CENTER)
+
+
+def add_slide_title(slide, title):
+    """슬라이드 제목 추가"""
+    return add_text(slide, Inches(0.5), Inches(0.5), Inches(15), Inches(1), title, TITLE_STYLE,
+                    split_lines=True)
 
 def add_table_slide(prs, title, table_data, headers):
     """테이블 슬라이드 추가"""
     slide_layout = prs.slide_layouts[5]  # Blank layout
     slide = prs.slides.add_slide(slide_layout)
     
-    # Title
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.5), Inches(15), Inches(1))
-    title_frame = title_box.text_frame
-    title_frame.text = title
-    title_frame.paragraphs[0].font.size = Pt(32)
-    title_frame.paragraphs[0].font.bold = True
-    title_frame.paragraphs[0].font.color.rgb = RGBColor(0, 84, 159)
+    add_slide_title(slide, title)
     
-    # Table
-    rows = len(table_data) + 1  # +1 for header
-    cols = len(headers)
-    left = Inches(1)
-    top = Inches(2)
-    width = Inches(14)
-    height = Inches(5.5)
-    
-    table = slide.shapes.add_table(rows, cols, left, top, width, height).table
-    
-    # Set column widths
-    for i in range(cols):
-        table.columns[i].width = Inches(14 / cols)
-    
-    # Add headers
-    for i, header in enumerate(headers):
-        cell = table.cell(0, i)
-        cell.text = header
-        cell.fill.solid()
-        cell.fill.fore_color.rgb = RGBColor(0, 84, 159)
-        paragraph = cell.text_frame.paragraphs[0]
-        paragraph.font.color.rgb = RGBColor(255, 255, 255)
-        paragraph.font.bold = True
-        paragraph.font.size = Pt(14)
-        paragraph.alignment = PP_ALIGN.CENTER
-    
-    # Add data
-    for row_idx, row_data in enumerate(table_data):
-        for col_idx, cell_data in enumerate(row_data):
-            cell = table.cell(row_idx + 1, col_idx)
-            cell.text = str(cell_data)
-            paragraph = cell.text_frame.paragraphs[0]
-            paragraph.font.size = Pt(12)
-            paragraph.alignment = PP_ALIGN.LEFT
-            
-            # Alternate row colors
-            if row_idx % 2 == 0:
-                cell.fill.solid()
-                cell.fill.fore_color.rgb = RGBColor(240, 248, 255)
+    # Table (header row + alternate row colors)
+    add_table(slide, headers, table_data, Inches(1), Inches(2), Inches(14), Inches(5.5),
+              TITLE_COLOR, HEADER_STYLE, CELL_STYLE, stripe_fill=rgb(240, 248, 255),
+              column_width=Inches(14 / len(headers)))
     
     return slide
 
@@ -70,28 +51,11 @@ def add_chart_slide(prs, title, chart_type, categories, series_data):
     slide_layout = prs.slide_layouts[5]  # Blank layout
     slide = prs.slides.add_slide(slide_layout)
     
-    # Title
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.5), Inches(15), Inches(1))
-    title_frame = title_box.text_frame
-    title_frame.text = title
-    title_frame.paragraphs[0].font.size = Pt(32)
-    title_frame.paragraphs[0].font.bold = True
-    title_frame.paragraphs[0].font.color.rgb = RGBColor(0, 84, 159)
+    add_slide_title(slide, title)
     
     # Chart
-    chart_data = CategoryChartData()
-    chart_data.categories = categories
-    
-    for series_name, values in series_data.items():
-        chart_data.add_series(series_name, values)
-    
-    x, y, cx, cy = Inches(1), Inches(2), Inches(14), Inches(6)
-    chart = slide.shapes.add_chart(chart_type, x, y, cx, cy, chart_data).chart
-    
-    # Chart styling
-    chart.has_legend = True
-    chart.legend.position = XL_LEGEND_POSITION.BOTTOM
-    chart.legend.include_in_layout = False
+    add_chart(slide, chart_type, categories, series_data,
+              Inches(1), Inches(2), Inches(14), Inches(6), legend_in_layout=False)
     
     return slide
 
@@ -100,13 +64,7 @@ def add_diagram_slide(prs, title, diagram_type="architecture"):
     slide_layout = prs.slide_layouts[5]  # Blank layout
     slide = prs.slides.add_slide(slide_layout)
     
-    # Title
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.5), Inches(15), Inches(1))
-    title_frame = title_box.text_frame
-    title_frame.text = title
-    title_frame.paragraphs[0].font.size = Pt(32)
-    title_frame.paragraphs[0].font.bold = True
-    title_frame.paragraphs[0].font.color.rgb = RGBColor(0, 84, 159)
+    add_slide_title(slide, title)
     
     if diagram_type == "architecture":
         # SDV Architecture Layers
@@ -118,28 +76,11 @@ def add_diagram_slide(prs, title, diagram_type="architecture"):
             ("Hardware Layer", "ECU, 센서, 액추에이터", RGBColor(128, 128, 128))
         ]
         
-        y_start = 2
-        for i, (layer_name, description, color) in enumerate(layers):
-            # Layer box
-            box = slide.shapes.add_shape(
-                MSO_SHAPE.RECTANGLE,
-                Inches(2), Inches(y_start + i * 1.1),
-                Inches(12), Inches(1)
-            )
-            box.fill.solid()
-            box.fill.fore_color.rgb = color
-            box.line.color.rgb = RGBColor(255, 255, 255)
-            box.line.width = Pt(2)
-            
-            # Layer text
-            text_frame = box.text_frame
-            text_frame.clear()
-            p = text_frame.paragraphs[0]
-            p.text = f"{layer_name}: {description}"
-            p.font.color.rgb = RGBColor(255, 255, 255)
-            p.font.bold = True
-            p.font.size = Pt(14)
-            p.alignment = PP_ALIGN.CENTER
+        layout = ADVANCED_LAYERS.place_for(prs)
+        for (layer_name, description, color), region in zip(layers, layout['layers']):
+            add_box(slide, MSO_SHAPE.RECTANGLE, *region.box,
+                    fill=color, line=WHITE, line_width=Pt(2),
+                    text=f"{layer_name}: {description}", style=LAYER_STYLE)
             
     elif diagram_type == "ecosystem":
         # SDV Ecosystem
@@ -147,19 +88,9 @@ def add_diagram_slide(prs, title, diagram_type="architecture"):
         radius = 2.5
         
         # Central circle - SDV Platform
-        center = slide.shapes.add_shape(
-            MSO_SHAPE.OVAL,
-            Inches(center_x - 1.5), Inches(center_y - 1.5),
-            Inches(3), Inches(3)
-        )
-        center.fill.solid()
-        center.fill.fore_color.rgb = RGBColor(0, 84, 159)
-        text_frame = center.text_frame
-        text_frame.text = "SDV\n플랫폼"
-        text_frame.paragraphs[0].font.color.rgb = RGBColor(255, 255, 255)
-        text_frame.paragraphs[0].font.bold = True
-        text_frame.paragraphs[0].font.size = Pt(18)
-        text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
+        add_box(slide, MSO_SHAPE.OVAL,
+                Inches(center_x - 1.5), Inches(center_y - 1.5), Inches(3), Inches(3),
+                fill=TITLE_COLOR, text="SDV\n플랫폼", style=HUB_STYLE, split_lines=True)
         
         # Surrounding elements
         elements = [
@@ -178,31 +109,12 @@ def add_diagram_slide(prs, title, diagram_type="architecture"):
             x = center_x + radius * math.cos(rad) - 0.75
             y = center_y + radius * math.sin(rad) - 0.75
             
-            # Add circle
-            circle = slide.shapes.add_shape(
-                MSO_SHAPE.OVAL,
-                Inches(x), Inches(y),
-                Inches(1.5), Inches(1.5)
-            )
-            circle.fill.solid()
-            circle.fill.fore_color.rgb = color
+            COMPONENTS.box(slide, MSO_SHAPE.OVAL, Inches(x), Inches(y), Inches(1.5), Inches(1.5),
+                           fill=color, text=name, style=NODE_STYLE, split_lines=True)
             
-            # Add text
-            text_frame = circle.text_frame
-            text_frame.text = name
-            text_frame.paragraphs[0].font.color.rgb = RGBColor(255, 255, 255)
-            text_frame.paragraphs[0].font.bold = True
-            text_frame.paragraphs[0].font.size = Pt(12)
-            text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-            
-            # Add connector line
-            connector = slide.shapes.add_connector(
-                1,  # Straight connector
-                Inches(center_x), Inches(center_y),
-                Inches(x + 0.75), Inches(y + 0.75)
-            )
-            connector.line.color.rgb = RGBColor(200, 200, 200)
-            connector.line.width = Pt(1)
+            # Connector line
+            COMPONENTS.line(slide, Inches(center_x), Inches(center_y), Inches(x + 0.75), Inches(y + 0.75),
+                            color=rgb(200, 200, 200), width=Pt(1))
     
     elif diagram_type == "timeline":
         # Timeline
@@ -211,13 +123,8 @@ def add_diagram_slide(prs, title, diagram_type="architecture"):
         end_x = 14
         
         # Main timeline
-        line = slide.shapes.add_connector(
-            1,
-            Inches(start_x), Inches(timeline_y),
-            Inches(end_x), Inches(timeline_y)
-        )
-        line.line.color.rgb = RGBColor(0, 84, 159)
-        line.line.width = Pt(3)
+        add_line(slide, Inches(start_x), Inches(timeline_y), Inches(end_x), Inches(timeline_y),
+                 color=TITLE_COLOR, width=Pt(3))
         
         # Timeline points
         milestones = [
@@ -231,32 +138,15 @@ def add_diagram_slide(prs, title, diagram_type="architecture"):
             x_pos = start_x + (end_x - start_x) * i / (len(milestones) - 1)
             
             # Milestone circle
-            circle = slide.shapes.add_shape(
-                MSO_SHAPE.OVAL,
-                Inches(x_pos - 0.2), Inches(timeline_y - 0.2),
-                Inches(0.4), Inches(0.4)
-            )
-            circle.fill.solid()
-            circle.fill.fore_color.rgb = RGBColor(255, 192, 0)
+            add_box(slide, MSO_SHAPE.OVAL,
+                    Inches(x_pos - 0.2), Inches(timeline_y - 0.2), Inches(0.4), Inches(0.4),
+                    fill=rgb(255, 192, 0))
             
-            # Year text above
-            year_box = slide.shapes.add_textbox(
-                Inches(x_pos - 0.5), Inches(timeline_y - 1.2),
-                Inches(1), Inches(0.5)
-            )
-            year_box.text_frame.text = str(year)
-            year_box.text_frame.paragraphs[0].font.bold = True
-            year_box.text_frame.paragraphs[0].font.size = Pt(14)
-            year_box.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-            
-            # Description below
-            desc_box = slide.shapes.add_textbox(
-                Inches(x_pos - 1.5), Inches(timeline_y + 0.5),
-                Inches(3), Inches(1)
-            )
-            desc_box.text_frame.text = f"{title}\n{desc}"
-            desc_box.text_frame.paragraphs[0].font.size = Pt(11)
-            desc_box.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
+            # Year text above, description below
+            add_text(slide, Inches(x_pos - 0.5), Inches(timeline_y - 1.2), Inches(1), Inches(0.5),
+                     str(year), YEAR_STYLE, split_lines=True)
+            add_text(slide, Inches(x_pos - 1.5), Inches(timeline_y + 0.5), Inches(3), Inches(1),
+                     f"{title}\n{desc}", CAPTION_STYLE, split_lines=True)
     
     elif diagram_type == "process":
         # Process Flow
@@ -268,48 +158,21 @@ def add_diagram_slide(prs, title, diagram_type="architecture"):
             ("배포 및\n운영", RGBColor(255, 192, 0))
         ]
         
-        x_start = 1.5
-        y_pos = 4
-        box_width = 2.5
-        spacing = 0.3
-        
-        for i, (process_name, color) in enumerate(processes):
-            x_pos = x_start + i * (box_width + spacing)
-            
-            # Process box
-            box = slide.shapes.add_shape(
-                MSO_SHAPE.ROUNDED_RECTANGLE,
-                Inches(x_pos), Inches(y_pos),
-                Inches(box_width), Inches(1.5)
-            )
-            box.fill.solid()
-            box.fill.fore_color.rgb = color
-            
-            # Process text
-            text_frame = box.text_frame
-            text_frame.text = process_name
-            text_frame.paragraphs[0].font.color.rgb = RGBColor(255, 255, 255)
-            text_frame.paragraphs[0].font.bold = True
-            text_frame.paragraphs[0].font.size = Pt(14)
-            text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
+        layout = ADVANCED_PROCESS.place_for(prs)
+        arrows = layout['arrows']
+        for i, ((process_name, color), step) in enumerate(zip(processes, layout['steps'])):
+            add_box(slide, MSO_SHAPE.ROUNDED_RECTANGLE, *step.box,
+                    fill=color, text=process_name, style=LAYER_STYLE, split_lines=True)
             
             # Arrow to next
-            if i < len(processes) - 1:
-                arrow = slide.shapes.add_shape(
-                    MSO_SHAPE.RIGHT_ARROW,
-                    Inches(x_pos + box_width), Inches(y_pos + 0.5),
-                    Inches(spacing), Inches(0.5)
-                )
-                arrow.fill.solid()
-                arrow.fill.fore_color.rgb = RGBColor(100, 100, 100)
+            if i < len(arrows):
+                add_box(slide, MSO_SHAPE.RIGHT_ARROW, *arrows[i].box, fill=rgb(100, 100, 100))
     
     return slide
 
 def create_advanced_sdv_presentation():
     # Create presentation with 16:9 aspect ratio
-    prs = Presentation()
-    prs.slide_width = Inches(16)
-    prs.slide_height = Inches(9)
+    prs = new_presentation("wide")
     
     # Slide 1: Title Slide with Design
     title_slide_layout = prs.slide_layouts[0]
@@ -334,13 +197,7 @@ def create_advanced_sdv_presentation():
     bullet_slide_layout = prs.slide_layouts[5]  # Blank
     slide = prs.slides.add_slide(bullet_slide_layout)
     
-    # Title
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.5), Inches(15), Inches(1))
-    title_frame = title_box.text_frame
-    title_frame.text = "Executive Summary"
-    title_frame.paragraphs[0].font.size = Pt(32)
-    title_frame.paragraphs[0].font.bold = True
-    title_frame.paragraphs[0].font.color.rgb = RGBColor(0, 84, 159)
+    add_slide_title(slide, "Executive Summary")
     
     # Key Points with boxes
     key_points = [
@@ -389,13 +246,9 @@ def create_advanced_sdv_presentation():
     add_diagram_slide(prs, "SDV 기술 아키텍처", "architecture")
     
     # Slide 4: Market Growth Chart
-    categories = ['2024', '2025', '2026', '2027', '2028', '2029', '2030']
-    series_data = {
-        '글로벌 시장': [250, 350, 500, 700, 950, 1200, 1500],
-        '한국 시장': [15, 25, 40, 65, 95, 130, 180],
-        '중국 시장': [80, 120, 180, 260, 350, 450, 550]
-    }
-    add_chart_slide(prs, "SDV 시장 성장 전망 (억 달러)", XL_CHART_TYPE.COLUMN_CLUSTERED, categories, series_data)
+    growth = MARKET.query("regional_growth")
+    add_chart_slide(prs, "SDV 시장 성장 전망 (억 달러)", XL_CHART_TYPE.COLUMN_CLUSTERED,
+                    growth["categories"], growth["series"])
     
     # Slide 5: Global Standards Comparison Table
     headers = ['국가', '표준 명칭', '주요 특징', '완성도', '채택률']
@@ -415,13 +268,7 @@ def create_advanced_sdv_presentation():
     slide_layout = prs.slide_layouts[5]
     slide = prs.slides.add_slide(slide_layout)
     
-    # Title
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.5), Inches(15), Inches(1))
-    title_frame = title_box.text_frame
-    title_frame.text = "SDV 핵심 기술 스택"
-    title_frame.paragraphs[0].font.size = Pt(32)
-    title_frame.paragraphs[0].font.bold = True
-    title_frame.paragraphs[0].font.color.rgb = RGBColor(0, 84, 159)
+    add_slide_title(slide, "SDV 핵심 기술 스택")
     
     # Create pyramid-like structure
     levels = [
@@ -453,11 +300,8 @@ def create_advanced_sdv_presentation():
         text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
     
     # Slide 8: Investment Distribution Pie Chart
-    categories = ['플랫폼 개발', '인프라 구축', '인력 양성', '표준화', 'R&D']
-    series_data = {
-        '투자 비중': [45, 25, 15, 8, 7]
-    }
-    add_chart_slide(prs, "SDV 투자 배분 계획 (%)", XL_CHART_TYPE.PIE, categories, series_data)
+    split = MARKET.query("investment_split")
+    add_chart_slide(prs, "SDV 투자 배분 계획 (%)", XL_CHART_TYPE.PIE, split["categories"], split["series"])
     
     # Slide 9: Timeline Roadmap
     add_diagram_slide(prs, "SDV 구현 로드맵", "timeline")
@@ -466,13 +310,7 @@ def create_advanced_sdv_presentation():
     slide_layout = prs.slide_layouts[5]
     slide = prs.slides.add_slide(slide_layout)
     
-    # Title
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.5), Inches(15), Inches(1))
-    title_frame = title_box.text_frame
-    title_frame.text = "한국 SDV 산업 SWOT 분석"
-    title_frame.paragraphs[0].font.size = Pt(32)
-    title_frame.paragraphs[0].font.bold = True
-    title_frame.paragraphs[0].font.color.rgb = RGBColor(0, 84, 159)
+    add_slide_title(slide, "한국 SDV 산업 SWOT 분석")
     
     # SWOT Matrix
     swot_data = [
@@ -521,13 +359,7 @@ def create_advanced_sdv_presentation():
     slide_layout = prs.slide_layouts[5]
     slide = prs.slides.add_slide(slide_layout)
     
-    # Title
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.5), Inches(15), Inches(1))
-    title_frame = title_box.text_frame
-    title_frame.text = "SDV 성과 지표 대시보드"
-    title_frame.paragraphs[0].font.size = Pt(32)
-    title_frame.paragraphs[0].font.bold = True
-    title_frame.paragraphs[0].font.color.rgb = RGBColor(0, 84, 159)
+    add_slide_title(slide, "SDV 성과 지표 대시보드")
     
     # KPI Cards
     kpis = [
@@ -583,26 +415,15 @@ def create_advanced_sdv_presentation():
         change_box.text_frame.paragraphs[0].font.color.rgb = color
     
     # Slide 13: Competitive Analysis Radar Chart
-    categories = ['2025', '2026', '2027', '2028', '2029', '2030']
-    series_data = {
-        '한국': [30, 45, 60, 75, 85, 95],
-        '중국': [70, 75, 80, 85, 90, 95],
-        '독일': [80, 85, 88, 90, 92, 95],
-        '일본': [60, 65, 70, 75, 80, 85]
-    }
-    add_chart_slide(prs, "국가별 SDV 기술 성숙도 전망 (%)", XL_CHART_TYPE.LINE, categories, series_data)
+    maturity = MARKET.query("tech_maturity")
+    add_chart_slide(prs, "국가별 SDV 기술 성숙도 전망 (%)", XL_CHART_TYPE.LINE,
+                    maturity["categories"], maturity["series"])
     
     # Slide 14: Security Architecture
     slide_layout = prs.slide_layouts[5]
     slide = prs.slides.add_slide(slide_layout)
     
-    # Title
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.5), Inches(15), Inches(1))
-    title_frame = title_box.text_frame
-    title_frame.text = "SDV 보안 아키텍처"
-    title_frame.paragraphs[0].font.size = Pt(32)
-    title_frame.paragraphs[0].font.bold = True
-    title_frame.paragraphs[0].font.color.rgb = RGBColor(0, 84, 159)
+    add_slide_title(slide, "SDV 보안 아키텍처")
     
     # Security Layers (Onion model)
     center_x, center_y = 8, 4.5
@@ -672,13 +493,7 @@ def create_advanced_sdv_presentation():
     slide_layout = prs.slide_layouts[5]
     slide = prs.slides.add_slide(slide_layout)
     
-    # Title
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.5), Inches(15), Inches(1))
-    title_frame = title_box.text_frame
-    title_frame.text = "SDV 비즈니스 모델 혁신"
-    title_frame.paragraphs[0].font.size = Pt(32)
-    title_frame.paragraphs[0].font.bold = True
-    title_frame.paragraphs[0].font.color.rgb = RGBColor(0, 84, 159)
+    add_slide_title(slide, "SDV 비즈니스 모델 혁신")
     
     # Revenue streams
     streams = [
@@ -765,13 +580,7 @@ def create_advanced_sdv_presentation():
     slide_layout = prs.slide_layouts[5]
     slide = prs.slides.add_slide(slide_layout)
     
-    # Title
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.5), Inches(15), Inches(1))
-    title_frame = title_box.text_frame
-    title_frame.text = "SDV 리스크 관리 매트릭스"
-    title_frame.paragraphs[0].font.size = Pt(32)
-    title_frame.paragraphs[0].font.bold = True
-    title_frame.paragraphs[0].font.color.rgb = RGBColor(0, 84, 159)
+    add_slide_title(slide, "SDV 리스크 관리 매트릭스")
     
     # Risk matrix grid
     grid_x, grid_y = 3, 2
@@ -843,13 +652,7 @@ def create_advanced_sdv_presentation():
     slide_layout = prs.slide_layouts[5]
     slide = prs.slides.add_slide(slide_layout)
     
-    # Title
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.5), Inches(15), Inches(1))
-    title_frame = title_box.text_frame
-    title_frame.text = "2025년 실행 계획 (Gantt Chart)"
-    title_frame.paragraphs[0].font.size = Pt(32)
-    title_frame.paragraphs[0].font.bold = True
-    title_frame.paragraphs[0].font.color.rgb = RGBColor(0, 84, 159)
+    add_slide_title(slide, "2025년 실행 계획 (Gantt Chart)")
     
     # Tasks and timeline
     tasks = [
@@ -899,25 +702,15 @@ def create_advanced_sdv_presentation():
         bar.fill.fore_color.rgb = color
     
     # Slide 20: Investment ROI Projection
-    categories = ['Y1', 'Y2', 'Y3', 'Y4', 'Y5']
-    series_data = {
-        '투자 (억원)': [1000, 1500, 1300, 1000, 700],
-        '수익 (억원)': [200, 800, 2000, 3500, 5000],
-        'ROI (%)': [20, 53, 154, 350, 714]
-    }
-    add_chart_slide(prs, "투자 대비 수익 전망 (5개년)", XL_CHART_TYPE.COLUMN_CLUSTERED, categories, series_data)
+    roi = MARKET.query("investment_roi")
+    add_chart_slide(prs, "투자 대비 수익 전망 (5개년)", XL_CHART_TYPE.COLUMN_CLUSTERED,
+                    roi["categories"], roi["series"])
     
     # Slide 21: Success Metrics Summary
     slide_layout = prs.slide_layouts[5]
     slide = prs.slides.add_slide(slide_layout)
     
-    # Title
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.5), Inches(15), Inches(1))
-    title_frame = title_box.text_frame
-    title_frame.text = "성공 지표 요약"
-    title_frame.paragraphs[0].font.size = Pt(32)
-    title_frame.paragraphs[0].font.bold = True
-    title_frame.paragraphs[0].font.color.rgb = RGBColor(0, 84, 159)
+    add_slide_title(slide, "성공 지표 요약")
     
     # Create gauge-style indicators
     metrics = [
@@ -1076,9 +869,18 @@ def create_advanced_sdv_presentation():
     title.text = "Q&A"
     subtitle.text = "감사합니다\n\n문의사항\nsdv-korea@example.com\nTel: 02-1234-5678\n\nSDV Korea Initiative 2025"
     
-    # Save the presentation
-    prs.save('/home/kim/sdv-c/SDV_Advanced_Presentation_Full.pptx')
+    return prs
+
+def build(output_dir="."):
+    """Build the deck into output_dir and return the written paths"""
+    prs = create_advanced_sdv_presentation()
+    path = os.path.join(output_dir, 'SDV_Advanced_Presentation_Full.pptx')
+    save_presentation(prs, path)
+    return [path]
+
+def main():
+    build()
     print("Advanced presentation created successfully: SDV_Advanced_Presentation_Full.pptx")
 
 if __name__ == "__main__":
-    create_advanced_sdv_presentation()
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -1,46 +1,26 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.dml.color import RGBColor
 from pptx.enum.dml import MSO_THEME_COLOR
-import datetime
+import os
+from sdv_data import build_datetime
+from sdv_package import save_presentation
+from sdv_slides import add_placeholder_slide, bullet_text
+from sdv_template import new_presentation
 
 def add_slide_with_bullets(prs, title_text, bullets):
     """Helper function to add slide with bullet points"""
-    slide = prs.slides.add_slide(prs.slide_layouts[1])
-    title = slide.shapes.title
-    content = slide.placeholders[1]
-    
-    title.text = title_text
-    
-    # Build bullet text
-    bullet_text = ""
-    for item in bullets:
-        if isinstance(item, str):
-            bullet_text += f"• {item}\n"
-        elif isinstance(item, dict):
-            bullet_text += f"• {item['main']}\n"
-            if 'sub' in item:
-                for sub in item['sub']:
-                    bullet_text += f"  - {sub}\n"
-    
-    content.text = bullet_text.strip()
-    return slide
+    return add_placeholder_slide(prs, 1, title_text, bullet_text(bullets))
 
 def create_comprehensive_sdv_presentation():
     """Create a comprehensive SDV presentation combining all insights"""
-    prs = Presentation()
+    prs = new_presentation()
     
     # 1. Title Slide
-    slide = prs.slides.add_slide(prs.slide_layouts[0])
-    title = slide.shapes.title
-    subtitle = slide.placeholders[1]
-    
-    title.text = "SDV (Software-Defined Vehicle)\n완전 분석 보고서"
-    subtitle.text = f"중국·독일·일본 표준화 동향 및 한국 대응 전략\n{datetime.datetime.now().strftime('%Y년 %m월 %d일')}"
+    add_placeholder_slide(prs, 0, "SDV (Software-Defined Vehicle)\n완전 분석 보고서", subtitle=f"중국·독일·일본 표준화 동향 및 한국 대응 전략\n{build_datetime().strftime('%Y년 %m월 %d일')}")
     
     # 2. Executive Summary
     bullets = [
@@ -63,9 +43,7 @@ def create_comprehensive_sdv_presentation():
     add_slide_with_bullets(prs, "목차", bullets)
     
     # 4. PART 1 - SDV Overview
-    slide = prs.slides.add_slide(prs.slide_layouts[2])
-    title = slide.shapes.title
-    title.text = "PART 1\nSDV 개념 및 시장 전망"
+    add_placeholder_slide(prs, 2, "PART 1\nSDV 개념 및 시장 전망")
     
     # 5. SDV Definition
     bullets = [
@@ -100,9 +78,7 @@ def create_comprehensive_sdv_presentation():
     add_slide_with_bullets(prs, "SDV 시장 전망", bullets)
     
     # 7. PART 2 - Global Standards
-    slide = prs.slides.add_slide(prs.slide_layouts[2])
-    title = slide.shapes.title
-    title.text = "PART 2\n글로벌 표준화 현황"
+    add_placeholder_slide(prs, 2, "PART 2\n글로벌 표준화 현황")
     
     # 8. China Standards
     bullets = [
@@ -165,17 +141,10 @@ def create_comprehensive_sdv_presentation():
     add_slide_with_bullets(prs, "일본 SDV 표준화", bullets)
     
     # 11. PART 3 - China Deep Dive
-    slide = prs.slides.add_slide(prs.slide_layouts[2])
-    title = slide.shapes.title
-    title.text = "PART 3\n중국 SDV 표준 심층 분석"
+    add_placeholder_slide(prs, 2, "PART 3\n중국 SDV 표준 심층 분석")
     
     # 12. Architecture Overview
-    slide = prs.slides.add_slide(prs.slide_layouts[1])
-    title = slide.shapes.title
-    content = slide.placeholders[1]
-    
-    title.text = "중국 SDV 아키텍처 구조"
-    content.text = """Application Layer
+    add_placeholder_slide(prs, 1, "중국 SDV 아키텍처 구조", """Application Layer
 ├── Smart Apps / Services
 │
 Service Interface Layer
@@ -189,7 +158,7 @@ Service Interface Layer
 │
 Hardware Layer
 ├── ECUs / Sensors / Actuators
-└── Vehicle Network (CAN/Ethernet)"""
+└── Vehicle Network (CAN/Ethernet)""")
     
     # 13. Atomic Service API Details
     bullets = [
@@ -210,12 +179,7 @@ Hardware Layer
     add_slide_with_bullets(prs, "Atomic Service API 상세", bullets)
     
     # 14. API Example
-    slide = prs.slides.add_slide(prs.slide_layouts[1])
-    title = slide.shapes.title
-    content = slide.placeholders[1]
-    
-    title.text = "API 호출 예시"
-    content.text = """Power System Service:
+    add_placeholder_slide(prs, 1, "API 호출 예시", """Power System Service:
 {
   "serviceId": "power.system",
   "method": "setPowerMode",
@@ -233,7 +197,7 @@ Response:
     "batteryLevel": 78,
     "estimatedRange": 420
   }
-}"""
+}""")
     
     # 15. Device Abstraction Details
     bullets = [
@@ -256,17 +220,10 @@ Response:
     add_slide_with_bullets(prs, "Device Abstraction API 상세", bullets)
     
     # 16. PART 4 - Comparison
-    slide = prs.slides.add_slide(prs.slide_layouts[2])
-    title = slide.shapes.title
-    title.text = "PART 4\n기술 비교 분석"
+    add_placeholder_slide(prs, 2, "PART 4\n기술 비교 분석")
     
     # 17. Standards Comparison Table
-    slide = prs.slides.add_slide(prs.slide_layouts[1])
-    title = slide.shapes.title
-    content = slide.placeholders[1]
-    
-    title.text = "표준 비교 매트릭스"
-    content.text = """항목          중국         AUTOSAR      일본
+    add_placeholder_slide(prs, 1, "표준 비교 매트릭스", """항목          중국         AUTOSAR      일본
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 주도          정부         컨소시엄      기업
 개방성        제한적       완전개방      선택적
@@ -274,7 +231,7 @@ Response:
 기술초점      서비스       안전         품질
 생태계        폐쇄적       개방적       하이브리드
 호환성        낮음         높음         중간
-적용분야      ICV/EV       전체         프리미엄"""
+적용분야      ICV/EV       전체         프리미엄""")
     
     # 18. Strengths and Weaknesses
     bullets = [
@@ -294,9 +251,7 @@ Response:
     add_slide_with_bullets(prs, "표준별 강점과 약점", bullets)
     
     # 19. PART 5 - Korea Strategy
-    slide = prs.slides.add_slide(prs.slide_layouts[2])
-    title = slide.shapes.title
-    title.text = "PART 5\n한국 대응 전략"
+    add_placeholder_slide(prs, 2, "PART 5\n한국 대응 전략")
     
     # 20. Short-term Strategy (2024-2025)
     bullets = [
@@ -399,12 +354,7 @@ Response:
     add_slide_with_bullets(prs, "리스크 관리", bullets)
     
     # 25. Budget Estimation
-    slide = prs.slides.add_slide(prs.slide_layouts[1])
-    title = slide.shapes.title
-    content = slide.placeholders[1]
-    
-    title.text = "예상 투자 규모"
-    content.text = """2024-2030 총 투자 규모: 3조원
+    add_placeholder_slide(prs, 1, "예상 투자 규모", """2024-2030 총 투자 규모: 3조원
 
 연도별 투자 계획:
 • 2024: 2,000억원 (기반 구축)
@@ -417,7 +367,7 @@ Response:
 • R&D: 40%
 • 인프라: 25%
 • 인력 양성: 20%
-• 국제 협력: 15%"""
+• 국제 협력: 15%""")
     
     # 26. Success Metrics
     bullets = [
@@ -440,12 +390,7 @@ Response:
     add_slide_with_bullets(prs, "성공 지표", bullets)
     
     # 27. Conclusion
-    slide = prs.slides.add_slide(prs.slide_layouts[1])
-    title = slide.shapes.title
-    content = slide.placeholders[1]
-    
-    title.text = "결론"
-    content.text = """SDV는 선택이 아닌 필수
+    add_placeholder_slide(prs, 1, "결론", """SDV는 선택이 아닌 필수
 
 핵심 성공 요인:
 • 빠른 실행
@@ -460,29 +405,19 @@ Response:
 • 정부의 적극적 지원
 
 "First Mover가 되기 위한 골든타임"
-지금이 행동할 때입니다."""
+지금이 행동할 때입니다.""")
     
     # 28. Q&A
-    slide = prs.slides.add_slide(prs.slide_layouts[1])
-    title = slide.shapes.title
-    content = slide.placeholders[1]
-    
-    title.text = "Q&A"
-    content.text = "감사합니다.\n\n질문과 토론을 환영합니다."
+    add_placeholder_slide(prs, 1, "Q&A", "감사합니다.\n\n질문과 토론을 환영합니다.")
     
     return prs
 
 def create_technical_deep_dive():
     """Create technical deep dive presentation"""
-    prs = Presentation()
+    prs = new_presentation()
     
     # Title
-    slide = prs.slides.add_slide(prs.slide_layouts[0])
-    title = slide.shapes.title
-    subtitle = slide.placeholders[1]
-    
-    title.text = "SDV 기술 심화 분석"
-    subtitle.text = "Architecture, API, Implementation Details"
+    add_placeholder_slide(prs, 0, "SDV 기술 심화 분석", subtitle="Architecture, API, Implementation Details")
     
     # Technical Architecture
     bullets = [
@@ -533,19 +468,28 @@ def create_technical_deep_dive():
     # Save presentation
     return prs
 
-def main():
-    print("Creating comprehensive SDV presentations...")
+def build(output_dir="."):
+    """Build both decks into output_dir and return the written paths"""
+    paths = []
     
     # Create main comprehensive presentation
     comprehensive_prs = create_comprehensive_sdv_presentation()
-    comprehensive_prs.save("SDV_종합분석_보고서.pptx")
+    paths.append(os.path.join(output_dir, "SDV_종합분석_보고서.pptx"))
+    save_presentation(comprehensive_prs, paths[-1])
     print("Created: SDV_종합분석_보고서.pptx")
     
     # Create technical deep dive
     technical_prs = create_technical_deep_dive()
-    technical_prs.save("SDV_기술심화_분석.pptx")
+    paths.append(os.path.join(output_dir, "SDV_기술심화_분석.pptx"))
+    save_presentation(technical_prs, paths[-1])
     print("Created: SDV_기술심화_분석.pptx")
     
+    return paths
+
+def main():
+    print("Creating comprehensive SDV presentations...")
+    build()
+    
     print("\nAll presentations created successfully!")
 
 if __name__ == "__main__":
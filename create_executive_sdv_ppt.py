@@ -1,19 +1,25 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-from pptx import Presentation
 from pptx.util import Inches, Pt, Cm
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR, MSO_AUTO_SIZE
 from pptx.dml.color import RGBColor
 from pptx.enum.shapes import MSO_SHAPE
-from pptx.chart.data import CategoryChartData
 from pptx.enum.chart import XL_CHART_TYPE
-import datetime
+import os
+from sdv_components import COMPONENTS
+from sdv_data import build_datetime
+from sdv_market_data import MARKET, percent
+from sdv_package import save_presentation
+from sdv_template import new_presentation
+from sdv_profiler import profile_slide_methods
+from sdv_slides import (TextStyle, WHITE, add_box, add_chart, add_line, add_paragraph, add_text, rgb,
+                        write_bullets, write_text)
 
+@profile_slide_methods
 class ProfessionalSDVPresentation:
     def __init__(self):
-        self.prs = Presentation()
-        self.setup_presentation()
+        self.prs = new_presentation("corporate")
         
         # Color scheme
         self.primary_color = RGBColor(0, 51, 102)      # Dark blue
@@ -22,28 +28,53 @@ class ProfessionalSDVPresentation:
         self.text_color = RGBColor(51, 51, 51)         # Dark gray
         self.light_gray = RGBColor(89, 89, 89)         # Light gray
         
-    def setup_presentation(self):
-        """Set up 16:9 presentation format"""
-        self.prs.slide_width = Inches(13.333)
-        self.prs.slide_height = Inches(7.5)
+        # Paragraph styles shared by the slide helpers
+        self.styles = {
+            'cover_title': TextStyle(size=48, bold=True, color=self.primary_color, align=PP_ALIGN.CENTER),
+            'cover_tagline': TextStyle(size=36, color=self.secondary_color, align=PP_ALIGN.CENTER),
+            'cover_subtitle': TextStyle(size=24, color=self.light_gray, align=PP_ALIGN.CENTER),
+            'cover_date': TextStyle(size=18, color=self.light_gray, align=PP_ALIGN.CENTER),
+            'slide_title': TextStyle(size=32, bold=True, color=self.primary_color),
+            'badge': TextStyle(size=16, bold=True, color=WHITE, align=PP_ALIGN.CENTER),
+            'item_title': TextStyle(size=18, bold=True, color=self.primary_color),
+            'item_desc': TextStyle(size=14, color=self.light_gray),
+            'icon': TextStyle(size=36, align=PP_ALIGN.CENTER),
+            'card_title': TextStyle(size=20, bold=True, color=self.primary_color, align=PP_ALIGN.CENTER),
+            'card_text': TextStyle(size=14, color=self.text_color, align=PP_ALIGN.CENTER),
+            'insight': TextStyle(size=16, bold=True, color=self.accent_color, align=PP_ALIGN.CENTER),
+            'phase_year': TextStyle(size=14, bold=True, color=WHITE, align=PP_ALIGN.CENTER),
+            'phase_title': TextStyle(size=18, bold=True, color=self.primary_color, align=PP_ALIGN.CENTER),
+            'phase_item': TextStyle(size=12, color=self.text_color, align=PP_ALIGN.LEFT),
+            'level': TextStyle(size=12, bold=True, color=WHITE, align=PP_ALIGN.CENTER),
+            'timeline': TextStyle(size=14, bold=True, color=self.primary_color),
+            'action': TextStyle(size=12, color=self.text_color),
+            'closing': TextStyle(size=48, bold=True, color=WHITE, align=PP_ALIGN.CENTER),
+            'closing_sub': TextStyle(size=32, color=self.accent_color, align=PP_ALIGN.CENTER),
+            'cta': TextStyle(size=24, italic=True, color=WHITE, align=PP_ALIGN.CENTER),
+            'layer_name': TextStyle(size=16, bold=True, color=WHITE, align=PP_ALIGN.CENTER),
+            'layer_desc': TextStyle(size=14, color=self.text_color),
+            'matrix_header': TextStyle(size=14, bold=True, color=WHITE, align=PP_ALIGN.CENTER),
+            'matrix_label': TextStyle(size=12, bold=True, align=PP_ALIGN.CENTER),
+            'legend': TextStyle(size=12, color=self.light_gray, align=PP_ALIGN.CENTER),
+        }
+        
+        # Rating cell styles by number of dots
+        rating = TextStyle(size=16, align=PP_ALIGN.CENTER)
+        low = rating.derive(color=rgb(255, 100, 0))
+        self.rating_styles = {
+            0: low, 1: low, 2: low,
+            3: rating.derive(color=rgb(255, 192, 0)),
+            4: rating.derive(color=rgb(100, 150, 0)),
+            5: rating.derive(color=rgb(0, 128, 0)),
+        }
         
     def add_cover_slide(self):
         """Add professional cover slide"""
         slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])  # Blank
         
-        # Background gradient effect
-        left = top = 0
-        width = self.prs.slide_width
-        height = self.prs.slide_height
-        
-        # Add colored rectangle for header
-        header_shape = slide.shapes.add_shape(
-            MSO_SHAPE.RECTANGLE,
-            0, 0, width, Inches(1.5)
-        )
-        header_shape.fill.solid()
-        header_shape.fill.fore_color.rgb = self.primary_color
-        header_shape.line.fill.background()
+        # Colored rectangle for header
+        add_box(slide, MSO_SHAPE.RECTANGLE, 0, 0, self.prs.slide_width, Inches(1.5),
+                fill=self.primary_color, no_line=True)
         
         # Main title
         title_box = slide.shapes.add_textbox(
@@ -52,45 +83,17 @@ class ProfessionalSDVPresentation:
         )
         title_frame = title_box.text_frame
         title_frame.clear()
-        
-        p = title_frame.paragraphs[0]
-        p.text = "Software-Defined Vehicle (SDV)"
-        p.font.size = Pt(48)
-        p.font.bold = True
-        p.font.color.rgb = self.primary_color
-        p.alignment = PP_ALIGN.CENTER
-        
-        p = title_frame.add_paragraph()
-        p.text = "글로벌 표준화 동향 및 한국 대응 전략"
-        p.font.size = Pt(36)
-        p.font.color.rgb = self.secondary_color
-        p.alignment = PP_ALIGN.CENTER
+        write_text(title_frame, "Software-Defined Vehicle (SDV)", self.styles['cover_title'])
+        add_paragraph(title_frame, "글로벌 표준화 동향 및 한국 대응 전략", self.styles['cover_tagline'])
         
         # Subtitle
-        subtitle_box = slide.shapes.add_textbox(
-            Inches(1), Inches(4.5),
-            Inches(11.333), Inches(1.5)
-        )
-        subtitle_frame = subtitle_box.text_frame
-        
-        p = subtitle_frame.paragraphs[0]
-        p.text = "중국 SDV 표준 심층 분석 | AUTOSAR 비교 | 실행 로드맵"
-        p.font.size = Pt(24)
-        p.font.color.rgb = self.light_gray
-        p.alignment = PP_ALIGN.CENTER
+        add_text(slide, Inches(1), Inches(4.5), Inches(11.333), Inches(1.5),
+                 "중국 SDV 표준 심층 분석 | AUTOSAR 비교 | 실행 로드맵", self.styles['cover_subtitle'])
         
         # Date and version
-        date_box = slide.shapes.add_textbox(
-            Inches(1), Inches(6.5),
-            Inches(11.333), Inches(0.5)
-        )
-        date_frame = date_box.text_frame
-        
-        p = date_frame.paragraphs[0]
-        p.text = f"{datetime.datetime.now().strftime('%Y년 %m월 %d일')} | Executive Briefing v2.0"
-        p.font.size = Pt(18)
-        p.font.color.rgb = self.light_gray
-        p.alignment = PP_ALIGN.CENTER
+        add_text(slide, Inches(1), Inches(6.5), Inches(11.333), Inches(0.5),
+                 f"{build_datetime().strftime('%Y년 %m월 %d일')} | Executive Briefing v2.0",
+                 self.styles['cover_date'])
         
         return slide
     
@@ -116,68 +119,25 @@ class ProfessionalSDVPresentation:
             y_pos = y_start + i * Inches(0.8)
             
             # Number circle
-            circle = slide.shapes.add_shape(
-                MSO_SHAPE.OVAL,
-                Inches(1), y_pos,
-                Inches(0.6), Inches(0.6)
-            )
-            circle.fill.solid()
-            circle.fill.fore_color.rgb = self.secondary_color
-            
-            text_frame = circle.text_frame
-            text_frame.clear()
-            p = text_frame.paragraphs[0]
-            p.text = num
-            p.font.size = Pt(16)
-            p.font.bold = True
-            p.font.color.rgb = RGBColor(255, 255, 255)
-            p.alignment = PP_ALIGN.CENTER
+            circle = add_box(slide, MSO_SHAPE.OVAL, Inches(1), y_pos, Inches(0.6), Inches(0.6),
+                             fill=self.secondary_color)
+            circle.text_frame.clear()
+            write_text(circle.text_frame, num, self.styles['badge'])
             
-            # Title
-            title_box = slide.shapes.add_textbox(
-                Inches(2), y_pos,
-                Inches(4), Inches(0.6)
-            )
-            text_frame = title_box.text_frame
-            p = text_frame.paragraphs[0]
-            p.text = title
-            p.font.size = Pt(18)
-            p.font.bold = True
-            p.font.color.rgb = self.primary_color
-            
-            # Description
-            desc_box = slide.shapes.add_textbox(
-                Inches(6.5), y_pos,
-                Inches(5.5), Inches(0.6)
-            )
-            text_frame = desc_box.text_frame
-            p = text_frame.paragraphs[0]
-            p.text = desc
-            p.font.size = Pt(14)
-            p.font.color.rgb = self.light_gray
+            # Title and description
+            add_text(slide, Inches(2), y_pos, Inches(4), Inches(0.6), title, self.styles['item_title'])
+            add_text(slide, Inches(6.5), y_pos, Inches(5.5), Inches(0.6), desc, self.styles['item_desc'])
             
         return slide
     
     def add_slide_title(self, slide, title_text):
         """Add consistent slide title"""
-        title_box = slide.shapes.add_textbox(
-            Inches(0.5), Inches(0.3),
-            Inches(12.333), Inches(0.8)
-        )
-        text_frame = title_box.text_frame
-        p = text_frame.paragraphs[0]
-        p.text = title_text
-        p.font.size = Pt(32)
-        p.font.bold = True
-        p.font.color.rgb = self.primary_color
+        add_text(slide, Inches(0.5), Inches(0.3), Inches(12.333), Inches(0.8),
+                 title_text, self.styles['slide_title'])
         
         # Add underline
-        line = slide.shapes.add_connector(
-            1, Inches(0.5), Inches(1.1),
-            Inches(12.833), Inches(1.1)
-        )
-        line.line.color.rgb = self.secondary_color
-        line.line.width = Pt(2)
+        add_line(slide, Inches(0.5), Inches(1.1), Inches(12.833), Inches(1.1),
+                 color=self.secondary_color, width=Pt(2))
         
     def add_key_message_slide(self):
         """Add key message slide with visual impact"""
@@ -211,50 +171,16 @@ class ProfessionalSDVPresentation:
             x_pos = x_start + i * (box_width + Inches(0.3))
             
             # Message box
-            box = slide.shapes.add_shape(
-                MSO_SHAPE.ROUNDED_RECTANGLE,
-                x_pos, y_pos,
-                box_width, Inches(3)
-            )
-            box.fill.solid()
-            box.fill.fore_color.rgb = RGBColor(240, 240, 240)
-            
-            # Icon (using text)
-            icon_box = slide.shapes.add_textbox(
-                x_pos, y_pos + Inches(0.3),
-                box_width, Inches(0.8)
-            )
-            text_frame = icon_box.text_frame
-            p = text_frame.paragraphs[0]
-            p.text = msg["icon"]
-            p.font.size = Pt(36)
-            p.alignment = PP_ALIGN.CENTER
+            add_box(slide, MSO_SHAPE.ROUNDED_RECTANGLE, x_pos, y_pos, box_width, Inches(3),
+                    fill=rgb(240, 240, 240))
             
-            # Title
-            title_box = slide.shapes.add_textbox(
-                x_pos + Inches(0.2), y_pos + Inches(1.2),
-                box_width - Inches(0.4), Inches(0.6)
-            )
-            text_frame = title_box.text_frame
-            p = text_frame.paragraphs[0]
-            p.text = msg["title"]
-            p.font.size = Pt(20)
-            p.font.bold = True
-            p.font.color.rgb = self.primary_color
-            p.alignment = PP_ALIGN.CENTER
-            
-            # Message
-            msg_box = slide.shapes.add_textbox(
-                x_pos + Inches(0.2), y_pos + Inches(1.8),
-                box_width - Inches(0.4), Inches(1)
-            )
-            text_frame = msg_box.text_frame
-            text_frame.word_wrap = True
-            p = text_frame.paragraphs[0]
-            p.text = msg["message"]
-            p.font.size = Pt(14)
-            p.font.color.rgb = self.text_color
-            p.alignment = PP_ALIGN.CENTER
+            # Icon (using text), title and message
+            add_text(slide, x_pos, y_pos + Inches(0.3), box_width, Inches(0.8),
+                     msg["icon"], self.styles['icon'])
+            add_text(slide, x_pos + Inches(0.2), y_pos + Inches(1.2), box_width - Inches(0.4), Inches(0.6),
+                     msg["title"], self.styles['card_title'])
+            add_text(slide, x_pos + Inches(0.2), y_pos + Inches(1.8), box_width - Inches(0.4), Inches(1),
+                     msg["message"], self.styles['card_text'], word_wrap=True)
             
         return slide
     
@@ -265,32 +191,19 @@ class ProfessionalSDVPresentation:
         self.add_slide_title(slide, "SDV 시장 성장 전망")
         
         # Add chart
-        x, y, cx, cy = Inches(1), Inches(1.5), Inches(11), Inches(5)
-        
-        chart_data = CategoryChartData()
-        chart_data.categories = ['2024', '2025', '2026', '2027', '2028', '2029', '2030']
-        chart_data.add_series('시장 규모 (억 달러)', (650, 980, 1420, 1800, 2200, 2800, 3500))
-        chart_data.add_series('SDV 차량 (백만대)', (20, 45, 75, 120, 180, 240, 300))
-        
-        chart = slide.shapes.add_chart(
-            XL_CHART_TYPE.COLUMN_CLUSTERED, x, y, cx, cy, chart_data
-        ).chart
-        
-        chart.has_title = True
-        chart.chart_title.text_frame.text = "SDV 시장 규모 및 차량 대수 전망"
+        market = MARKET.query("market_growth")
+        series = [('시장 규모 (억 달러)', market["market_eok_usd"]),
+                  ('SDV 차량 (백만대)', market["sdv_vehicles_m"])]
+        add_chart(slide, XL_CHART_TYPE.COLUMN_CLUSTERED, market["categories"], series,
+                  Inches(1), Inches(1.5), Inches(11), Inches(5),
+                  legend=None, title="SDV 시장 규모 및 차량 대수 전망")
         
         # Add key insights
-        insights_box = slide.shapes.add_textbox(
-            Inches(1), Inches(6.5),
-            Inches(11), Inches(0.8)
-        )
-        text_frame = insights_box.text_frame
-        p = text_frame.paragraphs[0]
-        p.text = "💡 Key Insight: CAGR 32% 성장 | 2030년 3,500억 달러 규모 | 소프트웨어 가치 비중 60% 도달"
-        p.font.size = Pt(16)
-        p.font.bold = True
-        p.font.color.rgb = self.accent_color
-        p.alignment = PP_ALIGN.CENTER
+        add_text(slide, Inches(1), Inches(6.5), Inches(11), Inches(0.8),
+                 f"💡 Key Insight: CAGR {percent(market['market_cagr'])} 성장 | "
+                 f"{market['categories'][-1]}년 {market['market_eok_usd'][-1]:,}억 달러 규모 | "
+                 f"소프트웨어 가치 비중 {market['sw_share_pct'][-1]}% 도달",
+                 self.styles['insight'])
         
         return slide
     
@@ -316,34 +229,12 @@ class ProfessionalSDVPresentation:
             y_pos = y_start + i * layer_height
             
             # Layer box
-            box = slide.shapes.add_shape(
-                MSO_SHAPE.RECTANGLE,
-                Inches(1), y_pos,
-                Inches(6), layer_height - Inches(0.1)
-            )
-            box.fill.solid()
-            box.fill.fore_color.rgb = color
-            
-            # Layer name
-            text_frame = box.text_frame
-            text_frame.clear()
-            p = text_frame.paragraphs[0]
-            p.text = name
-            p.font.size = Pt(16)
-            p.font.bold = True
-            p.font.color.rgb = RGBColor(255, 255, 255)
-            p.alignment = PP_ALIGN.CENTER
+            COMPONENTS.box(slide, MSO_SHAPE.RECTANGLE, Inches(1), y_pos, Inches(6), layer_height - Inches(0.1),
+                           fill=color, text=name, style=self.styles['layer_name'])
             
             # Description
-            desc_box = slide.shapes.add_textbox(
-                Inches(7.5), y_pos,
-                Inches(5), layer_height - Inches(0.1)
-            )
-            text_frame = desc_box.text_frame
-            p = text_frame.paragraphs[0]
-            p.text = desc
-            p.font.size = Pt(14)
-            p.font.color.rgb = self.text_color
+            COMPONENTS.text(slide, Inches(7.5), y_pos, Inches(5), layer_height - Inches(0.1),
+                            desc, self.styles['layer_desc'])
             
         return slide
     
@@ -374,77 +265,28 @@ class ProfessionalSDVPresentation:
         
         # Header row
         for i, header in enumerate(data["headers"]):
-            x = left + i * cell_width
-            
-            box = slide.shapes.add_shape(
-                MSO_SHAPE.RECTANGLE,
-                x, top, cell_width - Inches(0.05), cell_height
-            )
-            box.fill.solid()
-            box.fill.fore_color.rgb = self.primary_color
-            
-            text_frame = box.text_frame
-            text_frame.clear()
-            p = text_frame.paragraphs[0]
-            p.text = header
-            p.font.size = Pt(14)
-            p.font.bold = True
-            p.font.color.rgb = RGBColor(255, 255, 255)
-            p.alignment = PP_ALIGN.CENTER
+            COMPONENTS.box(slide, MSO_SHAPE.RECTANGLE, left + i * cell_width, top, cell_width - Inches(0.05), cell_height,
+                           fill=self.primary_color, text=header, style=self.styles['matrix_header'])
             
         # Data rows
         for row_idx, row_data in enumerate(data["rows"]):
             y = top + (row_idx + 1) * cell_height
+            # Alternating colors
+            fill = rgb(245, 245, 245) if row_idx % 2 == 0 else WHITE
             
             for col_idx, cell_text in enumerate(row_data):
-                x = left + col_idx * cell_width
-                
-                box = slide.shapes.add_shape(
-                    MSO_SHAPE.RECTANGLE,
-                    x, y, cell_width - Inches(0.05), cell_height
-                )
-                
-                # Alternating colors
-                if row_idx % 2 == 0:
-                    box.fill.solid()
-                    box.fill.fore_color.rgb = RGBColor(245, 245, 245)
-                else:
-                    box.fill.solid()
-                    box.fill.fore_color.rgb = RGBColor(255, 255, 255)
-                
-                text_frame = box.text_frame
-                text_frame.clear()
-                p = text_frame.paragraphs[0]
-                p.text = cell_text
-                
                 if col_idx == 0:
-                    p.font.bold = True
-                    p.font.size = Pt(12)
+                    style = self.styles['matrix_label']
                 else:
-                    p.font.size = Pt(16)
                     # Color dots based on rating
-                    if "●●●●●" in cell_text:
-                        p.font.color.rgb = RGBColor(0, 128, 0)
-                    elif "●●●●" in cell_text:
-                        p.font.color.rgb = RGBColor(100, 150, 0)
-                    elif "●●●" in cell_text:
-                        p.font.color.rgb = RGBColor(255, 192, 0)
-                    else:
-                        p.font.color.rgb = RGBColor(255, 100, 0)
-                
-                p.alignment = PP_ALIGN.CENTER
+                    style = self.rating_styles[min(cell_text.count("●"), 5)]
+                COMPONENTS.box(slide, MSO_SHAPE.RECTANGLE, left + col_idx * cell_width, y,
+                               cell_width - Inches(0.05), cell_height,
+                               fill=fill, text=cell_text, style=style)
         
         # Legend
-        legend_box = slide.shapes.add_textbox(
-            Inches(1), Inches(6.5),
-            Inches(11), Inches(0.5)
-        )
-        text_frame = legend_box.text_frame
-        p = text_frame.paragraphs[0]
-        p.text = "● = 낮음  ●●● = 보통  ●●●●● = 높음"
-        p.font.size = Pt(12)
-        p.font.color.rgb = self.light_gray
-        p.alignment = PP_ALIGN.CENTER
+        add_text(slide, Inches(1), Inches(6.5), Inches(11), Inches(0.5),
+                 "● = 낮음  ●●● = 보통  ●●●●● = 높음", self.styles['legend'])
         
         return slide
     
@@ -455,13 +297,8 @@ class ProfessionalSDVPresentation:
         self.add_slide_title(slide, "한국 SDV 대응 로드맵")
         
         # Timeline arrow
-        arrow = slide.shapes.add_shape(
-            MSO_SHAPE.RIGHT_ARROW,
-            Inches(1), Inches(3.5),
-            Inches(11.5), Inches(0.5)
-        )
-        arrow.fill.solid()
-        arrow.fill.fore_color.rgb = self.secondary_color
+        add_box(slide, MSO_SHAPE.RIGHT_ARROW, Inches(1), Inches(3.5), Inches(11.5), Inches(0.5),
+                fill=self.secondary_color)
         
         # Phases
         phases = [
@@ -490,53 +327,18 @@ class ProfessionalSDVPresentation:
             x_pos = x_start + i * Inches(3.8)
             
             # Year box
-            year_box = slide.shapes.add_shape(
-                MSO_SHAPE.ROUNDED_RECTANGLE,
-                x_pos, Inches(1.8),
-                Inches(3.5), Inches(0.6)
-            )
-            year_box.fill.solid()
-            year_box.fill.fore_color.rgb = self.primary_color
-            
-            text_frame = year_box.text_frame
-            text_frame.clear()
-            p = text_frame.paragraphs[0]
-            p.text = phase_data["year"]
-            p.font.size = Pt(14)
-            p.font.bold = True
-            p.font.color.rgb = RGBColor(255, 255, 255)
-            p.alignment = PP_ALIGN.CENTER
+            year_box = add_box(slide, MSO_SHAPE.ROUNDED_RECTANGLE, x_pos, Inches(1.8), Inches(3.5), Inches(0.6),
+                               fill=self.primary_color)
+            year_box.text_frame.clear()
+            write_text(year_box.text_frame, phase_data["year"], self.styles['phase_year'])
             
             # Phase title
-            title_box = slide.shapes.add_textbox(
-                x_pos, Inches(2.5),
-                Inches(3.5), Inches(0.6)
-            )
-            text_frame = title_box.text_frame
-            p = text_frame.paragraphs[0]
-            p.text = phase_data["title"]
-            p.font.size = Pt(18)
-            p.font.bold = True
-            p.font.color.rgb = self.primary_color
-            p.alignment = PP_ALIGN.CENTER
+            add_text(slide, x_pos, Inches(2.5), Inches(3.5), Inches(0.6),
+                     phase_data["title"], self.styles['phase_title'])
             
             # Items
-            items_box = slide.shapes.add_textbox(
-                x_pos, Inches(4.5),
-                Inches(3.5), Inches(2)
-            )
-            text_frame = items_box.text_frame
-            text_frame.clear()
-            
-            for j, item in enumerate(phase_data["items"]):
-                if j == 0:
-                    p = text_frame.paragraphs[0]
-                else:
-                    p = text_frame.add_paragraph()
-                p.text = f"• {item}"
-                p.font.size = Pt(12)
-                p.font.color.rgb = self.text_color
-                p.alignment = PP_ALIGN.LEFT
+            items_box = slide.shapes.add_textbox(x_pos, Inches(4.5), Inches(3.5), Inches(2))
+            write_bullets(items_box.text_frame, phase_data["items"], self.styles['phase_item'], prefix="• ")
         
         return slide
     
@@ -586,46 +388,16 @@ class ProfessionalSDVPresentation:
             y_pos = y_start + i * Inches(1.8)
             
             # Urgency indicator
-            indicator = slide.shapes.add_shape(
-                MSO_SHAPE.RECTANGLE,
-                Inches(1), y_pos,
-                Inches(1.5), Inches(0.5)
-            )
-            indicator.fill.solid()
-            indicator.fill.fore_color.rgb = level_data["color"]
-            
-            text_frame = indicator.text_frame
-            text_frame.clear()
-            p = text_frame.paragraphs[0]
-            p.text = level_data["level"]
-            p.font.size = Pt(12)
-            p.font.bold = True
-            p.font.color.rgb = RGBColor(255, 255, 255)
-            p.alignment = PP_ALIGN.CENTER
+            indicator = add_box(slide, MSO_SHAPE.RECTANGLE, Inches(1), y_pos, Inches(1.5), Inches(0.5),
+                                fill=level_data["color"])
+            indicator.text_frame.clear()
+            write_text(indicator.text_frame, level_data["level"], self.styles['level'])
             
-            # Timeline
-            timeline_box = slide.shapes.add_textbox(
-                Inches(2.8), y_pos,
-                Inches(1.5), Inches(0.5)
-            )
-            text_frame = timeline_box.text_frame
-            p = text_frame.paragraphs[0]
-            p.text = level_data["timeline"]
-            p.font.size = Pt(14)
-            p.font.bold = True
-            p.font.color.rgb = self.primary_color
-            
-            # Items
-            items_text = " | ".join(level_data["items"])
-            items_box = slide.shapes.add_textbox(
-                Inches(4.5), y_pos,
-                Inches(7.5), Inches(0.5)
-            )
-            text_frame = items_box.text_frame
-            p = text_frame.paragraphs[0]
-            p.text = items_text
-            p.font.size = Pt(12)
-            p.font.color.rgb = self.text_color
+            # Timeline and items
+            add_text(slide, Inches(2.8), y_pos, Inches(1.5), Inches(0.5),
+                     level_data["timeline"], self.styles['timeline'])
+            add_text(slide, Inches(4.5), y_pos, Inches(7.5), Inches(0.5),
+                     " | ".join(level_data["items"]), self.styles['action'])
         
         return slide
     
@@ -634,46 +406,17 @@ class ProfessionalSDVPresentation:
         slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])
         
         # Background
-        bg = slide.shapes.add_shape(
-            MSO_SHAPE.RECTANGLE,
-            0, 0,
-            self.prs.slide_width, self.prs.slide_height
-        )
-        bg.fill.solid()
-        bg.fill.fore_color.rgb = self.primary_color
-        bg.line.fill.background()
+        add_box(slide, MSO_SHAPE.RECTANGLE, 0, 0, self.prs.slide_width, self.prs.slide_height,
+                fill=self.primary_color, no_line=True)
         
         # Main message
-        msg_box = slide.shapes.add_textbox(
-            Inches(1), Inches(2),
-            Inches(11.333), Inches(2)
-        )
-        text_frame = msg_box.text_frame
-        p = text_frame.paragraphs[0]
-        p.text = "The Future is Software-Defined"
-        p.font.size = Pt(48)
-        p.font.bold = True
-        p.font.color.rgb = RGBColor(255, 255, 255)
-        p.alignment = PP_ALIGN.CENTER
-        
-        p = text_frame.add_paragraph()
-        p.text = "\n지금이 SDV 시대의 리더가 될 기회입니다"
-        p.font.size = Pt(32)
-        p.font.color.rgb = self.accent_color
-        p.alignment = PP_ALIGN.CENTER
+        msg_box = add_text(slide, Inches(1), Inches(2), Inches(11.333), Inches(2),
+                           "The Future is Software-Defined", self.styles['closing'])
+        add_paragraph(msg_box.text_frame, "\n지금이 SDV 시대의 리더가 될 기회입니다", self.styles['closing_sub'])
         
         # Call to action
-        cta_box = slide.shapes.add_textbox(
-            Inches(1), Inches(5),
-            Inches(11.333), Inches(1)
-        )
-        text_frame = cta_box.text_frame
-        p = text_frame.paragraphs[0]
-        p.text = "Act Now or Be Left Behind"
-        p.font.size = Pt(24)
-        p.font.italic = True
-        p.font.color.rgb = RGBColor(255, 255, 255)
-        p.alignment = PP_ALIGN.CENTER
+        add_text(slide, Inches(1), Inches(5), Inches(11.333), Inches(1),
+                 "Act Now or Be Left Behind", self.styles['cta'])
         
         return slide
     
@@ -700,16 +443,21 @@ class ProfessionalSDVPresentation:
         
         return self.prs
 
-def main():
-    print("Creating executive SDV presentation...")
-    
+def build(output_dir="."):
+    """Build the deck into output_dir and return the written paths"""
     presentation = ProfessionalSDVPresentation()
     prs = presentation.create_presentation()
     
-    filename = "SDV_Executive_Presentation_Premium.pptx"
-    prs.save(filename)
+    path = os.path.join(output_dir, "SDV_Executive_Presentation_Premium.pptx")
+    save_presentation(prs, path)
+    return [path]
+
+def main():
+    print("Creating executive SDV presentation...")
+    
+    filename, = build()
     
-    print(f"✅ Successfully created: {filename}")
+    print(f"✅ Successfully created: {os.path.basename(filename)}")
     print("📊 Format: 16:9 Widescreen (13.333 x 7.5 inches)")
     print("📑 Professional design with visual elements")
     print("🎯 Executive-level content and formatting")
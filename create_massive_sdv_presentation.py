@@ -1,23 +1,46 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-from pptx import Presentation
-from pptx.util import Inches, Pt, Cm
+from pptx.util import Inches, Cm
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR, MSO_AUTO_SIZE
 from pptx.dml.color import RGBColor
 from pptx.enum.shapes import MSO_SHAPE
-from pptx.chart.data import CategoryChartData
-from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION
+from pptx.enum.chart import XL_CHART_TYPE
 import datetime
-import random
+import os
+from sdv_components import COMPONENTS
+from sdv_data import SeededDataProvider
+from sdv_layout import MASSIVE_ARCHITECTURE
+from sdv_market_data import MARKET, korean_won
+from sdv_package import save_presentation
+from sdv_template import new_presentation
+from sdv_profiler import profile_slide_methods
+from sdv_slides import TextStyle, WHITE, add_box, add_chart, add_table, add_text, write_bullets
+
+# Strategy parameters of the investment plan (see sdv_sweep.py for variant decks)
+BASE_YEAR = 2024
+STRATEGY_PARAMS = {
+    "investment_eok": 30000,        # 총 투자 규모 (억원)
+    "target_year": 2030,            # 투자 기간과 KPI 목표 연도
+    "annual_return_eok": 10000,     # 목표 연도 이후 연 수익 (억원)
+    "experts_target": 5000,         # SDV 전문인력 (명)
+    "patents_target": 500,          # 특허 출원 (건)
+    "partners_target": 30,          # 글로벌 파트너 (개)
+    "exports_target_eok": 10000,    # 수출 규모 (억원)
+}
+# 투자 분야별 배분 비율 (%)
+INVESTMENT_SPLIT = [("R&D", 40), ("인프라", 25), ("인력 양성", 20), ("국제 협력", 15)]
 
+@profile_slide_methods
 class MassiveSDVPresentation:
     """Create a massive, comprehensive SDV presentation"""
     
-    def __init__(self):
-        self.prs = Presentation()
-        self.setup_presentation()
+    def __init__(self, seed=None, params=None):
+        self.prs = new_presentation("corporate")
         self.slide_count = 0
+        self.current_section = 0
+        self.data = SeededDataProvider(seed)
+        self.params = dict(STRATEGY_PARAMS, **(params or {}))
         
         # Professional color palette
         self.colors = {
@@ -33,59 +56,48 @@ class MassiveSDVPresentation:
             'bg': RGBColor(242, 242, 242),       # Light bg
         }
         
-    def setup_presentation(self):
-        """Set up 16:9 widescreen format"""
-        self.prs.slide_width = Inches(13.333)
-        self.prs.slide_height = Inches(7.5)
+        # Paragraph styles shared by the slide helpers
+        self.styles = {
+            'section': TextStyle(size=18, color=self.colors['accent']),
+            'cover_title': TextStyle(size=44, bold=True, color=WHITE, align=PP_ALIGN.CENTER),
+            'cover_subtitle': TextStyle(size=24, color=self.colors['accent'], align=PP_ALIGN.CENTER),
+            'number': TextStyle(size=10, color=self.colors['light'], align=PP_ALIGN.RIGHT),
+            'bar_title': TextStyle(size=28, bold=True, color=WHITE),
+            'heading': TextStyle(size=24, bold=True, color=self.colors['primary']),
+            'body': TextStyle(size=16, color=self.colors['dark']),
+            'bullet': TextStyle(level=0, size=18, color=self.colors['dark'], space_after=12),
+            'bullet_main': TextStyle(level=0, size=18, bold=True, color=self.colors['primary'], space_after=6),
+            'bullet_sub': TextStyle(level=1, size=16, color=self.colors['medium'], space_after=4),
+            'table_header': TextStyle(size=14, bold=True, color=WHITE, align=PP_ALIGN.CENTER),
+            'table_cell': TextStyle(size=12, color=self.colors['dark'], align=PP_ALIGN.LEFT),
+            'layer': TextStyle(size=14, bold=True, color=WHITE, align=PP_ALIGN.CENTER),
+            'layer_components': TextStyle(size=11, color=self.colors['dark']),
+        }
         
     def add_title_slide(self, main_title, subtitle, section=None):
         """Add a professional title slide"""
         slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])
         self.slide_count += 1
+        if section is not None:
+            self.current_section = section
         
         # Background
-        bg = slide.shapes.add_shape(
-            MSO_SHAPE.RECTANGLE, 0, 0,
-            self.prs.slide_width, self.prs.slide_height
-        )
-        bg.fill.solid()
-        bg.fill.fore_color.rgb = self.colors['primary']
-        bg.line.fill.background()
+        add_box(slide, MSO_SHAPE.RECTANGLE, 0, 0, self.prs.slide_width, self.prs.slide_height,
+                fill=self.colors['primary'], no_line=True)
         
         # Section number if provided
         if section:
-            section_box = slide.shapes.add_textbox(
-                Inches(0.5), Inches(0.5), Inches(2), Inches(1)
-            )
-            text_frame = section_box.text_frame
-            p = text_frame.paragraphs[0]
-            p.text = f"Section {section}"
-            p.font.size = Pt(18)
-            p.font.color.rgb = self.colors['accent']
+            add_text(slide, Inches(0.5), Inches(0.5), Inches(2), Inches(1),
+                     f"Section {section}", self.styles['section'])
             
         # Main title
-        title_box = slide.shapes.add_textbox(
-            Inches(1), Inches(2.5), Inches(11.333), Inches(2)
-        )
-        text_frame = title_box.text_frame
-        p = text_frame.paragraphs[0]
-        p.text = main_title
-        p.font.size = Pt(44)
-        p.font.bold = True
-        p.font.color.rgb = RGBColor(255, 255, 255)
-        p.alignment = PP_ALIGN.CENTER
+        add_text(slide, Inches(1), Inches(2.5), Inches(11.333), Inches(2),
+                 main_title, self.styles['cover_title'])
         
         # Subtitle
         if subtitle:
-            subtitle_box = slide.shapes.add_textbox(
-                Inches(1), Inches(4.5), Inches(11.333), Inches(1.5)
-            )
-            text_frame = subtitle_box.text_frame
-            p = text_frame.paragraphs[0]
-            p.text = subtitle
-            p.font.size = Pt(24)
-            p.font.color.rgb = self.colors['accent']
-            p.alignment = PP_ALIGN.CENTER
+            add_text(slide, Inches(1), Inches(4.5), Inches(11.333), Inches(1.5),
+                     subtitle, self.styles['cover_subtitle'])
             
         # Slide number
         self.add_slide_number(slide)
@@ -94,15 +106,13 @@ class MassiveSDVPresentation:
     
     def add_slide_number(self, slide):
         """Add slide number to bottom right"""
-        number_box = slide.shapes.add_textbox(
-            Inches(12), Inches(7), Inches(1), Inches(0.5)
-        )
-        text_frame = number_box.text_frame
-        p = text_frame.paragraphs[0]
-        p.text = str(self.slide_count)
-        p.font.size = Pt(10)
-        p.font.color.rgb = self.colors['light']
-        p.alignment = PP_ALIGN.RIGHT
+        add_text(slide, Inches(12), Inches(7), Inches(1), Inches(0.5),
+                 str(self.slide_count), self.styles['number'])
+    
+    def add_slide_heading(self, slide, title):
+        """Add the navy heading used by table, chart and diagram slides"""
+        add_text(slide, Inches(0.5), Inches(0.3), Inches(12), Inches(0.7),
+                 title, self.styles['heading'])
     
     def add_content_slide(self, title, content=None, bullets=None):
         """Add content slide with various layouts"""
@@ -110,72 +120,25 @@ class MassiveSDVPresentation:
         self.slide_count += 1
         
         # Title bar
-        title_bar = slide.shapes.add_shape(
-            MSO_SHAPE.RECTANGLE,
-            0, 0, self.prs.slide_width, Inches(1)
-        )
-        title_bar.fill.solid()
-        title_bar.fill.fore_color.rgb = self.colors['secondary']
-        title_bar.line.fill.background()
+        add_box(slide, MSO_SHAPE.RECTANGLE, 0, 0, self.prs.slide_width, Inches(1),
+                fill=self.colors['secondary'], no_line=True)
         
         # Title text
-        title_box = slide.shapes.add_textbox(
-            Inches(0.5), Inches(0.2), Inches(12), Inches(0.6)
-        )
-        text_frame = title_box.text_frame
-        p = text_frame.paragraphs[0]
-        p.text = title
-        p.font.size = Pt(28)
-        p.font.bold = True
-        p.font.color.rgb = RGBColor(255, 255, 255)
+        add_text(slide, Inches(0.5), Inches(0.2), Inches(12), Inches(0.6),
+                 title, self.styles['bar_title'])
         
         # Content area
         if content:
-            content_box = slide.shapes.add_textbox(
-                Inches(0.5), Inches(1.5), Inches(12.333), Inches(5.5)
-            )
-            text_frame = content_box.text_frame
-            text_frame.word_wrap = True
-            p = text_frame.paragraphs[0]
-            p.text = content
-            p.font.size = Pt(16)
-            p.font.color.rgb = self.colors['dark']
+            add_text(slide, Inches(0.5), Inches(1.5), Inches(12.333), Inches(5.5),
+                     content, self.styles['body'], word_wrap=True)
             
         elif bullets:
             content_box = slide.shapes.add_textbox(
                 Inches(0.5), Inches(1.5), Inches(12.333), Inches(5.5)
             )
-            text_frame = content_box.text_frame
-            text_frame.clear()
-            
-            for i, bullet in enumerate(bullets):
-                if i == 0:
-                    p = text_frame.paragraphs[0]
-                else:
-                    p = text_frame.add_paragraph()
-                    
-                if isinstance(bullet, str):
-                    p.text = f"• {bullet}"
-                    p.level = 0
-                    p.font.size = Pt(18)
-                    p.font.color.rgb = self.colors['dark']
-                    p.space_after = Pt(12)
-                elif isinstance(bullet, dict):
-                    p.text = f"• {bullet['main']}"
-                    p.level = 0
-                    p.font.size = Pt(18)
-                    p.font.bold = True
-                    p.font.color.rgb = self.colors['primary']
-                    p.space_after = Pt(6)
-                    
-                    if 'sub' in bullet:
-                        for sub in bullet['sub']:
-                            p = text_frame.add_paragraph()
-                            p.text = f"- {sub}"
-                            p.level = 1
-                            p.font.size = Pt(16)
-                            p.font.color.rgb = self.colors['medium']
-                            p.space_after = Pt(4)
+            write_bullets(content_box.text_frame, bullets, self.styles['bullet'],
+                          self.styles['bullet_main'], self.styles['bullet_sub'],
+                          prefix="• ", sub_prefix="- ")
         
         self.add_slide_number(slide)
         return slide
@@ -185,59 +148,12 @@ class MassiveSDVPresentation:
         slide = self.prs.slides.add_slide(self.prs.slide_layouts[5])
         self.slide_count += 1
         
-        # Title
-        title_shape = slide.shapes.add_textbox(
-            Inches(0.5), Inches(0.3), Inches(12), Inches(0.7)
-        )
-        text_frame = title_shape.text_frame
-        p = text_frame.paragraphs[0]
-        p.text = title
-        p.font.size = Pt(24)
-        p.font.bold = True
-        p.font.color.rgb = self.colors['primary']
-        
-        # Table
-        rows = len(data) + 1
-        cols = len(headers)
-        left = Inches(0.5)
-        top = Inches(1.2)
-        width = Inches(12.333)
-        height = Inches(5.8)
-        
-        table = slide.shapes.add_table(rows, cols, left, top, width, height).table
-        
-        # Set column widths
-        for i in range(cols):
-            table.columns[i].width = Inches(12.333 / cols)
-        
-        # Header row
-        for i, header in enumerate(headers):
-            cell = table.cell(0, i)
-            cell.text = header
-            cell.fill.solid()
-            cell.fill.fore_color.rgb = self.colors['primary']
-            
-            p = cell.text_frame.paragraphs[0]
-            p.font.size = Pt(14)
-            p.font.bold = True
-            p.font.color.rgb = RGBColor(255, 255, 255)
-            p.alignment = PP_ALIGN.CENTER
-        
-        # Data rows
-        for row_idx, row_data in enumerate(data):
-            for col_idx, cell_value in enumerate(row_data):
-                cell = table.cell(row_idx + 1, col_idx)
-                cell.text = str(cell_value)
-                
-                # Alternating row colors
-                if row_idx % 2 == 0:
-                    cell.fill.solid()
-                    cell.fill.fore_color.rgb = self.colors['bg']
-                
-                p = cell.text_frame.paragraphs[0]
-                p.font.size = Pt(12)
-                p.font.color.rgb = self.colors['dark']
-                p.alignment = PP_ALIGN.LEFT
+        self.add_slide_heading(slide, title)
+        
+        # Table with alternating row colors
+        add_table(slide, headers, data, Inches(0.5), Inches(1.2), Inches(12.333), Inches(5.8),
+                  self.colors['primary'], self.styles['table_header'], self.styles['table_cell'],
+                  stripe_fill=self.colors['bg'], column_width=Inches(12.333 / len(headers)))
         
         self.add_slide_number(slide)
         return slide
@@ -247,55 +163,40 @@ class MassiveSDVPresentation:
         slide = self.prs.slides.add_slide(self.prs.slide_layouts[5])
         self.slide_count += 1
         
-        # Title
-        title_shape = slide.shapes.add_textbox(
-            Inches(0.5), Inches(0.3), Inches(12), Inches(0.7)
-        )
-        text_frame = title_shape.text_frame
-        p = text_frame.paragraphs[0]
-        p.text = title
-        p.font.size = Pt(24)
-        p.font.bold = True
-        p.font.color.rgb = self.colors['primary']
+        self.add_slide_heading(slide, title)
         
         # Chart data
-        chart_data = CategoryChartData()
-        
         if chart_type == "market":
-            chart_data.categories = ['2024', '2025', '2026', '2027', '2028', '2029', '2030']
-            chart_data.add_series('시장 규모 (십억 달러)', (65, 98, 142, 180, 220, 280, 350))
-            chart_data.add_series('SDV 차량 (백만대)', (20, 45, 75, 120, 180, 240, 300))
-            chart_data.add_series('SW 비중 (%)', (30, 35, 40, 45, 50, 55, 60))
+            market = MARKET.query("market_growth")
+            categories = market["categories"]
+            series = [('시장 규모 (십억 달러)', market["market_usd_b"]),
+                      ('SDV 차량 (백만대)', market["sdv_vehicles_m"]),
+                      ('SW 비중 (%)', market["sw_share_pct"])]
             chart_type_enum = XL_CHART_TYPE.COLUMN_CLUSTERED
             
         elif chart_type == "comparison":
-            chart_data.categories = ['표준화 속도', '기술 성숙도', '글로벌 호환', '생태계', '정부 지원']
-            chart_data.add_series('중국', (90, 60, 40, 40, 95))
-            chart_data.add_series('AUTOSAR', (60, 90, 95, 95, 40))
-            chart_data.add_series('일본', (40, 80, 60, 60, 60))
+            categories = ['표준화 속도', '기술 성숙도', '글로벌 호환', '생태계', '정부 지원']
+            series = [('중국', (90, 60, 40, 40, 95)),
+                      ('AUTOSAR', (60, 90, 95, 95, 40)),
+                      ('일본', (40, 80, 60, 60, 60))]
             chart_type_enum = XL_CHART_TYPE.RADAR
             
         elif chart_type == "timeline":
-            chart_data.categories = ['Q1 2024', 'Q2 2024', 'Q3 2024', 'Q4 2024', 
-                                   'Q1 2025', 'Q2 2025', 'Q3 2025', 'Q4 2025']
-            chart_data.add_series('진행률 (%)', (10, 20, 35, 50, 65, 75, 85, 100))
+            categories = ['Q1 2024', 'Q2 2024', 'Q3 2024', 'Q4 2024',
+                          'Q1 2025', 'Q2 2025', 'Q3 2025', 'Q4 2025']
+            series = [('진행률 (%)', (10, 20, 35, 50, 65, 75, 85, 100))]
             chart_type_enum = XL_CHART_TYPE.LINE
             
         else:
-            chart_data.categories = ['A', 'B', 'C', 'D', 'E']
-            chart_data.add_series('Series 1', (random.randint(10, 100) for _ in range(5)))
-            chart_data.add_series('Series 2', (random.randint(10, 100) for _ in range(5)))
+            data = self.data.section(self.current_section).slide(title)
+            categories = ['A', 'B', 'C', 'D', 'E']
+            series = [('Series 1', data.series(5, 10, 100)),
+                      ('Series 2', data.series(5, 10, 100))]
             chart_type_enum = XL_CHART_TYPE.COLUMN_CLUSTERED
         
         # Add chart
-        x, y, cx, cy = Inches(1), Inches(1.5), Inches(11.333), Inches(5.5)
-        chart = slide.shapes.add_chart(
-            chart_type_enum, x, y, cx, cy, chart_data
-        ).chart
-        
-        chart.has_legend = True
-        chart.legend.position = XL_LEGEND_POSITION.BOTTOM
-        chart.has_title = False
+        add_chart(slide, chart_type_enum, categories, series,
+                  Inches(1), Inches(1.5), Inches(11.333), Inches(5.5), title=False)
         
         self.add_slide_number(slide)
         return slide
@@ -305,16 +206,7 @@ class MassiveSDVPresentation:
         slide = self.prs.slides.add_slide(self.prs.slide_layouts[5])
         self.slide_count += 1
         
-        # Title
-        title_shape = slide.shapes.add_textbox(
-            Inches(0.5), Inches(0.3), Inches(12), Inches(0.7)
-        )
-        text_frame = title_shape.text_frame
-        p = text_frame.paragraphs[0]
-        p.text = title
-        p.font.size = Pt(24)
-        p.font.bold = True
-        p.font.color.rgb = self.colors['primary']
+        self.add_slide_heading(slide, title)
         
         # Architecture layers
         layers = [
@@ -344,42 +236,15 @@ class MassiveSDVPresentation:
             ])
         ]
         
-        y_start = Inches(1.3)
-        layer_height = Inches(0.95)
+        layout = MASSIVE_ARCHITECTURE.place_for(self.prs)
         
-        for i, (name, color, components) in enumerate(layers):
-            y_pos = y_start + i * layer_height
-            
+        for (name, color, components), layer, row in zip(layers, layout['layers'], layout['components']):
             # Layer box
-            layer_box = slide.shapes.add_shape(
-                MSO_SHAPE.ROUNDED_RECTANGLE,
-                Inches(0.5), y_pos,
-                Inches(3.5), layer_height - Inches(0.05)
-            )
-            layer_box.fill.solid()
-            layer_box.fill.fore_color.rgb = color
-            
-            # Layer name
-            text_frame = layer_box.text_frame
-            text_frame.clear()
-            p = text_frame.paragraphs[0]
-            p.text = name
-            p.font.size = Pt(14)
-            p.font.bold = True
-            p.font.color.rgb = RGBColor(255, 255, 255)
-            p.alignment = PP_ALIGN.CENTER
+            COMPONENTS.box(slide, MSO_SHAPE.ROUNDED_RECTANGLE, *layer.box,
+                           fill=color, text=name, style=self.styles['layer'])
             
             # Components
-            comp_text = " | ".join(components[:4]) + "..."
-            comp_box = slide.shapes.add_textbox(
-                Inches(4.2), y_pos + Inches(0.2),
-                Inches(8), layer_height - Inches(0.25)
-            )
-            text_frame = comp_box.text_frame
-            p = text_frame.paragraphs[0]
-            p.text = comp_text
-            p.font.size = Pt(11)
-            p.font.color.rgb = self.colors['dark']
+            COMPONENTS.text(slide, *row.box, " | ".join(components[:4]) + "...", self.styles['layer_components'])
             
         self.add_slide_number(slide)
         return slide
@@ -387,6 +252,9 @@ class MassiveSDVPresentation:
     def create_section_1_executive_summary(self):
         """Section 1: Executive Summary (10 slides)"""
         slides = []
+        params = self.params
+        investment = params["investment_eok"]
+        years = params["target_year"] - BASE_YEAR + 1
         
         # Section title
         slides.append(self.add_title_slide(
@@ -439,7 +307,7 @@ class MassiveSDVPresentation:
    • 산학연 협력 체계 구축
 
 4. 대규모 투자 불가피
-   • 최소 3조원 규모 투자 필요
+   • 최소 """ + korean_won(investment) + """ 규모 투자 필요
    • R&D, 인프라, 인력 동시 투자
    • 정부-민간 공동 투자"""
         ))
@@ -469,27 +337,25 @@ class MassiveSDVPresentation:
         slides.append(self.add_content_slide(
             "투자 개요",
             bullets=[
-                "총 투자 규모: 3조원 (2024-2030)",
-                "연평균 투자: 4,300억원",
+                f"총 투자 규모: {korean_won(investment)} ({BASE_YEAR}-{params['target_year']})",
+                f"연평균 투자: {korean_won(round(investment / years, -2))}",
                 {"main": "투자 분야별 배분", "sub": [
-                    "R&D: 1.2조원 (40%)",
-                    "인프라: 7,500억원 (25%)",
-                    "인력 양성: 6,000억원 (20%)",
-                    "국제 협력: 4,500억원 (15%)"
+                    f"{name}: {korean_won(investment * share / 100)} ({share}%)"
+                    for name, share in INVESTMENT_SPLIT
                 ]},
-                "ROI 예상: 2030년 이후 연 1조원 수익"
+                f"ROI 예상: {params['target_year']}년 이후 연 {korean_won(params['annual_return_eok'])} 수익"
             ]
         ))
         
         # Success metrics
         kpi_data = [
-            ["KPI", "2024", "2025", "2027", "2030"],
-            ["SDV 전문인력 (명)", "100", "500", "2,000", "5,000"],
-            ["특허 출원 (건)", "10", "50", "200", "500"],
+            ["KPI", "2024", "2025", "2027", str(params["target_year"])],
+            ["SDV 전문인력 (명)", "100", "500", "2,000", f"{params['experts_target']:,}"],
+            ["특허 출원 (건)", "10", "50", "200", f"{params['patents_target']:,}"],
             ["양산 차종 (개)", "0", "1", "5", "전체"],
-            ["글로벌 파트너 (개)", "1", "3", "10", "30"],
+            ["글로벌 파트너 (개)", "1", "3", "10", f"{params['partners_target']:,}"],
             ["표준 기여도", "참관", "참여", "주도", "리더"],
-            ["수출 규모 (억원)", "0", "0", "100", "10,000"]
+            ["수출 규모 (억원)", "0", "0", "100", f"{params['exports_target_eok']:,}"]
         ]
         slides.append(self.add_table_slide(
             "핵심 성과 지표 (KPI)",
@@ -539,19 +405,11 @@ class MassiveSDVPresentation:
         ))
         
         # Regional market share
-        regional_data = [
-            ["지역", "2024 시장규모($B)", "2030 예상($B)", "CAGR(%)", "점유율(2030)"],
-            ["중국", "20", "120", "35%", "34%"],
-            ["북미", "18", "95", "32%", "27%"],
-            ["유럽", "15", "80", "32%", "23%"],
-            ["일본", "7", "28", "26%", "8%"],
-            ["한국", "3", "15", "31%", "4%"],
-            ["기타", "2", "12", "35%", "4%"]
-        ]
+        regional_data = MARKET.query("regional_outlook")
         slides.append(self.add_table_slide(
             "지역별 SDV 시장 전망",
-            regional_data[0],
-            regional_data[1:]
+            regional_data["headers"],
+            regional_data["rows"]
         ))
         
         # OEM landscape
@@ -1811,18 +1669,22 @@ SNS:
         print(f"Created {self.slide_count} slides")
         return self.prs
 
+def build(output_dir="."):
+    """Build the deck into output_dir and return the written paths"""
+    presentation = MassiveSDVPresentation()
+    prs = presentation.create_presentation()
+    
+    path = os.path.join(output_dir, "SDV_Complete_Analysis_150_Slides.pptx")
+    save_presentation(prs, path)
+    return [path]
+
 def main():
     print("Creating MASSIVE SDV presentation...")
     print("This will take some time due to the large number of slides...")
     
-    presentation = MassiveSDVPresentation()
-    prs = presentation.create_presentation()
-    
-    filename = "SDV_Complete_Analysis_150_Slides.pptx"
-    prs.save(filename)
+    filename, = build()
     
-    print(f"\n✅ Successfully created: {filename}")
-    print(f"📊 Total slides: {presentation.slide_count}")
+    print(f"\n✅ Successfully created: {os.path.basename(filename)}")
     print(f"📦 Format: 16:9 Widescreen (13.333 x 7.5 inches)")
     print(f"🎯 Complete analysis with all sections")
     print(f"💾 File should be significantly larger now!")
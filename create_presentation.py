@@ -1,192 +1,270 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import PyPDF2
-from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
 import re
 import os
+from sdv_package import save_presentation
+from sdv_slides import add_placeholder_slide
+from sdv_template import new_presentation
+from sdv_translate import translate_document
+
+SOURCE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+KOREAN_PDF = "TalkFile_SDV 개념 및 중독일 표준화 동향_최동근작성.pdf.pdf"
+CHINESE_PDFS = [
+    ("SDV Intelligent Connected Vehicle Service Interface Specification Part 1 Atomic Service API Interface Version 4 Beta 1(중국어).pdf", "Part 1: Atomic Service API"),
+    ("SDV Intelligent Connected Vehicle Service Interface Specification Part 2 Device Abstraction API Interface Version 4 Beta 1(중국어).pdf", "Part 2: Device Abstraction API")
+]
+
+# (path, size, mtime) -> [page text]; a warm process (sdv_watch) parses each PDF once.
+# Kept when sdv_watch reloads this module after an edit.
+_pdf_text_cache = globals().get("_pdf_text_cache", {})
+
+def extract_pdf_pages(pdf_path):
+    """Text of every page of a PDF file, or None if it cannot be read"""
+    try:
+        stat = os.stat(pdf_path)
+        key = (os.path.abspath(pdf_path), stat.st_size, stat.st_mtime_ns)
+    except OSError:
+        key = None
+    if key in _pdf_text_cache:
+        return _pdf_text_cache[key]
+    pages = _read_pdf_pages(pdf_path)
+    if key is not None and pages is not None:
+        _pdf_text_cache[key] = pages
+    return pages
 
 def extract_pdf_text(pdf_path):
     """Extract text from PDF file"""
-    text = ""
+    pages = extract_pdf_pages(pdf_path)
+    if pages is None:
+        return None, 0
+    return "".join(page + "\n" for page in pages), len(pages)
+
+def _read_pdf_pages(pdf_path):
+    import PyPDF2  # PDF 파싱 시에만 로드 (시작 시간 단축)
+
     try:
         with open(pdf_path, 'rb') as file:
             pdf_reader = PyPDF2.PdfReader(file)
-            num_pages = len(pdf_reader.pages)
-            
-            for page_num in range(num_pages):
-                page = pdf_reader.pages[page_num]
-                text += page.extract_text() + "\n"
-                
-        return text, num_pages
+            return [page.extract_text() for page in pdf_reader.pages]
     except Exception as e:
         print(f"Error reading {pdf_path}: {str(e)}")
-        return None, 0
+        return None
+
+def split_sections(text, first_title):
+    """[{"title", "content": [lines]}] split at numbered (1. / IV.) headings"""
+    sections = []
+    
+    # Try to find major sections based on common patterns
+    lines = text.split('\n')
+    current_section = {"title": first_title, "content": []}
+    
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+            
+        # Look for numbered sections or major headings
+        if re.match(r'^\d+\.', line) or re.match(r'^[IVX]+\.', line):
+            if current_section["content"]:
+                sections.append(current_section)
+            current_section = {"title": line, "content": []}
+        else:
+            current_section["content"].append(line)
+    
+    if current_section["content"]:
+        sections.append(current_section)
+    return sections
+
+def korean_document(text, pages):
+    """Split the Korean document text into sections"""
+    return {
+        "title": "SDV 개념 및 중독일 표준화 동향",
+        "author": "최동근",
+        "pages": pages,
+        "sections": split_sections(text, "SDV 개념 및 표준화 동향")
+    }
 
 def parse_korean_pdf():
     """Parse the Korean SDV document"""
-    pdf_path = "TalkFile_SDV 개념 및 중독일 표준화 동향_최동근작성.pdf.pdf"
+    pdf_path = os.path.join(SOURCE_DIR, KOREAN_PDF)
     text, pages = extract_pdf_text(pdf_path)
     
     if text:
-        sections = []
-        
-        # Try to find major sections based on common patterns
-        lines = text.split('\n')
-        current_section = {"title": "SDV 개념 및 표준화 동향", "content": []}
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            # Look for numbered sections or major headings
-            if re.match(r'^\d+\.', line) or re.match(r'^[IVX]+\.', line):
-                if current_section["content"]:
-                    sections.append(current_section)
-                current_section = {"title": line, "content": []}
-            else:
-                current_section["content"].append(line)
-        
-        if current_section["content"]:
-            sections.append(current_section)
-            
-        return {
-            "title": "SDV 개념 및 중독일 표준화 동향",
-            "author": "최동근",
-            "pages": pages,
-            "sections": sections
-        }
+        return korean_document(text, pages)
     return None
 
+def chinese_document(pdf_file, title, text, pages):
+    """Catalog entry for one Chinese specification"""
+    # Extract what we can from the structure
+    doc = {
+        "title": title,
+        "pages": pages,
+        "content_preview": text[:500] if text else "Unable to extract content",
+        "full_title": pdf_file.replace("(중국어).pdf", "")
+    }
+    if text:
+        # 용어집 기반 오프라인 번역 (sdv_translate, 번역 메모리 재사용)
+        translation = translate_document(text)
+        doc["translated_preview"] = translation.preview(500)
+        doc["translation_coverage"] = translation.coverage
+    return doc
+
 def parse_chinese_pdfs():
     """Try to parse Chinese PDFs"""
     chinese_docs = []
     
-    pdf_files = [
-        ("SDV Intelligent Connected Vehicle Service Interface Specification Part 1 Atomic Service API Interface Version 4 Beta 1(중국어).pdf", "Part 1: Atomic Service API"),
-        ("SDV Intelligent Connected Vehicle Service Interface Specification Part 2 Device Abstraction API Interface Version 4 Beta 1(중국어).pdf", "Part 2: Device Abstraction API")
-    ]
-    
-    for pdf_file, title in pdf_files:
-        text, pages = extract_pdf_text(pdf_file)
+    for pdf_file, title in CHINESE_PDFS:
+        text, pages = extract_pdf_text(os.path.join(SOURCE_DIR, pdf_file))
         if text:
-            # Extract what we can from the structure
-            chinese_docs.append({
-                "title": title,
-                "pages": pages,
-                "content_preview": text[:500] if text else "Unable to extract content",
-                "full_title": pdf_file.replace("(중국어).pdf", "")
-            })
+            chinese_docs.append(chinese_document(pdf_file, title, text, pages))
     
     return chinese_docs
 
-def create_ppt_presentation(korean_data, chinese_data):
-    """Create PowerPoint presentation"""
-    prs = Presentation()
-    
-    # Title Slide
-    slide = prs.slides.add_slide(prs.slide_layouts[0])
-    title = slide.shapes.title
-    subtitle = slide.placeholders[1]
-    title.text = "SDV (Software-Defined Vehicle)"
-    subtitle.text = "개념 및 표준화 동향 분석\n중독일 표준 문서 리뷰"
-    
-    # Overview Slide
-    slide = prs.slides.add_slide(prs.slide_layouts[1])
-    title = slide.shapes.title
-    content = slide.placeholders[1]
-    title.text = "문서 개요"
-    
+TITLE_SLIDE = (0, "SDV (Software-Defined Vehicle)", "개념 및 표준화 동향 분석\n중독일 표준 문서 리뷰")
+CHINESE_SECTION_TITLE = "SDV Service Interface Specifications"
+SUMMARY_TEXT = """주요 내용:
+
+• SDV는 소프트웨어 중심의 차량 아키텍처
+• 중국, 독일, 일본의 표준화 동향 분석
+• Service Interface Specification 정의
+  - Part 1: Atomic Service API
+  - Part 2: Device Abstraction API
+• Version 4 Beta 1 사양 문서화"""
+
+def overview_text(korean_data, chinese_data):
+    """Body of the document overview slide"""
     overview_text = "포함된 문서:\n\n"
     overview_text += f"1. SDV 개념 및 중독일 표준화 동향 (작성: 최동근)\n"
-    overview_text += f"   - 총 {korean_data['pages']}페이지\n\n"
+    if korean_data:
+        overview_text += f"   - 총 {korean_data['pages']}페이지\n\n"
+    else:
+        overview_text += "   - 원문 PDF 없음\n\n"
     overview_text += "2. SDV Intelligent Connected Vehicle Service Interface Specification\n"
     for doc in chinese_data:
         overview_text += f"   - {doc['title']}: {doc['pages']}페이지\n"
-    
-    content.text = overview_text
-    
-    # Korean Document Section
+    return overview_text
+
+def korean_slides(korean_data):
+    """(layout, title, body) for the Korean document section"""
+    slides = []
     if korean_data and korean_data.get('sections'):
         # Main title slide for Korean document
-        slide = prs.slides.add_slide(prs.slide_layouts[2])
-        title = slide.shapes.title
-        title.text = korean_data['title']
+        slides.append((2, korean_data['title'], None))
         
         # Add slides for major sections
         for i, section in enumerate(korean_data['sections'][:10]):  # Limit to first 10 sections
             if len(section['content']) > 0:
-                slide = prs.slides.add_slide(prs.slide_layouts[1])
-                title = slide.shapes.title
-                content = slide.placeholders[1]
-                
-                title.text = section['title'][:100]  # Limit title length
-                
                 # Combine content, limiting to reasonable amount
                 content_text = '\n'.join(section['content'][:10])
                 if len(content_text) > 500:
                     content_text = content_text[:500] + "..."
-                content.text = content_text
+                slides.append((1, section['title'][:100], content_text))  # Limit title length
+    return slides
+
+def chinese_slide(doc):
+    """(layout, title, body) for one Chinese specification"""
+    content_text = f"Document: {doc['full_title']}\n\n"
+    content_text += f"Total Pages: {doc['pages']}\n\n"
+    if doc.get('translated_preview'):
+        content_text += f"Content Preview (용어집 번역, 용어 적용률 {doc['translation_coverage']:.0%}):\n"
+        content_text += doc['translated_preview']
+    else:
+        content_text += "Content Preview:\n"
+        content_text += doc['content_preview']
+    return (1, doc['title'], content_text)
+
+def create_ppt_presentation(korean_data, chinese_data, filename='SDV_Presentation.pptx'):
+    """Create PowerPoint presentation"""
+    prs = new_presentation()
+    
+    # Title Slide
+    layout, title, subtitle = TITLE_SLIDE
+    add_placeholder_slide(prs, layout, title, subtitle=subtitle)
+    
+    # Overview Slide
+    add_placeholder_slide(prs, 1, "문서 개요", overview_text(korean_data, chinese_data))
+    
+    # Korean Document Section
+    for layout, title, body in korean_slides(korean_data):
+        add_placeholder_slide(prs, layout, title, body)
     
     # Chinese Documents Section
-    slide = prs.slides.add_slide(prs.slide_layouts[2])
-    title = slide.shapes.title
-    title.text = "SDV Service Interface Specifications"
+    add_placeholder_slide(prs, 2, CHINESE_SECTION_TITLE)
     
     for doc in chinese_data:
-        slide = prs.slides.add_slide(prs.slide_layouts[1])
-        title = slide.shapes.title
-        content = slide.placeholders[1]
-        
-        title.text = doc['title']
-        content_text = f"Document: {doc['full_title']}\n\n"
-        content_text += f"Total Pages: {doc['pages']}\n\n"
-        content_text += "Content Preview:\n"
-        content_text += doc['content_preview']
-        content.text = content_text
+        add_placeholder_slide(prs, *chinese_slide(doc))
     
     # Summary Slide
-    slide = prs.slides.add_slide(prs.slide_layouts[1])
-    title = slide.shapes.title
-    content = slide.placeholders[1]
-    title.text = "요약 및 결론"
-    
-    summary_text = "주요 내용:\n\n"
-    summary_text += "• SDV는 소프트웨어 중심의 차량 아키텍처\n"
-    summary_text += "• 중국, 독일, 일본의 표준화 동향 분석\n"
-    summary_text += "• Service Interface Specification 정의\n"
-    summary_text += "  - Part 1: Atomic Service API\n"
-    summary_text += "  - Part 2: Device Abstraction API\n"
-    summary_text += "• Version 4 Beta 1 사양 문서화"
-    
-    content.text = summary_text
+    add_placeholder_slide(prs, 1, "요약 및 결론", SUMMARY_TEXT)
     
     # Save presentation
-    prs.save('SDV_Presentation.pptx')
-    print("Presentation saved as SDV_Presentation.pptx")
+    save_presentation(prs, filename)
+    print(f"Presentation saved as {os.path.basename(filename)}")
 
-def main():
-    print("Starting PDF extraction and PPT creation...")
+def extract_source(source):
+    """Extract one (kind, pdf_file, title) source; runs in the pipeline's worker pool"""
+    return extract_pdf_text(os.path.join(SOURCE_DIR, source[1]))
+
+def create_ppt_presentation_pipelined(filename='SDV_Presentation.pptx', workers=2, queue_size=2, executor=None):
+    """Create the presentation while the PDFs are still being parsed (see sdv_pipeline)
+
+    Produces the same deck as create_ppt_presentation. The overview slide is
+    added up front and its body is filled in once every document is known.
+    """
+    from sdv_pipeline import run_pipeline
+    
+    prs = new_presentation()
+    layout, title, subtitle = TITLE_SLIDE
+    add_placeholder_slide(prs, layout, title, subtitle=subtitle)
+    overview = add_placeholder_slide(prs, 1, "문서 개요")
     
-    # Change to the sdv-c directory
-    os.chdir('/home/kim/sdv-c')
+    documents = {"korean": None, "chinese": []}
+    sources = [("korean", KOREAN_PDF, None)] + [("chinese", pdf_file, title) for pdf_file, title in CHINESE_PDFS]
     
-    # Parse Korean PDF
-    print("Parsing Korean PDF...")
-    korean_data = parse_korean_pdf()
+    def build_slides(index, source, result):
+        kind, pdf_file, title = source
+        text, pages = result
+        if kind == "korean":
+            documents["korean"] = korean_document(text, pages) if text else None
+            # The Chinese section header follows the Korean document
+            return korean_slides(documents["korean"]) + [(2, CHINESE_SECTION_TITLE, None)]
+        if not text:
+            return []
+        doc = chinese_document(pdf_file, title, text, pages)
+        documents["chinese"].append(doc)
+        return [chinese_slide(doc)]
     
-    # Parse Chinese PDFs
-    print("Attempting to parse Chinese PDFs...")
-    chinese_data = parse_chinese_pdfs()
+    def render(job):
+        add_placeholder_slide(prs, *job)
+    
+    report = run_pipeline(sources, extract_source, build_slides, render, workers, queue_size, executor)
+    
+    overview.placeholders[1].text = overview_text(documents["korean"], documents["chinese"])
+    add_placeholder_slide(prs, 1, "요약 및 결론", SUMMARY_TEXT)
+    
+    save_presentation(prs, filename)
+    print(f"Presentation saved as {os.path.basename(filename)}")
+    return report
+
+def build(output_dir="."):
+    """Build the deck into output_dir and return the written paths"""
+    path = os.path.join(output_dir, 'SDV_Presentation.pptx')
+    create_ppt_presentation_pipelined(path)
+    return [path]
+
+def main():
+    print("Starting PDF extraction and PPT creation...")
     
-    # Create PowerPoint presentation
-    print("Creating PowerPoint presentation...")
-    create_ppt_presentation(korean_data, chinese_data)
+    # PDFs are parsed in a worker pool while earlier documents are rendered
+    print("Parsing PDFs and creating PowerPoint presentation...")
+    report = create_ppt_presentation_pipelined()
+    report.print()
     
     print("Done!")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
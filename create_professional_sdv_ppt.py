@@ -1,13 +1,38 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-from pptx import Presentation
 from pptx.util import Inches, Pt, Cm
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR, MSO_AUTO_SIZE
 from pptx.dml.color import RGBColor
 from pptx.enum.dml import MSO_THEME_COLOR
 from pptx.enum.shapes import MSO_SHAPE
-import datetime
+import os
+from sdv_data import build_datetime
+from sdv_market_data import MARKET
+from sdv_package import save_presentation
+from sdv_template import new_presentation
+from sdv_slides import (TextStyle, WHITE, add_box, add_placeholder_slide, add_table, add_text, rgb,
+                        style_paragraphs, write_bullets, write_text)
+
+NAVY = rgb(0, 51, 102)
+BLUE = rgb(0, 112, 192)
+GRAY = rgb(89, 89, 89)
+DARK = rgb(51, 51, 51)
+
+COVER_TITLE_STYLE = TextStyle(size=44, bold=True, color=NAVY)
+COVER_SUBTITLE_STYLE = TextStyle(size=24, color=GRAY)
+SECTION_NUMBER_STYLE = TextStyle(size=72, bold=True, color=BLUE, align=PP_ALIGN.CENTER)
+SECTION_TITLE_STYLE = TextStyle(size=40, bold=True, align=PP_ALIGN.LEFT)
+SLIDE_TITLE_STYLE = TextStyle(size=32, bold=True, color=NAVY)
+HEADING_STYLE = TextStyle(size=28, bold=True, color=NAVY)
+BODY_STYLE = TextStyle(size=18, color=GRAY)
+BULLET_STYLE = TextStyle(level=0, size=20, color=DARK)
+BULLET_MAIN_STYLE = TextStyle(level=0, size=20, bold=True, color=DARK)
+BULLET_SUB_STYLE = TextStyle(level=1, size=18, color=GRAY)
+HEADER_STYLE = TextStyle(size=14, bold=True, color=WHITE, align=PP_ALIGN.CENTER)
+CELL_STYLE = TextStyle(size=12, color=DARK, align=PP_ALIGN.LEFT)
+PHASE_STYLE = TextStyle(size=16, bold=True, color=WHITE, align=PP_ALIGN.CENTER)
+DETAIL_STYLE = TextStyle(size=11, color=DARK)
 
 def setup_slide_size(prs):
     """Set presentation to 16:9 widescreen format"""
@@ -15,24 +40,16 @@ def setup_slide_size(prs):
     prs.slide_height = Inches(5.625)
     return prs
 
+def add_heading(slide, title):
+    """Add the slide heading used by table and timeline slides"""
+    return add_text(slide, Inches(0.5), Inches(0.3), Inches(9), Inches(0.8), title, HEADING_STYLE,
+                    split_lines=True)
+
 def add_title_slide(prs, title, subtitle):
     """Add a professional title slide"""
-    slide_layout = prs.slide_layouts[0]
-    slide = prs.slides.add_slide(slide_layout)
-    
-    # Title
-    title_shape = slide.shapes.title
-    title_shape.text = title
-    title_shape.text_frame.paragraphs[0].font.size = Pt(44)
-    title_shape.text_frame.paragraphs[0].font.bold = True
-    title_shape.text_frame.paragraphs[0].font.color.rgb = RGBColor(0, 51, 102)
-    
-    # Subtitle
-    subtitle_shape = slide.placeholders[1]
-    subtitle_shape.text = subtitle
-    subtitle_shape.text_frame.paragraphs[0].font.size = Pt(24)
-    subtitle_shape.text_frame.paragraphs[0].font.color.rgb = RGBColor(89, 89, 89)
-    
+    slide = add_placeholder_slide(prs, 0, title, subtitle=subtitle)
+    COVER_TITLE_STYLE.apply(slide.shapes.title.text_frame.paragraphs[0])
+    COVER_SUBTITLE_STYLE.apply(slide.placeholders[1].text_frame.paragraphs[0])
     return slide
 
 def add_section_divider(prs, section_title, section_number):
@@ -41,43 +58,22 @@ def add_section_divider(prs, section_title, section_number):
     slide = prs.slides.add_slide(slide_layout)
     
     # Add section number
-    left = Inches(0.5)
-    top = Inches(2)
-    width = Inches(1.5)
-    height = Inches(1)
-    
-    shape = slide.shapes.add_textbox(left, top, width, height)
-    text_frame = shape.text_frame
-    text_frame.clear()
-    
-    p = text_frame.paragraphs[0]
-    p.text = f"{section_number:02d}"
-    p.font.size = Pt(72)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(0, 112, 192)
-    p.alignment = PP_ALIGN.CENTER
+    shape = slide.shapes.add_textbox(Inches(0.5), Inches(2), Inches(1.5), Inches(1))
+    shape.text_frame.clear()
+    write_text(shape.text_frame, f"{section_number:02d}", SECTION_NUMBER_STYLE)
     
     # Section title
     title = slide.shapes.title
     title.text = section_title
-    title.text_frame.paragraphs[0].font.size = Pt(40)
-    title.text_frame.paragraphs[0].font.bold = True
-    title.text_frame.paragraphs[0].alignment = PP_ALIGN.LEFT
+    SECTION_TITLE_STYLE.apply(title.text_frame.paragraphs[0])
     title.left = Inches(2.5)
     
     return slide
 
 def add_content_slide(prs, title, content=None, bullets=None, layout_idx=1):
     """Add a content slide with proper formatting"""
-    slide_layout = prs.slide_layouts[layout_idx]
-    slide = prs.slides.add_slide(slide_layout)
-    
-    # Title formatting
-    title_shape = slide.shapes.title
-    title_shape.text = title
-    title_shape.text_frame.paragraphs[0].font.size = Pt(32)
-    title_shape.text_frame.paragraphs[0].font.bold = True
-    title_shape.text_frame.paragraphs[0].font.color.rgb = RGBColor(0, 51, 102)
+    slide = add_placeholder_slide(prs, layout_idx, title)
+    SLIDE_TITLE_STYLE.apply(slide.shapes.title.text_frame.paragraphs[0])
     
     # Content
     if content or bullets:
@@ -85,41 +81,11 @@ def add_content_slide(prs, title, content=None, bullets=None, layout_idx=1):
         
         if content:
             content_shape.text = content
-            for paragraph in content_shape.text_frame.paragraphs:
-                paragraph.font.size = Pt(18)
-                paragraph.font.color.rgb = RGBColor(89, 89, 89)
+            style_paragraphs(content_shape.text_frame, BODY_STYLE)
                 
         elif bullets:
-            text_frame = content_shape.text_frame
-            text_frame.clear()
-            
-            for i, bullet in enumerate(bullets):
-                if i == 0:
-                    p = text_frame.paragraphs[0]
-                else:
-                    p = text_frame.add_paragraph()
-                
-                if isinstance(bullet, str):
-                    p.text = bullet
-                    p.level = 0
-                    p.font.size = Pt(20)
-                    p.font.color.rgb = RGBColor(51, 51, 51)
-                elif isinstance(bullet, dict):
-                    # Main bullet
-                    p.text = bullet.get('main', '')
-                    p.level = 0
-                    p.font.size = Pt(20)
-                    p.font.bold = True
-                    p.font.color.rgb = RGBColor(51, 51, 51)
-                    
-                    # Sub-bullets
-                    if 'sub' in bullet:
-                        for sub in bullet['sub']:
-                            p = text_frame.add_paragraph()
-                            p.text = sub
-                            p.level = 1
-                            p.font.size = Pt(18)
-                            p.font.color.rgb = RGBColor(89, 89, 89)
+            write_bullets(content_shape.text_frame, bullets, BULLET_STYLE,
+                          BULLET_MAIN_STYLE, BULLET_SUB_STYLE)
     
     return slide
 
@@ -127,59 +93,12 @@ def add_comparison_table(prs, title, headers, rows):
     """Add a slide with comparison table"""
     slide = prs.slides.add_slide(prs.slide_layouts[5])  # Blank layout
     
-    # Title
-    left = Inches(0.5)
-    top = Inches(0.3)
-    width = Inches(9)
-    height = Inches(0.8)
-    
-    title_box = slide.shapes.add_textbox(left, top, width, height)
-    title_frame = title_box.text_frame
-    title_frame.text = title
-    title_frame.paragraphs[0].font.size = Pt(28)
-    title_frame.paragraphs[0].font.bold = True
-    title_frame.paragraphs[0].font.color.rgb = RGBColor(0, 51, 102)
-    
-    # Table
-    left = Inches(0.5)
-    top = Inches(1.2)
-    width = Inches(9)
-    height = Inches(3.8)
-    
-    table = slide.shapes.add_table(len(rows) + 1, len(headers), left, top, width, height).table
-    
-    # Set column widths
-    for i in range(len(headers)):
-        table.columns[i].width = Inches(9 / len(headers))
-    
-    # Header row
-    for i, header in enumerate(headers):
-        cell = table.cell(0, i)
-        cell.text = header
-        cell.fill.solid()
-        cell.fill.fore_color.rgb = RGBColor(0, 112, 192)
-        
-        paragraph = cell.text_frame.paragraphs[0]
-        paragraph.font.size = Pt(14)
-        paragraph.font.bold = True
-        paragraph.font.color.rgb = RGBColor(255, 255, 255)
-        paragraph.alignment = PP_ALIGN.CENTER
+    add_heading(slide, title)
     
-    # Data rows
-    for row_idx, row_data in enumerate(rows):
-        for col_idx, cell_text in enumerate(row_data):
-            cell = table.cell(row_idx + 1, col_idx)
-            cell.text = str(cell_text)
-            
-            # Alternating row colors
-            if row_idx % 2 == 0:
-                cell.fill.solid()
-                cell.fill.fore_color.rgb = RGBColor(242, 242, 242)
-            
-            paragraph = cell.text_frame.paragraphs[0]
-            paragraph.font.size = Pt(12)
-            paragraph.font.color.rgb = RGBColor(51, 51, 51)
-            paragraph.alignment = PP_ALIGN.LEFT
+    # Table with alternating row colors
+    add_table(slide, headers, rows, Inches(0.5), Inches(1.2), Inches(9), Inches(3.8),
+              BLUE, HEADER_STYLE, CELL_STYLE, stripe_fill=rgb(242, 242, 242),
+              column_width=Inches(9 / len(headers)))
     
     return slide
 
@@ -187,13 +106,7 @@ def add_timeline_slide(prs, title, timeline_data):
     """Add a timeline/roadmap slide"""
     slide = prs.slides.add_slide(prs.slide_layouts[5])  # Blank layout
     
-    # Title
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(9), Inches(0.8))
-    title_frame = title_box.text_frame
-    title_frame.text = title
-    title_frame.paragraphs[0].font.size = Pt(28)
-    title_frame.paragraphs[0].font.bold = True
-    title_frame.paragraphs[0].font.color.rgb = RGBColor(0, 51, 102)
+    add_heading(slide, title)
     
     # Timeline
     y_position = Inches(1.5)
@@ -205,49 +118,25 @@ def add_timeline_slide(prs, title, timeline_data):
         width = Inches(2)
         height = Inches(0.8)
         
-        # Phase box
-        shape = slide.shapes.add_shape(
-            MSO_SHAPE.ROUNDED_RECTANGLE,
-            left, top, width, height
-        )
-        shape.fill.solid()
-        shape.fill.fore_color.rgb = RGBColor(0, 112, 192)
-        
-        text_frame = shape.text_frame
-        text_frame.clear()
-        p = text_frame.paragraphs[0]
-        p.text = item['phase']
-        p.font.size = Pt(16)
-        p.font.bold = True
-        p.font.color.rgb = RGBColor(255, 255, 255)
-        p.alignment = PP_ALIGN.CENTER
+        phase = add_box(slide, MSO_SHAPE.ROUNDED_RECTANGLE, left, top, width, height, fill=BLUE)
+        phase.text_frame.clear()
+        write_text(phase.text_frame, item['phase'], PHASE_STYLE)
         
         # Details box
         detail_box = slide.shapes.add_textbox(left, top + height + Inches(0.2), width, Inches(2))
-        text_frame = detail_box.text_frame
-        text_frame.clear()
-        
-        for j, detail in enumerate(item['details']):
-            if j == 0:
-                p = text_frame.paragraphs[0]
-            else:
-                p = text_frame.add_paragraph()
-            p.text = f"• {detail}"
-            p.font.size = Pt(11)
-            p.font.color.rgb = RGBColor(51, 51, 51)
+        write_bullets(detail_box.text_frame, item['details'], DETAIL_STYLE, prefix="• ")
     
     return slide
 
 def create_professional_sdv_presentation():
     """Create a professional SDV presentation"""
-    prs = Presentation()
-    prs = setup_slide_size(prs)
+    prs = new_presentation("compact")
     
     # 1. Title Slide
     add_title_slide(
         prs,
         "SDV (Software-Defined Vehicle)\n글로벌 표준화 동향 및 대응 전략",
-        f"중국 SDV 표준 심층 분석 | 한국 자동차 산업 로드맵\n\n{datetime.datetime.now().strftime('%Y년 %m월 %d일')}"
+        f"중국 SDV 표준 심층 분석 | 한국 자동차 산업 로드맵\n\n{build_datetime().strftime('%Y년 %m월 %d일')}"
     )
     
     # 2. Executive Summary
@@ -300,14 +189,8 @@ def create_professional_sdv_presentation():
     add_content_slide(prs, "SDV 정의 및 핵심 기술", bullets=bullets)
     
     # Market Analysis
-    headers = ["구분", "2024년", "2027년", "2030년", "CAGR"]
-    rows = [
-        ["시장 규모", "$650억", "$1,800억", "$3,500억", "32%"],
-        ["SDV 비중", "15%", "50%", "95%", "-"],
-        ["SW 가치 비중", "30%", "45%", "60%", "-"],
-        ["OTA 차량", "2천만대", "1.2억대", "3억대", "45%"]
-    ]
-    add_comparison_table(prs, "SDV 시장 전망", headers, rows)
+    outlook = MARKET.query("market_outlook")
+    add_comparison_table(prs, "SDV 시장 전망", outlook["headers"], outlook["rows"])
     
     # Section 2: China Standards
     add_section_divider(prs, "중국 SDV 표준 분석", 2)
@@ -626,12 +509,18 @@ ADAS & Autonomous
     
     return prs
 
+def build(output_dir="."):
+    """Build the deck into output_dir and return the written paths"""
+    prs = create_professional_sdv_presentation()
+    path = os.path.join(output_dir, "SDV_Professional_Presentation_16x9.pptx")
+    save_presentation(prs, path)
+    return [path]
+
 def main():
     print("Creating professional SDV presentation (16:9)...")
     
     # Create main presentation
-    prs = create_professional_sdv_presentation()
-    prs.save("SDV_Professional_Presentation_16x9.pptx")
+    build()
     print("✓ Created: SDV_Professional_Presentation_16x9.pptx")
     
     print("\nPresentation created successfully!")
@@ -1,28 +1,39 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-from pptx import Presentation
-from pptx.util import Inches, Pt, Cm
+from pptx.util import Inches, Cm
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR, MSO_AUTO_SIZE
 from pptx.dml.color import RGBColor
 from pptx.enum.shapes import MSO_SHAPE
-from pptx.chart.data import CategoryChartData, XyChartData
-from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION, XL_TICK_MARK
+from pptx.enum.chart import XL_CHART_TYPE, XL_TICK_MARK
 import datetime
-import random
+import os
+from sdv_data import SeededDataProvider, derive_seed
+from sdv_package import save_presentation
+from sdv_template import new_presentation
+from sdv_profiler import profile_slide_methods
+from sdv_slides import TextStyle, WHITE, add_box, add_chart, add_text, fill_table, rgb, style_paragraphs
 
+OPENING_TITLE_STYLE = TextStyle(size=32, bold=True)
+HEADING_STYLE = TextStyle(size=28, bold=True)
+BODY_STYLE = TextStyle(size=14)
+CODE_STYLE = TextStyle(size=11, font_name="Consolas")
+LABEL_STYLE = TextStyle(size=14, bold=True, color=WHITE, align=PP_ALIGN.CENTER)
+DETAIL_STYLE = TextStyle(size=11)
+
+@profile_slide_methods
 class UltimateSDVPresentation:
     """Create the ultimate comprehensive SDV presentation with 200+ slides"""
     
-    def __init__(self):
-        self.prs = Presentation()
-        self.setup_presentation()
+    def __init__(self, seed=None):
+        self.prs = new_presentation("corporate")
         self.slide_count = 0
+        self.data = SeededDataProvider(seed)
         
-    def setup_presentation(self):
-        """Set up 16:9 widescreen format"""
-        self.prs.slide_width = Inches(13.333)
-        self.prs.slide_height = Inches(7.5)
+    def add_slide_heading(self, slide, text):
+        """Add the section heading at the top of a slide"""
+        add_text(slide, Inches(0.5), Inches(0.3), Inches(12), Inches(0.7), text, HEADING_STYLE,
+                 split_lines=True)
     
     def add_slide(self, layout_idx=5):
         """Add a slide and increment counter"""
@@ -36,14 +47,10 @@ class UltimateSDVPresentation:
         # Opening Section (10 slides)
         for i in range(10):
             slide = self.add_slide()
-            title = slide.shapes.add_textbox(Inches(1), Inches(0.5), Inches(11), Inches(1))
-            title.text_frame.text = f"Opening Section - Slide {i+1}"
-            title.text_frame.paragraphs[0].font.size = Pt(32)
-            title.text_frame.paragraphs[0].font.bold = True
-            
-            content = slide.shapes.add_textbox(Inches(1), Inches(2), Inches(11), Inches(5))
-            content.text_frame.text = self.generate_content(i)
-            content.text_frame.word_wrap = True
+            add_text(slide, Inches(1), Inches(0.5), Inches(11), Inches(1),
+                     f"Opening Section - Slide {i+1}", OPENING_TITLE_STYLE, split_lines=True)
+            add_text(slide, Inches(1), Inches(2), Inches(11), Inches(5),
+                     self.generate_content(i), word_wrap=True, split_lines=True)
         
         # Market Analysis Deep Dive (30 slides)
         for i in range(30):
@@ -155,16 +162,14 @@ class UltimateSDVPresentation:
             "Ecosystem Partner Networks"
         ]
         
-        title = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(12), Inches(0.7))
-        title.text_frame.text = f"Market Analysis: {titles[index % len(titles)]}"
-        title.text_frame.paragraphs[0].font.size = Pt(28)
-        title.text_frame.paragraphs[0].font.bold = True
+        self.add_slide_heading(slide, f"Market Analysis: {titles[index % len(titles)]}")
         
         # Add chart or table
+        data = self.data.section("market").slide(index)
         if index % 3 == 0:
-            self.add_chart_to_slide(slide)
+            self.add_chart_to_slide(slide, data)
         elif index % 3 == 1:
-            self.add_table_to_slide(slide)
+            self.add_table_to_slide(slide, data)
         else:
             self.add_detailed_content(slide)
     
@@ -183,10 +188,7 @@ class UltimateSDVPresentation:
             "International Alignment Strategy"
         ]
         
-        title = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(12), Inches(0.7))
-        title.text_frame.text = f"中国 SDV 标准: {topics[index % len(topics)]}"
-        title.text_frame.paragraphs[0].font.size = Pt(28)
-        title.text_frame.paragraphs[0].font.bold = True
+        self.add_slide_heading(slide, f"中国 SDV 标准: {topics[index % len(topics)]}")
         
         # Add detailed API examples
         if index % 2 == 0:
@@ -209,10 +211,7 @@ class UltimateSDVPresentation:
             "OTA Update Mechanisms"
         ]
         
-        title = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(12), Inches(0.7))
-        title.text_frame.text = f"Technical Deep Dive: {aspects[index % len(aspects)]}"
-        title.text_frame.paragraphs[0].font.size = Pt(28)
-        title.text_frame.paragraphs[0].font.bold = True
+        self.add_slide_heading(slide, f"Technical Deep Dive: {aspects[index % len(aspects)]}")
         
         self.add_architecture_diagram(slide)
     
@@ -231,12 +230,9 @@ class UltimateSDVPresentation:
             "Government Support Levels"
         ]
         
-        title = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(12), Inches(0.7))
-        title.text_frame.text = f"Global Comparison: {comparisons[index % len(comparisons)]}"
-        title.text_frame.paragraphs[0].font.size = Pt(28)
-        title.text_frame.paragraphs[0].font.bold = True
+        self.add_slide_heading(slide, f"Global Comparison: {comparisons[index % len(comparisons)]}")
         
-        self.add_comparison_matrix(slide)
+        self.add_comparison_matrix(slide, self.data.section("comparison").slide(index))
     
     def add_korea_strategy_slide(self, slide, index):
         """Add Korea strategy slides"""
@@ -258,10 +254,7 @@ class UltimateSDVPresentation:
             "성공 시나리오"
         ]
         
-        title = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(12), Inches(0.7))
-        title.text_frame.text = f"한국 전략: {strategies[index % len(strategies)]}"
-        title.text_frame.paragraphs[0].font.size = Pt(28)
-        title.text_frame.paragraphs[0].font.bold = True
+        self.add_slide_heading(slide, f"한국 전략: {strategies[index % len(strategies)]}")
         
         self.add_strategy_content(slide)
     
@@ -280,10 +273,7 @@ class UltimateSDVPresentation:
             "Communication Strategy"
         ]
         
-        title = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(12), Inches(0.7))
-        title.text_frame.text = f"Implementation: {implementations[index % len(implementations)]}"
-        title.text_frame.paragraphs[0].font.size = Pt(28)
-        title.text_frame.paragraphs[0].font.bold = True
+        self.add_slide_heading(slide, f"Implementation: {implementations[index % len(implementations)]}")
         
         self.add_roadmap_content(slide)
     
@@ -302,10 +292,7 @@ class UltimateSDVPresentation:
             "Apple: Project Titan"
         ]
         
-        title = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(12), Inches(0.7))
-        title.text_frame.text = f"Case Study: {cases[index % len(cases)]}"
-        title.text_frame.paragraphs[0].font.size = Pt(28)
-        title.text_frame.paragraphs[0].font.bold = True
+        self.add_slide_heading(slide, f"Case Study: {cases[index % len(cases)]}")
         
         self.add_case_study_content(slide)
     
@@ -324,12 +311,9 @@ class UltimateSDVPresentation:
             "Regulatory Evolution"
         ]
         
-        title = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(12), Inches(0.7))
-        title.text_frame.text = f"Future Outlook: {futures[index % len(futures)]}"
-        title.text_frame.paragraphs[0].font.size = Pt(28)
-        title.text_frame.paragraphs[0].font.bold = True
+        self.add_slide_heading(slide, f"Future Outlook: {futures[index % len(futures)]}")
         
-        self.add_future_content(slide)
+        self.add_future_content(slide, self.data.section("future").slide(index))
     
     def add_appendix_slide(self, slide, index):
         """Add appendix slides"""
@@ -346,65 +330,39 @@ class UltimateSDVPresentation:
             "Additional Resources"
         ]
         
-        title = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(12), Inches(0.7))
-        title.text_frame.text = f"Appendix: {appendices[index % len(appendices)]}"
-        title.text_frame.paragraphs[0].font.size = Pt(28)
-        title.text_frame.paragraphs[0].font.bold = True
+        self.add_slide_heading(slide, f"Appendix: {appendices[index % len(appendices)]}")
         
         self.add_appendix_content(slide)
     
-    def add_chart_to_slide(self, slide):
+    def add_chart_to_slide(self, slide, data=None):
         """Add various types of charts"""
-        chart_data = CategoryChartData()
-        chart_data.categories = ['2024', '2025', '2026', '2027', '2028', '2029', '2030']
+        if data is None:
+            data = self.data.slide(self.slide_count)
+        categories = ['2024', '2025', '2026', '2027', '2028', '2029', '2030']
         
-        # Generate random data for demonstration
-        for series in range(3):
-            chart_data.add_series(f'Series {series+1}', 
-                [random.randint(100, 1000) for _ in range(7)])
+        # Generate seeded sample data for demonstration
+        series = [(f'Series {series+1}', data.series(7, 100, 1000)) for series in range(3)]
         
-        x, y, cx, cy = Inches(1), Inches(1.5), Inches(11.333), Inches(5.5)
-        chart = slide.shapes.add_chart(
-            XL_CHART_TYPE.COLUMN_CLUSTERED, x, y, cx, cy, chart_data
-        ).chart
-        
-        chart.has_legend = True
-        chart.legend.position = XL_LEGEND_POSITION.BOTTOM
+        add_chart(slide, XL_CHART_TYPE.COLUMN_CLUSTERED, categories, series,
+                  Inches(1), Inches(1.5), Inches(11.333), Inches(5.5))
     
-    def add_table_to_slide(self, slide):
+    def add_table_to_slide(self, slide, data=None):
         """Add detailed tables"""
+        if data is None:
+            data = self.data.slide(self.slide_count)
         rows, cols = 10, 6
-        left = Inches(1)
-        top = Inches(1.5)
-        width = Inches(11.333)
-        height = Inches(5.5)
-        
-        table = slide.shapes.add_table(rows, cols, left, top, width, height).table
+        table = slide.shapes.add_table(
+            rows, cols, Inches(1), Inches(1.5), Inches(11.333), Inches(5.5)
+        ).table
         
         # Fill with sample data
         headers = ['항목', '2024', '2025', '2026', '2027', '2030']
-        for col_idx, header in enumerate(headers):
-            cell = table.cell(0, col_idx)
-            cell.text = header
-            cell.fill.solid()
-            cell.fill.fore_color.rgb = RGBColor(0, 51, 102)
-            
-        for row_idx in range(1, rows):
-            for col_idx in range(cols):
-                cell = table.cell(row_idx, col_idx)
-                if col_idx == 0:
-                    cell.text = f"Item {row_idx}"
-                else:
-                    cell.text = str(random.randint(100, 999))
+        body = [[f"Item {row_idx}"] + [data.randint(100, 999) for _ in range(1, cols)]
+                for row_idx in range(1, rows)]
+        fill_table(table, headers, body, rgb(0, 51, 102), None)
     
     def add_detailed_content(self, slide):
         """Add detailed text content"""
-        content_box = slide.shapes.add_textbox(
-            Inches(1), Inches(1.5), Inches(11.333), Inches(5.5)
-        )
-        text_frame = content_box.text_frame
-        text_frame.word_wrap = True
-        
         content = """Comprehensive analysis reveals multiple layers of complexity in SDV implementation:
 
         Technical Challenges:
@@ -425,17 +383,12 @@ class UltimateSDVPresentation:
         • Data sovereignty becoming national security issue
         • Standards wars determining future market access"""
         
-        text_frame.text = content
-        for paragraph in text_frame.paragraphs:
-            paragraph.font.size = Pt(14)
+        content_box = add_text(slide, Inches(1), Inches(1.5), Inches(11.333), Inches(5.5),
+                               content, word_wrap=True, split_lines=True)
+        style_paragraphs(content_box.text_frame, BODY_STYLE)
     
     def add_api_example(self, slide):
         """Add API code examples"""
-        code_box = slide.shapes.add_textbox(
-            Inches(1), Inches(1.5), Inches(11.333), Inches(5.5)
-        )
-        text_frame = code_box.text_frame
-        
         code = """// Atomic Service API Example
         {
           "header": {
@@ -460,9 +413,8 @@ class UltimateSDVPresentation:
           }
         }"""
         
-        text_frame.text = code
-        text_frame.paragraphs[0].font.name = "Consolas"
-        text_frame.paragraphs[0].font.size = Pt(11)
+        add_text(slide, Inches(1), Inches(1.5), Inches(11.333), Inches(5.5), code, CODE_STYLE,
+                 split_lines=True)
     
     def add_standard_details(self, slide):
         """Add standards specification details"""
@@ -481,24 +433,12 @@ class UltimateSDVPresentation:
         
         for i in range(5):
             y_pos = Inches(1.5) + i * Inches(1)
-            box = slide.shapes.add_shape(
-                MSO_SHAPE.ROUNDED_RECTANGLE,
-                Inches(2), y_pos,
-                Inches(9.333), Inches(0.8)
-            )
-            box.fill.solid()
-            box.fill.fore_color.rgb = colors[i]
-            
-            text_frame = box.text_frame
-            text_frame.text = f"Architecture Layer {i+1}"
-            text_frame.paragraphs[0].font.size = Pt(14)
-            text_frame.paragraphs[0].font.bold = True
-            text_frame.paragraphs[0].font.color.rgb = RGBColor(255, 255, 255)
-            text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-    
-    def add_comparison_matrix(self, slide):
+            add_box(slide, MSO_SHAPE.ROUNDED_RECTANGLE, Inches(2), y_pos, Inches(9.333), Inches(0.8),
+                    fill=colors[i], text=f"Architecture Layer {i+1}", style=LABEL_STYLE, split_lines=True)
+    
+    def add_comparison_matrix(self, slide, data=None):
         """Add comparison matrices"""
-        self.add_table_to_slide(slide)
+        self.add_table_to_slide(slide, data)
     
     def add_strategy_content(self, slide):
         """Add strategy content"""
@@ -511,72 +451,62 @@ class UltimateSDVPresentation:
             x_pos = Inches(1) + i * Inches(3)
             
             # Phase box
-            phase_box = slide.shapes.add_shape(
-                MSO_SHAPE.CHEVRON,
-                x_pos, Inches(2),
-                Inches(2.8), Inches(1.5)
-            )
-            phase_box.fill.solid()
-            phase_box.fill.fore_color.rgb = RGBColor(0, 112, 192)
-            
-            text_frame = phase_box.text_frame
-            text_frame.text = f"Phase {i+1}\n202{4+i}"
-            text_frame.paragraphs[0].font.size = Pt(14)
-            text_frame.paragraphs[0].font.bold = True
-            text_frame.paragraphs[0].font.color.rgb = RGBColor(255, 255, 255)
-            text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
+            add_box(slide, MSO_SHAPE.CHEVRON, x_pos, Inches(2), Inches(2.8), Inches(1.5),
+                    fill=rgb(0, 112, 192), text=f"Phase {i+1}\n202{4+i}", style=LABEL_STYLE, split_lines=True)
             
             # Details below
-            detail_box = slide.shapes.add_textbox(
-                x_pos, Inches(4),
-                Inches(2.8), Inches(2.5)
-            )
-            text_frame = detail_box.text_frame
-            text_frame.text = f"• Milestone {i+1}\n• Deliverable {i+1}\n• KPI Target {i+1}"
-            text_frame.paragraphs[0].font.size = Pt(11)
+            add_text(slide, x_pos, Inches(4), Inches(2.8), Inches(2.5),
+                     f"• Milestone {i+1}\n• Deliverable {i+1}\n• KPI Target {i+1}", DETAIL_STYLE,
+                     split_lines=True)
     
     def add_case_study_content(self, slide):
         """Add case study analysis"""
         self.add_detailed_content(slide)
     
-    def add_future_content(self, slide):
+    def add_future_content(self, slide, data=None):
         """Add future projections"""
-        self.add_chart_to_slide(slide)
+        self.add_chart_to_slide(slide, data)
     
     def add_appendix_content(self, slide):
         """Add appendix information"""
         self.add_detailed_content(slide)
 
-def main():
-    print("="*60)
-    print("Creating ULTIMATE SDV Presentation")
-    print("Target: 200+ slides with comprehensive content")
-    print("="*60)
-    
+def build(output_dir="."):
+    """Build both 200+ slide decks into output_dir and return the written paths"""
     presentation = UltimateSDVPresentation()
     prs = presentation.create_mega_presentation()
     
-    filename = "SDV_Ultimate_Comprehensive_200_Slides.pptx"
-    prs.save(filename)
+    filename = os.path.join(output_dir, "SDV_Ultimate_Comprehensive_200_Slides.pptx")
+    save_presentation(prs, filename)
     
-    print(f"\n✅ Successfully created: {filename}")
+    print(f"\n✅ Successfully created: {os.path.basename(filename)}")
     print(f"📊 Total slides: {presentation.slide_count}")
-    print(f"📦 Format: 16:9 Widescreen")
-    print(f"🎯 Comprehensive coverage of all SDV aspects")
-    print(f"💾 This should be a MASSIVE file now!")
     
     # Create another one with different focus
     print("\nCreating additional specialized presentation...")
     
-    presentation2 = UltimateSDVPresentation()
+    presentation2 = UltimateSDVPresentation(seed=derive_seed("technical-deep-dive"))
     prs2 = presentation2.create_mega_presentation()
     
-    filename2 = "SDV_Technical_Deep_Dive_200_Slides.pptx"
-    prs2.save(filename2)
+    filename2 = os.path.join(output_dir, "SDV_Technical_Deep_Dive_200_Slides.pptx")
+    save_presentation(prs2, filename2)
     
-    print(f"\n✅ Also created: {filename2}")
+    print(f"\n✅ Also created: {os.path.basename(filename2)}")
     print(f"📊 Total slides: {presentation2.slide_count}")
     
+    return [filename, filename2]
+
+def main():
+    print("="*60)
+    print("Creating ULTIMATE SDV Presentation")
+    print("Target: 200+ slides with comprehensive content")
+    print("="*60)
+    
+    build()
+    
+    print(f"📦 Format: 16:9 Widescreen")
+    print(f"🎯 Comprehensive coverage of all SDV aspects")
+    
     print("\n🎉 All presentations created successfully!")
     print(f"📁 Total files created with substantial content")
 
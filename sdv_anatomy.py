@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Where the bytes (and the build time) of a deck go.
+
+A saved package is broken down by part type (slide XML, chart XML,
+embedded xlsx, media, layouts, ...) and by slide: every slide owns its
+slide XML, notes, charts, embedded workbooks and the media it is first to
+reference, so the slide rows add up to the package minus the shared
+layouts, masters and package parts. Sizes are given uncompressed and as
+stored in the zip.
+
+With --build the deck is generated in this process with the add_* profiler
+enabled (sdv_profiler). Each slide's package bytes are split between the
+top-level add_* calls that touched it in proportion to the XML bytes they
+added (a slide created blank by add_slide and filled by
+add_market_analysis_slide mostly counts for the latter), and the slide is
+counted for the largest contributor. That gives package bytes and build
+time per slide method; nested helpers (add_slide_number, chart helpers, ...) are
+listed with their time and the XML bytes they produced, with stored bytes
+estimated from the compression ratio of the slides they touched.
+
+Usage:
+    python sdv_anatomy.py SDV_Technical_Deep_Dive_200_Slides.pptx SDV_Executive_Presentation_Premium.pptx
+    python sdv_anatomy.py --build ultimate --slides 20
+"""
+
+import argparse
+import importlib
+import io
+import json
+import os
+import sys
+import time
+
+from sdv_package import part_category, save_presentation
+from sdv_slide_import import ZipPackage, rels_name
+
+# Parts shared by all slides; they are not attributed to any slide
+SHARED_CATEGORIES = ("layouts", "masters & themes")
+UNINSTRUMENTED = "(not instrumented)"
+
+
+class PackageAnatomy:
+    """Sizes of a saved package per part, part type and slide"""
+
+    def __init__(self, source, name=None):
+        self.name = name or (source if isinstance(source, str) else "deck")
+        self.package = ZipPackage(source)
+        self.sizes = {info.filename: (info.file_size, info.compress_size) for info in self.package.zip.infolist()}
+        self.slide_parts = self.package.slide_parts()
+        self.owned = self._assign_parts()
+
+    def _assign_parts(self):
+        """[member names] per slide: the slide and every non-shared part it reaches first"""
+        slide_set = set(self.slide_parts)
+        seen = set()
+        owned = []
+        for slide in self.slide_parts:
+            members = []
+            pending = [slide]
+            while pending:
+                part = pending.pop()
+                if part in seen or part not in self.sizes:
+                    continue
+                seen.add(part)
+                members.append(part)
+                if rels_name(part) in self.sizes:
+                    members.append(rels_name(part))
+                for _, _, target, external in self.package.rels(part):
+                    if external or (target in slide_set and target != slide):
+                        continue
+                    if part_category(target) not in SHARED_CATEGORIES:
+                        pending.append(target)
+            owned.append(members)
+        return owned
+
+    @property
+    def raw_bytes(self):
+        return sum(raw for raw, _ in self.sizes.values())
+
+    @property
+    def stored_bytes(self):
+        return sum(stored for _, stored in self.sizes.values())
+
+    def categories(self):
+        """{part type: {"parts", "raw_bytes", "stored_bytes"}}"""
+        rows = {}
+        for name, (raw, stored) in self.sizes.items():
+            row = rows.setdefault(part_category(name), {"parts": 0, "raw_bytes": 0, "stored_bytes": 0})
+            row["parts"] += 1
+            row["raw_bytes"] += raw
+            row["stored_bytes"] += stored
+        return rows
+
+    def slides(self):
+        """One row per slide: its bytes in total and per part type"""
+        rows = []
+        for index, members in enumerate(self.owned):
+            row = {"slide": index + 1, "part": self.slide_parts[index], "raw_bytes": 0, "stored_bytes": 0,
+                   "by_type": {}}
+            for name in members:
+                raw, stored = self.sizes[name]
+                row["raw_bytes"] += raw
+                row["stored_bytes"] += stored
+                category = part_category(name)
+                row["by_type"][category] = row["by_type"].get(category, 0) + stored
+            rows.append(row)
+        return rows
+
+    def print(self, top=10, file=None):
+        file = file or sys.stdout
+        print(f"📦 {self.name}: {len(self.slide_parts)} slides, {len(self.sizes)} parts, "
+              f"{self.raw_bytes / 1024:.0f} KB -> {self.stored_bytes / 1024:.0f} KB stored", file=file)
+        print(f"{'Part type':<18} {'Parts':>6} {'Raw KB':>9} {'Stored KB':>10} {'Share':>7}", file=file)
+        for category, row in sorted(self.categories().items(), key=lambda item: -item[1]["stored_bytes"]):
+            print(f"{category:<18} {row['parts']:>6} {row['raw_bytes'] / 1024:>9.1f} "
+                  f"{row['stored_bytes'] / 1024:>10.1f} {row['stored_bytes'] / self.stored_bytes:>7.1%}", file=file)
+        slides = self.slides()
+        if top and slides:
+            print(f"\nLargest {min(top, len(slides))} of {len(slides)} slides "
+                  f"(mean {sum(row['stored_bytes'] for row in slides) / len(slides) / 1024:.1f} KB stored):",
+                  file=file)
+            print(f"{'Slide':>6} {'Raw KB':>9} {'Stored KB':>10}  Stored by type", file=file)
+            for row in sorted(slides, key=lambda row: -row["stored_bytes"])[:top]:
+                by_type = ", ".join(f"{category} {size / 1024:.1f}" for category, size in
+                                    sorted(row["by_type"].items(), key=lambda item: -item[1]))
+                print(f"{row['slide']:>6} {row['raw_bytes'] / 1024:>9.1f} {row['stored_bytes'] / 1024:>10.1f}  "
+                      f"{by_type}", file=file)
+
+
+def profile_build(deck):
+    """Generate `deck` (a sdv_profiler.DECK_METHODS key) with the profiler on
+
+    Returns (package bytes, profiler events, build seconds).
+    """
+    profiler_module = importlib.import_module("sdv_profiler")
+    module, cls_name, method = profiler_module.DECK_METHODS[deck]
+    builder = getattr(importlib.import_module(module), cls_name)()
+    profiler = profiler_module.PROFILER
+    profiler.reset()
+    profiler.enable()
+    start = time.perf_counter()
+    try:
+        getattr(builder, method)()
+    finally:
+        profiler.disable()
+    elapsed = time.perf_counter() - start
+    buffer = io.BytesIO()
+    save_presentation(builder.prs, buffer)
+    return buffer.getvalue(), list(profiler.events), elapsed
+
+
+def method_rows(anatomy, events):
+    """Slide methods with their share of the package bytes, helpers with estimated bytes
+
+    Returns (slide method rows, helper rows), each sorted by stored bytes.
+    """
+    slides = anatomy.slides()
+    # XML bytes each top-level call added to each slide, spread evenly over the slides it touched
+    shares = {}
+    for event in events:
+        if event["depth"] == 0 and event["slides"]:
+            for index in event["slides"]:
+                weights = shares.setdefault(index, {})
+                weights[event["name"]] = weights.get(event["name"], 0) + event["xml_bytes"] / len(event["slides"])
+
+    methods = {}
+
+    def row(name):
+        return methods.setdefault(name, {"name": name, "calls": 0, "seconds": 0.0, "slides": 0,
+                                         "raw_bytes": 0.0, "stored_bytes": 0.0})
+
+    for event in events:
+        if event["depth"] == 0:
+            entry = row(event["name"])
+            entry["calls"] += 1
+            entry["seconds"] += event["duration"]
+    for slide in slides:
+        weights = shares.get(slide["slide"] - 1) or {UNINSTRUMENTED: 1}
+        total = sum(weights.values()) or 1
+        row(max(weights, key=weights.get))["slides"] += 1
+        for name, weight in weights.items():
+            entry = row(name)
+            entry["raw_bytes"] += slide["raw_bytes"] * weight / total
+            entry["stored_bytes"] += slide["stored_bytes"] * weight / total
+
+    helpers = {}
+    for event in events:
+        if event["depth"] == 0:
+            continue
+        entry = helpers.setdefault(event["name"], {"name": event["name"], "calls": 0, "seconds": 0.0,
+                                                   "xml_bytes": 0, "stored_bytes": 0.0})
+        entry["calls"] += 1
+        entry["seconds"] += event["duration"]
+        entry["xml_bytes"] += event["xml_bytes"]
+        touched = [slides[index] for index in event["slides"] if index < len(slides)]
+        raw = sum(slide["raw_bytes"] for slide in touched)
+        if raw:
+            entry["stored_bytes"] += event["xml_bytes"] * sum(slide["stored_bytes"] for slide in touched) / raw
+
+    def by_size(rows):
+        return sorted(rows.values(), key=lambda entry: -entry["stored_bytes"])
+
+    return by_size(methods), by_size(helpers)
+
+
+def print_methods(top_level, helpers, file=None):
+    file = file or sys.stdout
+    print(f"\n{'Slide method':<58} {'Calls':>6} {'Slides':>6} {'ms':>8} {'Raw KB':>9} {'Stored KB':>10} "
+          f"{'KB/call':>9}", file=file)
+    for row in top_level:
+        per_call = row["stored_bytes"] / row["calls"] / 1024 if row["calls"] else 0.0
+        print(f"{row['name']:<58} {row['calls']:>6} {row['slides']:>6} {row['seconds'] * 1000:>8.1f} "
+              f"{row['raw_bytes'] / 1024:>9.1f} {row['stored_bytes'] / 1024:>10.1f} {per_call:>9.2f}", file=file)
+    if helpers:
+        print(f"\n{'Nested helper (inclusive)':<58} {'Calls':>6} {'ms':>8} {'XML KB':>9} {'~Stored KB':>10}",
+              file=file)
+        for row in helpers:
+            print(f"{row['name']:<58} {row['calls']:>6} {row['seconds'] * 1000:>8.1f} "
+                  f"{row['xml_bytes'] / 1024:>9.1f} {row['stored_bytes'] / 1024:>10.1f}", file=file)
+
+
+def print_comparison(anatomies, file=None):
+    """Stored KB per part type side by side"""
+    file = file or sys.stdout
+    tables = [anatomy.categories() for anatomy in anatomies]
+    labels = [os.path.splitext(os.path.basename(anatomy.name))[0][:24] for anatomy in anatomies]
+    categories = sorted({category for table in tables for category in table},
+                        key=lambda category: -max(table.get(category, {}).get("stored_bytes", 0) for table in tables))
+    width = max(12, *(len(label) for label in labels))
+    print(f"\n{'Stored KB':<18}" + "".join(f" {label:>{width}}" for label in labels), file=file)
+    for category in categories:
+        print(f"{category:<18}" + "".join(
+            f" {table.get(category, {}).get('stored_bytes', 0) / 1024:>{width}.1f}" for table in tables), file=file)
+    print(f"{'total per slide':<18}" + "".join(
+        f" {anatomy.stored_bytes / max(len(anatomy.slide_parts), 1) / 1024:>{width}.1f}" for anatomy in anatomies),
+        file=file)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Break a deck down by part type, slide and generator method")
+    parser.add_argument("decks", nargs="*", help="saved .pptx files")
+    parser.add_argument("--build", help="generate this deck with the profiler and attribute bytes to add_* methods")
+    parser.add_argument("--slides", type=int, default=10, help="number of largest slides to list")
+    parser.add_argument("--json", help="write the breakdown as JSON")
+    args = parser.parse_args(argv)
+    if not args.decks and not args.build:
+        parser.error("give a deck or --build")
+
+    anatomies = [PackageAnatomy(path) for path in args.decks]
+    report = {"decks": []}
+    for anatomy in anatomies:
+        anatomy.print(args.slides)
+        print()
+        report["decks"].append({"name": anatomy.name, "categories": anatomy.categories(), "slides": anatomy.slides()})
+
+    if args.build:
+        blob, events, elapsed = profile_build(args.build)
+        anatomy = PackageAnatomy(blob, name=f"{args.build} (built in {elapsed:.2f}s, profiled)")
+        anatomy.print(args.slides)
+        top_level, helpers = method_rows(anatomy, events)
+        print_methods(top_level, helpers)
+        anatomies.append(anatomy)
+        report["decks"].append({"name": args.build, "seconds": elapsed, "categories": anatomy.categories(),
+                                "slides": anatomy.slides(), "methods": top_level, "helpers": helpers})
+
+    if len(anatomies) > 1:
+        print_comparison(anatomies)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=1)
+        print(f"\nBreakdown written to {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
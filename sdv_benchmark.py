@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Generation benchmark suite.
+
+Each workload drives one generator. At every synthetic size it builds that
+many slides by cycling through the same slide helpers the generator's deck
+method uses (so the mix of title, table, chart and diagram slides matches the
+real deck), then saves the result to memory. The size "full" runs the deck
+method itself (create_presentation, create_mega_presentation, ...).
+
+Every case runs in a fresh interpreter so that peak RSS is per case. Results
+are written as JSON; passing --baseline compares against an earlier run and
+flags cases that got slower, bigger or hungrier than the threshold allows.
+
+Usage:
+    python sdv_benchmark.py                              # all workloads, all sizes
+    python sdv_benchmark.py -w massive --sizes 10 100
+    python sdv_benchmark.py --output new.json --baseline old.json
+"""
+
+import argparse
+import io
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import time
+from queue import Empty
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+DEFAULT_SIZES = ["full", 10, 100, 1000, 10000]
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                              ".sdv_build", "bench", "latest.json")
+
+# Metrics compared against the baseline, and whether higher is better
+TRACKED_METRICS = {
+    "slides_per_s": True,
+    "save_s": False,
+    "peak_rss_kb": False,
+    "output_bytes": False,
+}
+TIMING_METRICS = ("slides_per_s", "save_s")
+
+# Cases faster than this are dominated by noise; only sizes are compared
+MIN_TIMED_WALL_S = 0.5
+# How often run_isolated checks that its child process is still alive
+POLL_S = 1.0
+
+
+def _massive(size):
+    from create_massive_sdv_presentation import MassiveSDVPresentation
+    builder = MassiveSDVPresentation()
+    if size == "full":
+        return builder.create_presentation()
+    steps = [
+        lambda i: builder.add_title_slide(f"Section {i}", "Benchmark section", section=i % 9),
+        lambda i: builder.add_content_slide(f"Bullets {i}", bullets=[
+            {"main": "SDV 시장 급성장", "sub": ["2030년까지 CAGR 32% 성장 예상", "시장 규모 3,500억 달러 도달"]},
+            "총 투자 규모: 3조원 (2024-2030)"]),
+        lambda i: builder.add_content_slide(f"Content {i}", content="SDV 전환은 선택이 아닌 생존의 문제입니다.\n" * 8),
+        lambda i: builder.add_table_slide(f"Table {i}", ["지역", "2024", "2030", "CAGR"],
+                                          [["중국", "20", "120", "35%"]] * 6),
+        lambda i: builder.add_chart_slide(f"Market {i}", chart_type="market"),
+        lambda i: builder.add_chart_slide(f"Comparison {i}", chart_type="comparison"),
+        lambda i: builder.add_chart_slide(f"Timeline {i}", chart_type="timeline"),
+        lambda i: builder.add_architecture_slide(f"Architecture {i}"),
+    ]
+    for i in range(size):
+        steps[i % len(steps)](i)
+    return builder.prs
+
+
+def _ultimate(size):
+    from create_ultimate_sdv_presentation import UltimateSDVPresentation
+    builder = UltimateSDVPresentation()
+    if size == "full":
+        return builder.create_mega_presentation()
+    sections = [
+        builder.add_market_analysis_slide,
+        builder.add_china_standards_slide,
+        builder.add_technical_slide,
+        builder.add_comparison_slide,
+        builder.add_korea_strategy_slide,
+        builder.add_implementation_slide,
+        builder.add_case_study_slide,
+        builder.add_future_slide,
+        builder.add_appendix_slide,
+    ]
+    for i in range(size):
+        sections[i % len(sections)](builder.add_slide(), i // len(sections))
+    return builder.prs
+
+
+def _executive(size):
+    from create_executive_sdv_ppt import ProfessionalSDVPresentation
+    builder = ProfessionalSDVPresentation()
+    if size == "full":
+        return builder.create_presentation()
+    steps = [
+        builder.add_cover_slide,
+        builder.add_agenda_slide,
+        builder.add_key_message_slide,
+        builder.add_market_chart_slide,
+        builder.add_architecture_diagram_slide,
+        builder.add_comparison_matrix_slide,
+        builder.add_roadmap_slide,
+        builder.add_action_items_slide,
+        builder.add_closing_slide,
+    ]
+    for i in range(size):
+        steps[i % len(steps)]()
+    return builder.prs
+
+
+def _advanced(size):
+    import create_advanced_sdv_presentation as gen
+    if size == "full":
+        return gen.create_advanced_sdv_presentation()
+    from pptx.enum.chart import XL_CHART_TYPE
+    from sdv_template import new_presentation
+    prs = new_presentation("wide")
+    categories = ['2024', '2025', '2026', '2027', '2028', '2029', '2030']
+    series = {'시장 규모': (650, 980, 1420, 1800, 2200, 2800, 3500)}
+    steps = [
+        lambda i: gen.add_table_slide(prs, f"Table {i}", [["중국", "ICV", "서비스", "80%", "60%"]] * 5,
+                                      ['국가', '표준 명칭', '주요 특징', '완성도', '채택률']),
+        lambda i: gen.add_chart_slide(prs, f"Chart {i}", XL_CHART_TYPE.COLUMN_CLUSTERED, categories, series),
+        lambda i: gen.add_diagram_slide(prs, f"Architecture {i}", "architecture"),
+        lambda i: gen.add_diagram_slide(prs, f"Ecosystem {i}", "ecosystem"),
+        lambda i: gen.add_diagram_slide(prs, f"Timeline {i}", "timeline"),
+        lambda i: gen.add_diagram_slide(prs, f"Process {i}", "process"),
+    ]
+    for i in range(size):
+        steps[i % len(steps)](i)
+    return prs
+
+
+def _professional(size):
+    import create_professional_sdv_ppt as gen
+    if size == "full":
+        return gen.create_professional_sdv_presentation()
+    from sdv_template import new_presentation
+    prs = new_presentation("compact")
+    steps = [
+        lambda i: gen.add_title_slide(prs, f"Title {i}", "Benchmark"),
+        lambda i: gen.add_section_divider(prs, f"Section {i}", i % 100),
+        lambda i: gen.add_content_slide(prs, f"Bullets {i}", bullets=[
+            {"main": "표준화 체계", "sub": ["Part 1: Atomic Service API", "Part 2: Device Abstraction API"]}]),
+        lambda i: gen.add_comparison_table(prs, f"Table {i}", ["항목", "중국", "AUTOSAR", "일본"],
+                                           [["주도 주체", "정부", "컨소시엄", "기업"]] * 6),
+        lambda i: gen.add_timeline_slide(prs, f"Timeline {i}", [
+            {"phase": f"Phase {k}", "details": ["기술 역량 구축", "파일럿 프로젝트"]} for k in range(3)]),
+    ]
+    for i in range(size):
+        steps[i % len(steps)](i)
+    return prs
+
+
+def _comprehensive(size):
+    import create_comprehensive_sdv_ppt as gen
+    if size == "full":
+        return gen.create_comprehensive_sdv_presentation()
+    from sdv_template import new_presentation
+    prs = new_presentation()
+    for i in range(size):
+        gen.add_slide_with_bullets(prs, f"Bullets {i}", [
+            "SDV는 미래 자동차 산업의 핵심 패러다임",
+            {"main": "Part 1: SDV 개념 및 시장 전망", "sub": ["SDV 정의", "핵심 기술", "시장 규모"]}])
+    return prs
+
+
+WORKLOADS = {
+    "massive": _massive,
+    "ultimate": _ultimate,
+    "executive": _executive,
+    "advanced": _advanced,
+    "professional": _professional,
+    "comprehensive": _comprehensive,
+}
+
+
+def peak_rss_kb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes elsewhere
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def run_case(workload, size):
+    """Build and save one case in the current process and return its metrics"""
+    from sdv_package import save_presentation
+
+    start = time.perf_counter()
+    prs = WORKLOADS[workload](size)
+    build_s = time.perf_counter() - start
+
+    stream = io.BytesIO()
+    start = time.perf_counter()
+    save_presentation(prs, stream)
+    save_s = time.perf_counter() - start
+
+    slides = len(prs.slides)
+    wall_s = build_s + save_s
+    return {
+        "workload": workload,
+        "size": size,
+        "slides": slides,
+        "wall_s": round(wall_s, 4),
+        "build_s": round(build_s, 4),
+        "save_s": round(save_s, 4),
+        "slides_per_s": round(slides / wall_s, 2) if wall_s else None,
+        "peak_rss_kb": peak_rss_kb(),
+        "output_bytes": len(stream.getvalue()),
+    }
+
+
+def _case_worker(workload, size, queue):
+    import contextlib
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = run_case(workload, size)
+    queue.put(result)
+
+
+def run_isolated(workload, size):
+    """Run one case in a fresh interpreter so peak RSS is not shared"""
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(target=_case_worker, args=(workload, size, queue))
+    process.start()
+    while True:
+        try:
+            result = queue.get(timeout=POLL_S)
+            break
+        except Empty:
+            # A child killed by an ImportError, the OOM killer or a segfault never reports back
+            if not process.is_alive() and queue.empty():
+                process.join()
+                raise RuntimeError(f"{workload} (size {size}): benchmark process exited with code "
+                                   f"{process.exitcode} without a result")
+    process.join()
+    return result
+
+
+def compare(results, baseline, threshold):
+    """Return human-readable regressions of `results` against `baseline`"""
+    previous = {(r["workload"], str(r["size"])): r for r in baseline.get("results", [])}
+    regressions = []
+    for result in results:
+        old = previous.get((result["workload"], str(result["size"])))
+        if not old:
+            continue
+        for metric, higher_is_better in TRACKED_METRICS.items():
+            if metric in TIMING_METRICS and min(result["wall_s"], old["wall_s"]) < MIN_TIMED_WALL_S:
+                continue
+            new_value, old_value = result.get(metric), old.get(metric)
+            if not new_value or not old_value:
+                continue
+            change = (new_value - old_value) / old_value
+            if (higher_is_better and change < -threshold) or (not higher_is_better and change > threshold):
+                regressions.append(
+                    f"{result['workload']}@{result['size']}: {metric} {old_value} -> {new_value} ({change:+.0%})"
+                )
+    return regressions
+
+
+def environment():
+    try:
+        import pptx
+        pptx_version = pptx.__version__
+    except ImportError:
+        pptx_version = None
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "python_pptx": pptx_version,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark deck generation")
+    parser.add_argument("-w", "--workloads", nargs="+", choices=sorted(WORKLOADS), default=list(WORKLOADS))
+    parser.add_argument("--sizes", nargs="+", default=DEFAULT_SIZES,
+                        help='slide counts to build, or "full" for the deck method itself')
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="where to write the JSON results")
+    parser.add_argument("--baseline", help="earlier results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed relative change (default 0.2)")
+    args = parser.parse_args(argv)
+
+    sizes = [size if size == "full" else int(size) for size in args.sizes]
+    results = []
+    print(f"{'Workload':<14} {'Size':>6} {'Slides':>7} {'Wall':>8} {'Save':>7} {'Slides/s':>9} {'RSS MB':>7} {'Bytes':>10}")
+    for workload in args.workloads:
+        for size in sizes:
+            result = run_isolated(workload, size)
+            results.append(result)
+            rss = f"{result['peak_rss_kb'] / 1024:.0f}" if result["peak_rss_kb"] else "-"
+            print(f"{workload:<14} {str(size):>6} {result['slides']:>7} {result['wall_s']:>7.2f}s "
+                  f"{result['save_s']:>6.2f}s {result['slides_per_s']:>9} {rss:>7} {result['output_bytes']:>10}")
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({"environment": environment(), "results": results}, f, indent=2, ensure_ascii=False)
+    print(f"\nResults written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        if regressions:
+            print(f"\n⚠️  {len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print("\nNo regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Incremental build orchestrator for the deck generators.
+
+Each deck declares the generator module that builds it, the outputs it
+writes and the source documents, data files and templates it reads. Local
+modules imported by a generator are discovered from its import statements,
+so editing a shared helper rebuilds every deck that uses it.
+
+A stamp store records the size, mtime and SHA-256 of every input after a
+successful build. Unchanged files are recognized from size and mtime alone,
+which keeps a no-op rebuild of the whole repository well under a second;
+files whose mtime moved are re-hashed so a touch does not trigger a rebuild.
+
+Usage:
+    python sdv_build.py                 # rebuild stale decks
+    python sdv_build.py massive -j 4    # rebuild one deck if stale
+    python sdv_build.py --force         # rebuild everything
+    python sdv_build.py --graph         # print the dependency graph
+"""
+
+import argparse
+import ast
+import functools
+import glob
+import hashlib
+import importlib
+import importlib.util
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+STAMP_FILE = os.path.join(BASE_DIR, ".sdv_build", "stamps.json")
+
+# Environment variables that change generated bytes
+BUILD_ENV = ("SDV_SEED", "SOURCE_DATE_EPOCH", "SDV_COMPRESSION", "SDV_MEDIA_DPI")
+
+
+class Deck:
+    """A build target: one generator module and the decks it writes"""
+
+    def __init__(self, name, module, outputs, sources=(), data=()):
+        self.name = name
+        self.module = module
+        self.outputs = list(outputs)
+        self.sources = list(sources)
+        self.data = list(data)
+
+
+# Market datasets read through sdv_market_data
+MARKET_DATA = ["data/market/*.csv", "data/market/*.parquet"]
+
+DECKS = [
+    Deck("presentation", "create_presentation",
+         ["SDV_Presentation.pptx"],
+         sources=["TalkFile_SDV*.pdf", "SDV Intelligent Connected Vehicle*(중국어).pdf"],
+         data=["i18n/glossary/*.json"]),
+    Deck("keti", "analyze_keti_ppt",
+         ["중국SDV표준_소개_KETI_박부식0826_수정본.pptx"],
+         sources=["중국SDV표준 소개_KETI 박부식0826.pptx"]),
+    Deck("advanced", "create_advanced_sdv_presentation",
+         ["SDV_Advanced_Presentation_Full.pptx"],
+         data=MARKET_DATA),
+    Deck("comprehensive", "create_comprehensive_sdv_ppt",
+         ["SDV_종합분석_보고서.pptx", "SDV_기술심화_분석.pptx"]),
+    Deck("executive", "create_executive_sdv_ppt",
+         ["SDV_Executive_Presentation_Premium.pptx"],
+         data=MARKET_DATA),
+    Deck("massive", "create_massive_sdv_presentation",
+         ["SDV_Complete_Analysis_150_Slides.pptx"],
+         data=MARKET_DATA),
+    Deck("new", "create_new_presentation",
+         ["SDV_Comprehensive_Presentation_2025.pptx"]),
+    Deck("professional", "create_professional_sdv_ppt",
+         ["SDV_Professional_Presentation_16x9.pptx"],
+         data=MARKET_DATA),
+    Deck("ultimate", "create_ultimate_sdv_presentation",
+         ["SDV_Ultimate_Comprehensive_200_Slides.pptx", "SDV_Technical_Deep_Dive_200_Slides.pptx"]),
+    Deck("chapters", "sdv_shards",
+         [f"SDV_Complete_Analysis_Ch{number}_{name}.pptx" for number, name in enumerate(
+             ["Executive_Summary", "Market_Analysis", "China_Standards", "Global_Comparison",
+              "Technical_Deep_Dive", "Korea_Strategy", "Implementation", "Appendix"], 1)]
+         + ["SDV_Complete_Analysis_Index.pptx"],
+         data=MARKET_DATA),
+    Deck("variants", "sdv_variants",
+         ["SDV_Ultimate_Comprehensive_200_Slides_ko.pptx", "SDV_Ultimate_Comprehensive_200_Slides_en.pptx",
+          "SDV_Ultimate_Comprehensive_200_Slides_zh.pptx"],
+         data=["i18n/*.json"]),
+]
+
+
+def get_deck(name):
+    """Look up a deck by name or generator module name"""
+    for deck in DECKS:
+        if name in (deck.name, deck.module):
+            return deck
+    raise KeyError(f"Unknown deck: {name}")
+
+
+def template_files():
+    """Template packages loaded by sdv_template for the generators"""
+    spec = importlib.util.find_spec("pptx")
+    if spec is None or not spec.submodule_search_locations:
+        return []
+    template_dir = os.path.join(list(spec.submodule_search_locations)[0], "templates")
+    templates = sorted(glob.glob(os.path.join(template_dir, "*.pptx")))
+    if os.environ.get("SDV_CORPORATE_TEMPLATE"):
+        templates.append(os.path.abspath(os.environ["SDV_CORPORATE_TEMPLATE"]))
+    return templates
+
+
+def local_imports(module):
+    """Names of the local modules `module` imports directly"""
+    path = os.path.join(BASE_DIR, module + ".py")
+    with open(path, "rb") as f:
+        tree = ast.parse(f.read(), path)
+    names = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.extend(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.append(node.module.split(".")[0])
+    return [name for name in dict.fromkeys(names)
+            if name != module and os.path.exists(os.path.join(BASE_DIR, name + ".py"))]
+
+
+@functools.lru_cache(maxsize=None)
+def module_deps(module):
+    """Local module files imported (transitively) by `module`, including itself"""
+    seen = []
+    pending = [module]
+    while pending:
+        name = pending.pop()
+        path = os.path.join(BASE_DIR, name + ".py")
+        if path in seen or not os.path.exists(path):
+            continue
+        seen.append(path)
+        pending.extend(local_imports(name))
+    return sorted(seen)
+
+
+def deck_inputs(deck):
+    """Every file whose content can change the deck's output, grouped by kind"""
+    def expand(patterns):
+        paths = []
+        for pattern in patterns:
+            paths.extend(glob.glob(os.path.join(BASE_DIR, pattern)))
+        return sorted(set(paths))
+
+    return {
+        "modules": module_deps(deck.module),
+        "sources": expand(deck.sources),
+        "data": expand(deck.data),
+        "templates": template_files(),
+    }
+
+
+def deck_outputs(deck, output_dir=BASE_DIR):
+    return [os.path.join(output_dir, name) for name in deck.outputs]
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class StampStore:
+    """Persistent record of input and output signatures per deck"""
+
+    def __init__(self, path=STAMP_FILE):
+        self.path = path
+        self.stamps = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.stamps = json.load(f)
+        self.dirty = False
+
+    def save(self):
+        if not self.dirty:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.stamps, f, ensure_ascii=False, indent=1, sort_keys=True)
+        os.replace(tmp, self.path)
+        self.dirty = False
+
+    def signature(self, path, previous=None):
+        """Return [size, mtime_ns, sha256] for path, reusing the hash when unchanged"""
+        st = os.stat(path)
+        if previous and previous[0] == st.st_size and previous[1] == st.st_mtime_ns:
+            return previous
+        return [st.st_size, st.st_mtime_ns, file_sha256(path)]
+
+    def collect(self, deck, output_dir=BASE_DIR):
+        """Current signatures of the deck's inputs, outputs and build environment"""
+        previous = self.stamps.get(deck.name, {})
+        old_files = previous.get("files", {})
+        files = {}
+        for paths in deck_inputs(deck).values():
+            for path in paths:
+                key = os.path.relpath(path, BASE_DIR)
+                files[key] = self.signature(path, old_files.get(key))
+        outputs = {}
+        old_outputs = previous.get("outputs", {})
+        for path in deck_outputs(deck, output_dir):
+            key = os.path.relpath(path, BASE_DIR)
+            if os.path.exists(path):
+                outputs[key] = self.signature(path, old_outputs.get(key))
+            else:
+                outputs[key] = None
+        env = {name: os.environ.get(name) for name in BUILD_ENV}
+        return {"files": files, "outputs": outputs, "env": env}
+
+    def is_stale(self, deck, current):
+        """Compare content hashes so that touched-but-unchanged files do not count"""
+        previous = self.stamps.get(deck.name)
+        if previous is None:
+            return True
+        if any(sig is None for sig in current["outputs"].values()):
+            return True
+
+        def hashes(signatures):
+            return {k: v[2] if v else None for k, v in signatures.items()}
+
+        if (hashes(previous.get("files", {})) != hashes(current["files"])
+                or hashes(previous.get("outputs", {})) != hashes(current["outputs"])
+                or previous.get("env") != current["env"]):
+            return True
+        if previous != current:
+            # Only mtimes moved; remember them so the next check is stat-only
+            self.record(deck, current)
+        return False
+
+    def record(self, deck, current):
+        self.stamps[deck.name] = current
+        self.dirty = True
+
+
+def build_module(module, output_dir):
+    """Run the generator's build() and the media stage (when SDV_MEDIA_DPI is set)"""
+    paths = importlib.import_module(module).build(output_dir)
+    from sdv_media import configured_dpi, optimize_deck
+    if configured_dpi():
+        for path in paths:
+            optimize_deck(path)
+    return paths
+
+
+def _run_build(module, output_dir):
+    """Worker entry point: import the generator and run its build()"""
+    start = time.perf_counter()
+    paths = build_module(module, output_dir)
+    return paths, time.perf_counter() - start
+
+
+def make_pool(modules, jobs=None):
+    """Process pool whose workers start with `modules` already imported
+
+    The generators (and python-pptx) are imported once in this process and
+    workers are forked from it, so no worker pays interpreter startup or the
+    import cost again. Platforms without fork fall back to the default start
+    method and import in each worker.
+    """
+    for module in modules:
+        importlib.import_module(module)
+    # Workers render whole decks, so also load the lazily imported chart code
+    importlib.import_module("pptx.chart.data")
+    # Parse the template masters once; forked workers inherit the cache
+    importlib.import_module("sdv_template").TEMPLATE_CACHE.warm()
+    context = None
+    if "fork" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("fork")
+    return ProcessPoolExecutor(max_workers=jobs or os.cpu_count() or 1, mp_context=context)
+
+
+class BuildResults(dict):
+    """{deck name: (paths, elapsed seconds)} plus .failed: {deck name: error message}"""
+
+    def __init__(self):
+        super().__init__()
+        self.failed = {}
+
+
+def build(targets=None, jobs=None, force=False, dry_run=False, output_dir=BASE_DIR, store=None):
+    """Rebuild stale decks in parallel; return BuildResults"""
+    decks = [get_deck(name) for name in targets] if targets else list(DECKS)
+    store = store or StampStore(os.path.join(output_dir, ".sdv_build", "stamps.json"))
+
+    stale = []
+    snapshots = {}
+    for deck in decks:
+        snapshots[deck.name] = store.collect(deck, output_dir)
+        if force or store.is_stale(deck, snapshots[deck.name]):
+            stale.append(deck)
+    store.save()
+
+    results = BuildResults()
+    if not stale:
+        print(f"All {len(decks)} decks up to date")
+        return results
+    if dry_run:
+        for deck in stale:
+            print(f"would rebuild: {deck.name} ({deck.module})")
+        return results
+
+    jobs = min(jobs or os.cpu_count() or 1, len(stale))
+    with make_pool([deck.module for deck in stale], jobs) as pool:
+        futures = {pool.submit(_run_build, deck.module, output_dir): deck for deck in stale}
+        for future in as_completed(futures):
+            deck = futures[future]
+            try:
+                paths, elapsed = future.result()
+            except Exception as e:
+                print(f"✗ {deck.name}: {e}")
+                results.failed[deck.name] = str(e)
+                continue
+            results[deck.name] = (paths, elapsed)
+            # Input signatures are taken before the build so that edits made
+            # while it was running are picked up next time
+            current = snapshots[deck.name]
+            current["outputs"] = store.collect(deck, output_dir)["outputs"]
+            store.record(deck, current)
+            print(f"✓ {deck.name}: {len(paths)} file(s) in {elapsed:.2f}s")
+    store.save()
+    return results
+
+
+def print_graph(decks=None):
+    for deck in decks or DECKS:
+        print(f"{deck.name} ({deck.module})")
+        for kind, paths in deck_inputs(deck).items():
+            for path in paths:
+                print(f"  <- [{kind}] {os.path.relpath(path, BASE_DIR)}")
+        for path in deck.outputs:
+            print(f"  -> {path}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rebuild decks whose inputs changed")
+    parser.add_argument("targets", nargs="*", help="deck names (default: all)")
+    parser.add_argument("-j", "--jobs", type=int, help="parallel build processes")
+    parser.add_argument("-f", "--force", action="store_true", help="rebuild even if up to date")
+    parser.add_argument("-n", "--dry-run", action="store_true", help="only list stale decks")
+    parser.add_argument("--graph", action="store_true", help="print the dependency graph")
+    parser.add_argument("-o", "--output-dir", default=BASE_DIR)
+    args = parser.parse_args(argv)
+
+    if args.graph:
+        print_graph([get_deck(name) for name in args.targets] or None)
+        return 0
+
+    start = time.perf_counter()
+    results = build(args.targets, args.jobs, args.force, args.dry_run, os.path.abspath(args.output_dir))
+    print(f"Done in {time.perf_counter() - start:.2f}s")
+    if results.failed:
+        print(f"✗ {len(results.failed)} deck(s) failed: {', '.join(sorted(results.failed))}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Prototype-based shape components for diagram-heavy slides.
+
+Building an autoshape through python-pptx parses a fresh XML template,
+then walks the fill, line and font proxies for every box. Architecture
+layers, matrix cells and ecosystem nodes repeat the same box dozens of
+times with only the text, fill color and position changing.
+
+A ComponentLibrary builds each distinct component (shape type, line,
+text style, ...) once on a scratch slide through the regular sdv_slides
+helpers and keeps its XML as a prototype. Later components are deep copies
+of that element with the id, name, offset, extent, fill color and text
+patched, so the output is the same XML the helpers would have produced.
+"""
+
+import copy
+
+from pptx.oxml.ns import qn
+
+from sdv_slides import add_box, add_line, add_text
+
+
+_SP_PR = qn("p:spPr")
+_TX_BODY = qn("p:txBody")
+_P = qn("a:p")
+_R = qn("a:r")
+_T = qn("a:t")
+
+
+class ShapePrototype:
+    """XML of one built shape, stamped onto slides with patched values
+
+    Prototypes with text are built with a one-character run; single-line
+    text only replaces that run's <a:t>.
+    """
+
+    def __init__(self, element):
+        element = copy.deepcopy(element)
+        self.element = element
+        self.basename = element[0][0].get("name").rsplit(" ", 1)[0]
+        self._xfrm_path = _child_path(element, _SP_PR, qn("a:xfrm"))
+        self._fill_path = _child_path(element, _SP_PR, qn("a:solidFill"), qn("a:srgbClr"))
+        self._text_path = _child_path(element, _TX_BODY)
+
+    def stamp(self, slide, left, top, width, height, text=None, fill=None,
+              split_lines=False, flip_h=False, flip_v=False):
+        """Append a copy to `slide` and return the new element"""
+        shapes = slide.shapes
+        element = copy.deepcopy(self.element)
+        shape_id = shapes._spTree.max_shape_id + 1
+        c_nv_pr = element[0][0]
+        c_nv_pr.set("id", str(shape_id))
+        c_nv_pr.set("name", f"{self.basename} {shape_id - 1}")
+
+        xfrm = _follow(element, self._xfrm_path)
+        if flip_h or flip_v or len(xfrm.attrib):
+            xfrm.attrib.pop("flipH", None)
+            xfrm.attrib.pop("flipV", None)
+            if flip_h:
+                xfrm.set("flipH", "1")
+            if flip_v:
+                xfrm.set("flipV", "1")
+        off, ext = xfrm[0], xfrm[1]
+        off.set("x", str(int(left)))
+        off.set("y", str(int(top)))
+        ext.set("cx", str(int(width)))
+        ext.set("cy", str(int(height)))
+
+        if fill is not None:
+            _follow(element, self._fill_path).set("val", str(fill))
+        if text is not None and self._text_path is not None:
+            _set_text(_follow(element, self._text_path), text, split_lines)
+
+        shapes._spTree.insert_element_before(element, "p:extLst")
+        return element
+
+
+def _child_path(element, *tags):
+    """Child indexes leading from `element` through `tags`, or None"""
+    path = []
+    for tag in tags:
+        child = element.find(tag)
+        if child is None:
+            return None
+        path.append(element.index(child))
+        element = child
+    return path
+
+
+def _follow(element, path):
+    for index in path:
+        element = element[index]
+    return element
+
+
+def _set_text(tx_body, text, split_lines):
+    """Replace the prototype's placeholder run, keeping the paragraph's <a:pPr>"""
+    first = tx_body.find(_P)
+    run = first.find(_R)
+    if text and "\n" not in text and "\v" not in text:
+        run.find(_T).text = text
+        return
+    first.remove(run)
+    lines = text.split("\n") if split_lines else [text]
+    first.append_text(lines[0])
+    for line in lines[1:]:
+        tx_body.add_p().append_text(line)
+
+
+class ComponentLibrary:
+    """Prototype cache for boxes, text boxes and connectors"""
+
+    def __init__(self):
+        self._prototypes = {}
+        self._scratch = None
+
+    def _scratch_slide(self):
+        if self._scratch is None:
+            from sdv_template import new_presentation
+
+            prs = new_presentation()
+            self._scratch = prs.slides.add_slide(prs.slide_layouts[6])
+        return self._scratch
+
+    def _prototype(self, key, build):
+        prototype = self._prototypes.get(key)
+        if prototype is None:
+            prototype = self._prototypes[key] = ShapePrototype(build(self._scratch_slide())._element)
+        return prototype
+
+    def box(self, slide, shape_type, left, top, width, height, fill=None, line=None, line_width=None,
+            no_line=False, text=None, style=None, split_lines=False):
+        """Same arguments and XML as sdv_slides.add_box; returns the new element"""
+        key = ("box", shape_type, fill is not None, line, line_width, no_line, text is not None, style)
+        prototype = self._prototype(key, lambda scratch: add_box(
+            scratch, shape_type, 0, 0, 1, 1, fill=fill, line=line, line_width=line_width,
+            no_line=no_line, text=None if text is None else "x", style=style))
+        return prototype.stamp(slide, left, top, width, height, text, fill, split_lines)
+
+    def text(self, slide, left, top, width, height, text, style=None, word_wrap=None, split_lines=False):
+        """Same arguments and XML as sdv_slides.add_text; returns the new element"""
+        key = ("text", style, word_wrap)
+        prototype = self._prototype(key, lambda scratch: add_text(
+            scratch, 0, 0, 1, 1, "x", style, word_wrap))
+        return prototype.stamp(slide, left, top, width, height, text, split_lines=split_lines)
+
+    def line(self, slide, x1, y1, x2, y2, color=None, width=None):
+        """Same arguments and XML as sdv_slides.add_line; returns the new element"""
+        key = ("line", color, width)
+        prototype = self._prototype(key, lambda scratch: add_line(scratch, 0, 0, 1, 1, color, width))
+        return prototype.stamp(slide, min(x1, x2), min(y1, y2), abs(x2 - x1), abs(y2 - y1),
+                               flip_h=x1 > x2, flip_v=y1 > y2)
+
+    def clear(self):
+        self._prototypes.clear()
+        self._scratch = None
+
+
+COMPONENTS = ComponentLibrary()
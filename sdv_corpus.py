@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Searchable corpus of the source PDFs and the decks.
+
+The page text extract_pdf_pages reads, the sections split_sections finds
+in it and the slide records slide_records takes from a deck (title, layout,
+text) are kept in one SQLite database (.sdv_build/corpus.sqlite) with an
+FTS5 table each for pages, sections and slides. The tables use the trigram
+tokenizer, so Chinese and Korean text without word breaks matches on any
+substring of three or more characters; shorter terms are matched with LIKE.
+
+Ingesting is incremental: a file whose size and mtime are unchanged is
+skipped, a changed file is hashed and only re-extracted when its content
+hash differs, and a file with the same content as one already stored
+(a copy or a renamed deck) gets that document's rows copied without being
+parsed. Raising EXTRACT_VERSION makes the next ingest parse every file
+again. PDF text has the spaces PyPDF2 puts between Chinese characters
+removed, so "智能网联" matches. Files are extracted in batches and each batch is written in one
+transaction; the database runs in WAL mode so searches keep working while
+an ingest is writing.
+
+Rows of a document have rowids doc_id << 20 | page/section/slide number, so
+replacing a document deletes a rowid range instead of scanning the tables.
+
+Usage:
+    python sdv_corpus.py ingest                         # PDFs and decks in this directory
+    python sdv_corpus.py ingest ~/specs decks/*.pptx    # directories are scanned recursively
+    python sdv_corpus.py search "Device Abstraction" -n 5
+    python sdv_corpus.py search 표준화 --kind slides
+    python sdv_corpus.py stats
+"""
+
+import argparse
+import collections
+import hashlib
+import os
+import sqlite3
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DB_FILE = os.path.join(BASE_DIR, ".sdv_build", "corpus.sqlite")
+EXTENSIONS = {".pdf": "pdf", ".pptx": "deck"}
+BATCH_SIZE = 50             # documents per transaction
+UNIT_BITS = 20              # up to 1M pages/sections/slides per document
+UNIT_MASK = (1 << UNIT_BITS) - 1
+MIN_MATCH_LENGTH = 3        # trigram tokenizer: shorter terms cannot use the index
+EXTRACT_VERSION = 1         # bump when extraction changes; stored documents are then parsed again
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    kind TEXT NOT NULL,
+    title TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    units INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS documents_by_hash ON documents(content_hash);
+CREATE VIRTUAL TABLE IF NOT EXISTS pages USING fts5(text, tokenize='trigram');
+CREATE VIRTUAL TABLE IF NOT EXISTS sections USING fts5(title, text, tokenize='trigram');
+CREATE VIRTUAL TABLE IF NOT EXISTS slides USING fts5(title, text, layout UNINDEXED, tokenize='trigram');
+"""
+# Columns per table and their bm25 weights (titles count more than body text)
+TABLES = {
+    "pages": (("text",), (1.0,)),
+    "sections": (("title", "text"), (3.0, 1.0)),
+    "slides": (("title", "text", "layout"), (5.0, 1.0, 0.0)),
+}
+# Page cache and memory map for the (large) trigram index
+PRAGMAS = ("journal_mode=WAL", "synchronous=NORMAL", "cache_size=-65536", "mmap_size=1073741824")
+
+Hit = collections.namedtuple("Hit", "score kind path title location snippet")
+
+
+def content_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def extract_pdf(path, title):
+    """{"pages": [(text,)], "sections": [(title, text)]} or None if unreadable"""
+    from create_presentation import extract_pdf_pages, split_sections
+    from sdv_translate import close_cjk_gaps
+
+    pages = extract_pdf_pages(path)
+    if pages is None:
+        return None
+    pages = [close_cjk_gaps(page) for page in pages]     # "智 能 网 联" -> "智能网联"
+    text = "".join(page + "\n" for page in pages)
+    return {"pages": [(page,) for page in pages],
+            "sections": [(section["title"], "\n".join(section["content"]))
+                         for section in split_sections(text, title)]}
+
+
+def extract_deck(path):
+    """{"slides": [(title, text, layout)]}"""
+    from pptx import Presentation
+    from analyze_keti_ppt import slide_records
+
+    return {"slides": [(record["title"], "\n".join(record["content"]), record["layout"])
+                       for record in slide_records(Presentation(path))]}
+
+
+def source_files(paths):
+    """PDF and .pptx files among `paths`; directories are walked"""
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, names in os.walk(path):
+                dirs[:] = sorted(name for name in dirs if not name.startswith("."))
+                for name in sorted(names):
+                    if os.path.splitext(name)[1].lower() in EXTENSIONS and not name.startswith("~$"):
+                        yield os.path.join(root, name)
+        elif os.path.splitext(path)[1].lower() in EXTENSIONS:
+            yield path
+
+
+class IngestReport:
+    def __init__(self):
+        self.counts = collections.Counter()     # added / updated / copied / unchanged / failed
+        self.rows = collections.Counter()       # table -> rows written
+        self.seconds = 0.0
+
+    def __str__(self):
+        documents = ", ".join(f"{count} {state}" for state, count in sorted(self.counts.items())) or "nothing"
+        rows = ", ".join(f"{count} {table}" for table, count in sorted(self.rows.items())) or "no rows"
+        return f"{documents}; {rows} written in {self.seconds:.2f}s"
+
+
+class Corpus:
+    """The corpus database: incremental ingest and ranked search"""
+
+    def __init__(self, path=DB_FILE):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.db = sqlite3.connect(path)
+        for pragma in PRAGMAS:
+            self.db.execute(f"PRAGMA {pragma}")
+        with self.db:
+            self.db.executescript(SCHEMA)
+            if self.db.execute("PRAGMA user_version").fetchone()[0] < EXTRACT_VERSION:
+                # Rows from an older extractor: no stat or hash matches, so the next ingest re-parses
+                self.db.execute("UPDATE documents SET content_hash = '', mtime_ns = -1")
+                self.db.execute(f"PRAGMA user_version = {EXTRACT_VERSION}")
+
+    def close(self):
+        self.db.close()
+
+    # Ingest ---------------------------------------------------------------
+
+    def ingest(self, paths, batch_size=BATCH_SIZE):
+        """Add or refresh the given files; returns an IngestReport"""
+        report = IngestReport()
+        start = time.perf_counter()
+        paths = list(dict.fromkeys(os.path.abspath(path) for path in paths))
+        for first in range(0, len(paths), batch_size):
+            # Parse outside the transaction; only the writes hold the lock
+            records = [self._prepare(path, report) for path in paths[first:first + batch_size]]
+            with self.db:
+                for record in records:
+                    if record is not None:
+                        self._write(record, report)
+        report.seconds = time.perf_counter() - start
+        return report
+
+    def _prepare(self, path, report):
+        """What to write for `path`, or None if it is unchanged or unreadable"""
+        kind = EXTENSIONS[os.path.splitext(path)[1].lower()]
+        stat = os.stat(path)
+        row = self.db.execute("SELECT id, content_hash, size, mtime_ns FROM documents WHERE path = ?",
+                              (path,)).fetchone()
+        if row and row[2:] == (stat.st_size, stat.st_mtime_ns):
+            report.counts["unchanged"] += 1
+            return None
+        digest = content_hash(path)
+        record = {"id": row[0] if row else None, "path": path, "kind": kind, "hash": digest,
+                  "size": stat.st_size, "mtime_ns": stat.st_mtime_ns,
+                  "title": os.path.splitext(os.path.basename(path))[0]}
+        if row and row[1] == digest:
+            record["state"] = "unchanged"       # touched but identical: only the stat is refreshed
+            return record
+        source = self.db.execute("SELECT id FROM documents WHERE content_hash = ? AND path != ?",
+                                 (digest, path)).fetchone()
+        if source:
+            record.update(state="copied", source=source[0])
+            return record
+        return self._extract(record, report)
+
+    def _extract(self, record, report):
+        """`record` with the units parsed from its file, or None if that fails"""
+        path = record["path"]
+        try:
+            units = extract_pdf(path, record["title"]) if record["kind"] == "pdf" else extract_deck(path)
+        except Exception as e:
+            print(f"⚠️  {os.path.basename(path)}: {e}")
+            units = None
+        if units is None:
+            report.counts["failed"] += 1
+            return None
+        record.update(state="updated" if record["id"] is not None else "added", units=units)
+        return record
+
+    def _write(self, record, report):
+        db = self.db
+        if record["state"] == "copied":
+            # The source may have been rewritten earlier in this batch; then its rows are not a copy
+            source = db.execute("SELECT content_hash FROM documents WHERE id = ?", (record["source"],)).fetchone()
+            if not source or source[0] != record["hash"]:
+                record = self._extract(record, report)
+                if record is None:
+                    return
+        if record["id"] is None:
+            record["id"] = db.execute(
+                "INSERT INTO documents (path, kind, title, content_hash, size, mtime_ns, units) "
+                "VALUES (?, ?, ?, ?, ?, ?, 0)",
+                (record["path"], record["kind"], record["title"], record["hash"], record["size"],
+                 record["mtime_ns"])).lastrowid
+        else:
+            db.execute("UPDATE documents SET content_hash = ?, size = ?, mtime_ns = ? WHERE id = ?",
+                       (record["hash"], record["size"], record["mtime_ns"], record["id"]))
+        report.counts[record["state"]] += 1
+        if record["state"] == "unchanged":
+            return
+
+        self._delete_rows(record["id"])
+        base = record["id"] << UNIT_BITS
+        if record["state"] == "copied":
+            source = record["source"] << UNIT_BITS
+            for table, (columns, _) in TABLES.items():
+                names = ", ".join(columns)
+                count = db.execute(
+                    f"INSERT INTO {table} (rowid, {names}) SELECT ? + (rowid & ?), {names} FROM {table} "
+                    f"WHERE rowid BETWEEN ? AND ?", (base, UNIT_MASK, source, source | UNIT_MASK)).rowcount
+                if count:
+                    report.rows[table] += count
+            units = db.execute("SELECT units FROM documents WHERE id = ?", (record["source"],)).fetchone()[0]
+        else:
+            for table, rows in record["units"].items():
+                columns = TABLES[table][0]
+                db.executemany(
+                    f"INSERT INTO {table} (rowid, {', '.join(columns)}) "
+                    f"VALUES (?{', ?' * len(columns)})",
+                    ((base + number, *row) for number, row in enumerate(rows, 1)))
+                report.rows[table] += len(rows)
+            units = len(record["units"].get("pages") or record["units"].get("slides") or ())
+        db.execute("UPDATE documents SET units = ? WHERE id = ?", (units, record["id"]))
+
+    def _delete_rows(self, doc_id):
+        first = doc_id << UNIT_BITS
+        for table in TABLES:
+            self.db.execute(f"DELETE FROM {table} WHERE rowid BETWEEN ? AND ?", (first, first | UNIT_MASK))
+
+    def prune(self):
+        """Drop documents whose file no longer exists; returns their paths"""
+        gone = [(doc_id, path) for doc_id, path in self.db.execute("SELECT id, path FROM documents")
+                if not os.path.exists(path)]
+        with self.db:
+            for doc_id, _ in gone:
+                self._delete_rows(doc_id)
+                self.db.execute("DELETE FROM documents WHERE id = ?", (doc_id,))
+        return [path for _, path in gone]
+
+    # Search ---------------------------------------------------------------
+
+    def search(self, query, limit=20, kinds=tuple(TABLES)):
+        """Best `limit` hits for `query` across pages, sections and slides
+
+        Every whitespace-separated term has to occur (as a substring). Hits
+        are ordered by bm25 score; a query made only of one- and two-letter
+        terms cannot use the index and comes back unranked, in corpus order.
+        """
+        terms = query.split()
+        if not terms:
+            return []
+        indexed = [term for term in terms if len(term) >= MIN_MATCH_LENGTH]
+        short = [term for term in terms if len(term) < MIN_MATCH_LENGTH]
+        hits = []
+        for table in kinds:
+            hits.extend(self._search_table(table, indexed, short, limit))
+        hits.sort(key=lambda hit: hit.score)
+        return hits[:limit]
+
+    def _search_table(self, table, indexed, short, limit):
+        columns, weights = TABLES[table]
+        text_columns = [column for column in columns if column != "layout"]
+        conditions, params = [], []
+        if indexed:
+            conditions.append(f"{table} MATCH ?")
+            params.append(" ".join('"' + term.replace('"', '""') + '"' for term in indexed))
+        for term in short:
+            pattern = "%" + term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            conditions.append("(" + " OR ".join(f"{column} LIKE ? ESCAPE '\\'" for column in text_columns) + ")")
+            params.extend([pattern] * len(text_columns))
+        if indexed:
+            # ORDER BY rank lets FTS5 sort, so snippet() only runs for the rows returned
+            conditions.append("rank MATCH ?")
+            params.append(f"bm25({', '.join(map(str, weights))})")
+            score, order = "rank", "ORDER BY rank "
+            snippet = f"replace(snippet({table}, -1, '[', ']', '…', 12), char(10), ' ')"
+        else:
+            score, snippet, order = "0.0", f"substr(replace({text_columns[-1]}, char(10), ' '), 1, 80)", ""
+        title = "title" if "title" in columns else "''"
+        rows = self.db.execute(
+            f"SELECT hit.score, d.path, d.title, hit.rowid & ?, hit.heading, hit.snippet FROM "
+            f"(SELECT rowid, {score} AS score, {title} AS heading, {snippet} AS snippet FROM {table} "
+            f"WHERE {' AND '.join(conditions)} {order}LIMIT ?) AS hit "
+            f"JOIN documents AS d ON d.id = hit.rowid >> ?",
+            (UNIT_MASK, *params, limit, UNIT_BITS)).fetchall()
+        label = {"pages": "p.", "sections": "§", "slides": "slide "}[table]
+        return [Hit(score, table, path, doc_title,
+                    f"{label}{number}" + (f" {' '.join(heading.split())[:40]}" if heading else ""), snippet)
+                for score, path, doc_title, number, heading, snippet in rows]
+
+    def stats(self):
+        """{"documents": {kind: count}, table: rows, "bytes": database size}"""
+        result = {"documents": dict(self.db.execute("SELECT kind, count(*) FROM documents GROUP BY kind"))}
+        for table in TABLES:
+            result[table] = self.db.execute(f"SELECT count(*) FROM {table}").fetchone()[0]
+        if self.path != ":memory:":
+            result["bytes"] = sum(os.path.getsize(self.path + suffix) for suffix in ("", "-wal")
+                                  if os.path.exists(self.path + suffix))
+        return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Full-text corpus of the PDFs and decks")
+    parser.add_argument("--db", default=DB_FILE, help="corpus database file")
+    commands = parser.add_subparsers(dest="command", required=True)
+    ingest = commands.add_parser("ingest", help="add or refresh PDFs and decks")
+    ingest.add_argument("paths", nargs="*", help="files or directories (default: this directory)")
+    ingest.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="documents per transaction")
+    ingest.add_argument("--prune", action="store_true", help="drop documents whose file is gone")
+    search = commands.add_parser("search", help="ranked hits across pages, sections and slides")
+    search.add_argument("query")
+    search.add_argument("-n", "--limit", type=int, default=10)
+    search.add_argument("--kind", action="append", choices=sorted(TABLES), help="search only these tables")
+    commands.add_parser("stats", help="documents and rows in the corpus")
+    args = parser.parse_args(argv)
+
+    corpus = Corpus(args.db)
+    try:
+        if args.command == "ingest":
+            files = list(source_files(args.paths or [BASE_DIR]))
+            print(f"📚 Ingesting {len(files)} file(s) into {os.path.relpath(args.db)}")
+            print(f"✓ {corpus.ingest(files, args.batch_size)}")
+            if args.prune:
+                print(f"🧹 Dropped {len(corpus.prune())} document(s) whose file is gone")
+        elif args.command == "search":
+            start = time.perf_counter()
+            hits = corpus.search(args.query, args.limit, args.kind or tuple(TABLES))
+            print(f"🔍 {len(hits)} hit(s) for {args.query!r} in {(time.perf_counter() - start) * 1000:.1f} ms")
+            for hit in hits:
+                print(f"{hit.score:>7.2f}  {hit.title[:40]} · {hit.location}")
+                print(f"         {hit.snippet}")
+        else:
+            stats = corpus.stats()
+            documents = ", ".join(f"{count} {kind}" for kind, count in sorted(stats["documents"].items()))
+            print(f"📚 {documents or 'no documents'}; {stats['pages']} pages, {stats['sections']} sections, "
+                  f"{stats['slides']} slides" + (f", {stats['bytes'] / 1024:.0f} KB" if "bytes" in stats else ""))
+    finally:
+        corpus.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
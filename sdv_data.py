@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Deterministic data provider for randomized chart and table slides.
+
+Every random value drawn by a generator comes from a provider whose seed is
+derived from a base seed plus a stable key path (section name, slide index).
+Adding or reordering slides in one section therefore never shifts the data
+of another, and identical inputs always produce identical decks.
+"""
+
+import datetime
+import hashlib
+import os
+import random
+
+DEFAULT_SEED = 20240826
+
+
+def base_seed():
+    """Return the build seed (SDV_SEED environment variable or the default)"""
+    value = os.environ.get("SDV_SEED")
+    return int(value) if value else DEFAULT_SEED
+
+
+def derive_seed(*keys):
+    """Derive a 64-bit seed from a key path, stable across processes"""
+    digest = hashlib.sha256("/".join(str(k) for k in keys).encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+def build_datetime():
+    """Return the build timestamp
+
+    Honors SOURCE_DATE_EPOCH so that dates printed on cover slides are part of
+    the build inputs instead of the wall clock.
+    """
+    epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    if epoch:
+        return datetime.datetime.fromtimestamp(int(epoch), datetime.timezone.utc).replace(tzinfo=None)
+    return datetime.datetime.now()
+
+
+class SeededDataProvider:
+    """Random data source scoped to a key path"""
+
+    def __init__(self, seed=None, path=()):
+        self.seed = base_seed() if seed is None else seed
+        self.path = tuple(path)
+        self._rng = random.Random(derive_seed(self.seed, *self.path))
+
+    def child(self, *keys):
+        """Return an independent provider for a sub-scope"""
+        return SeededDataProvider(self.seed, self.path + tuple(str(k) for k in keys))
+
+    def section(self, name):
+        """Provider for a deck section"""
+        return self.child("section", name)
+
+    def slide(self, key):
+        """Provider for a single slide (index or title) inside this scope"""
+        return self.child("slide", key)
+
+    def randint(self, low, high):
+        """Integer in [low, high], like random.randint"""
+        return self._rng.randint(low, high)
+
+    def series(self, count, low, high):
+        """Tuple of `count` integers in [low, high]"""
+        return tuple(self._rng.randint(low, high) for _ in range(count))
+
+    def table(self, rows, cols, low, high):
+        """List of `rows` lists with `cols` integers in [low, high]"""
+        return [list(self.series(cols, low, high)) for _ in range(rows)]
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Static HTML/SVG export of the generated decks.
+
+Each deck becomes a directory with one small SVG per slide, a manifest,
+a search index and a viewer page:
+
+    html/
+      index.html                    deck list
+      SDV_Complete_Analysis_150_Slides/
+        index.html                  viewer, slides load lazily as they scroll in
+        manifest.json               title, size and content hash of every slide
+        search.js                   slide text, loaded on first search
+        slides/001.svg ...
+
+Slides are hashed from their zip members (slide XML, relationships,
+charts, and the deck's slide size and theme) before python-pptx is even
+loaded. A re-export only redraws slides whose hash changed, and skips a
+deck entirely when none did.
+
+Usage:
+    python sdv_html_export.py                       # every generated deck -> html/
+    python sdv_html_export.py SDV_Presentation.pptx -o site
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import os
+import posixpath
+import re
+import sys
+import time
+import zipfile
+from urllib.parse import quote
+
+from sdv_render import RENDERER_VERSION
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_OUTPUT = os.path.join(BASE_DIR, "html")
+
+_REL_RE = re.compile(rb'<Relationship [^>]*?Target="([^"]+)"')
+_SLIDE_FILE_RE = re.compile(r"^\d{3,}\.svg$")     # slides/NNN.svg as written by export_deck
+_SLD_SZ_RE = re.compile(rb"<p:sldSz [^>]*>")
+_MASTER_RE = re.compile(r"^ppt/slideMasters/slideMaster\d+\.xml$")
+
+
+def generated_decks():
+    """Deck files listed in sdv_build, in build order"""
+    from sdv_build import DECKS
+
+    return [os.path.join(BASE_DIR, output) for deck in DECKS for output in deck.outputs]
+
+
+def deck_slug(path):
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def slide_members(zipf):
+    """Slide member names in presentation order"""
+    pres_rels = zipf.read("ppt/_rels/presentation.xml.rels").decode("utf-8")
+    targets = dict(re.findall(r'Id="(rId\d+)"[^>]*?Target="([^"]+)"', pres_rels))
+    targets.update({rid: target for target, rid in re.findall(r'Target="([^"]+)"[^>]*?Id="(rId\d+)"', pres_rels)})
+    order = re.findall(r'<p:sldId [^>]*?r:id="(rId\d+)"', zipf.read("ppt/presentation.xml").decode("utf-8"))
+    return [posixpath.normpath(posixpath.join("ppt", targets[rid])) for rid in order]
+
+
+def _related_parts(zipf, names, member):
+    """Part names `member`'s relationships point to"""
+    rels = posixpath.join(posixpath.dirname(member), "_rels", posixpath.basename(member) + ".rels")
+    if rels not in names:
+        return []
+    return [posixpath.normpath(posixpath.join(posixpath.dirname(member), target.decode()))
+            for target in _REL_RE.findall(zipf.read(rels))]
+
+
+def deck_parts(zipf, names):
+    """Deck-wide bytes every slide is drawn with: the slide size and the slide masters' themes"""
+    parts = _SLD_SZ_RE.findall(zipf.read("ppt/presentation.xml"))
+    masters = sorted(name for name in names if _MASTER_RE.match(name))
+    themes = sorted({part for master in masters for part in _related_parts(zipf, names, master)
+                     if part.startswith("ppt/theme/") and part in names})
+    return b"".join(parts + [zipf.read(theme) for theme in themes])
+
+
+def slide_hashes(path):
+    """Content hash of every slide, from the zip members that affect its rendering"""
+    hashes = []
+    with zipfile.ZipFile(path) as zipf:
+        names = set(zipf.namelist())
+        shared = deck_parts(zipf, names)
+        for member in slide_members(zipf):
+            digest = hashlib.sha256(f"renderer {RENDERER_VERSION}\n".encode())
+            digest.update(shared)
+            digest.update(zipf.read(member))
+            rels = posixpath.join(posixpath.dirname(member), "_rels", posixpath.basename(member) + ".rels")
+            if rels in names:
+                rels_xml = zipf.read(rels)
+                digest.update(rels_xml)
+                for target in _REL_RE.findall(rels_xml):
+                    part = posixpath.normpath(posixpath.join(posixpath.dirname(member), target.decode()))
+                    # Charts and layouts change what is drawn; notes and media do not
+                    if part.startswith(("ppt/charts/", "ppt/slideLayouts/")) and part in names:
+                        digest.update(zipf.read(part))
+            hashes.append(digest.hexdigest()[:16])
+    return hashes
+
+
+def load_manifest(deck_dir):
+    try:
+        with open(os.path.join(deck_dir, "manifest.json"), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def export_deck(path, output_dir=DEFAULT_OUTPUT, force=False):
+    """Export one deck; returns (slides rendered, slides reused)"""
+    slug = deck_slug(path)
+    deck_dir = os.path.join(output_dir, slug)
+    slides_dir = os.path.join(deck_dir, "slides")
+    hashes = slide_hashes(path)
+    previous = None if force else load_manifest(deck_dir)
+    old = {}
+    if previous:
+        old = {entry["hash"]: entry for entry in previous["slides"]}
+        if [entry["hash"] for entry in previous["slides"]] == hashes and all(
+                os.path.exists(os.path.join(deck_dir, entry["file"])) for entry in previous["slides"]):
+            return 0, len(hashes)
+
+    from pptx import Presentation
+    from sdv_render import SlideRenderer, slide_text, slide_title
+
+    os.makedirs(slides_dir, exist_ok=True)
+    # Read every SVG that moves before writing any: inserting a slide shifts the
+    # others, so a reused file may be overwritten earlier in the loop below
+    moved = {}
+    for number, digest in enumerate(hashes, 1):
+        reuse = old.get(digest)
+        if reuse and reuse["file"] != f"slides/{number:03d}.svg" and digest not in moved:
+            try:
+                with open(os.path.join(deck_dir, reuse["file"]), "rb") as f:
+                    moved[digest] = f.read()
+            except OSError:
+                pass
+    prs = Presentation(path)
+    renderer = SlideRenderer(prs)
+    entries = []
+    rendered = 0
+    for number, (slide, digest) in enumerate(zip(prs.slides, hashes), 1):
+        name = f"slides/{number:03d}.svg"
+        target = os.path.join(deck_dir, name)
+        reuse = old.get(digest)
+        if reuse and (digest in moved or reuse["file"] == name and os.path.exists(target)):
+            if reuse["file"] != name:
+                with open(target, "wb") as f:
+                    f.write(moved[digest])
+            title, text = reuse["title"], reuse["text"]
+        else:
+            with open(target, "w", encoding="utf-8") as f:
+                f.write(renderer.render(slide))
+            title, text = slide_title(slide), slide_text(slide)
+            rendered += 1
+        entries.append(slide_entry(number, digest, title, text))
+
+    # Slides removed from the deck
+    for leftover in os.listdir(slides_dir):
+        if _SLIDE_FILE_RE.match(leftover) and int(leftover[:-4]) > len(entries):
+            os.remove(os.path.join(slides_dir, leftover))
+
+    manifest = build_manifest(os.path.basename(path), prs, entries)
+    _write(os.path.join(deck_dir, "manifest.json"), json.dumps(manifest, ensure_ascii=False, indent=1))
+    _write(os.path.join(deck_dir, "search.js"), search_js(manifest))
+    _write(os.path.join(deck_dir, "index.html"), viewer_html(manifest))
+    return rendered, len(entries) - rendered
+
+
+def slide_entry(number, digest, title, text):
+    return {"number": number, "file": f"slides/{number:03d}.svg", "hash": digest, "title": title, "text": text}
+
+
+def build_manifest(deck_name, prs, entries):
+    return {
+        "deck": deck_name,
+        "title": entries[0]["title"] if entries else deck_slug(deck_name),
+        "width": round(prs.slide_width / 12700, 1),
+        "height": round(prs.slide_height / 12700, 1),
+        "renderer": RENDERER_VERSION,
+        "slides": entries,
+    }
+
+
+def search_js(manifest):
+    """Slide texts as a script, so search also works from file:// URLs"""
+    texts = [entry["text"] for entry in manifest["slides"]]
+    return "window.SDV_SEARCH = " + json.dumps(texts, ensure_ascii=False) + ";\n"
+
+
+def _write(path, text):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+VIEWER_CSS = """
+body{margin:0;font-family:'Malgun Gothic','Apple SD Gothic Neo','Noto Sans KR',sans-serif;background:#f2f3f5;color:#222}
+header{position:sticky;top:0;z-index:1;display:flex;gap:12px;align-items:center;padding:10px 20px;background:#00335f;color:#fff}
+header a{color:#fff}
+header input{margin-left:auto;padding:6px 10px;border:0;border-radius:4px;width:260px}
+main{max-width:1100px;margin:0 auto;padding:20px}
+figure{margin:0 0 24px;background:#fff;box-shadow:0 1px 3px rgba(0,0,0,.2)}
+figure img{display:block;width:100%;height:auto}
+figcaption{padding:6px 12px;font-size:13px;color:#555}
+.hidden{display:none}
+"""
+
+VIEWER_JS = """
+(function () {
+  var input = document.getElementById('search');
+  var figures = document.querySelectorAll('figure');
+  function filter() {
+    var q = input.value.trim().toLowerCase();
+    figures.forEach(function (fig, i) {
+      var text = (window.SDV_SEARCH[i] || '').toLowerCase();
+      fig.classList.toggle('hidden', q !== '' && text.indexOf(q) < 0);
+    });
+  }
+  input.addEventListener('focus', function load() {
+    input.removeEventListener('focus', load);
+    var script = document.createElement('script');
+    script.src = 'search.js';
+    script.onload = filter;
+    document.head.appendChild(script);
+  });
+  input.addEventListener('input', function () { if (window.SDV_SEARCH) filter(); });
+})();
+"""
+
+
+def viewer_html(manifest):
+    """Viewer page; images use loading=lazy so only visible slides are fetched"""
+    width, height = manifest["width"], manifest["height"]
+    figures = "\n".join(
+        f'<figure id="s{entry["number"]}"><img src="{entry["file"]}?v={entry["hash"]}" loading="lazy" '
+        f'width="{width:g}" height="{height:g}" alt="{html.escape(entry["title"])}">'
+        f'<figcaption>{entry["number"]}. {html.escape(entry["title"])}</figcaption></figure>'
+        for entry in manifest["slides"]
+    )
+    return f"""<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{html.escape(manifest["deck"])}</title>
+<style>{VIEWER_CSS}</style>
+</head>
+<body>
+<header><a href="../index.html">◀ Decks</a><strong>{html.escape(manifest["deck"])}</strong>
+<span>{len(manifest["slides"])} slides</span><input id="search" type="search" placeholder="슬라이드 검색"></header>
+<main>
+{figures}
+</main>
+<script>{VIEWER_JS}</script>
+</body>
+</html>
+"""
+
+
+def index_html(output_dir):
+    """Deck list page for every exported deck under output_dir"""
+    decks = []
+    for slug in sorted(os.listdir(output_dir)):
+        manifest = load_manifest(os.path.join(output_dir, slug))
+        if manifest is not None:
+            decks.append((slug, manifest["deck"], len(manifest["slides"])))
+    return deck_list_html(decks)
+
+
+def deck_list_html(decks):
+    """Deck list page for (slug, deck file name, slide count) tuples"""
+    rows = []
+    for slug, name, count in decks:
+        href = quote(slug)
+        cover = f'<img src="{href}/slides/001.svg" loading="lazy" width="240"><br>' if count else ""
+        rows.append(f'<li><a href="{href}/index.html">{cover}{html.escape(name)}</a> ({count} slides)</li>')
+    return f"""<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<title>SDV Decks</title>
+<style>{VIEWER_CSS} ul{{list-style:none;display:flex;flex-wrap:wrap;gap:20px;padding:20px}} li img{{box-shadow:0 1px 3px rgba(0,0,0,.3)}}</style>
+</head>
+<body>
+<header><strong>SDV Decks</strong></header>
+<ul>
+{chr(10).join(rows)}
+</ul>
+</body>
+</html>
+"""
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export generated decks to static HTML/SVG")
+    parser.add_argument("decks", nargs="*", help=".pptx files (default: every generated deck)")
+    parser.add_argument("-o", "--output-dir", default=DEFAULT_OUTPUT)
+    parser.add_argument("-f", "--force", action="store_true", help="redraw every slide")
+    args = parser.parse_args(argv)
+
+    decks = args.decks or [path for path in generated_decks() if os.path.exists(path)]
+    os.makedirs(args.output_dir, exist_ok=True)
+    for path in decks:
+        start = time.perf_counter()
+        rendered, reused = export_deck(path, args.output_dir, args.force)
+        print(f"✓ {os.path.basename(path)}: {rendered} rendered, {reused} unchanged "
+              f"({time.perf_counter() - start:.2f}s)")
+    _write(os.path.join(args.output_dir, "index.html"), index_html(args.output_dir))
+    print(f"📄 Viewer: {os.path.join(args.output_dir, 'index.html')}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
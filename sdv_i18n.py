@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Per-locale strings for deck variants.
+
+A catalog maps the text a generator writes (in whatever language the
+generator happens to use) to its Korean, English and Chinese versions:
+
+    entries     exact strings: {"Bibliography": {"ko": "참고문헌", "zh": "参考文献"}}
+    templates   strings with a {} slot, the slot translated recursively:
+                {"Appendix: {}": {"ko": "부록: {}", "zh": "附录: {}"}}
+    keep        regular expressions for text that stays as is (code, numbers)
+
+Leading whitespace and bullet markers are kept around the translated text.
+A locale missing from an entry falls back to the source text, which is
+right when the source is already in that language.
+
+Usage:
+    python sdv_i18n.py          # check the catalogs for missing translations
+"""
+
+import glob
+import json
+import os
+import re
+import sys
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CATALOG_DIR = os.path.join(BASE_DIR, "i18n")
+
+LOCALES = ("ko", "en", "zh")
+BULLETS = ("• ", "- ", "▶ ", "✓ ")
+
+_HANGUL_RE = re.compile(r"[가-힣]")
+_HAN_RE = re.compile(r"[一-鿿]")
+_LETTER_RE = re.compile(r"[^\W\d_]")
+
+
+def detect_locale(text):
+    """Locale of a string from its script: Hangul -> ko, Han -> zh, else en"""
+    if _HANGUL_RE.search(text):
+        return "ko"
+    if _HAN_RE.search(text):
+        return "zh"
+    return "en"
+
+
+class Catalog:
+    def __init__(self, entries=None, templates=None, keep=()):
+        self.entries = dict(entries or {})
+        self.templates = []
+        for template, variants in (templates or {}).items():
+            self.add_template(template, variants)
+        self.keep = [re.compile(pattern) for pattern in keep]
+        self._memo = {}
+
+    @classmethod
+    def load(cls, paths=None):
+        """Merge the JSON catalogs in `paths` (default: i18n/*.json)"""
+        catalog = cls()
+        for path in paths or sorted(glob.glob(os.path.join(CATALOG_DIR, "*.json"))):
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            catalog.entries.update(data.get("entries", {}))
+            for template, variants in data.get("templates", {}).items():
+                catalog.add_template(template, variants)
+            catalog.keep.extend(re.compile(pattern) for pattern in data.get("keep", ()))
+        return catalog
+
+    def add_template(self, template, variants):
+        prefix, _, suffix = template.partition("{}")
+        pattern = re.compile(re.escape(prefix) + "(.+?)" + re.escape(suffix) + "$")
+        self.templates.append((pattern, template, variants))
+        self._memo = {}
+
+    def translate(self, text, locale):
+        """`text` in `locale`, or None when the catalog does not cover it"""
+        key = (text, locale)
+        if key not in self._memo:
+            self._memo[key] = self._translate(text, locale)
+        return self._memo[key]
+
+    def _translate(self, text, locale):
+        stripped = text.lstrip()
+        indent = text[:len(text) - len(stripped)]
+        stripped = stripped.rstrip()
+        if not _LETTER_RE.search(stripped) or any(pattern.match(stripped) for pattern in self.keep):
+            return text
+        for bullet in BULLETS:
+            if stripped.startswith(bullet):
+                inner = self.translate(stripped[len(bullet):], locale)
+                return None if inner is None else indent + bullet + inner
+        variants = self.entries.get(stripped)
+        if variants is not None:
+            return indent + variants.get(locale, stripped)
+        for pattern, template, variants in self.templates:
+            match = pattern.match(stripped)
+            if match:
+                inner = self.translate(match.group(1), locale)
+                slot = match.group(1) if inner is None else inner
+                return indent + variants.get(locale, template).replace("{}", slot, 1)
+        return None
+
+    def missing(self, locales=LOCALES):
+        """(source, locale) pairs whose translation is neither given nor the source language"""
+        result = []
+        sources = list(self.entries.items()) + [(template, variants) for _, template, variants in self.templates]
+        for source, variants in sources:
+            source_locale = detect_locale(source)
+            for locale in locales:
+                if locale != source_locale and locale not in variants:
+                    result.append((source, locale))
+        return result
+
+
+def main(argv=None):
+    catalog = Catalog.load()
+    missing = catalog.missing()
+    print(f"📚 {len(catalog.entries)} entries, {len(catalog.templates)} templates, {len(catalog.keep)} keep rules")
+    for source, locale in missing:
+        print(f"  ⚠️  [{locale}] {source}")
+    if not missing:
+        print("✓ Every entry has all locales")
+    return 1 if missing else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
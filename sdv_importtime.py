@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Cold-start import budget check for the generator scripts.
+
+Each module is imported in a fresh interpreter with `python -X importtime`.
+The budget applies to the project's own import time: the module's
+cumulative time minus that of `import pptx` (BASELINE), which is most of
+the wall time and outside this repository's control. Chart, PDF and
+workbook machinery (DEFERRED) must not be loaded at import at all; they are
+imported on first use by the helpers that need them.
+
+The best of several runs is used so that one slow run does not fail the
+check. Exits with status 1 when a module is over budget or loads a deferred
+module, so it can run in CI next to the build.
+
+Usage:
+    python sdv_importtime.py                       # all generators
+    python sdv_importtime.py create_presentation --budget-ms 15
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+MODULES = [
+    "create_presentation",
+    "analyze_keti_ppt",
+    "create_advanced_sdv_presentation",
+    "create_comprehensive_sdv_ppt",
+    "create_executive_sdv_ppt",
+    "create_massive_sdv_presentation",
+    "create_new_presentation",
+    "create_professional_sdv_ppt",
+    "create_ultimate_sdv_presentation",
+]
+
+# Loaded on first use only
+DEFERRED = ("PyPDF2", "xlsxwriter", "pptx.chart.data", "numpy")
+
+# Imported by every generator and not counted against the budget
+BASELINE = "pptx"
+
+# Import time allowed per module on top of BASELINE, about 1.3x the slowest
+# generator (create_massive_sdv_presentation, ~23 ms)
+DEFAULT_BUDGET_MS = 30
+
+
+def import_profile(module):
+    """Return {imported module: cumulative µs} for `import module` in a new interpreter"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BASE_DIR, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr.strip().splitlines()[-1]}")
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        timings[name.strip()] = int(cumulative)
+    return timings
+
+
+def check_module(module, runs=3):
+    """Return (best own import ms, its total import ms, deferred modules that were loaded)
+
+    Own time is the module's cumulative import time minus BASELINE's.
+    """
+    best = None
+    loaded = ()
+    for _ in range(runs):
+        timings = import_profile(module)
+        total = timings[module] / 1000
+        own = total - timings.get(BASELINE, 0) / 1000
+        if best is None or own < best[0]:
+            best = (own, total)
+        loaded = tuple(name for name in DEFERRED if name in timings)
+    return best[0], best[1], loaded
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check generator cold-start import time")
+    parser.add_argument("modules", nargs="*", default=MODULES)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help=f"import time allowed on top of `import {BASELINE}`")
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    failures = 0
+    print(f"{'Module':<36} {'Total ms':>9} {'Own ms':>8} {'Budget':>8}  Deferred loaded")
+    for module in args.modules:
+        own, total, loaded = check_module(module, args.runs)
+        over = own > args.budget_ms
+        failures += over or bool(loaded)
+        mark = "❌" if over or loaded else "✅"
+        print(f"{module:<36} {total:>9.1f} {own:>8.1f} {args.budget_ms:>8.0f}  {', '.join(loaded) or '-'} {mark}")
+
+    if failures:
+        print(f"\n⚠️  {failures} module(s) over the import budget or loading deferred modules")
+        return 1
+    print("\nAll modules within the import budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
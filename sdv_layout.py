@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Grid layout engine with precomputed EMU geometry.
+
+A LayoutSpec names the regions of a slide (single boxes, rows and stacks of
+equal cells, and the gaps between cells) in inches on a design canvas. For a
+given slide size the spec is placed once: every region is scaled to the
+slide, converted to EMU and checked for overlaps, and the result is cached.
+Helpers then read finished coordinates instead of redoing `Inches()`
+arithmetic for every shape, and the same spec renders at 4:3, 16:9 or 16:10.
+
+Usage:
+    python sdv_layout.py            # place every spec at every aspect ratio
+"""
+
+import sys
+
+from pptx.util import Emu, Inches
+
+EMU_PER_INCH = 914400
+
+ASPECTS = {
+    "4:3": (Inches(10), Inches(7.5)),
+    "16:9": (Inches(13.333), Inches(7.5)),
+    "16:10": (Inches(12), Inches(7.5)),
+}
+
+# Overlaps smaller than this (rounding between touching cells) are ignored
+OVERLAP_TOLERANCE = 12700  # 1 pt
+
+
+class LayoutError(ValueError):
+    """Regions of a layout overlap or a region is missing"""
+
+
+class Region:
+    """Rectangle in EMU"""
+
+    __slots__ = ("name", "left", "top", "width", "height")
+
+    def __init__(self, name, left, top, width, height):
+        self.name = name
+        self.left = Emu(left)
+        self.top = Emu(top)
+        self.width = Emu(width)
+        self.height = Emu(height)
+
+    @property
+    def right(self):
+        return Emu(self.left + self.width)
+
+    @property
+    def bottom(self):
+        return Emu(self.top + self.height)
+
+    @property
+    def box(self):
+        """(left, top, width, height) for add_shape/add_textbox"""
+        return self.left, self.top, self.width, self.height
+
+    def offset(self, dx=0, dy=0, dw=0, dh=0):
+        """Region moved and resized by EMU deltas"""
+        return Region(self.name, self.left + dx, self.top + dy, self.width + dw, self.height + dh)
+
+    def overlaps(self, other, tolerance=OVERLAP_TOLERANCE):
+        dx = min(self.right, other.right) - max(self.left, other.left)
+        dy = min(self.bottom, other.bottom) - max(self.top, other.top)
+        return dx > tolerance and dy > tolerance
+
+    def __repr__(self):
+        return (f"Region({self.name!r}, {self.left / EMU_PER_INCH:.2f}in, {self.top / EMU_PER_INCH:.2f}in, "
+                f"{self.width / EMU_PER_INCH:.2f}in x {self.height / EMU_PER_INCH:.2f}in)")
+
+
+class LayoutSpec:
+    """Named regions on a design canvas, placed once per slide size"""
+
+    def __init__(self, name, width, height):
+        self.name = name
+        self.width = width
+        self.height = height
+        self._regions = []
+        self._placed = {}
+
+    def box(self, name, left, top, width, height):
+        """One region"""
+        self._regions.append((name, "box", (left, top, width, height, 1, 0)))
+        return self
+
+    def row(self, name, left, top, width, height, count, gap=0):
+        """`count` cells of `width` laid out left to right"""
+        self._regions.append((name, "row", (left, top, width, height, count, gap)))
+        return self
+
+    def stack(self, name, left, top, width, height, count, gap=0):
+        """`count` cells of `height` laid out top to bottom"""
+        self._regions.append((name, "stack", (left, top, width, height, count, gap)))
+        return self
+
+    def between(self, name, row_name, top, height):
+        """Regions filling the gaps between the cells of row `row_name`"""
+        self._regions.append((name, "between", (row_name, top, height)))
+        return self
+
+    def place(self, slide_width, slide_height):
+        """Layout for a slide size, computed on first use"""
+        key = (int(slide_width), int(slide_height))
+        if key not in self._placed:
+            self._placed[key] = Layout(self, key[0], key[1])
+        return self._placed[key]
+
+    def place_for(self, prs):
+        return self.place(prs.slide_width, prs.slide_height)
+
+    def iter_regions(self):
+        return iter(self._regions)
+
+
+class Layout:
+    """A LayoutSpec placed on one slide size"""
+
+    def __init__(self, spec, slide_width, slide_height):
+        self.spec = spec
+        self.slide_width = slide_width
+        self.slide_height = slide_height
+        sx = slide_width / (spec.width * EMU_PER_INCH)
+        sy = slide_height / (spec.height * EMU_PER_INCH)
+        self.regions = {}
+        for name, kind, args in spec.iter_regions():
+            if kind == "between":
+                row_name, top, height = args
+                cells = self.regions[row_name]
+                y = round(top * sy * EMU_PER_INCH)
+                h = round(height * sy * EMU_PER_INCH)
+                self.regions[name] = [Region(f"{name}[{i}]", a.right, y, b.left - a.right, h)
+                                      for i, (a, b) in enumerate(zip(cells, cells[1:]))]
+                continue
+            left, top, width, height, count, gap = args
+            cells = []
+            for i in range(count):
+                x, y = left, top
+                if kind == "row":
+                    x = left + i * (width + gap)
+                elif kind == "stack":
+                    y = top + i * (height + gap)
+                cells.append(Region(f"{name}[{i}]" if kind != "box" else name,
+                                    round(x * sx * EMU_PER_INCH), round(y * sy * EMU_PER_INCH),
+                                    round(width * sx * EMU_PER_INCH), round(height * sy * EMU_PER_INCH)))
+            self.regions[name] = cells[0] if kind == "box" else cells
+        overlaps = self.overlaps()
+        if overlaps:
+            pairs = ", ".join(f"{a.name}/{b.name}" for a, b in overlaps)
+            raise LayoutError(f"Layout {spec.name!r} has overlapping regions: {pairs}")
+
+    def __getitem__(self, name):
+        try:
+            return self.regions[name]
+        except KeyError:
+            raise LayoutError(f"Layout {self.spec.name!r} has no region {name!r}") from None
+
+    def all_regions(self):
+        for value in self.regions.values():
+            yield from value if isinstance(value, list) else (value,)
+
+    def overlaps(self):
+        """Pairs of overlapping regions, plus regions outside the slide"""
+        regions = list(self.all_regions())
+        found = []
+        bounds = Region("slide", 0, 0, self.slide_width, self.slide_height)
+        for i, a in enumerate(regions):
+            if a.left < 0 or a.top < 0 or a.right > bounds.right or a.bottom > bounds.bottom:
+                found.append((a, bounds))
+            for b in regions[i + 1:]:
+                if a.overlaps(b):
+                    found.append((a, b))
+        return found
+
+
+# Layouts used by the generators ------------------------------------------
+
+# Six-layer stack of create_massive_sdv_presentation.add_architecture_slide
+MASSIVE_ARCHITECTURE = (
+    LayoutSpec("massive-architecture", 13.333, 7.5)
+    .stack("layers", 0.5, 1.3, 3.5, 0.9, count=6, gap=0.05)
+    .stack("components", 4.2, 1.5, 8, 0.7, count=6, gap=0.25)
+)
+
+# create_advanced_sdv_presentation.add_diagram_slide
+ADVANCED_LAYERS = (
+    LayoutSpec("advanced-layers", 16, 9)
+    .stack("layers", 2, 2, 12, 1, count=5, gap=0.1)
+)
+
+ADVANCED_PROCESS = (
+    LayoutSpec("advanced-process", 16, 9)
+    .row("steps", 1.5, 4, 2.5, 1.5, count=5, gap=0.3)
+    .between("arrows", "steps", 4.5, 0.5)
+)
+
+LAYOUTS = [MASSIVE_ARCHITECTURE, ADVANCED_LAYERS, ADVANCED_PROCESS]
+
+
+def main(argv=None):
+    failures = 0
+    for spec in LAYOUTS:
+        for aspect, (width, height) in ASPECTS.items():
+            try:
+                layout = spec.place(width, height)
+            except LayoutError as error:
+                failures += 1
+                print(f"❌ {spec.name:<24} {aspect:<6} {error}")
+                continue
+            print(f"✅ {spec.name:<24} {aspect:<6} {sum(1 for _ in layout.all_regions())} regions")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
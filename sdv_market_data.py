@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Market figures behind the chart slides and KPI tables.
+
+The market datasets live in data/market/ as CSV (or Parquet) files, one
+column per metric. They are loaded into column arrays: NumPy arrays when
+NumPy is installed, plain lists otherwise, with the same results. NumPy is
+imported on the first load, not with this module, so the generators that
+import MARKET start without it. CAGR,
+shares and ratios are computed column-wise from them, and the
+generators ask for named queries (MARKET.query("market_growth")) instead of
+repeating the numbers in code.
+
+Datasets and query results are cached per process and dropped when a source
+file's mtime changes, so watch mode picks up edited figures without a
+restart.
+
+Usage:
+    python sdv_market_data.py                   # list datasets and queries
+    python sdv_market_data.py regional_outlook  # print a query result
+"""
+
+import csv
+import json
+import math
+import os
+import sys
+
+_numpy = False      # not looked up yet
+
+
+def numpy_module():
+    """NumPy, imported on the first computation so the generators start fast; None if missing"""
+    global _numpy
+    if _numpy is False:
+        try:
+            import numpy
+        except ImportError:  # lists and per-element arithmetic give the same numbers
+            numpy = None
+        _numpy = numpy
+    return _numpy
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(BASE_DIR, "data", "market")
+FORMATS = (".csv", ".parquet")
+
+
+class Dataset:
+    """Columns of one data file: numeric columns as arrays, others as lists of strings"""
+
+    def __init__(self, name, columns):
+        self.name = name
+        self.columns = columns
+
+    def __getitem__(self, column):
+        return self.columns[column]
+
+    def __len__(self):
+        return len(next(iter(self.columns.values()), ()))
+
+    def index(self, column, value):
+        """Row number where `column` equals `value`"""
+        return values(self.columns[column]).index(value)
+
+
+def _column(values):
+    """Float array if every non-empty value is numeric (empty cells become NaN), else strings"""
+    try:
+        numbers = [float(value) if value not in ("", None) else math.nan for value in values]
+    except (TypeError, ValueError):
+        return [str(value) for value in values]
+    np = numpy_module()
+    return np.array(numbers) if np is not None else numbers
+
+
+def load_dataset(path):
+    """Dataset from a .csv or .parquet file"""
+    name, ext = os.path.splitext(os.path.basename(path))
+    if ext == ".parquet":
+        try:
+            import pyarrow.parquet
+        except ImportError:
+            raise RuntimeError(f"Reading {os.path.basename(path)} needs pyarrow") from None
+        raw = pyarrow.parquet.read_table(path).to_pydict()
+    else:
+        with open(path, encoding="utf-8-sig", newline="") as f:
+            rows = list(csv.DictReader(f))
+        raw = {column: [row[column] for row in rows] for column in (rows[0].keys() if rows else ())}
+    return Dataset(name, {column: _column(values) for column, values in raw.items()})
+
+
+# Column-wise arithmetic -------------------------------------------------------
+
+def _broadcast(*args):
+    length = max((len(arg) for arg in args if isinstance(arg, (list, tuple))), default=1)
+    return zip(*(arg if isinstance(arg, (list, tuple)) else [arg] * length for arg in args))
+
+
+def cagr(first, last, years):
+    """Compound annual growth rate, element-wise over arrays or scalars"""
+    np = numpy_module()
+    if np is not None:
+        return (np.asarray(last, float) / np.asarray(first, float)) ** (1.0 / np.asarray(years, float)) - 1.0
+    if not any(isinstance(arg, (list, tuple)) for arg in (first, last, years)):
+        return (last / first) ** (1.0 / years) - 1.0
+    return [(end / start) ** (1.0 / span) - 1.0 for start, end, span in _broadcast(first, last, years)]
+
+
+def scaled(array, factor, offset=0.0):
+    """array * factor + offset"""
+    np = numpy_module()
+    if np is not None:
+        return np.asarray(array, float) * factor + offset
+    return [value * factor + offset for value in array]
+
+
+def ratio(numerator, denominator):
+    """numerator / denominator, element-wise"""
+    np = numpy_module()
+    if np is not None:
+        return np.asarray(numerator, float) / np.asarray(denominator, float)
+    return [top / bottom for top, bottom in zip(numerator, denominator)]
+
+
+def shares(values):
+    """Whole-number percentages of the total that add up to 100 (largest remainder)"""
+    values = [float(value) for value in values]
+    total = sum(values)
+    exact = [value * 100.0 / total for value in values]
+    result = [math.floor(value) for value in exact]
+    by_remainder = sorted(range(len(values)), key=lambda index: (result[index] - exact[index], index))
+    for index in by_remainder[:100 - sum(result)]:
+        result[index] += 1
+    return result
+
+
+def values(array):
+    """Tuple of chart values: whole numbers as int, NaN dropped as None"""
+    result = []
+    for value in (array.tolist() if hasattr(array, "tolist") else array):
+        if isinstance(value, float) and math.isnan(value):
+            result.append(None)
+        elif isinstance(value, float) and value.is_integer():
+            result.append(int(value))
+        else:
+            result.append(value)
+    return tuple(result)
+
+
+def percent(rate):
+    return f"{round(float(rate) * 100)}%"
+
+
+def korean_count(millions):
+    """20 -> '2천만', 120 -> '1.2억', 300 -> '3억'"""
+    if millions >= 100:
+        return f"{millions / 100:g}억"
+    return f"{millions / 10:g}천만"
+
+
+def korean_won(eok):
+    """30000 -> '3조원', 7500 -> '7,500억원' (amounts in 억원)"""
+    if eok >= 10000:
+        return f"{eok / 10000:g}조원"
+    return f"{round(eok):,}억원"
+
+
+# Named queries ----------------------------------------------------------------
+
+QUERIES = {}
+
+
+def query(*datasets):
+    """Register a query function that reads `datasets`"""
+    def register(func):
+        QUERIES[func.__name__] = (func, datasets)
+        return func
+    return register
+
+
+@query("sdv_market")
+def market_growth(data):
+    """Yearly market size, SDV vehicles and software share with the period CAGR"""
+    market = data["sdv_market"]
+    years = market["year"]
+    span = float(years[-1] - years[0])
+    return {
+        "categories": [str(year) for year in values(years)],
+        "market_usd_b": values(market["market_usd_b"]),
+        "market_eok_usd": values(scaled(market["market_usd_b"], 10)),
+        "sdv_vehicles_m": values(market["sdv_vehicles_m"]),
+        "sw_share_pct": values(market["sw_share_pct"]),
+        "market_cagr": float(cagr(market["market_usd_b"][0], market["market_usd_b"][-1], span)),
+        "vehicles_cagr": float(cagr(market["sdv_vehicles_m"][0], market["sdv_vehicles_m"][-1], span)),
+    }
+
+
+@query("sdv_market")
+def market_outlook(data):
+    """KPI table rows (구분, 2024년, 2027년, 2030년, CAGR)"""
+    market = data["sdv_market"]
+    growth = market_growth(data)
+    columns = [market.index("year", year) for year in (2024, 2027, 2030)]
+
+    def pick(column):
+        return [values(market[column])[index] for index in columns]
+
+    return {
+        "headers": ["구분"] + [f"{values(market['year'])[index]}년" for index in columns] + ["CAGR"],
+        "rows": [
+            ["시장 규모"] + [f"${value * 10:,}억" for value in pick("market_usd_b")] + [percent(growth["market_cagr"])],
+            ["SDV 비중"] + [f"{value}%" for value in pick("sdv_share_pct")] + ["-"],
+            ["SW 가치 비중"] + [f"{value}%" for value in pick("sw_share_pct")] + ["-"],
+            ["OTA 차량"] + [f"{korean_count(value)}대" for value in pick("sdv_vehicles_m")]
+            + [percent(growth["vehicles_cagr"])],
+        ],
+    }
+
+
+@query("regional_market")
+def regional_outlook(data):
+    """Regional table: 2024 and 2030 market, CAGR and 2030 share"""
+    regions = data["regional_market"]
+    start, end = regions["market_2024_usd_b"], regions["market_2030_usd_b"]
+    rates = cagr(start, end, 2030 - 2024)
+    rows = [[name, str(first), str(last), percent(rate), f"{share}%"]
+            for name, first, last, rate, share in zip(regions["region"], values(start), values(end),
+                                                     rates, shares(end))]
+    return {"headers": ["지역", "2024 시장규모($B)", "2030 예상($B)", "CAGR(%)", "점유율(2030)"], "rows": rows}
+
+
+@query("market_by_region")
+def regional_growth(data):
+    """Global, Korean and Chinese market series (억 달러) per year"""
+    market = data["market_by_region"]
+    return {
+        "categories": [str(year) for year in values(market["year"])],
+        "series": {
+            "글로벌 시장": list(values(market["global_eok_usd"])),
+            "한국 시장": list(values(market["korea_eok_usd"])),
+            "중국 시장": list(values(market["china_eok_usd"])),
+        },
+    }
+
+
+@query("investment_split")
+def investment_split(data):
+    """Share of the investment budget per category (%)"""
+    split = data["investment_split"]
+    return {"categories": list(split["category"]), "series": {"투자 비중": list(values(split["share_pct"]))}}
+
+
+@query("tech_maturity")
+def tech_maturity(data):
+    """Projected SDV technology maturity per country (%)"""
+    maturity = data["tech_maturity"]
+    countries = [("한국", "korea_pct"), ("중국", "china_pct"), ("독일", "germany_pct"), ("일본", "japan_pct")]
+    return {
+        "categories": [str(year) for year in values(maturity["year"])],
+        "series": {label: list(values(maturity[column])) for label, column in countries},
+    }
+
+
+@query("investment_roi")
+def investment_roi(data):
+    """Yearly investment and revenue (억원) with the revenue/investment ratio (%)"""
+    roi = data["investment_roi"]
+    return {
+        "categories": list(roi["period"]),
+        "series": {
+            "투자 (억원)": list(values(roi["investment_eok"])),
+            "수익 (억원)": list(values(roi["revenue_eok"])),
+            "ROI (%)": [round(value) for value in values(scaled(ratio(roi["revenue_eok"], roi["investment_eok"]), 100))],
+        },
+    }
+
+
+class MarketData:
+    """Loaded datasets and query results, invalidated by source mtime"""
+
+    def __init__(self, data_dir=DATA_DIR):
+        self.data_dir = data_dir
+        self._datasets = {}     # name -> (path, mtime_ns, Dataset)
+        self._results = {}      # query -> (mtimes, result)
+        self.loads = 0
+
+    def path(self, name):
+        for ext in FORMATS:
+            path = os.path.join(self.data_dir, name + ext)
+            if os.path.exists(path):
+                return path
+        raise KeyError(f"No dataset named {name} in {self.data_dir}")
+
+    def _mtime(self, name):
+        path = self.path(name)
+        return path, os.stat(path).st_mtime_ns
+
+    def dataset(self, name):
+        path, mtime = self._mtime(name)
+        cached = self._datasets.get(name)
+        if cached is None or cached[:2] != (path, mtime):
+            self.loads += 1
+            cached = self._datasets[name] = (path, mtime, load_dataset(path))
+        return cached[2]
+
+    def __getitem__(self, name):
+        return self.dataset(name)
+
+    def query(self, name):
+        """Result of the named query, recomputed only when one of its files changed"""
+        func, datasets = QUERIES[name]
+        stamp = tuple(self._mtime(dataset) for dataset in datasets)
+        cached = self._results.get(name)
+        if cached is None or cached[0] != stamp:
+            cached = self._results[name] = (stamp, func(self))
+        return cached[1]
+
+    def names(self):
+        return sorted(os.path.splitext(name)[0] for name in os.listdir(self.data_dir) if name.endswith(FORMATS))
+
+    def clear(self):
+        self._datasets.clear()
+        self._results.clear()
+
+
+MARKET = MarketData()
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        print(f"📁 {os.path.relpath(DATA_DIR, BASE_DIR)} ({'NumPy' if numpy_module() is not None else 'pure Python'})")
+        for name in MARKET.names():
+            dataset = MARKET.dataset(name)
+            print(f"  {name}: {len(dataset)} rows, columns {', '.join(dataset.columns)}")
+        print("Queries:")
+        for name, (func, datasets) in sorted(QUERIES.items()):
+            print(f"  {name} ({', '.join(datasets)}): {func.__doc__}")
+        return 0
+    for name in argv:
+        print(f"# {name}")
+        print(json.dumps(MARKET.query(name), ensure_ascii=False, indent=1))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
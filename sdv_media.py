@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Downscale and recompress the images of a finished deck.
+
+Decks that reuse the KETI slides carry their full-resolution screenshots
+and photos, often several times larger than the box they are shown in.
+This stage works on the saved package: for every picture it takes the
+displayed size from the shape's EMU extents (through group transforms and
+crops), resamples the image to the target DPI and re-encodes it. Photos
+(JPEGs, and PNGs with many colours and no transparency) become JPEG;
+diagrams and screenshots with few colours stay lossless PNG. Images are
+processed in worker threads and only replaced when the result is clearly
+smaller. Images whose displayed size cannot be determined (placeholder
+pictures without their own extents, fills in tables, uses outside slides,
+layouts and masters) and formats Pillow cannot read are left alone.
+
+Set SDV_MEDIA_DPI to run this stage on every deck sdv_build.py writes.
+
+Usage:
+    python sdv_media.py deck.pptx                 # report only
+    python sdv_media.py deck.pptx -o small.pptx   # write the optimized deck
+    python sdv_media.py deck.pptx --dpi 96 -i     # optimize in place
+"""
+
+import argparse
+import io
+import math
+import os
+import posixpath
+import sys
+import time
+
+from lxml import etree
+
+from sdv_package import COMPRESSION_LEVELS, compress_member, default_compression, write_zip, zip_timestamp
+from sdv_slide_import import CT_NS, P_NS, RELS_NS, R_NS, ZipPackage
+
+A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+EMU_PER_INCH = 914400
+
+DEFAULT_DPI = 150
+JPEG_QUALITY = 85
+# Images with more distinct colours than this are treated as photos
+PHOTO_COLORS = 4096
+# A new encoding is kept only below this fraction of the original size
+MIN_RATIO = 0.9
+# Parts whose pictures are sized from their shapes
+DRAWING_PREFIXES = ("ppt/slides/", "ppt/slideLayouts/", "ppt/slideMasters/")
+READABLE_FORMATS = {"PNG", "JPEG", "BMP", "TIFF"}
+
+
+def configured_dpi():
+    """Target DPI from SDV_MEDIA_DPI, or None when the stage is off"""
+    value = os.environ.get("SDV_MEDIA_DPI")
+    return int(value) if value else None
+
+
+def _scale(element):
+    """Horizontal and vertical scale of a group's child coordinates"""
+    xfrm = element.find(f"{{{P_NS}}}grpSpPr/{{{A_NS}}}xfrm")
+    if xfrm is None:
+        return 1.0, 1.0
+    ext, child = xfrm.find(f"{{{A_NS}}}ext"), xfrm.find(f"{{{A_NS}}}chExt")
+    if ext is None or child is None or not int(child.get("cx")) or not int(child.get("cy")):
+        return 1.0, 1.0
+    return int(ext.get("cx")) / int(child.get("cx")), int(ext.get("cy")) / int(child.get("cy"))
+
+
+def _blip_extent(blip, slide_size):
+    """Displayed (cx, cy) in EMU of the whole image behind `blip`, or None if unknown"""
+    blip_fill = blip.getparent()
+    shape = blip_fill.getparent()
+    if shape.tag == f"{{{P_NS}}}bgPr":
+        cx, cy = slide_size
+    else:
+        if shape.tag == f"{{{P_NS}}}spPr":
+            shape = shape.getparent()
+        if shape.tag not in (f"{{{P_NS}}}pic", f"{{{P_NS}}}sp"):
+            return None
+        ext = shape.find(f"{{{P_NS}}}spPr/{{{A_NS}}}xfrm/{{{A_NS}}}ext")
+        if ext is None:
+            return None
+        cx, cy = int(ext.get("cx")), int(ext.get("cy"))
+        for group in shape.iterancestors(f"{{{P_NS}}}grpSp"):
+            sx, sy = _scale(group)
+            cx, cy = cx * sx, cy * sy
+    # A crop shows only part of the image, so the whole image is shown larger
+    rect = blip_fill.find(f"{{{A_NS}}}srcRect")
+    if rect is not None:
+        shown_x = 1 - (int(rect.get("l", 0)) + int(rect.get("r", 0))) / 100000
+        shown_y = 1 - (int(rect.get("t", 0)) + int(rect.get("b", 0))) / 100000
+        if shown_x > 0 and shown_y > 0:
+            cx, cy = cx / shown_x, cy / shown_y
+    return cx, cy
+
+
+def displayed_sizes(package):
+    """{media part: (cx, cy) largest displayed size in EMU, or None when any use is unknown}"""
+    sizes = {}
+    slide_size = package.slide_size()
+    for name in package.infos:
+        if not name.endswith(".rels"):
+            continue
+        part = posixpath.join(posixpath.dirname(posixpath.dirname(name)), posixpath.basename(name)[:-5])
+        media = {rid: target for rid, _, target, external in package.rels(part)
+                 if not external and target.startswith("ppt/media/")}
+        if not media:
+            continue
+        if not part.startswith(DRAWING_PREFIXES) or part not in package.infos:
+            for target in media.values():
+                sizes[target] = None
+            continue
+        root = etree.fromstring(package.read(part))
+        for element in root.iter():
+            for attr in (f"{{{R_NS}}}embed", f"{{{R_NS}}}link"):
+                target = media.get(element.get(attr))
+                if target is None:
+                    continue
+                extent = _blip_extent(element, slide_size) if element.tag == f"{{{A_NS}}}blip" else None
+                if extent is None or sizes.get(target, ()) is None:
+                    sizes[target] = None
+                else:
+                    previous = sizes.get(target, (0, 0))
+                    sizes[target] = (max(previous[0], extent[0]), max(previous[1], extent[1]))
+    return sizes
+
+
+def is_photo(image):
+    """JPEGs and opaque images with many colours; everything else is a diagram"""
+    if image.format == "JPEG":
+        return True
+    if "A" in image.getbands() or "transparency" in image.info:
+        return False
+    return image.convert("RGB").getcolors(PHOTO_COLORS) is None
+
+
+def optimize_image(blob, extent, dpi=DEFAULT_DPI, quality=JPEG_QUALITY):
+    """(new blob, extension, kind, old pixels, new pixels) for one image, or None to keep it"""
+    from PIL import Image
+
+    try:
+        image = Image.open(io.BytesIO(blob))
+        image.load()
+    except Exception:
+        return None
+    if image.format not in READABLE_FORMATS or getattr(image, "n_frames", 1) > 1:
+        return None
+    photo = is_photo(image)
+    width, height = image.size
+    target = (math.ceil(extent[0] * dpi / EMU_PER_INCH), math.ceil(extent[1] * dpi / EMU_PER_INCH))
+    factor = min(1.0, max(target[0] / width, target[1] / height))
+    size = (max(1, round(width * factor)), max(1, round(height * factor)))
+    resized = size != (width, height)
+    if not resized and image.format == "JPEG":
+        # Re-encoding a JPEG at the same size only adds artefacts
+        return None
+    if image.mode not in ("RGB", "RGBA", "L", "LA"):
+        image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+    if resized:
+        image = image.resize(size, Image.LANCZOS)
+    out = io.BytesIO()
+    if photo:
+        image.convert("RGB").save(out, "JPEG", quality=quality, optimize=True)
+        ext, kind = "jpeg", "photo"
+    else:
+        image.save(out, "PNG", optimize=True)
+        ext, kind = "png", "diagram"
+    data = out.getvalue()
+    if len(data) >= len(blob) * MIN_RATIO:
+        return None
+    return data, ext, kind, (width, height), size
+
+
+class MediaReport:
+    """Per-image results of one optimization run"""
+
+    def __init__(self):
+        self.rows = []      # (old name, new name, kind, old pixels, new pixels, old bytes, new bytes)
+        self.skipped = []   # media parts left unchanged
+        self.seconds = 0.0
+
+    @property
+    def saved_bytes(self):
+        return sum(row[5] - row[6] for row in self.rows)
+
+    def print(self, file=None):
+        file = file or sys.stdout
+        for old, new, kind, old_px, new_px, old_bytes, new_bytes in self.rows:
+            print(f"  {old} -> {posixpath.basename(new)} ({kind}): {old_px[0]}x{old_px[1]} -> "
+                  f"{new_px[0]}x{new_px[1]}, {old_bytes / 1024:.0f} KB -> {new_bytes / 1024:.0f} KB", file=file)
+        print(f"🖼️  {len(self.rows)} image(s) optimized, {len(self.skipped)} unchanged, "
+              f"{self.saved_bytes / 1024:.0f} KB saved in {self.seconds:.2f}s", file=file)
+
+
+class MediaOptimizer:
+    """Resample and re-encode a deck's images for a target DPI"""
+
+    def __init__(self, dpi=DEFAULT_DPI, quality=JPEG_QUALITY, workers=None):
+        self.dpi = dpi
+        self.quality = quality
+        self.workers = workers or min(8, os.cpu_count() or 1)
+
+    def _optimize_all(self, package, sizes):
+        candidates = [(name, extent) for name, extent in sorted(sizes.items())
+                      if extent is not None and name in package.infos]
+
+        def optimize(item):
+            name, extent = item
+            return name, optimize_image(package.read(name), extent, self.dpi, self.quality)
+
+        # Pillow releases the GIL while decoding, resampling and encoding
+        if self.workers == 1 or len(candidates) < 2:
+            return [optimize(item) for item in candidates]
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            return list(pool.map(optimize, candidates))
+
+    def optimize(self, source, output=None):
+        """Optimize the deck at `source`; writes `output` (path or stream) when given and
+        anything changed, and returns the MediaReport"""
+        start = time.perf_counter()
+        package = ZipPackage(source)
+        sizes = displayed_sizes(package)
+        report = MediaReport()
+        replaced = {}       # old name -> (new name, blob)
+        names = set(package.infos)
+        for name, result in self._optimize_all(package, sizes):
+            if result is None:
+                report.skipped.append(name)
+                continue
+            data, ext, kind, old_px, new_px = result
+            new_name = name
+            if posixpath.splitext(name)[1][1:].lower() not in (ext, "jpg" if ext == "jpeg" else ext):
+                new_name = _free_name(posixpath.splitext(name)[0], ext, names)
+            replaced[name] = (new_name, data)
+            report.rows.append((name, new_name, kind, old_px, new_px, package.infos[name].file_size, len(data)))
+        report.skipped.extend(name for name, extent in sorted(sizes.items()) if extent is None)
+        if replaced and output is not None:
+            self._write(package, replaced, output)
+        report.seconds = time.perf_counter() - start
+        return report
+
+    def _write(self, package, replaced, output):
+        level = COMPRESSION_LEVELS[default_compression()]
+        renamed = {old: new for old, (new, _) in replaced.items() if new != old}
+        changed = {}
+        if renamed:
+            for name in package.infos:
+                if name.endswith(".rels"):
+                    updated = _retarget(package, name, renamed)
+                    if updated is not None:
+                        changed[name] = updated
+            changed["[Content_Types].xml"] = _content_types(package, renamed)
+        members = []
+        for info in package.zip.infolist():
+            name = info.filename
+            if name in replaced:
+                new_name, data = replaced[name]
+                # Already compressed image data does not deflate further
+                members.append(compress_member(new_name, data, None))
+            elif name in changed:
+                members.append(compress_member(name, changed[name], level))
+            else:
+                members.append(package.raw_member(name))
+        if isinstance(output, (str, os.PathLike)):
+            tmp = f"{output}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as stream:
+                write_zip(stream, members, zip_timestamp())
+            os.replace(tmp, output)
+        else:
+            write_zip(output, members, zip_timestamp())
+
+
+def _free_name(stem, ext, names):
+    """image2 + jpeg -> image2.jpeg, or the next free imageN.jpeg"""
+    candidate = f"{stem}.{ext}"
+    prefix = stem.rstrip("0123456789")
+    number = 0
+    while candidate in names:
+        number += 1
+        candidate = f"{prefix}{number}.{ext}"
+    names.add(candidate)
+    return candidate
+
+
+def _retarget(package, rels_part, renamed):
+    """Rewritten relationship part pointing at renamed media, or None if it has no such targets"""
+    root = etree.fromstring(package.read(rels_part))
+    base = posixpath.dirname(posixpath.dirname(rels_part))
+    found = False
+    for rel in root.iter(f"{{{RELS_NS}}}Relationship"):
+        if rel.get("TargetMode") == "External":
+            continue
+        target = posixpath.normpath(posixpath.join(base, rel.get("Target"))).lstrip("/")
+        if target in renamed:
+            rel.set("Target", posixpath.relpath(renamed[target], base or "."))
+            found = True
+    if not found:
+        return None
+    return etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True)
+
+
+def _content_types(package, renamed):
+    root = etree.fromstring(package.read("[Content_Types].xml"))
+    for override in list(root.iter(f"{{{CT_NS}}}Override")):
+        if override.get("PartName").lstrip("/") in renamed:
+            root.remove(override)
+    extensions = {posixpath.splitext(name)[1][1:] for name in renamed.values()}
+    for ext in sorted(extensions - set(package.defaults)):
+        root.insert(0, etree.Element(f"{{{CT_NS}}}Default", {"Extension": ext, "ContentType": f"image/{ext}"}))
+    return etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True)
+
+
+def optimize_deck(path, output=None, dpi=None, quality=JPEG_QUALITY, workers=None):
+    """Optimize the images of the deck at `path` in place (or into `output`); returns the MediaReport"""
+    optimizer = MediaOptimizer(dpi or configured_dpi() or DEFAULT_DPI, quality, workers)
+    return optimizer.optimize(path, output or path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Downscale and recompress the images of a deck")
+    parser.add_argument("deck")
+    parser.add_argument("--dpi", type=int, default=configured_dpi() or DEFAULT_DPI)
+    parser.add_argument("-q", "--quality", type=int, default=JPEG_QUALITY, help="JPEG quality for photos")
+    parser.add_argument("-j", "--workers", type=int)
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("-o", "--output", help="write the optimized deck here (default: report only)")
+    group.add_argument("-i", "--in-place", action="store_true", help="overwrite the deck")
+    args = parser.parse_args(argv)
+
+    before = os.path.getsize(args.deck)
+    output = args.deck if args.in_place else args.output
+    report = MediaOptimizer(args.dpi, args.quality, args.workers).optimize(args.deck, output)
+    report.print()
+    if output and report.rows:
+        after = os.path.getsize(output)
+        print(f"📦 {before / 1024:.0f} KB -> {after / 1024:.0f} KB ({before / after:.1f}x smaller)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
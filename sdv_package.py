@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Package writer for generated decks.
+
+python-pptx stamps every zip member with the wall-clock time and XlsxWriter
+stamps a creation date into each embedded chart workbook, so two builds of
+the same deck never match byte for byte. This writer serializes the same
+parts in the same order with fixed timestamps instead.
+
+It also replaces python-pptx's serial, fixed-level deflate with a
+configurable engine: parts are compressed in a thread pool (zlib releases
+the GIL) and the zip archive is assembled from the finished streams.
+
+Compression modes:
+    store    no compression, fastest for local previews
+    fast     deflate level 1
+    default  deflate level 6 (python-pptx's behaviour)
+    max      deflate level 9
+
+The mode for every generator can be chosen with SDV_COMPRESSION.
+
+Usage:
+    python sdv_package.py deck.pptx --compression max -o smaller.pptx
+"""
+
+import argparse
+import io
+import os
+import re
+import struct
+import sys
+import time
+import zipfile
+import zlib
+
+ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)
+
+COMPRESSION_LEVELS = {
+    "store": None,
+    "fast": 1,
+    "default": 6,
+    "max": 9,
+}
+
+_XLSX_DATE_RE = re.compile(rb"(<dcterms:(?:created|modified)[^>]*>)[^<]*(</dcterms:)")
+
+
+def zip_timestamp():
+    """Timestamp for zip members (SOURCE_DATE_EPOCH or 1980-01-01)"""
+    epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    if not epoch:
+        return ZIP_EPOCH
+    stamp = time.gmtime(max(int(epoch), 315532800))
+    return stamp[:6]
+
+
+def default_compression():
+    """Compression mode from SDV_COMPRESSION, falling back to "default" """
+    mode = os.environ.get("SDV_COMPRESSION", "default")
+    if mode not in COMPRESSION_LEVELS:
+        raise ValueError(f"Unknown SDV_COMPRESSION mode: {mode}")
+    return mode
+
+
+def part_category(membername):
+    """Coarse part type used for reporting"""
+    if membername.endswith(".rels"):
+        return "relationships"
+    if membername.startswith("ppt/slides/"):
+        return "slide XML"
+    if membername.startswith("ppt/charts/"):
+        return "chart XML"
+    if membername.startswith("ppt/embeddings/"):
+        return "embedded xlsx" if membername.endswith(".xlsx") else "embedded object"
+    if membername.startswith("ppt/media/") or membername.startswith("docProps/thumbnail"):
+        return "media"
+    if membername.startswith("ppt/slideLayouts/"):
+        return "layouts"
+    if membername.startswith(("ppt/slideMasters/", "ppt/theme/", "ppt/notesMasters/")):
+        return "masters & themes"
+    return "package"
+
+
+def iter_package_items(prs, skip=()):
+    """Yield (membername, blob, content_type) for every item in save order
+
+    Members named in `skip` are yielded with a blob of None and not serialized.
+    """
+    # python-pptx is only needed to save; count_slides and recompression work without it
+    from pptx.opc.oxml import serialize_part_xml
+    from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI
+    from pptx.opc.serialized import _ContentTypesItem
+
+    package = prs.part.package
+    parts = tuple(package.iter_parts())
+    yield (CONTENT_TYPES_URI.membername,
+           serialize_part_xml(_ContentTypesItem.xml_for(parts)), None)
+    yield PACKAGE_URI.rels_uri.membername, package._rels.xml, None
+    for part in parts:
+        membername = part.partname.membername
+        if membername in skip:
+            blob = None
+        else:
+            blob = part.blob
+            if part.partname.ext == "xlsx":
+                blob = normalize_xlsx(blob)
+        yield membername, blob, part.content_type
+        if part._rels:
+            rels_name = part.partname.rels_uri.membername
+            yield rels_name, None if rels_name in skip else part.rels.xml, None
+
+
+def iter_zip_items(path):
+    """Yield (membername, blob, None) for every member of an existing package"""
+    with zipfile.ZipFile(path) as zipf:
+        for info in zipf.infolist():
+            yield info.filename, zipf.read(info), None
+
+
+def normalize_xlsx(blob):
+    """Pin the creation date XlsxWriter writes into embedded chart workbooks"""
+    date = time.strftime("%Y-%m-%dT%H:%M:%SZ", zip_timestamp() + (0, 0, 0))
+    src = zipfile.ZipFile(io.BytesIO(blob))
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as dst:
+        for info in src.infolist():
+            data = src.read(info)
+            if info.filename == "docProps/core.xml":
+                data = _XLSX_DATE_RE.sub(rb"\g<1>" + date.encode() + rb"\g<2>", data)
+            member = zipfile.ZipInfo(info.filename, info.date_time)
+            member.compress_type = info.compress_type
+            member.external_attr = info.external_attr
+            dst.writestr(member, data)
+    return out.getvalue()
+
+
+def count_slides(path):
+    """Number of slides in a saved deck, read from presentation.xml only"""
+    with zipfile.ZipFile(path) as zipf:
+        return zipf.read("ppt/presentation.xml").count(b"<p:sldId ")
+
+
+class CompressedMember:
+    """One zip member with its payload already compressed"""
+
+    __slots__ = ("name", "method", "crc", "raw_size", "data", "seconds")
+
+    def __init__(self, name, method, crc, raw_size, data, seconds):
+        self.name = name
+        self.method = method
+        self.crc = crc
+        self.raw_size = raw_size
+        self.data = data
+        self.seconds = seconds
+
+
+def compress_member(name, blob, level):
+    """Compress one blob to a raw deflate stream (or store it when level is None)"""
+    start = time.perf_counter()
+    crc = zlib.crc32(blob)
+    if level is None:
+        method, data = zipfile.ZIP_STORED, blob
+    else:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+        method, data = zipfile.ZIP_DEFLATED, compressor.compress(blob) + compressor.flush()
+    return CompressedMember(name, method, crc, len(blob), data, time.perf_counter() - start)
+
+
+def _dos_datetime(date_time):
+    year, month, day, hour, minute, second = date_time
+    return (hour << 11) | (minute << 5) | (second // 2), ((year - 1980) << 9) | (month << 5) | day
+
+
+def write_zip(stream, members, date_time):
+    """Assemble a zip archive from precompressed members"""
+    dos_time, dos_date = _dos_datetime(date_time)
+    central = []
+    offset = 0
+    for member in members:
+        name = member.name.encode("utf-8")
+        flags = 0 if member.name.isascii() else 0x800
+        if offset > 0xFFFFFFFF or len(member.data) > 0xFFFFFFFF:
+            raise ValueError("Package too large for a non-ZIP64 archive")
+        header = struct.pack(
+            "<IHHHHHIIIHH", 0x04034B50, 20, flags, member.method, dos_time, dos_date,
+            member.crc, len(member.data), member.raw_size, len(name), 0,
+        )
+        stream.write(header)
+        stream.write(name)
+        stream.write(member.data)
+        central.append(struct.pack(
+            "<IHHHHHHIIIHHHHHII", 0x02014B50, 20, 20, flags, member.method, dos_time, dos_date,
+            member.crc, len(member.data), member.raw_size, len(name), 0, 0, 0, 0, 0, offset,
+        ) + name)
+        offset += len(header) + len(name) + len(member.data)
+    directory = b"".join(central)
+    stream.write(directory)
+    stream.write(struct.pack("<IHHHHIIH", 0x06054B50, 0, 0, len(central), len(central),
+                             len(directory), offset, 0))
+
+
+class PackageReport:
+    """Compression ratio and throughput per part type for one save"""
+
+    def __init__(self, mode, members, wall_time):
+        self.mode = mode
+        self.members = members
+        self.wall_time = wall_time
+        self.categories = {}
+        for member in members:
+            row = self.categories.setdefault(part_category(member.name), {
+                "parts": 0, "raw_bytes": 0, "stored_bytes": 0, "seconds": 0.0,
+            })
+            row["parts"] += 1
+            row["raw_bytes"] += member.raw_size
+            row["stored_bytes"] += len(member.data)
+            row["seconds"] += member.seconds
+
+    @property
+    def raw_bytes(self):
+        return sum(row["raw_bytes"] for row in self.categories.values())
+
+    @property
+    def stored_bytes(self):
+        return sum(row["stored_bytes"] for row in self.categories.values())
+
+    def print(self, file=None):
+        file = file or sys.stdout
+        print(f"Compression: {self.mode} | {self.raw_bytes / 1024:.0f} KB -> {self.stored_bytes / 1024:.0f} KB "
+              f"in {self.wall_time * 1000:.0f} ms", file=file)
+        print(f"{'Part type':<18} {'Parts':>6} {'Raw KB':>9} {'Stored KB':>10} {'Ratio':>7} {'MB/s':>8}", file=file)
+        for name, row in sorted(self.categories.items(), key=lambda item: -item[1]["raw_bytes"]):
+            ratio = row["stored_bytes"] / row["raw_bytes"] if row["raw_bytes"] else 1.0
+            throughput = row["raw_bytes"] / row["seconds"] / 1e6 if row["seconds"] else 0.0
+            print(f"{name:<18} {row['parts']:>6} {row['raw_bytes'] / 1024:>9.1f} "
+                  f"{row['stored_bytes'] / 1024:>10.1f} {ratio:>7.2f} {throughput:>8.1f}", file=file)
+
+
+class PackageWriter:
+    """Writes package items with a chosen compression mode using worker threads"""
+
+    def __init__(self, compression=None, workers=None):
+        self.compression = compression or default_compression()
+        if self.compression not in COMPRESSION_LEVELS:
+            raise ValueError(f"Unknown compression mode: {self.compression}")
+        self.level = COMPRESSION_LEVELS[self.compression]
+        self.workers = workers or min(8, os.cpu_count() or 1)
+
+    def compress(self, items, reuse=None):
+        """Compress (membername, blob) items in parallel, preserving order
+
+        Items with a blob of None are taken from `reuse` ({membername: CompressedMember}).
+        """
+        items = list(items)
+
+        def member(item):
+            name, blob, _ = item
+            return reuse[name] if blob is None else compress_member(name, blob, self.level)
+
+        if self.workers == 1 or len(items) < 2:
+            return [member(item) for item in items]
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            return list(pool.map(member, items))
+
+    def write_items(self, items, pkg_file, reuse=None):
+        """Write items to a path or stream and return a PackageReport"""
+        start = time.perf_counter()
+        members = self.compress(items, reuse)
+        if isinstance(pkg_file, (str, os.PathLike)):
+            with open(pkg_file, "wb") as stream:
+                write_zip(stream, members, zip_timestamp())
+        else:
+            write_zip(pkg_file, members, zip_timestamp())
+        return PackageReport(self.compression, members, time.perf_counter() - start)
+
+    def write(self, prs, pkg_file, reuse=None):
+        """Save `prs`; members in `reuse` are copied instead of serialized and compressed again"""
+        reuse = reuse or {}
+        return self.write_items(iter_package_items(prs, skip=reuse), pkg_file, reuse)
+
+
+def save_presentation(prs, pkg_file, compression=None, workers=None):
+    """Save `prs` to a path or stream with reproducible bytes
+
+    Returns the PackageReport with per-part-type compression statistics.
+    """
+    return PackageWriter(compression, workers).write(prs, pkg_file)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Recompress an existing .pptx package")
+    parser.add_argument("deck")
+    parser.add_argument("-c", "--compression", choices=sorted(COMPRESSION_LEVELS), default="default")
+    parser.add_argument("-o", "--output", help="output path (default: report only)")
+    parser.add_argument("-j", "--workers", type=int)
+    args = parser.parse_args(argv)
+
+    writer = PackageWriter(args.compression, args.workers)
+    items = iter_zip_items(args.deck)
+    report = writer.write_items(items, args.output or io.BytesIO())
+    report.print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Asyncio ingestion-to-deck pipeline.
+
+Three stages connected by bounded queues:
+
+    extract  N workers run the blocking extractor (PDF parsing) in a thread
+             or process pool
+    build    turns each extracted document into slide jobs, in source order
+    render   adds the slides to the deck as the jobs arrive
+
+Slides for the first document render while later documents are still being
+parsed, so the end-to-end time approaches the slowest stage instead of the
+sum of all of them. Each queue holds at most `queue_size` items; a stage
+that runs ahead waits on a full queue, which caps how many extracted texts
+are held in memory at once.
+
+Usage:
+    python sdv_pipeline.py             # build SDV_Presentation.pptx and show stage times
+"""
+
+import asyncio
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+
+class StageStats:
+    """Items handled, busy time and time spent blocked on a full queue"""
+
+    def __init__(self, name):
+        self.name = name
+        self.items = 0
+        self.busy = 0.0
+        self.blocked = 0.0
+
+
+class PipelineReport:
+    def __init__(self, stages, wall_time):
+        self.stages = stages
+        self.wall_time = wall_time
+
+    @property
+    def longest_stage(self):
+        return max(self.stages, key=lambda stage: stage.busy)
+
+    def print(self, file=None):
+        file = file or sys.stdout
+        print(f"{'Stage':<10} {'Items':>6} {'Busy ms':>9} {'Blocked ms':>11}", file=file)
+        for stage in self.stages:
+            print(f"{stage.name:<10} {stage.items:>6} {stage.busy * 1000:>9.1f} {stage.blocked * 1000:>11.1f}",
+                  file=file)
+        longest = self.longest_stage
+        print(f"Wall {self.wall_time * 1000:.1f} ms | longest stage {longest.name} "
+              f"{longest.busy * 1000:.1f} ms | serial sum "
+              f"{sum(stage.busy for stage in self.stages) * 1000:.1f} ms", file=file)
+
+
+def make_executor(kind=None, workers=2):
+    """Thread or process pool for the extract stage
+
+    Processes let pure-Python parsers run beside the renderer; with a single
+    CPU threads are cheaper. SDV_PIPELINE_EXECUTOR overrides the default.
+    """
+    kind = kind or os.environ.get("SDV_PIPELINE_EXECUTOR") or ("process" if (os.cpu_count() or 1) > 1 else "thread")
+    if kind == "process":
+        return ProcessPoolExecutor(max_workers=workers)
+    if kind == "thread":
+        return ThreadPoolExecutor(max_workers=workers)
+    raise ValueError(f"Unknown executor kind: {kind}")
+
+
+async def _put(queue, item, stats):
+    start = time.perf_counter()
+    await queue.put(item)
+    stats.blocked += time.perf_counter() - start
+
+
+async def _extract_worker(jobs, extracted, extract, executor, stats):
+    loop = asyncio.get_running_loop()
+    while True:
+        try:
+            index, source = jobs.get_nowait()
+        except asyncio.QueueEmpty:
+            return
+        start = time.perf_counter()
+        result = await loop.run_in_executor(executor, extract, source)
+        stats.busy += time.perf_counter() - start
+        stats.items += 1
+        await _put(extracted, (index, source, result), stats)
+
+
+async def _build_stage(extracted, slides, build, stats):
+    pending = {}
+    next_index = 0
+    while True:
+        item = await extracted.get()
+        if item is None:
+            break
+        pending[item[0]] = item
+        # Documents may finish out of order; slides are emitted in source order
+        while next_index in pending:
+            index, source, result = pending.pop(next_index)
+            start = time.perf_counter()
+            jobs = build(index, source, result)
+            stats.busy += time.perf_counter() - start
+            stats.items += 1
+            for job in jobs:
+                await _put(slides, job, stats)
+            next_index += 1
+    await slides.put(None)
+
+
+async def _render_stage(slides, render, stats):
+    while True:
+        job = await slides.get()
+        if job is None:
+            return
+        start = time.perf_counter()
+        render(job)
+        stats.busy += time.perf_counter() - start
+        stats.items += 1
+        # Let the other stages hand over finished work between slides
+        await asyncio.sleep(0)
+
+
+async def run_ingestion(sources, extract, build, render, workers=2, queue_size=2, executor=None):
+    """Run the extract -> build -> render pipeline and return a PipelineReport
+
+    extract(source)               blocking, runs in the executor (must be picklable for processes)
+    build(index, source, result)  returns a list of slide jobs, called in source order
+    render(job)                   adds one slide, called on the event loop
+    """
+    stats = [StageStats("extract"), StageStats("build"), StageStats("render")]
+    jobs = asyncio.Queue()
+    for index, source in enumerate(sources):
+        jobs.put_nowait((index, source))
+    extracted = asyncio.Queue(maxsize=queue_size)
+    slides = asyncio.Queue(maxsize=queue_size)
+
+    own_executor = executor is None
+    executor = executor or make_executor(workers=workers)
+    start = time.perf_counter()
+
+    async def extract_all():
+        await asyncio.gather(*(_extract_worker(jobs, extracted, extract, executor, stats[0])
+                               for _ in range(max(1, min(workers, len(sources))))))
+        await extracted.put(None)
+
+    tasks = [
+        asyncio.create_task(extract_all()),
+        asyncio.create_task(_build_stage(extracted, slides, build, stats[1])),
+        asyncio.create_task(_render_stage(slides, render, stats[2])),
+    ]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        # A failed stage would leave the others waiting on a full or empty queue
+        for task in tasks:
+            task.cancel()
+        raise
+    finally:
+        if own_executor:
+            executor.shutdown()
+    return PipelineReport(stats, time.perf_counter() - start)
+
+
+def run_pipeline(sources, extract, build, render, workers=2, queue_size=2, executor=None):
+    """Synchronous entry point for run_ingestion"""
+    return asyncio.run(run_ingestion(sources, extract, build, render, workers, queue_size, executor))
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build SDV_Presentation.pptx with the async pipeline")
+    parser.add_argument("-j", "--workers", type=int, default=2, help="extraction workers")
+    parser.add_argument("-q", "--queue-size", type=int, default=2)
+    parser.add_argument("--executor", choices=["thread", "process"])
+    parser.add_argument("-o", "--output", default="SDV_Presentation.pptx")
+    args = parser.parse_args(argv)
+
+    from create_presentation import create_ppt_presentation_pipelined
+
+    executor = make_executor(args.executor, args.workers)
+    with executor:
+        report = create_ppt_presentation_pipelined(args.output, args.workers, args.queue_size, executor)
+    report.print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Per-slide-type instrumentation for the presentation classes.
+
+`profile_slide_methods` wraps every `add_*` method of a generator class.
+While the profiler is disabled a wrapped call costs one attribute check;
+when enabled (SDV_PROFILE=1 or PROFILER.enable()) each call records its
+wall time, the shapes it created, the slide XML bytes it produced (plus any
+chart parts it added) and the slides it touched.
+
+Nested helpers (for example add_slide_number inside add_content_slide) are
+recorded too, so cumulative times are inclusive of children.
+
+Usage:
+    python sdv_profiler.py massive --trace massive_trace.json
+    SDV_PROFILE=1 python create_massive_sdv_presentation.py
+"""
+
+import argparse
+import atexit
+import functools
+import json
+import os
+import sys
+import time
+
+from lxml import etree
+
+CHART_RELTYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/chart"
+
+
+class SlideProfiler:
+    """Collects one event per instrumented call"""
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.events = []
+        self._origin = time.perf_counter()
+        self._depth = 0
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        self.events = []
+        self._origin = time.perf_counter()
+
+    def call(self, name, method, instance, args, kwargs):
+        """Run `method` and record what it added to instance.prs"""
+        slides = instance.prs.slides
+        n_before = len(slides)
+        last = slides[n_before - 1] if n_before else None
+        before = _slide_snapshot(last) if last is not None else None
+
+        self._depth += 1
+        start = time.perf_counter()
+        try:
+            return method(instance, *args, **kwargs)
+        finally:
+            end = time.perf_counter()
+            self._depth -= 1
+            touched = []
+            shapes = xml_bytes = 0
+            if last is not None:
+                after = _slide_snapshot(last)
+                if after != before:
+                    touched.append(n_before - 1)
+                    shapes += after[0] - before[0]
+                    xml_bytes += after[1] - before[1]
+                    xml_bytes += _chart_bytes(last, exclude=before[2])
+            for index in range(n_before, len(slides)):
+                count, size, _ = _slide_snapshot(slides[index])
+                touched.append(index)
+                shapes += count
+                xml_bytes += size + _chart_bytes(slides[index])
+            self.events.append({
+                "name": name,
+                "start": start - self._origin,
+                "duration": end - start,
+                "depth": self._depth,
+                "shapes": shapes,
+                "xml_bytes": xml_bytes,
+                "slides": touched,
+            })
+
+    def summary(self):
+        """Aggregate events per method: calls, time, shapes and XML bytes"""
+        rows = {}
+        for event in self.events:
+            row = rows.setdefault(event["name"], {
+                "name": event["name"], "calls": 0, "total_s": 0.0, "shapes": 0, "xml_bytes": 0,
+            })
+            row["calls"] += 1
+            row["total_s"] += event["duration"]
+            row["shapes"] += event["shapes"]
+            row["xml_bytes"] += event["xml_bytes"]
+        return sorted(rows.values(), key=lambda row: row["total_s"], reverse=True)
+
+    def print_summary(self, file=None):
+        file = file or sys.stdout
+        print(f"{'Method':<58} {'Calls':>6} {'Total ms':>10} {'Mean ms':>9} {'Shapes':>7} {'XML KB':>8}", file=file)
+        print("-" * 103, file=file)
+        for row in self.summary():
+            mean_ms = row["total_s"] * 1000 / row["calls"]
+            print(f"{row['name']:<58} {row['calls']:>6} {row['total_s'] * 1000:>10.1f} {mean_ms:>9.2f} "
+                  f"{row['shapes']:>7} {row['xml_bytes'] / 1024:>8.1f}", file=file)
+
+    def chrome_trace(self):
+        """Events in Chrome trace format (chrome://tracing, Perfetto, speedscope)"""
+        events = []
+        for event in self.events:
+            events.append({
+                "name": event["name"].rsplit(".", 1)[-1],
+                "cat": event["name"].split(".", 1)[0],
+                "ph": "X",
+                "ts": round(event["start"] * 1e6, 3),
+                "dur": round(event["duration"] * 1e6, 3),
+                "pid": os.getpid(),
+                "tid": 1,
+                "args": {"shapes": event["shapes"], "xml_bytes": event["xml_bytes"], "slides": event["slides"]},
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.chrome_trace(), f, ensure_ascii=False)
+
+
+def _slide_snapshot(slide):
+    """(shape count, slide XML bytes, chart rIds) of a slide"""
+    sp_tree = slide.shapes._spTree
+    charts = frozenset(rId for rId, rel in slide.part.rels.items() if rel.reltype == CHART_RELTYPE)
+    return len(sp_tree.xpath("./p:sp|./p:graphicFrame|./p:cxnSp|./p:pic|./p:grpSp")), \
+        len(etree.tostring(slide._element)), charts
+
+
+def _chart_bytes(slide, exclude=frozenset()):
+    """Bytes of chart XML and embedded workbooks related from `slide`"""
+    total = 0
+    for rId, rel in slide.part.rels.items():
+        if rel.reltype != CHART_RELTYPE or rId in exclude:
+            continue
+        chart_part = rel.target_part
+        total += len(chart_part.blob)
+        xlsx_part = chart_part.chart_workbook.xlsx_part
+        if xlsx_part is not None:
+            total += len(xlsx_part.blob)
+    return total
+
+
+PROFILER = SlideProfiler(enabled=bool(os.environ.get("SDV_PROFILE")))
+
+if PROFILER.enabled:
+    # Enabled from the environment: report when the generator script exits
+    atexit.register(PROFILER.print_summary)
+
+
+def profile_slide_methods(cls):
+    """Class decorator instrumenting every add_* method of a generator class"""
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith("add_") and callable(value):
+            setattr(cls, attr, _instrument(f"{cls.__name__}.{attr}", value))
+    return cls
+
+
+def _instrument(name, method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not PROFILER.enabled:
+            return method(self, *args, **kwargs)
+        return PROFILER.call(name, method, self, args, kwargs)
+    return wrapper
+
+
+DECK_METHODS = {
+    "massive": ("create_massive_sdv_presentation", "MassiveSDVPresentation", "create_presentation"),
+    "ultimate": ("create_ultimate_sdv_presentation", "UltimateSDVPresentation", "create_mega_presentation"),
+    "executive": ("create_executive_sdv_ppt", "ProfessionalSDVPresentation", "create_presentation"),
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Profile add_* methods while building a deck")
+    parser.add_argument("deck", choices=sorted(DECK_METHODS))
+    parser.add_argument("--trace", help="write a Chrome trace JSON file")
+    args = parser.parse_args(argv)
+
+    import importlib
+    # Generators import this file as `sdv_profiler`, not `__main__`
+    profiler = importlib.import_module("sdv_profiler").PROFILER
+    module, cls_name, method = DECK_METHODS[args.deck]
+    builder = getattr(importlib.import_module(module), cls_name)()
+
+    profiler.enable()
+    start = time.perf_counter()
+    getattr(builder, method)()
+    elapsed = time.perf_counter() - start
+    profiler.disable()
+
+    print()
+    profiler.print_summary()
+    print(f"\nBuilt {len(builder.prs.slides)} slides in {elapsed:.2f}s (profiled)")
+    if args.trace:
+        profiler.export_chrome_trace(args.trace)
+        print(f"Chrome trace written to {args.trace}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,758 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Lightweight SVG rendering of generated slides.
+
+Turns the shapes python-pptx writes for these decks into SVG: text boxes
+and placeholders, rectangles, rounded rectangles, ovals, chevrons, arrows
+and the other preset shapes in GEOMETRY, straight, elbow and curved
+connectors with arrowheads, tables and category charts. It is not an office-suite renderer: text is wrapped with
+estimated glyph widths, overflowing placeholder text is shrunk the way
+PowerPoint's autofit would, and unknown geometry falls back to a rectangle.
+That is enough for a browser viewer and for search snippets.
+
+Usage:
+    python sdv_render.py deck.pptx 3 > slide3.svg
+"""
+
+import math
+import sys
+import unicodedata
+from xml.sax.saxutils import escape
+
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+from pptx.oxml.ns import qn
+
+# Bump when the output changes so exported and cached slides are redrawn
+RENDERER_VERSION = 2
+
+EMU_PER_PT = 12700
+FONT_FAMILY = "'Malgun Gothic','Apple SD Gothic Neo','Noto Sans KR','Noto Sans CJK KR',sans-serif"
+
+DEFAULT_THEME = {
+    "dk1": "000000", "lt1": "FFFFFF", "dk2": "1F497D", "lt2": "EEECE1",
+    "accent1": "4F81BD", "accent2": "C0504D", "accent3": "9BBB59",
+    "accent4": "8064A2", "accent5": "4BACC6", "accent6": "F79646",
+    "hlink": "0000FF", "folHlink": "800080",
+}
+SCHEME_ALIASES = {"tx1": "dk1", "bg1": "lt1", "tx2": "dk2", "bg2": "lt2"}
+
+SERIES_COLORS = ["4472C4", "ED7D31", "A5A5A5", "FFC000", "5B9BD5", "70AD47"]
+
+# Master text sizes of the default template (pt)
+TITLE_SIZE = 44
+BODY_SIZES = (32, 28, 24, 20, 20)
+TEXT_SIZE = 18
+
+ALIGN = {"l": "start", "ctr": "middle", "r": "end", "just": "start", "dist": "start"}
+
+# <a:prstDash> values as multiples of the line width
+DASHES = {"dash": (4, 3), "sysDash": (3, 1), "dot": (1, 2), "sysDot": (1, 1), "dashDot": (4, 3, 1, 3),
+          "lgDash": (8, 3), "lgDashDot": (8, 3, 1, 3), "sysDashDot": (3, 1, 1, 1)}
+
+_SP_PR = qn("p:spPr")
+_XFRM = qn("a:xfrm")
+_PRST_GEOM = qn("a:prstGeom")
+
+GEOMETRY = {}
+
+
+def geometry(*names):
+    """Register an SVG builder for preset geometries"""
+    def register(func):
+        for name in names:
+            GEOMETRY[name] = func
+        return func
+    return register
+
+
+def _pt(emu):
+    return round(emu / EMU_PER_PT, 1)
+
+
+def _num(value):
+    text = f"{value:.1f}"
+    return text[:-2] if text.endswith(".0") else text
+
+
+def glyph_width(char, size):
+    """Estimated advance of one character at `size` pt"""
+    if unicodedata.east_asian_width(char) in "WF":
+        return size
+    if char == " ":
+        return size * 0.3
+    return size * (0.62 if char.isupper() or char.isdigit() else 0.5)
+
+
+def text_width(text, size):
+    return sum(glyph_width(char, size) for char in text)
+
+
+def wrap_line(text, size, width):
+    """Break `text` into lines no wider than `width` pt"""
+    if width <= 0 or text_width(text, size) <= width:
+        return [text]
+    lines = []
+    current = ""
+    current_width = 0.0
+    for token in _tokens(text):
+        token_width = text_width(token, size)
+        if current and current_width + token_width > width:
+            lines.append(current.rstrip())
+            current, current_width = token.lstrip(), text_width(token.lstrip(), size)
+        else:
+            current += token
+            current_width += token_width
+    if current:
+        lines.append(current.rstrip())
+    return lines or [""]
+
+
+def _tokens(text):
+    """Words, keeping wide (CJK) characters as break opportunities"""
+    token = ""
+    for char in text:
+        if char == " ":
+            token += char
+            yield token
+            token = ""
+        elif unicodedata.east_asian_width(char) in "WF":
+            if token:
+                yield token
+            yield char
+            token = ""
+        else:
+            token += char
+    if token:
+        yield token
+
+
+class Theme:
+    """Scheme colors of a presentation's first master"""
+
+    def __init__(self, prs=None):
+        self.colors = dict(DEFAULT_THEME)
+        if prs is None:
+            return
+        master = prs.slide_masters[0]
+        for rel in master.part.rels.values():
+            if rel.reltype.endswith("/theme"):
+                self._load(rel.target_part.blob)
+                break
+
+    def _load(self, blob):
+        from lxml import etree
+
+        root = etree.fromstring(blob)
+        scheme = root.find(".//" + qn("a:clrScheme"))
+        if scheme is None:
+            return
+        for entry in scheme:
+            name = etree.QName(entry).localname
+            for color in entry:
+                value = color.get("lastClr") or color.get("val")
+                if value and len(value) == 6:
+                    self.colors[name] = value.upper()
+
+    def color(self, element):
+        """Hex color of an <a:srgbClr>/<a:schemeClr>/... element, or None"""
+        if element is None:
+            return None
+        tag = element.tag
+        if tag == qn("a:srgbClr"):
+            return element.get("val")
+        if tag == qn("a:schemeClr"):
+            name = element.get("val")
+            return self.colors.get(SCHEME_ALIASES.get(name, name))
+        if tag == qn("a:sysClr"):
+            return element.get("lastClr")
+        if tag == qn("a:prstClr"):
+            return {"black": "000000", "white": "FFFFFF"}.get(element.get("val"))
+        return None
+
+    def fill_color(self, parent):
+        """Color of the solid or first gradient fill under `parent`; "none" for noFill"""
+        if parent is None:
+            return None
+        if parent.find(qn("a:noFill")) is not None:
+            return "none"
+        solid = parent.find(qn("a:solidFill"))
+        if solid is not None and len(solid):
+            return self.color(solid[0])
+        stop = parent.find(qn("a:gradFill") + "/" + qn("a:gsLst") + "/" + qn("a:gs"))
+        if stop is not None and len(stop):
+            return self.color(stop[0])
+        return None
+
+
+class SlideRenderer:
+    """Renders the slides of one presentation to SVG strings"""
+
+    def __init__(self, prs):
+        self.prs = prs
+        self.width = prs.slide_width
+        self.height = prs.slide_height
+        self.theme = Theme(prs)
+
+    def render(self, slide):
+        out = [
+            f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {_pt(self.width)} {_pt(self.height)}" '
+            f'font-family="{FONT_FAMILY}">',
+            f'<rect width="100%" height="100%" fill="#{self._background(slide)}"/>',
+        ]
+        for shape in slide.shapes:
+            self.render_shape(shape, out)
+        out.append("</svg>")
+        return "\n".join(out)
+
+    def _background(self, slide):
+        bg = slide._element.find(qn("p:cSld") + "/" + qn("p:bg") + "/" + qn("p:bgPr"))
+        color = self.theme.fill_color(bg)
+        return color if color and color != "none" else "FFFFFF"
+
+    # Shapes ----------------------------------------------------------------
+
+    def render_shape(self, shape, out):
+        shape_type = shape.shape_type
+        if shape_type == MSO_SHAPE_TYPE.GROUP:
+            for child in shape.shapes:
+                self.render_shape(child, out)
+            return
+        if getattr(shape, "has_chart", False):
+            self.render_chart(shape, out)
+            return
+        if getattr(shape, "has_table", False):
+            self.render_table(shape, out)
+            return
+        if shape_type == MSO_SHAPE_TYPE.PICTURE:
+            self._box(out, shape.left, shape.top, shape.width, shape.height, "DDDDDD", None, 0)
+            return
+        element = shape._element
+        if element.tag == qn("p:cxnSp"):
+            self.render_connector(shape, out)
+            return
+        if shape.left is None or shape.width is None:
+            return
+        is_placeholder = shape.is_placeholder
+        if is_placeholder and not (shape.has_text_frame and shape.text_frame.text.strip()):
+            # Empty placeholders are not shown in slide show
+            return
+        self.render_geometry(shape, out)
+        if shape.has_text_frame:
+            self.render_text(shape, out)
+
+    def _shape_colors(self, shape):
+        """(fill, stroke, stroke width pt) for an autoshape or text box"""
+        element = shape._element
+        sp_pr = element.find(qn("p:spPr"))
+        style = element.find(qn("p:style"))
+        fill = self.theme.fill_color(sp_pr)
+        if fill is None and style is not None:
+            ref = style.find(qn("a:fillRef"))
+            if ref is not None and ref.get("idx") != "0" and len(ref):
+                fill = self.theme.color(ref[0])
+        ln = sp_pr.find(qn("a:ln")) if sp_pr is not None else None
+        stroke = self.theme.fill_color(ln)
+        if stroke is None and style is not None:
+            ref = style.find(qn("a:lnRef"))
+            if ref is not None and ref.get("idx") != "0" and len(ref):
+                stroke = self.theme.color(ref[0])
+        width = int(ln.get("w")) / EMU_PER_PT if ln is not None and ln.get("w") else 0.75
+        return fill, stroke, width
+
+    def render_geometry(self, shape, out):
+        fill, stroke, stroke_width = self._shape_colors(shape)
+        if (fill in (None, "none")) and (stroke in (None, "none")):
+            return
+        sp_pr = shape._element.find(_SP_PR)
+        prst = sp_pr.find(_PRST_GEOM) if sp_pr is not None else None
+        name = prst.get("prst") if prst is not None else "rect"
+        builder = GEOMETRY.get(name, GEOMETRY["rect"])
+        x, y, w, h = _pt(shape.left), _pt(shape.top), _pt(shape.width), _pt(shape.height)
+        if name == "line":
+            fill = None
+        out.append(builder(x, y, w, h, _adjustments(prst)) + _paint(fill, stroke, stroke_width)
+                   + _dash(sp_pr, stroke_width) + _transform(sp_pr, x, y, w, h) + "/>")
+
+    def _box(self, out, left, top, width, height, fill, stroke, stroke_width):
+        out.append(f'<rect x="{_num(_pt(left))}" y="{_num(_pt(top))}" width="{_num(_pt(width))}" '
+                   f'height="{_num(_pt(height))}"' + _paint(fill, stroke, stroke_width) + "/>")
+
+    def render_connector(self, shape, out):
+        _, stroke, stroke_width = self._shape_colors(shape)
+        if stroke in (None, "none"):
+            return
+        sp_pr = shape._element.find(_SP_PR)
+        prst = sp_pr.find(_PRST_GEOM)
+        name = prst.get("prst") if prst is not None else "line"
+        x1, y1, x2, y2 = _pt(shape.begin_x), _pt(shape.begin_y), _pt(shape.end_x), _pt(shape.end_y)
+        adj = _adjustments(prst).get("adj1", 50000) / 100000
+        # into_begin / into_end: the path points next to each end, for arrowhead directions
+        if name.startswith("bentConnector"):
+            mid = x1 + (x2 - x1) * adj
+            d = f"M{_num(x1)},{_num(y1)} H{_num(mid)} V{_num(y2)} H{_num(x2)}"
+            into_begin, into_end = (mid, y1), (mid, y2)
+        elif name.startswith("curvedConnector"):
+            mid = x1 + (x2 - x1) * adj
+            d = (f"M{_num(x1)},{_num(y1)} C{_num(mid)},{_num(y1)} {_num(mid)},{_num(y2)} "
+                 f"{_num(x2)},{_num(y2)}")
+            into_begin, into_end = (mid, y1), (mid, y2)
+        else:
+            d = f"M{_num(x1)},{_num(y1)} L{_num(x2)},{_num(y2)}"
+            into_begin, into_end = (x2, y2), (x1, y1)
+        out.append(f'<path d="{d}"' + _paint(None, stroke, stroke_width) + _dash(sp_pr, stroke_width) + "/>")
+        ln = sp_pr.find(qn("a:ln"))
+        if ln is not None:
+            if _has_arrow(ln, "a:tailEnd"):
+                out.append(_arrowhead(into_end, (x2, y2), stroke, stroke_width))
+            if _has_arrow(ln, "a:headEnd"):
+                out.append(_arrowhead(into_begin, (x1, y1), stroke, stroke_width))
+
+    # Text ------------------------------------------------------------------
+
+    def _default_size(self, shape, level):
+        if shape.is_placeholder:
+            ph_type = shape.placeholder_format.type
+            if ph_type is not None and "TITLE" in str(ph_type):
+                return TITLE_SIZE
+            return BODY_SIZES[min(level, len(BODY_SIZES) - 1)]
+        return TEXT_SIZE
+
+    def _default_color(self, shape):
+        style = shape._element.find(qn("p:style"))
+        if style is not None:
+            ref = style.find(qn("a:fontRef"))
+            if ref is not None and len(ref):
+                return self.theme.color(ref[0])
+        return self.theme.colors["dk1"]
+
+    def paragraphs(self, text_frame, shape):
+        """[(lines of text, size, bold, color, anchor, level)] for each paragraph"""
+        default_color = self._default_color(shape)
+        result = []
+        for paragraph in text_frame.paragraphs:
+            p = paragraph._p
+            p_pr = p.pPr
+            def_rpr = p_pr.find(qn("a:defRPr")) if p_pr is not None else None
+            level = int(p_pr.get("lvl", 0)) if p_pr is not None else 0
+            first_run = p.find(qn("a:r") + "/" + qn("a:rPr"))
+            size = bold = color = None
+            for props in (first_run, def_rpr):
+                if props is None:
+                    continue
+                if size is None and props.get("sz"):
+                    size = int(props.get("sz")) / 100
+                if bold is None and props.get("b") is not None:
+                    bold = props.get("b") in ("1", "true")
+                if color is None:
+                    fill = self.theme.fill_color(props)
+                    color = fill if fill != "none" else None
+            size = size or self._default_size(shape, level)
+            align = p_pr.get("algn", "l") if p_pr is not None else "l"
+            result.append((paragraph.text.split("\v"), size, bool(bold), color or default_color,
+                           ALIGN.get(align, "start"), level))
+        return result
+
+    def render_text(self, shape, out):
+        text_frame = shape.text_frame
+        if not text_frame.text.strip():
+            return
+        body_pr = text_frame._txBody.bodyPr
+        inset = lambda name, default: int(body_pr.get(name, default)) / EMU_PER_PT
+        left = _pt(shape.left) + inset("lIns", 91440)
+        top = _pt(shape.top) + inset("tIns", 45720)
+        width = _pt(shape.width) - inset("lIns", 91440) - inset("rIns", 91440)
+        height = _pt(shape.height) - inset("tIns", 45720) - inset("bIns", 45720)
+        wrap = body_pr.get("wrap") != "none"
+        anchor = body_pr.get("anchor") or ("ctr" if shape._element.find(qn("p:style")) is not None else "t")
+
+        paragraphs = self.paragraphs(text_frame, shape)
+        scale = 1.0
+        while True:
+            laid_out = self._layout(paragraphs, width, wrap, scale)
+            total = sum(line_height for _, _, line_height, _ in laid_out)
+            # Shrink overflowing placeholder text the way normAutofit would
+            if not shape.is_placeholder or total <= height or scale <= 0.3:
+                break
+            scale -= 0.1
+
+        y = top
+        if anchor == "ctr":
+            y = top + (height - total) / 2
+        elif anchor == "b":
+            y = top + height - total
+        for line, para, line_height, indent in laid_out:
+            _, size, bold, color, align, _ = para
+            size *= scale
+            y += line_height
+            if not line:
+                continue
+            x = {"start": left + indent, "middle": left + width / 2, "end": left + width}[align]
+            weight = ' font-weight="bold"' if bold else ""
+            out.append(f'<text x="{_num(x)}" y="{_num(y - line_height * 0.25)}" font-size="{_num(size)}" '
+                       f'fill="#{color}" text-anchor="{align}"{weight}>{escape(line)}</text>')
+
+    def _layout(self, paragraphs, width, wrap, scale):
+        laid_out = []
+        for para in paragraphs:
+            lines, size, _, _, _, level = para
+            size *= scale
+            indent = level * size * 1.2
+            for line in lines:
+                for part in (wrap_line(line, size, width - indent) if wrap else [line]):
+                    laid_out.append((part, para, size * 1.2, indent))
+        return laid_out
+
+    # Tables ----------------------------------------------------------------
+
+    def render_table(self, shape, out):
+        table = shape.table
+        x0, y = _pt(shape.left), _pt(shape.top)
+        widths = [_pt(column.width) for column in table.columns]
+        for row in table.rows:
+            row_height = _pt(row.height)
+            x = x0
+            for cell, width in zip(row.cells, widths):
+                tc_pr = cell._tc.find(qn("a:tcPr"))
+                fill = self.theme.fill_color(tc_pr) if tc_pr is not None else None
+                out.append(f'<rect x="{_num(x)}" y="{_num(y)}" width="{_num(width)}" height="{_num(row_height)}"'
+                           + _paint(fill if fill not in (None, "none") else "FFFFFF", "BFBFBF", 0.75) + "/>")
+                paragraphs = self.paragraphs(cell.text_frame, shape)
+                if paragraphs and cell.text.strip():
+                    lines, size, bold, color, align, _ = paragraphs[0]
+                    text = " ".join(lines)
+                    while size > 6 and text_width(text, size) > width - 8:
+                        size -= 1
+                    tx = {"start": x + 4, "middle": x + width / 2, "end": x + width - 4}[align]
+                    weight = ' font-weight="bold"' if bold else ""
+                    out.append(f'<text x="{_num(tx)}" y="{_num(y + row_height / 2 + size * 0.35)}" '
+                               f'font-size="{_num(size)}" fill="#{color}" text-anchor="{align}"{weight}>'
+                               f'{escape(text)}</text>')
+                x += width
+            y += row_height
+
+    # Charts ----------------------------------------------------------------
+
+    def render_chart(self, shape, out):
+        chart = shape.chart
+        x, y, w, h = _pt(shape.left), _pt(shape.top), _pt(shape.width), _pt(shape.height)
+        out.append(f'<rect x="{_num(x)}" y="{_num(y)}" width="{_num(w)}" height="{_num(h)}" fill="#FFFFFF"/>')
+        top = y + 8
+        if chart.has_title and chart.chart_title.has_text_frame:
+            title = chart.chart_title.text_frame.text
+            if title:
+                out.append(f'<text x="{_num(x + w / 2)}" y="{_num(y + 20)}" font-size="14" '
+                           f'text-anchor="middle" font-weight="bold">{escape(title)}</text>')
+                top = y + 30
+        plot = chart.plots[0]
+        categories = [str(category) for category in plot.categories]
+        series = [(s.name, [v or 0 for v in s.values]) for plot in chart.plots for s in plot.series]
+        legend_h = 20 if chart.has_legend and series else 0
+        area = (x + 40, top, w - 56, y + h - top - 24 - legend_h)
+        kind = chart.chart_type.name if chart.chart_type is not None else ""
+        if "PIE" in kind or "DOUGHNUT" in kind:
+            self._pie(out, area, categories, series[0][1] if series else [], "DOUGHNUT" in kind)
+            legend = categories
+        elif "RADAR" in kind:
+            self._radar(out, area, categories, series)
+            legend = [name for name, _ in series]
+        else:
+            self._category_axes(out, area, categories, series, kind)
+            legend = [name for name, _ in series]
+        if legend_h:
+            self._legend(out, x, y + h - legend_h, w, legend)
+
+    def _category_axes(self, out, area, categories, series, kind):
+        ax, ay, aw, ah = area
+        values = [value for _, vals in series for value in vals] or [0]
+        high = max(max(values), 0) or 1
+        low = min(min(values), 0)
+        span = high - low
+        horizontal = kind.startswith("BAR")
+        out.append(f'<line x1="{_num(ax)}" y1="{_num(ay + ah)}" x2="{_num(ax + aw)}" y2="{_num(ay + ah)}" '
+                   f'stroke="#888888" stroke-width="0.75"/>')
+        out.append(f'<line x1="{_num(ax)}" y1="{_num(ay)}" x2="{_num(ax)}" y2="{_num(ay + ah)}" '
+                   f'stroke="#888888" stroke-width="0.75"/>')
+        n = max(len(categories), 1)
+        slot = (ah if horizontal else aw) / n
+        for i, category in enumerate(categories):
+            if horizontal:
+                out.append(f'<text x="{_num(ax - 4)}" y="{_num(ay + slot * (i + 0.5) + 3)}" font-size="8" '
+                           f'text-anchor="end">{escape(category)}</text>')
+            else:
+                out.append(f'<text x="{_num(ax + slot * (i + 0.5))}" y="{_num(ay + ah + 12)}" font-size="8" '
+                           f'text-anchor="middle">{escape(category)}</text>')
+        if "LINE" in kind:
+            for s, (_, vals) in enumerate(series):
+                points = " ".join(f"{_num(ax + slot * (i + 0.5))},{_num(ay + ah - (v - low) / span * ah)}"
+                                  for i, v in enumerate(vals))
+                out.append(f'<polyline points="{points}" fill="none" '
+                           f'stroke="#{SERIES_COLORS[s % len(SERIES_COLORS)]}" stroke-width="2"/>')
+            return
+        bars = max(len(series), 1)
+        bar = slot * 0.7 / bars
+        for s, (_, vals) in enumerate(series):
+            color = SERIES_COLORS[s % len(SERIES_COLORS)]
+            for i, v in enumerate(vals[:n]):
+                length = abs(v) / span * (aw if horizontal else ah)
+                offset = slot * i + slot * 0.15 + bar * s
+                if horizontal:
+                    out.append(f'<rect x="{_num(ax)}" y="{_num(ay + offset)}" width="{_num(length)}" '
+                               f'height="{_num(bar)}" fill="#{color}"/>')
+                else:
+                    out.append(f'<rect x="{_num(ax + offset)}" y="{_num(ay + ah - length)}" width="{_num(bar)}" '
+                               f'height="{_num(length)}" fill="#{color}"/>')
+
+    def _pie(self, out, area, categories, values, hole):
+        ax, ay, aw, ah = area
+        r = min(aw, ah) / 2
+        cx, cy = ax + aw / 2, ay + ah / 2
+        total = sum(values) or 1
+        angle = -math.pi / 2
+        for i, value in enumerate(values):
+            sweep = value / total * 2 * math.pi
+            end = angle + sweep
+            large = 1 if sweep > math.pi else 0
+            x1, y1 = cx + r * math.cos(angle), cy + r * math.sin(angle)
+            x2, y2 = cx + r * math.cos(end), cy + r * math.sin(end)
+            out.append(f'<path d="M{_num(cx)},{_num(cy)} L{_num(x1)},{_num(y1)} '
+                       f'A{_num(r)},{_num(r)} 0 {large} 1 {_num(x2)},{_num(y2)} Z" '
+                       f'fill="#{SERIES_COLORS[i % len(SERIES_COLORS)]}" stroke="#FFFFFF"/>')
+            angle = end
+        if hole:
+            out.append(f'<circle cx="{_num(cx)}" cy="{_num(cy)}" r="{_num(r * 0.5)}" fill="#FFFFFF"/>')
+
+    def _radar(self, out, area, categories, series):
+        ax, ay, aw, ah = area
+        r = min(aw, ah) / 2
+        cx, cy = ax + aw / 2, ay + ah / 2
+        n = max(len(categories), 3)
+        high = max([v for _, vals in series for v in vals] or [1]) or 1
+
+        def point(i, fraction):
+            angle = -math.pi / 2 + 2 * math.pi * i / n
+            return cx + r * fraction * math.cos(angle), cy + r * fraction * math.sin(angle)
+
+        ring = " ".join(f"{_num(px)},{_num(py)}" for px, py in (point(i, 1) for i in range(n)))
+        out.append(f'<polygon points="{ring}" fill="none" stroke="#BFBFBF" stroke-width="0.75"/>')
+        for i, category in enumerate(categories):
+            px, py = point(i, 1.12)
+            out.append(f'<text x="{_num(px)}" y="{_num(py)}" font-size="8" text-anchor="middle">'
+                       f'{escape(category)}</text>')
+        for s, (_, vals) in enumerate(series):
+            points = " ".join(f"{_num(px)},{_num(py)}" for px, py in (point(i, v / high) for i, v in enumerate(vals)))
+            color = SERIES_COLORS[s % len(SERIES_COLORS)]
+            out.append(f'<polygon points="{points}" fill="#{color}" fill-opacity="0.25" '
+                       f'stroke="#{color}" stroke-width="1.5"/>')
+
+    def _legend(self, out, x, y, w, names):
+        step = min(120, w / max(len(names), 1))
+        start = x + (w - step * len(names)) / 2
+        for i, name in enumerate(names):
+            lx = start + step * i
+            out.append(f'<rect x="{_num(lx)}" y="{_num(y + 4)}" width="8" height="8" '
+                       f'fill="#{SERIES_COLORS[i % len(SERIES_COLORS)]}"/>')
+            out.append(f'<text x="{_num(lx + 11)}" y="{_num(y + 11)}" font-size="8">{escape(str(name))}</text>')
+
+
+def _paint(fill, stroke, stroke_width):
+    fill = f"#{fill}" if fill not in (None, "none") else "none"
+    attrs = f' fill="{fill}"'
+    if stroke not in (None, "none"):
+        attrs += f' stroke="#{stroke}" stroke-width="{_num(stroke_width)}"'
+    return attrs
+
+
+def _adjustments(prst):
+    """{"adj": 50000, ...} from a <a:prstGeom>'s <a:avLst>"""
+    values = {}
+    av_lst = prst.find(qn("a:avLst")) if prst is not None else None
+    if av_lst is not None:
+        for gd in av_lst:
+            fmla = gd.get("fmla", "")
+            if fmla.startswith("val "):
+                values[gd.get("name")] = int(fmla[4:])
+    return values
+
+
+def _transform(sp_pr, x, y, w, h):
+    """SVG transform for <a:xfrm> rotation and flips around the shape center"""
+    xfrm = sp_pr.find(_XFRM) if sp_pr is not None else None
+    if xfrm is None:
+        return ""
+    rot = int(xfrm.get("rot", "0")) / 60000
+    flip_h, flip_v = xfrm.get("flipH") == "1", xfrm.get("flipV") == "1"
+    if not (rot or flip_h or flip_v):
+        return ""
+    cx, cy = x + w / 2, y + h / 2
+    parts = [f"translate({_num(cx)} {_num(cy)})"]
+    if rot:
+        parts.append(f"rotate({_num(rot)})")
+    if flip_h or flip_v:
+        parts.append(f"scale({-1 if flip_h else 1} {-1 if flip_v else 1})")
+    parts.append(f"translate({_num(-cx)} {_num(-cy)})")
+    return f' transform="{" ".join(parts)}"'
+
+
+def _dash(sp_pr, stroke_width):
+    dash = sp_pr.find(qn("a:ln") + "/" + qn("a:prstDash")) if sp_pr is not None else None
+    pattern = DASHES.get(dash.get("val")) if dash is not None else None
+    if not pattern:
+        return ""
+    return f' stroke-dasharray="{" ".join(_num(step * max(stroke_width, 1)) for step in pattern)}"'
+
+
+def _has_arrow(ln, tag):
+    end = ln.find(qn(tag))
+    return end is not None and end.get("type", "none") != "none"
+
+
+def _arrowhead(start, tip, color, stroke_width):
+    """Filled triangle at `tip`, pointing away from `start`"""
+    (x1, y1), (x2, y2) = start, tip
+    length = math.hypot(x2 - x1, y2 - y1)
+    if not length:
+        return ""
+    ux, uy = (x2 - x1) / length, (y2 - y1) / length
+    size = max(3 * stroke_width, 4)
+    bx, by = x2 - ux * size, y2 - uy * size
+    points = [(x2, y2), (bx - uy * size / 2, by + ux * size / 2), (bx + uy * size / 2, by - ux * size / 2)]
+    return _polygon(points) + f' fill="#{color}"/>'
+
+
+def _polygon(points):
+    return '<polygon points="' + " ".join(f"{_num(px)},{_num(py)}" for px, py in points) + '"'
+
+
+@geometry("rect")
+def _rect(x, y, w, h, adj):
+    return f'<rect x="{_num(x)}" y="{_num(y)}" width="{_num(w)}" height="{_num(h)}"'
+
+
+@geometry("roundRect")
+def _round_rect(x, y, w, h, adj):
+    radius = min(w, h) * adj.get("adj", 16667) / 100000
+    return (f'<rect x="{_num(x)}" y="{_num(y)}" width="{_num(w)}" height="{_num(h)}" '
+            f'rx="{_num(radius)}" ry="{_num(radius)}"')
+
+
+@geometry("ellipse")
+def _ellipse(x, y, w, h, adj):
+    return f'<ellipse cx="{_num(x + w / 2)}" cy="{_num(y + h / 2)}" rx="{_num(w / 2)}" ry="{_num(h / 2)}"'
+
+
+@geometry("line")
+def _line(x, y, w, h, adj):
+    return f'<line x1="{_num(x)}" y1="{_num(y)}" x2="{_num(x + w)}" y2="{_num(y + h)}"'
+
+
+@geometry("chevron")
+def _chevron(x, y, w, h, adj):
+    a = min(w, h) * adj.get("adj", 50000) / 100000
+    return _polygon([(x, y), (x + w - a, y), (x + w, y + h / 2), (x + w - a, y + h), (x, y + h), (x + a, y + h / 2)])
+
+
+@geometry("homePlate")
+def _home_plate(x, y, w, h, adj):
+    a = min(w, h) * adj.get("adj", 50000) / 100000
+    return _polygon([(x, y), (x + w - a, y), (x + w, y + h / 2), (x + w - a, y + h), (x, y + h)])
+
+
+@geometry("rightArrow")
+def _right_arrow(x, y, w, h, adj):
+    shaft = h * adj.get("adj1", 50000) / 100000
+    head = min(w, h) * adj.get("adj2", 50000) / 100000
+    top, bottom, neck = y + (h - shaft) / 2, y + (h + shaft) / 2, x + w - head
+    return _polygon([(x, top), (neck, top), (neck, y), (x + w, y + h / 2), (neck, y + h), (neck, bottom),
+                     (x, bottom)])
+
+
+@geometry("leftArrow")
+def _left_arrow(x, y, w, h, adj):
+    shaft = h * adj.get("adj1", 50000) / 100000
+    head = min(w, h) * adj.get("adj2", 50000) / 100000
+    top, bottom, neck = y + (h - shaft) / 2, y + (h + shaft) / 2, x + head
+    return _polygon([(x + w, top), (neck, top), (neck, y), (x, y + h / 2), (neck, y + h), (neck, bottom),
+                     (x + w, bottom)])
+
+
+@geometry("trapezoid")
+def _trapezoid(x, y, w, h, adj):
+    a = min(w, h) * adj.get("adj", 25000) / 100000
+    return _polygon([(x, y + h), (x + a, y), (x + w - a, y), (x + w, y + h)])
+
+
+@geometry("triangle")
+def _triangle(x, y, w, h, adj):
+    return _polygon([(x + w * adj.get("adj", 50000) / 100000, y), (x + w, y + h), (x, y + h)])
+
+
+@geometry("diamond")
+def _diamond(x, y, w, h, adj):
+    return _polygon([(x + w / 2, y), (x + w, y + h / 2), (x + w / 2, y + h), (x, y + h / 2)])
+
+
+@geometry("hexagon")
+def _hexagon(x, y, w, h, adj):
+    a = min(w, h) * adj.get("adj", 25000) / 100000
+    return _polygon([(x + a, y), (x + w - a, y), (x + w, y + h / 2), (x + w - a, y + h), (x + a, y + h),
+                     (x, y + h / 2)])
+
+
+@geometry("donut")
+def _donut(x, y, w, h, adj):
+    ring = min(w, h) * adj.get("adj", 25000) / 100000
+    rx, ry, cx, cy = w / 2, h / 2, x + w / 2, y + h / 2
+    ix, iy = max(rx - ring, 0), max(ry - ring, 0)
+    return (f'<path fill-rule="evenodd" d="M{_num(cx - rx)},{_num(cy)} a{_num(rx)},{_num(ry)} 0 1,0 '
+            f'{_num(2 * rx)},0 a{_num(rx)},{_num(ry)} 0 1,0 {_num(-2 * rx)},0 Z '
+            f'M{_num(cx - ix)},{_num(cy)} a{_num(ix)},{_num(iy)} 0 1,0 {_num(2 * ix)},0 '
+            f'a{_num(ix)},{_num(iy)} 0 1,0 {_num(-2 * ix)},0 Z"')
+
+
+@geometry("wave")
+def _wave(x, y, w, h, adj):
+    a = h * adj.get("adj1", 12500) / 100000
+    return (f'<path d="M{_num(x)},{_num(y + a)} C{_num(x + w / 3)},{_num(y - a)} {_num(x + 2 * w / 3)},'
+            f'{_num(y + 3 * a)} {_num(x + w)},{_num(y + a)} L{_num(x + w)},{_num(y + h - a)} '
+            f'C{_num(x + 2 * w / 3)},{_num(y + h - 3 * a)} {_num(x + w / 3)},{_num(y + h + a)} '
+            f'{_num(x)},{_num(y + h - a)} Z"')
+
+
+def slide_text(slide):
+    """All text on a slide (shapes, tables, chart titles) for search"""
+    parts = []
+    for shape in slide.shapes:
+        if shape.has_text_frame:
+            parts.append(shape.text_frame.text.replace("\v", " "))
+        elif getattr(shape, "has_table", False):
+            parts.extend(cell.text for row in shape.table.rows for cell in row.cells)
+        elif getattr(shape, "has_chart", False) and shape.chart.has_title:
+            parts.append(shape.chart.chart_title.text_frame.text)
+    return " ".join(" ".join(part.split()) for part in parts if part.strip())
+
+
+def slide_title(slide):
+    """Title placeholder text, else the first non-empty text on the slide"""
+    title = slide.shapes.title
+    if title is not None and title.text_frame.text.strip():
+        return " ".join(title.text_frame.text.split())
+    for shape in slide.shapes:
+        if shape.has_text_frame and shape.text_frame.text.strip():
+            return " ".join(shape.text_frame.text.split())[:120]
+    return ""
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 2:
+        print("Usage: python sdv_render.py deck.pptx SLIDE_NUMBER", file=sys.stderr)
+        return 2
+    from pptx import Presentation
+
+    prs = Presentation(argv[0])
+    sys.stdout.write(SlideRenderer(prs).render(prs.slides[int(argv[1]) - 1]) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,426 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Local web service for the decks in the repository.
+
+Serves the same viewer as sdv_html_export, but renders slides on demand:
+
+    /                          deck list
+    /<deck>/                   viewer
+    /<deck>/manifest.json      slide titles, text and hashes
+    /<deck>/slides/003.svg     one slide
+    /metrics                   request latency and cache counters (JSON)
+
+Rendered slides are kept in a bounded LRU cache keyed by (deck hash, slide
+index). Every slide response carries a strong ETag made from the slide's
+content hash, which is known without rendering, so a conditional GET is
+answered with 304 straight from the zip index. Rendering runs on a single
+worker thread; concurrent requests for the same slide wait on one render.
+A deck is re-read when its file changes on disk.
+
+Usage:
+    python sdv_server.py                       # decks in the repository, port 8000
+    python sdv_server.py /tmp/decks -p 8080 --cache-size 512
+"""
+
+import argparse
+import asyncio
+import glob
+import hashlib
+import io
+import json
+import os
+import sys
+import time
+import zipfile
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote, unquote, urlsplit
+
+from sdv_html_export import (build_manifest, deck_list_html, deck_slug, search_js, slide_entry,
+                             slide_hashes, viewer_html)
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+MAX_HEADER_BYTES = 16 * 1024
+KEEP_ALIVE_SECONDS = 15
+REASONS = {200: "OK", 301: "Moved Permanently", 304: "Not Modified", 400: "Bad Request",
+           404: "Not Found", 405: "Method Not Allowed", 500: "Internal Server Error"}
+# Errors from reading a missing, truncated or half-written .pptx
+READ_ERRORS = (KeyError, ValueError, OSError, zipfile.BadZipFile)
+
+
+class DeckVersion:
+    """One on-disk version of a deck; the bytes are kept so renders match the hashes"""
+
+    def __init__(self, data):
+        self.data = data
+        self.hash = hashlib.sha256(data).hexdigest()[:16]
+        self.slide_hashes = slide_hashes(io.BytesIO(data))
+        self._prs = None
+        self._renderer = None
+        self._manifest = None
+
+    def _load(self):
+        if self._prs is None:
+            from pptx import Presentation
+            from sdv_render import SlideRenderer
+
+            self._prs = Presentation(io.BytesIO(self.data))
+            self._renderer = SlideRenderer(self._prs)
+
+    # The methods below run on the render thread only
+
+    def render(self, index):
+        self._load()
+        return self._renderer.render(self._prs.slides[index]).encode("utf-8")
+
+    def manifest(self, name):
+        if self._manifest is None:
+            from sdv_render import slide_text, slide_title
+
+            self._load()
+            entries = [slide_entry(number, digest, slide_title(slide), slide_text(slide))
+                       for number, (slide, digest) in enumerate(zip(self._prs.slides, self.slide_hashes), 1)]
+            self._manifest = build_manifest(name, self._prs, entries)
+        return self._manifest
+
+
+class Deck:
+    """A .pptx file, re-read when its size or mtime changes"""
+
+    def __init__(self, path):
+        self.path = path
+        self.name = os.path.basename(path)
+        self.slug = deck_slug(path)
+        self.version = None
+        self._stat = None
+
+    def refresh(self):
+        """Current version; returns the old version too when the file changed"""
+        stat = os.stat(self.path)
+        key = (stat.st_mtime_ns, stat.st_size)
+        if key == self._stat:
+            return self.version, None
+        with open(self.path, "rb") as f:
+            data = f.read()
+        try:
+            version = DeckVersion(data)
+        except READ_ERRORS as exc:
+            # Half-written file: keep serving the previous version
+            if self.version is None:
+                raise
+            print(f"⚠️  {self.name}: {exc}; keeping previous version")
+            return self.version, None
+        old, self.version, self._stat = self.version, version, key
+        return version, old
+
+
+class SlideCache:
+    """LRU of rendered slides keyed by (deck hash, slide index)"""
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.evictions = 0
+
+    def get(self, key):
+        body = self.entries.get(key)
+        if body is not None:
+            self.entries.move_to_end(key)
+        return body
+
+    def put(self, key, body):
+        if key in self.entries:
+            return
+        self.entries[key] = body
+        self.bytes += len(body)
+        while len(self.entries) > self.max_entries:
+            _, evicted = self.entries.popitem(last=False)
+            self.bytes -= len(evicted)
+            self.evictions += 1
+
+    def drop_deck(self, deck_hash):
+        for key in [key for key in self.entries if key[0] == deck_hash]:
+            self.bytes -= len(self.entries.pop(key))
+
+
+class Metrics:
+    def __init__(self, window=4096):
+        self.started = time.time()
+        self.requests = 0
+        self.status = Counter()
+        self.latencies = deque(maxlen=window)
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.joined_renders = 0
+        self.renders = 0
+        self.render_seconds = 0.0
+        self.open_connections = 0
+
+    def record(self, status, seconds):
+        self.requests += 1
+        self.status[status] += 1
+        self.latencies.append(seconds)
+
+    def snapshot(self, cache):
+        latencies = sorted(self.latencies)
+
+        def percentile(fraction):
+            if not latencies:
+                return 0.0
+            return round(latencies[min(len(latencies) - 1, int(len(latencies) * fraction))] * 1000, 3)
+
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            "uptime_s": round(time.time() - self.started, 1),
+            "requests": self.requests,
+            "status": {str(code): count for code, count in sorted(self.status.items())},
+            "open_connections": self.open_connections,
+            "latency_ms": {"p50": percentile(0.5), "p95": percentile(0.95), "p99": percentile(0.99),
+                           "max": percentile(1.0), "window": len(latencies)},
+            "cache": {"entries": len(cache.entries), "max_entries": cache.max_entries, "bytes": cache.bytes,
+                      "hits": self.cache_hits, "misses": self.cache_misses, "evictions": cache.evictions,
+                      "hit_rate": round(self.cache_hits / lookups, 4) if lookups else 0.0},
+            "renders": {"count": self.renders, "joined": self.joined_renders,
+                        "avg_ms": round(self.render_seconds / self.renders * 1000, 3) if self.renders else 0.0},
+        }
+
+
+class Response:
+    def __init__(self, status, body=b"", content_type="text/plain; charset=utf-8", headers=None):
+        self.status = status
+        self.body = body.encode("utf-8") if isinstance(body, str) else body
+        self.content_type = content_type
+        self.headers = headers or {}
+
+
+class DeckServer:
+    def __init__(self, deck_dirs, cache_size=1024):
+        self.deck_dirs = deck_dirs
+        self.decks = {}
+        self.cache = SlideCache(cache_size)
+        self.metrics = Metrics()
+        self._inflight = {}
+        # python-pptx objects are not thread-safe; one thread renders everything
+        self._render_thread = ThreadPoolExecutor(max_workers=1, thread_name_prefix="render")
+
+    def scan(self):
+        found = {}
+        for directory in self.deck_dirs:
+            for path in sorted(glob.glob(os.path.join(directory, "*.pptx"))):
+                if not os.path.basename(path).startswith("~$"):
+                    slug = deck_slug(path)
+                    found[slug] = self.decks.get(slug) or Deck(path)
+        self.decks = found
+
+    def deck(self, slug):
+        deck = self.decks.get(slug)
+        if deck is None:
+            self.scan()
+            deck = self.decks.get(slug)
+        if deck is None:
+            return None, None
+        version, old = deck.refresh()
+        if old is not None:
+            self.cache.drop_deck(old.hash)
+        return deck, version
+
+    async def _on_render_thread(self, key, func, *args):
+        """Run func on the render thread, sharing one call between concurrent requests"""
+        future = self._inflight.get(key)
+        if future is not None:
+            self.metrics.joined_renders += 1
+            return await asyncio.shield(future)
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._render_thread, func, *args)
+        self._inflight[key] = future
+        future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded so a client hanging up does not cancel the render for the others
+        return await asyncio.shield(future)
+
+    async def slide(self, version, index):
+        key = (version.hash, index)
+        body = self.cache.get(key)
+        if body is not None:
+            self.metrics.cache_hits += 1
+            return body
+        self.metrics.cache_misses += 1
+
+        def render():
+            start = time.perf_counter()
+            body = version.render(index)
+            self.metrics.renders += 1
+            self.metrics.render_seconds += time.perf_counter() - start
+            return body
+
+        body = await self._on_render_thread(("slide",) + key, render)
+        self.cache.put(key, body)
+        return body
+
+    async def manifest(self, deck, version):
+        return await self._on_render_thread(("manifest", version.hash), version.manifest, deck.name)
+
+    async def respond(self, method, target, headers):
+        path = unquote(urlsplit(target).path)
+        if method not in ("GET", "HEAD"):
+            return Response(405, "Method not allowed\n", headers={"Allow": "GET, HEAD"})
+        if path in ("/", "/index.html"):
+            self.scan()
+            decks = []
+            for deck in self.decks.values():
+                try:
+                    version, _ = deck.refresh()
+                except READ_ERRORS:
+                    continue
+                decks.append((deck.slug, deck.name, len(version.slide_hashes)))
+            return Response(200, deck_list_html(decks), "text/html; charset=utf-8",
+                            {"Cache-Control": "no-cache"})
+        if path == "/metrics":
+            return Response(200, json.dumps(self.metrics.snapshot(self.cache), indent=1),
+                            "application/json", {"Cache-Control": "no-store"})
+
+        slug, sep, rest = path.lstrip("/").partition("/")
+        try:
+            deck, version = self.deck(slug)
+        except READ_ERRORS:
+            return Response(500, f"Cannot read {slug}\n")
+        if deck is None:
+            return Response(404, "No such deck\n")
+        if not sep:
+            return Response(301, headers={"Location": quote(path) + "/"})
+
+        if rest.startswith("slides/") and rest.endswith(".svg"):
+            try:
+                index = int(rest[len("slides/"):-len(".svg")]) - 1
+            except ValueError:
+                return Response(404, "No such slide\n")
+            if not 0 <= index < len(version.slide_hashes):
+                return Response(404, "No such slide\n")
+            etag = f'"{version.slide_hashes[index]}"'
+            # Viewer links carry ?v=<hash>, so those URLs never change content
+            cache_control = ("public, max-age=31536000, immutable" if f"v={version.slide_hashes[index]}" in target
+                             else "no-cache")
+            if _etag_matches(headers.get("if-none-match"), etag):
+                return Response(304, headers={"ETag": etag, "Cache-Control": cache_control})
+            body = await self.slide(version, index)
+            return Response(200, body, "image/svg+xml", {"ETag": etag, "Cache-Control": cache_control})
+
+        pages = {
+            "": ("text/html; charset=utf-8", viewer_html),
+            "index.html": ("text/html; charset=utf-8", viewer_html),
+            "manifest.json": ("application/json",
+                              lambda manifest: json.dumps(manifest, ensure_ascii=False, indent=1)),
+            "search.js": ("application/javascript; charset=utf-8", search_js),
+        }
+        if rest not in pages:
+            return Response(404, "Not found\n")
+        content_type, page = pages[rest]
+        etag = f'"{version.hash}-{rest or "index"}"'
+        if _etag_matches(headers.get("if-none-match"), etag):
+            return Response(304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+        body = page(await self.manifest(deck, version))
+        return Response(200, body, content_type, {"ETag": etag, "Cache-Control": "no-cache"})
+
+    async def handle(self, reader, writer):
+        self.metrics.open_connections += 1
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), KEEP_ALIVE_SECONDS)
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError,
+                        ConnectionError):
+                    return
+                start = time.perf_counter()
+                try:
+                    method, target, version, headers = _parse_request(head)
+                except ValueError:
+                    await self._send(writer, "GET", Response(400, "Bad request\n"), False)
+                    return
+                try:
+                    response = await self.respond(method, target, headers)
+                except Exception as exc:  # keep serving other requests
+                    print(f"❌ {method} {target}: {exc!r}")
+                    response = Response(500, "Internal server error\n")
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" and (version == "HTTP/1.1" or connection == "keep-alive")
+                await self._send(writer, method, response, keep_alive)
+                self.metrics.record(response.status, time.perf_counter() - start)
+                if not keep_alive:
+                    return
+        except ConnectionError:
+            pass
+        finally:
+            self.metrics.open_connections -= 1
+            writer.close()
+
+    async def _send(self, writer, method, response, keep_alive):
+        lines = [f"HTTP/1.1 {response.status} {REASONS[response.status]}",
+                 f"Content-Length: {len(response.body)}",
+                 f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+        if response.status != 304:
+            lines.append(f"Content-Type: {response.content_type}")
+        lines.extend(f"{name}: {value}" for name, value in response.headers.items())
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        if method != "HEAD" and response.status != 304:
+            writer.write(response.body)
+        await writer.drain()
+
+    async def serve(self, host="127.0.0.1", port=8000, ready=None):
+        self.scan()
+        server = await asyncio.start_server(self.handle, host, port, limit=MAX_HEADER_BYTES, backlog=1024)
+        if ready is not None:
+            ready(server)
+        async with server:
+            await server.serve_forever()
+
+    def close(self):
+        self._render_thread.shutdown(wait=False)
+
+
+def _parse_request(head):
+    lines = head.decode("latin-1").split("\r\n")
+    method, target, version = lines[0].split(" ")
+    if not target.startswith("/") or not version.startswith("HTTP/1."):
+        raise ValueError(lines[0])
+    headers = {}
+    for line in lines[1:]:
+        if line:
+            name, sep, value = line.partition(":")
+            if not sep:
+                raise ValueError(line)
+            headers[name.strip().lower()] = value.strip()
+    return method, target, version, headers
+
+
+def _etag_matches(if_none_match, etag):
+    if not if_none_match:
+        return False
+    return if_none_match.strip() == "*" or etag in (tag.strip() for tag in if_none_match.split(","))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the repository's decks as SVG slides")
+    parser.add_argument("dirs", nargs="*", default=[BASE_DIR], help="directories with .pptx files")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("-p", "--port", type=int, default=8000)
+    parser.add_argument("--cache-size", type=int, default=1024, help="rendered slides kept in memory")
+    args = parser.parse_args(argv)
+
+    server = DeckServer(args.dirs, args.cache_size)
+
+    def ready(listener):
+        print(f"🌐 Serving {len(server.decks)} decks at http://{args.host}:{args.port}/ "
+              f"(metrics: /metrics)")
+
+    try:
+        asyncio.run(server.serve(args.host, args.port, ready))
+    except KeyboardInterrupt:
+        print("\n👋 Stopped")
+    finally:
+        server.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Chapter files for the 150-slide Complete Analysis deck.
+
+MassiveSDVPresentation builds its slides section by section
+(create_section_1_executive_summary ... create_section_8_appendix). This
+mode writes every section to its own chapter file plus an index deck whose
+chapter boxes link to the files. Every file starts from the same corporate
+template, so all chapters carry the same master, layouts and theme; within
+one run those parts are compressed once and reused.
+
+Chapters are rebuilt independently. A chapter's fingerprint covers its own
+create_section_* method, the rest of the generator except the other
+sections, the local modules it imports, the templates and the build
+environment. Editing one section therefore rewrites one chapter (and the
+index when its slide count changes). Slide numbers restart in every chapter.
+
+Usage:
+    python sdv_shards.py             # build changed chapters and the index
+    python sdv_shards.py -f 3 5      # force chapters 3 and 5
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+
+import sdv_build
+from sdv_package import PackageWriter, part_category, save_presentation
+from sdv_watch import definitions
+
+GENERATOR = "create_massive_sdv_presentation"
+PREFIX = "SDV_Complete_Analysis"
+INDEX_NAME = f"{PREFIX}_Index.pptx"
+STAMP_NAME = os.path.join(".sdv_build", "shards.json")
+
+_SECTION_RE = re.compile(r"^create_section_(\d+)_(\w+)$")
+# Parts identical in every chapter built from the same template
+SHARED_CATEGORIES = ("layouts", "masters & themes")
+
+
+def chapters():
+    """[(number, method name, title, file name)] in section order"""
+    from create_massive_sdv_presentation import MassiveSDVPresentation
+
+    result = []
+    for name in dir(MassiveSDVPresentation):
+        match = _SECTION_RE.match(name)
+        if match:
+            words = match.group(2).split("_")
+            title = " ".join(word.upper() if len(word) <= 2 else word.capitalize() for word in words)
+            file_name = f"{PREFIX}_Ch{match.group(1)}_{'_'.join(word.capitalize() for word in words)}.pptx"
+            result.append((int(match.group(1)), name, title, file_name))
+    return sorted(result)
+
+
+def generator_definitions():
+    """{qualified name: AST dump} of the generator module"""
+    return definitions(_read(os.path.join(sdv_build.BASE_DIR, GENERATOR + ".py")))
+
+
+def chapter_fingerprint(method, shared_digest, defs):
+    """Hash of one section method plus everything all chapters share"""
+    body = defs.get(f"MassiveSDVPresentation.{method}", "")
+    return hashlib.sha256((shared_digest + body).encode("utf-8")).hexdigest()
+
+
+def shared_fingerprint(defs):
+    """Hash of the generator without its sections, local modules, templates, data and environment"""
+    digest = hashlib.sha256()
+    for name, dump in sorted(defs.items()):
+        # Sections are hashed per chapter; the full-deck entry points are not used here
+        if _SECTION_RE.match(name.rpartition(".")[2]) or name in (
+                "MassiveSDVPresentation.create_presentation", "build", "main"):
+            continue
+        digest.update(f"{name}\0{dump}\0".encode("utf-8"))
+    generator = os.path.join(sdv_build.BASE_DIR, GENERATOR + ".py")
+    inputs = sdv_build.deck_inputs(sdv_build.get_deck("chapters"))
+    for path in sdv_build.module_deps("sdv_shards") + sdv_build.template_files() + inputs["data"]:
+        if path != generator:
+            digest.update(f"{os.path.basename(path)}\0{sdv_build.file_sha256(path)}\0".encode("utf-8"))
+    digest.update(json.dumps({name: os.environ.get(name) for name in sdv_build.BUILD_ENV},
+                             sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def build_chapter(method, path, writer=None, shared=None):
+    """Generate one section into its own file; returns (slide count, PackageReport)"""
+    from create_massive_sdv_presentation import MassiveSDVPresentation
+
+    presentation = MassiveSDVPresentation()
+    getattr(presentation, method)()
+    writer = writer or PackageWriter()
+    report = writer.write(presentation.prs, path, reuse=shared)
+    return presentation.slide_count, report
+
+
+def build_index(entries, path):
+    """Cover slide and a contents slide whose boxes open the chapter files"""
+    from pptx.enum.shapes import MSO_SHAPE
+    from pptx.util import Inches
+    from create_massive_sdv_presentation import MassiveSDVPresentation
+    from sdv_slides import TextStyle, add_box
+
+    presentation = MassiveSDVPresentation()
+    presentation.add_title_slide("SDV (Software-Defined Vehicle)",
+                                 "Complete Analysis and Strategy Report\n완전 분석 및 전략 보고서", section=0)
+    slide = presentation.prs.slides.add_slide(presentation.prs.slide_layouts[6])
+    presentation.slide_count += 1
+    presentation.add_slide_heading(slide, "Chapters / 목차")
+    colors = presentation.colors
+    style = TextStyle(size=16, bold=True, color=colors['primary'])
+    for index, (number, title, file_name, slides) in enumerate(entries):
+        column, row = divmod(index, 4)
+        box = add_box(slide, MSO_SHAPE.ROUNDED_RECTANGLE, Inches(0.5 + column * 6.3), Inches(1.3 + row * 1.45),
+                      Inches(6.0), Inches(1.2), fill=colors['bg'], line=colors['secondary'],
+                      text=f"Chapter {number}. {title}\n{slides} slides · {file_name}", style=style,
+                      split_lines=True)
+        # Relative link: the chapter files sit next to the index
+        box.click_action.hyperlink.address = file_name
+    presentation.add_slide_number(slide)
+    save_presentation(presentation.prs, path)
+
+
+class ShardBuilder:
+    def __init__(self, output_dir=sdv_build.BASE_DIR):
+        self.output_dir = output_dir
+        self.stamp_path = os.path.join(output_dir, STAMP_NAME)
+        try:
+            with open(self.stamp_path, encoding="utf-8") as f:
+                self.stamps = json.load(f)
+        except (OSError, ValueError):
+            self.stamps = {}
+
+    def is_current(self, key, fingerprint, path):
+        stamp = self.stamps.get(key)
+        return (stamp is not None and stamp["fingerprint"] == fingerprint and os.path.exists(path)
+                and sdv_build.file_sha256(path) == stamp["sha256"])
+
+    def record(self, key, fingerprint, path, **extra):
+        self.stamps[key] = dict(extra, fingerprint=fingerprint, sha256=sdv_build.file_sha256(path))
+
+    def build(self, force=()):
+        """Rebuild stale chapters (and those in `force`) and the index; returns written paths"""
+        defs = generator_definitions()
+        shared_digest = shared_fingerprint(defs)
+        writer = PackageWriter()
+        shared = None
+        written = []
+        entries = []
+        for number, method, title, file_name in chapters():
+            path = os.path.join(self.output_dir, file_name)
+            key = f"chapter-{number}"
+            fingerprint = chapter_fingerprint(method, shared_digest, defs)
+            if number not in force and self.is_current(key, fingerprint, path):
+                print(f"· Chapter {number} {title}: up to date")
+            else:
+                start = time.perf_counter()
+                slides, report = build_chapter(method, path, writer, shared)
+                if shared is None:
+                    shared = {member.name: member for member in report.members
+                              if part_category(member.name) in SHARED_CATEGORIES}
+                self.record(key, fingerprint, path, slides=slides)
+                written.append(path)
+                print(f"✓ Chapter {number} {title}: {slides} slides in {time.perf_counter() - start:.2f}s")
+            entries.append((number, title, file_name, self.stamps[key]["slides"]))
+
+        path = os.path.join(self.output_dir, INDEX_NAME)
+        fingerprint = hashlib.sha256((shared_digest + json.dumps(entries)).encode("utf-8")).hexdigest()
+        if force or not self.is_current("index", fingerprint, path):
+            build_index(entries, path)
+            self.record("index", fingerprint, path)
+            written.append(path)
+            print(f"✓ Index: {len(entries)} chapters, {sum(entry[3] for entry in entries)} slides")
+        self.save()
+        return written
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.stamp_path), exist_ok=True)
+        tmp = f"{self.stamp_path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.stamps, f, indent=1, sort_keys=True)
+        os.replace(tmp, self.stamp_path)
+
+
+def _read(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def build(output_dir="."):
+    """Build the chapter files and index into output_dir and return their paths"""
+    ShardBuilder(output_dir).build()
+    return [os.path.join(output_dir, name) for name in
+            [file_name for _, _, _, file_name in chapters()] + [INDEX_NAME]]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Split the Complete Analysis deck into chapter files")
+    parser.add_argument("-o", "--output-dir", default=".")
+    parser.add_argument("-f", "--force", nargs="*", type=int, metavar="CHAPTER",
+                        help="rebuild these chapters (all when no number is given)")
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    if args.force is not None and not args.force:
+        force = {number for number, _, _, _ in chapters()}
+    else:
+        force = set(args.force or ())
+    start = time.perf_counter()
+    written = ShardBuilder(args.output_dir).build(force)
+    print(f"\n📚 {len(written)} file(s) written in {time.perf_counter() - start:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Copy slides between decks at the zip-part level.
+
+python-pptx cannot copy a slide from one presentation to another. This
+module works on the saved packages instead: a slide part is copied with
+everything its relationships reach (layout, master, theme, images,
+embedded objects), parts are renamed where the target already uses a
+name, and the relationship files are rewritten to the new names. Slide,
+layout and master XML is copied as bytes and never parsed into shapes;
+only presentation.xml, [Content_Types].xml and the relationship files are
+edited. Media and embedded objects are deduplicated by hash, and members of
+the target that do not change are copied into the new zip still compressed.
+
+Speaker notes are not carried over. Both decks must have the same slide
+size (within rounding), since slides are not rescaled.
+
+Usage:
+    python sdv_slide_import.py generated.pptx original.pptx 3-21 --at 4 -o combined.pptx
+"""
+
+import argparse
+import hashlib
+import io
+import os
+import posixpath
+import re
+import struct
+import sys
+import time
+import zipfile
+from xml.sax.saxutils import quoteattr
+
+from lxml import etree
+
+from sdv_package import COMPRESSION_LEVELS, CompressedMember, compress_member, default_compression, \
+    write_zip, zip_timestamp
+
+RELS_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+CT_NS = "http://schemas.openxmlformats.org/package/2006/content-types"
+P_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
+R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+RT = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/"
+
+# Relationships that are dropped instead of followed
+SKIPPED_TYPES = {RT + "notesSlide"}
+# Parts compared by content: identical bytes are stored once
+BINARY_PREFIXES = ("ppt/media/", "ppt/embeddings/")
+
+# EMU; about 0.001"
+SIZE_TOLERANCE = 1000
+
+_NUMBERED_RE = re.compile(r"^(.*?)(\d+)(\.[^./]+)$")
+_LAYOUT_ID_RE = re.compile(rb'(<p:sldLayoutId\b[^>]*?\bid=")(\d+)(")')
+_SLD_SZ_RE = re.compile(rb'<p:sldSz\b[^>]*?\bcx="(\d+)"[^>]*?\bcy="(\d+)"')
+
+
+def rels_name(partname):
+    directory, base = posixpath.split(partname)
+    return posixpath.join(directory, "_rels", base + ".rels")
+
+
+def parse_slide_numbers(spec):
+    """'3-5,8' -> [3, 4, 5, 8]"""
+    numbers = []
+    for chunk in spec.split(","):
+        start, _, end = chunk.strip().partition("-")
+        numbers.extend(range(int(start), int(end or start) + 1))
+    return numbers
+
+
+class ZipPackage:
+    """Read-only view of a .pptx: members, relationships and content types"""
+
+    def __init__(self, source):
+        if isinstance(source, (bytes, bytearray)):
+            self.blob = bytes(source)
+        else:
+            with open(source, "rb") as f:
+                self.blob = f.read()
+        self.zip = zipfile.ZipFile(io.BytesIO(self.blob))
+        self.infos = {info.filename: info for info in self.zip.infolist()}
+        self._rels = {}
+        types = etree.fromstring(self.read("[Content_Types].xml"))
+        self.defaults = {el.get("Extension").lower(): el.get("ContentType") for el in types.iter(f"{{{CT_NS}}}Default")}
+        self.overrides = {el.get("PartName").lstrip("/"): el.get("ContentType")
+                          for el in types.iter(f"{{{CT_NS}}}Override")}
+
+    def read(self, name):
+        return self.zip.read(name)
+
+    def raw_member(self, name):
+        """The member as stored in the zip (still compressed), for copying without recompression"""
+        info = self.infos[name]
+        name_length, extra_length = struct.unpack("<HH", self.blob[info.header_offset + 26:info.header_offset + 30])
+        start = info.header_offset + 30 + name_length + extra_length
+        data = self.blob[start:start + info.compress_size]
+        return CompressedMember(name, info.compress_type, info.CRC, info.file_size, data, 0.0)
+
+    def content_type(self, name):
+        if name in self.overrides:
+            return self.overrides[name]
+        return self.defaults.get(posixpath.splitext(name)[1][1:].lower())
+
+    def rels(self, partname):
+        """[(rId, type, resolved target or URL, external)] of a part"""
+        if partname not in self._rels:
+            result = []
+            name = rels_name(partname)
+            if name in self.infos:
+                base = posixpath.dirname(partname)
+                for rel in etree.fromstring(self.read(name)).iter(f"{{{RELS_NS}}}Relationship"):
+                    external = rel.get("TargetMode") == "External"
+                    target = rel.get("Target")
+                    if not external:
+                        target = posixpath.normpath(posixpath.join(base, target)).lstrip("/")
+                    result.append((rel.get("Id"), rel.get("Type"), target, external))
+            self._rels[partname] = result
+        return self._rels[partname]
+
+    def slide_parts(self):
+        """Slide part names in presentation order"""
+        presentation = etree.fromstring(self.read("ppt/presentation.xml"))
+        targets = {rid: target for rid, _, target, _ in self.rels("ppt/presentation.xml")}
+        return [targets[el.get(f"{{{R_NS}}}id")] for el in presentation.iter(f"{{{P_NS}}}sldId")]
+
+    def slide_size(self):
+        match = _SLD_SZ_RE.search(self.read("ppt/presentation.xml"))
+        return (int(match.group(1)), int(match.group(2))) if match else None
+
+
+class ImportReport:
+    def __init__(self):
+        self.slides = 0
+        self.parts = 0
+        self.reused_media = 0
+        self.seconds = 0.0
+
+
+class SlideImporter:
+    """Target package plus the parts imported into it, written out by save()"""
+
+    def __init__(self, target):
+        self.target = ZipPackage(target)
+        self.names = set(self.target.infos)
+        self.changed = {}      # existing member -> new bytes
+        self.added = {}        # new member -> bytes, in insertion order
+        self.copied = {}       # (source id, part) -> target part
+        self.counters = {}
+        self.report = ImportReport()
+        self._hashes = None
+        self.presentation = etree.fromstring(self.target.read("ppt/presentation.xml"))
+        self.presentation_rels = etree.fromstring(self.target.read(rels_name("ppt/presentation.xml")))
+        self.content_types = etree.fromstring(self.target.read("[Content_Types].xml"))
+
+    # Names and ids ---------------------------------------------------------
+
+    def _fresh_name(self, name):
+        match = _NUMBERED_RE.match(name)
+        stem, ext = (match.group(1), match.group(3)) if match else posixpath.splitext(name)
+        number = self.counters.get((stem, ext), 0)
+        while True:
+            number += 1
+            candidate = f"{stem}{number}{ext}"
+            if candidate not in self.names:
+                self.counters[(stem, ext)] = number
+                self.names.add(candidate)
+                return candidate
+
+    def _next_rid(self):
+        used = {rel.get("Id") for rel in self.presentation_rels}
+        number = len(used) + 1
+        while f"rId{number}" in used:
+            number += 1
+        return f"rId{number}"
+
+    def _master_ids(self):
+        """Ids shared by slide masters and slide layouts across the presentation"""
+        ids = [int(el.get("id")) for el in self.presentation.iter(f"{{{P_NS}}}sldMasterId")]
+        for rid, rel_type, target, _ in self.target.rels("ppt/presentation.xml"):
+            if rel_type == RT + "slideMaster":
+                ids.extend(int(value) for _, value, _ in _LAYOUT_ID_RE.findall(self._part_bytes(target)))
+        for name, blob in self.added.items():
+            if name.startswith("ppt/slideMasters/") and name.endswith(".xml"):
+                ids.extend(int(value) for _, value, _ in _LAYOUT_ID_RE.findall(blob))
+        return ids
+
+    def _part_bytes(self, name):
+        if name in self.added:
+            return self.added[name]
+        if name in self.changed:
+            return self.changed[name]
+        return self.target.read(name)
+
+    def _media_hashes(self):
+        if self._hashes is None:
+            self._hashes = {}
+            for name in self.target.infos:
+                if name.startswith(BINARY_PREFIXES):
+                    self._hashes[hashlib.sha256(self.target.read(name)).digest()] = name
+        return self._hashes
+
+    # Copying ---------------------------------------------------------------
+
+    def _copy_part(self, source, name):
+        key = (id(source), name)
+        if key in self.copied:
+            return self.copied[key]
+        blob = source.read(name)
+        if name.startswith(BINARY_PREFIXES):
+            digest = hashlib.sha256(blob).digest()
+            existing = self._media_hashes().get(digest)
+            if existing is not None:
+                self.copied[key] = existing
+                self.report.reused_media += 1
+                return existing
+        target_name = self._fresh_name(name)
+        # Recorded before following relationships: masters and layouts point at each other
+        self.copied[key] = target_name
+        if name.startswith(BINARY_PREFIXES):
+            self._media_hashes()[hashlib.sha256(blob).digest()] = target_name
+        rels = []
+        for rid, rel_type, target, external in source.rels(name):
+            if rel_type in SKIPPED_TYPES:
+                continue
+            if rel_type == RT + "slide" and not external:
+                raise ValueError(f"{name} links to another slide ({target}); import that slide as well")
+            if not external:
+                copied = self._copy_part(source, target)
+                target = posixpath.relpath(copied, posixpath.dirname(target_name))
+            rels.append((rid, rel_type, target, external))
+        if source.content_type(name) == "application/vnd.openxmlformats-officedocument.presentationml.slideMaster+xml":
+            blob = self._register_master(target_name, blob)
+        self.added[target_name] = blob
+        if rels:
+            self.added[rels_name(target_name)] = _rels_xml(rels)
+        self._add_content_type(target_name, source.content_type(name))
+        self.report.parts += 1
+        return target_name
+
+    def _register_master(self, name, blob):
+        """Give the copied master and its layouts unused ids and list the master in presentation.xml"""
+        next_id = max(self._master_ids() + [2147483647]) + 1
+        master_id = next_id
+
+        def renumber(match):
+            nonlocal next_id
+            next_id += 1
+            return match.group(1) + str(next_id).encode() + match.group(3)
+
+        blob = _LAYOUT_ID_RE.sub(renumber, blob)
+        rid = self._add_presentation_rel(RT + "slideMaster", name)
+        master_list = self.presentation.find(f"{{{P_NS}}}sldMasterIdLst")
+        etree.SubElement(master_list, f"{{{P_NS}}}sldMasterId", {"id": str(master_id), f"{{{R_NS}}}id": rid})
+        return blob
+
+    def _add_presentation_rel(self, rel_type, name):
+        rid = self._next_rid()
+        etree.SubElement(self.presentation_rels, f"{{{RELS_NS}}}Relationship",
+                         {"Id": rid, "Type": rel_type, "Target": posixpath.relpath(name, "ppt")})
+        return rid
+
+    def _add_content_type(self, name, content_type):
+        if content_type is None:
+            return
+        ext = posixpath.splitext(name)[1][1:].lower()
+        if self.target.defaults.get(ext) == content_type:
+            return
+        if ext not in self.target.defaults and ext not in ("xml", "rels"):
+            self.target.defaults[ext] = content_type
+            default = etree.Element(f"{{{CT_NS}}}Default", {"Extension": ext, "ContentType": content_type})
+            # Defaults come before overrides
+            self.content_types.insert(0, default)
+            return
+        etree.SubElement(self.content_types, f"{{{CT_NS}}}Override",
+                         {"PartName": "/" + name, "ContentType": content_type})
+
+    def add_slides(self, source, numbers, position=None):
+        """Import slides `numbers` (1-based) of `source` before slide `position` (default: at the end)"""
+        start = time.perf_counter()
+        if not isinstance(source, ZipPackage):
+            source = ZipPackage(source)
+        if not _same_size(source.slide_size(), self.target.slide_size()):
+            raise ValueError(f"Slide size differs: source {source.slide_size()}, target {self.target.slide_size()}")
+        slides = source.slide_parts()
+        slide_list = self.presentation.find(f"{{{P_NS}}}sldIdLst")
+        if slide_list is None:
+            slide_list = etree.SubElement(self.presentation, f"{{{P_NS}}}sldIdLst")
+            # sldIdLst follows the master/notes/handout lists
+            anchor = self.presentation.find(f"{{{P_NS}}}sldSz")
+            if anchor is not None:
+                anchor.addprevious(slide_list)
+        next_id = max([int(el.get("id")) for el in slide_list] + [255]) + 1
+        index = len(slide_list) if position is None else max(0, position - 1)
+        for number in numbers:
+            if not 1 <= number <= len(slides):
+                raise ValueError(f"Slide {number} out of range (1-{len(slides)})")
+            name = self._copy_part(source, slides[number - 1])
+            rid = self._add_presentation_rel(RT + "slide", name)
+            element = etree.Element(f"{{{P_NS}}}sldId", {"id": str(next_id), f"{{{R_NS}}}id": rid})
+            slide_list.insert(index, element)
+            next_id += 1
+            index += 1
+            self.report.slides += 1
+        self.report.seconds += time.perf_counter() - start
+        return self
+
+    def save(self, pkg_file, compression=None):
+        """Write the combined package to a path or stream"""
+        level = COMPRESSION_LEVELS[compression or default_compression()]
+        self.changed["ppt/presentation.xml"] = _serialize(self.presentation)
+        self.changed[rels_name("ppt/presentation.xml")] = _serialize(self.presentation_rels)
+        self.changed["[Content_Types].xml"] = _serialize(self.content_types)
+        members = []
+        for info in self.target.zip.infolist():
+            if info.filename in self.changed:
+                members.append(compress_member(info.filename, self.changed[info.filename], level))
+            else:
+                members.append(self.target.raw_member(info.filename))
+        for name, blob in self.added.items():
+            members.append(compress_member(name, blob, level))
+        if isinstance(pkg_file, (str, os.PathLike)):
+            with open(pkg_file, "wb") as stream:
+                write_zip(stream, members, zip_timestamp())
+        else:
+            write_zip(pkg_file, members, zip_timestamp())
+        return self.report
+
+
+def _same_size(a, b):
+    """Equal slide sizes, allowing for rounding (13.333" is 305 EMU short of 16:9 at 7.5")"""
+    return a is not None and b is not None and all(abs(x - y) <= SIZE_TOLERANCE for x, y in zip(a, b))
+
+
+def _serialize(element):
+    return etree.tostring(element, xml_declaration=True, encoding="UTF-8", standalone=True)
+
+
+def _rels_xml(rels):
+    out = ['<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+           f'<Relationships xmlns="{RELS_NS}">']
+    for rid, rel_type, target, external in rels:
+        mode = ' TargetMode="External"' if external else ""
+        out.append(f'<Relationship Id={quoteattr(rid)} Type={quoteattr(rel_type)} '
+                   f'Target={quoteattr(target)}{mode}/>')
+    out.append("</Relationships>")
+    return "".join(out).encode("utf-8")
+
+
+def import_slides(target, source, numbers, output, position=None):
+    """Import slides of `source` into the deck `target` and write `output`; returns the ImportReport"""
+    return SlideImporter(target).add_slides(source, numbers, position).save(output)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Copy slides from one deck into another at the zip-part level")
+    parser.add_argument("target", help="deck that receives the slides")
+    parser.add_argument("source", help="deck to copy slides from")
+    parser.add_argument("slides", help="slide numbers, e.g. 3-21 or 2,5,7")
+    parser.add_argument("--at", type=int, help="insert before this slide of the target (default: append)")
+    parser.add_argument("-o", "--output", help="output path (default: overwrite the target)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    report = import_slides(args.target, args.source, parse_slide_numbers(args.slides),
+                           args.output or args.target, args.at)
+    total = time.perf_counter() - start
+    print(f"✓ {report.slides} slides, {report.parts} parts copied, {report.reused_media} media reused "
+          f"in {report.seconds * 1000:.1f} ms ({report.seconds * 1000 / max(report.slides, 1):.2f} ms/slide), "
+          f"written in {total:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Shared slide primitives for all deck generators.
+
+Every generator used to carry its own copy of the title/table/chart/bullet
+helpers. They now call the primitives below, so an optimization made here
+reaches every deck.
+
+Paragraph formatting lives in the paragraph's <a:pPr> element. A TextStyle
+formats the first paragraph through python-pptx, keeps the resulting <a:pPr>
+as a prototype, and afterwards formats paragraphs by inserting a copy of that
+element instead of walking the font/fill proxies again. Colors and lengths are
+cached, so helpers can ask for them inside loops.
+"""
+
+import copy
+import functools
+
+from pptx.dml.color import RGBColor
+from pptx.enum.chart import XL_LEGEND_POSITION
+from pptx.util import Emu, Inches, Pt
+
+
+@functools.lru_cache(maxsize=None)
+def rgb(red, green, blue):
+    """Cached RGBColor"""
+    return RGBColor(red, green, blue)
+
+
+@functools.lru_cache(maxsize=4096)
+def inches(value):
+    """Cached Inches() length"""
+    return Inches(value)
+
+
+@functools.lru_cache(maxsize=None)
+def pt(value):
+    """Cached Pt() length"""
+    return Pt(value)
+
+
+WHITE = rgb(255, 255, 255)
+
+
+class TextStyle:
+    """Paragraph formatting (font, color, alignment, level, spacing)"""
+
+    __slots__ = ("size", "bold", "italic", "color", "align", "level", "space_after", "font_name", "_ppr")
+
+    def __init__(self, size=None, bold=None, color=None, align=None, level=None,
+                 space_after=None, font_name=None, italic=None):
+        self.size = size
+        self.bold = bold
+        self.italic = italic
+        self.color = color
+        self.align = align
+        self.level = level
+        self.space_after = space_after
+        self.font_name = font_name
+        self._ppr = None
+
+    def derive(self, **changes):
+        """Copy of this style with some attributes replaced"""
+        values = {name: getattr(self, name) for name in self.__slots__ if name != "_ppr"}
+        values.update(changes)
+        return TextStyle(**values)
+
+    def apply(self, paragraph):
+        """Format `paragraph` and return it"""
+        p = paragraph._p
+        if p.pPr is not None:
+            # Already carries its own properties (placeholders, re-styled text)
+            return self._apply_properties(paragraph)
+        if self._ppr is None:
+            self._apply_properties(paragraph)
+            self._ppr = copy.deepcopy(p.pPr) if p.pPr is not None else False
+        elif self._ppr is not False:
+            p.insert(0, copy.deepcopy(self._ppr))
+        return paragraph
+
+    def _apply_properties(self, paragraph):
+        if self.level is not None:
+            paragraph.level = self.level
+        font = paragraph.font
+        if self.font_name is not None:
+            font.name = self.font_name
+        if self.size is not None:
+            font.size = pt(self.size)
+        if self.bold is not None:
+            font.bold = self.bold
+        if self.italic is not None:
+            font.italic = self.italic
+        if self.color is not None:
+            font.color.rgb = self.color
+        if self.align is not None:
+            paragraph.alignment = self.align
+        if self.space_after is not None:
+            paragraph.space_after = pt(self.space_after)
+        return paragraph
+
+
+def write_text(text_frame, text, style=None, word_wrap=None, split_lines=False):
+    """Put `text` in the first paragraph of `text_frame` and style it
+
+    With split_lines each line of `text` becomes its own paragraph (the
+    behaviour of `text_frame.text = ...`); only the first one is styled.
+    Otherwise line breaks stay inside the first paragraph.
+    """
+    if word_wrap is not None:
+        text_frame.word_wrap = word_wrap
+    if split_lines:
+        text_frame.text = text
+        paragraph = text_frame.paragraphs[0]
+    else:
+        paragraph = text_frame.paragraphs[0]
+        paragraph.text = text
+    if style is not None:
+        style.apply(paragraph)
+    return text_frame
+
+
+def add_paragraph(text_frame, text, style=None):
+    """Append a paragraph holding `text` to `text_frame`"""
+    paragraph = text_frame.add_paragraph()
+    paragraph.text = text
+    if style is not None:
+        style.apply(paragraph)
+    return paragraph
+
+
+def style_paragraphs(text_frame, style):
+    """Apply `style` to every paragraph of `text_frame`"""
+    for paragraph in text_frame.paragraphs:
+        style.apply(paragraph)
+    return text_frame
+
+
+def add_text(slide, left, top, width, height, text, style=None, word_wrap=None, split_lines=False):
+    """Add a textbox holding `text` and return the shape"""
+    box = slide.shapes.add_textbox(left, top, width, height)
+    write_text(box.text_frame, text, style, word_wrap, split_lines)
+    return box
+
+
+def add_box(slide, shape_type, left, top, width, height, fill=None, line=None, line_width=None,
+            no_line=False, text=None, style=None, split_lines=False):
+    """Add an autoshape with an optional solid fill, outline and text"""
+    shape = slide.shapes.add_shape(shape_type, left, top, width, height)
+    if fill is not None:
+        shape.fill.solid()
+        shape.fill.fore_color.rgb = fill
+    if no_line:
+        shape.line.fill.background()
+    elif line is not None:
+        shape.line.color.rgb = line
+    if line_width is not None:
+        shape.line.width = line_width
+    if text is not None:
+        write_text(shape.text_frame, text, style, split_lines=split_lines)
+    return shape
+
+
+def add_line(slide, x1, y1, x2, y2, color=None, width=None):
+    """Add a straight connector"""
+    line = slide.shapes.add_connector(1, x1, y1, x2, y2)
+    if color is not None:
+        line.line.color.rgb = color
+    if width is not None:
+        line.line.width = width
+    return line
+
+
+def write_bullets(text_frame, bullets, item_style, main_style=None, sub_style=None,
+                  prefix="", sub_prefix=""):
+    """Fill `text_frame` with bullets
+
+    A bullet is either a string or {"main": ..., "sub": [...]}; strings use
+    `item_style`, dict headings `main_style` and their children `sub_style`.
+    """
+    main_style = main_style or item_style
+    sub_style = sub_style or item_style
+    text_frame.clear()
+    first = True
+    for bullet in bullets:
+        p = text_frame.paragraphs[0] if first else text_frame.add_paragraph()
+        first = False
+        if isinstance(bullet, str):
+            p.text = f"{prefix}{bullet}"
+            item_style.apply(p)
+        elif isinstance(bullet, dict):
+            p.text = f"{prefix}{bullet.get('main', '')}"
+            main_style.apply(p)
+            for sub in bullet.get('sub', ()):
+                p = text_frame.add_paragraph()
+                p.text = f"{sub_prefix}{sub}"
+                sub_style.apply(p)
+    return text_frame
+
+
+def bullet_text(bullets, prefix="• ", sub_prefix="  - "):
+    """Bullets flattened into one newline-separated string"""
+    lines = []
+    for item in bullets:
+        if isinstance(item, str):
+            lines.append(f"{prefix}{item}")
+        elif isinstance(item, dict):
+            lines.append(f"{prefix}{item['main']}")
+            lines.extend(f"{sub_prefix}{sub}" for sub in item.get('sub', ()))
+    return "\n".join(lines)
+
+
+def write_outline(text_frame, items):
+    """Fill a body placeholder with (text, level) items; plain strings are level 0"""
+    for i, item in enumerate(items):
+        text, level = (item, None) if isinstance(item, str) else item
+        if i == 0:
+            text_frame.text = text
+            continue
+        p = text_frame.add_paragraph()
+        p.text = text
+        if level is not None:
+            p.level = level
+    return text_frame
+
+
+def add_placeholder_slide(prs, layout_idx, title, body=None, subtitle=None):
+    """Slide from a layout with its title (and body or subtitle placeholder) filled
+
+    `body` may be a string or a list for write_outline.
+    """
+    slide = prs.slides.add_slide(prs.slide_layouts[layout_idx])
+    if title is not None:
+        slide.shapes.title.text = title
+    if subtitle is not None:
+        slide.placeholders[1].text = subtitle
+    if isinstance(body, str):
+        slide.placeholders[1].text = body
+    elif body is not None:
+        write_outline(slide.placeholders[1].text_frame, body)
+    return slide
+
+
+def fill_table(table, headers, rows, header_fill, header_style, body_style=None,
+               stripe_fill=None, first_row=1):
+    """Write a header row and data rows into an existing table
+
+    Even data rows (0, 2, ...) get `stripe_fill` when it is given.
+    """
+    for col, header in enumerate(headers):
+        cell = table.cell(0, col)
+        cell.text = header
+        cell.fill.solid()
+        cell.fill.fore_color.rgb = header_fill
+        if header_style is not None:
+            header_style.apply(cell.text_frame.paragraphs[0])
+    for row_idx, row_data in enumerate(rows):
+        for col, value in enumerate(row_data):
+            cell = table.cell(row_idx + first_row, col)
+            cell.text = str(value)
+            if stripe_fill is not None and row_idx % 2 == 0:
+                cell.fill.solid()
+                cell.fill.fore_color.rgb = stripe_fill
+            if body_style is not None:
+                body_style.apply(cell.text_frame.paragraphs[0])
+    return table
+
+
+def add_table(slide, headers, rows, left, top, width, height, header_fill, header_style,
+              body_style=None, stripe_fill=None, total_rows=None, column_width=None):
+    """Add a table with equal column widths, a header row and striped data rows
+
+    `column_width` overrides the per-column width (width / columns by default).
+    """
+    cols = len(headers)
+    table = slide.shapes.add_table(total_rows or len(rows) + 1, cols, left, top, width, height).table
+    column_width = column_width if column_width is not None else Emu(width // cols)
+    for column in table.columns:
+        column.width = column_width
+    return fill_table(table, headers, rows, header_fill, header_style, body_style, stripe_fill)
+
+
+def category_chart_data(categories, series):
+    """CategoryChartData from categories and (name, values) pairs or a dict"""
+    from pptx.chart.data import CategoryChartData  # loads XlsxWriter; only needed for charts
+
+    chart_data = CategoryChartData()
+    chart_data.categories = categories
+    items = series.items() if isinstance(series, dict) else series
+    for name, values in items:
+        chart_data.add_series(name, values)
+    return chart_data
+
+
+def add_chart(slide, chart_type, categories, series, left, top, width, height,
+              legend=XL_LEGEND_POSITION.BOTTOM, legend_in_layout=None, title=None):
+    """Add a category chart and return the chart
+
+    legend: legend position, or None for no legend change.
+    title: None leaves the title alone, False hides it, a string sets it.
+    """
+    chart_data = category_chart_data(categories, series)
+    chart = slide.shapes.add_chart(chart_type, left, top, width, height, chart_data).chart
+    if legend is not None:
+        chart.has_legend = True
+        chart.legend.position = legend
+        if legend_in_layout is not None:
+            chart.legend.include_in_layout = legend_in_layout
+    if title is False:
+        chart.has_title = False
+    elif title is not None:
+        chart.has_title = True
+        chart.chart_title.text_frame.text = title
+    return chart
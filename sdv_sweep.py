@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Variants of the Complete Analysis deck over a grid of strategy parameters.
+
+MassiveSDVPresentation reads its investment plan and KPI targets from
+`params` (STRATEGY_PARAMS). A sweep takes a grid of values, e.g. three
+budgets x two target years, and writes one deck per combination without
+rebuilding 150 slides each time:
+
+1. The first combination is built in full and its package is compressed
+   once; every part that no parameter touches is reused by all variants.
+2. Which slides depend on which parameter is found by building once more
+   per swept parameter with another value from the grid and comparing each
+   slide's parts (slide XML, charts, embedded workbooks).
+3. For each variant only the create_section_* methods that contain
+   dependent slides are run, starting from the recorded slide number, and
+   the changed slide parts replace the baseline ones in the package.
+
+Slides are compared again after re-rendering, so a slide that only
+changes for some values is still picked up as long as it sits in a section
+with a detected dependency. Variants whose sections come out with a
+different slide count or part structure are built in full instead.
+
+Usage:
+    python sdv_sweep.py -p investment_eok=20000,30000,50000 -p target_year=2030,2032 -o sweep
+    python sdv_sweep.py --grid grid.json -o sweep
+"""
+
+import argparse
+import contextlib
+import hashlib
+import io
+import itertools
+import json
+import os
+import sys
+import time
+
+from sdv_package import PackageWriter, compress_member, iter_package_items, normalize_xlsx, part_category, \
+    write_zip, zip_timestamp
+
+PREFIX = "SDV_Complete_Analysis_Scenario"
+MANIFEST_NAME = "sweep.json"
+# Parts every slide shares; a slide's own parts are everything else it reaches
+SHARED_CATEGORIES = ("layouts", "masters & themes")
+
+
+def parse_grid(specs, grid_file=None):
+    """{parameter: [values]} from a JSON file and/or name=v1,v2 options"""
+    grid = {}
+    if grid_file:
+        with open(grid_file, encoding="utf-8") as f:
+            grid.update(json.load(f))
+    for spec in specs or ():
+        name, _, values = spec.partition("=")
+        grid[name.strip()] = [_value(value.strip()) for value in values.split(",")]
+    from create_massive_sdv_presentation import STRATEGY_PARAMS
+    unknown = sorted(set(grid) - set(STRATEGY_PARAMS))
+    if unknown:
+        raise ValueError(f"Unknown parameter(s): {', '.join(unknown)} (known: {', '.join(STRATEGY_PARAMS)})")
+    return grid
+
+
+def _value(text):
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def combinations(grid):
+    """Every combination of the grid as a dict, first values first"""
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*(grid[name] for name in names))]
+
+
+def slide_parts(slide):
+    """{rId path: (relationship type, part)} for the slide and the non-shared parts it reaches"""
+    result = {(): (None, slide.part)}
+    pending = [((), slide.part)]
+    while pending:
+        path, part = pending.pop()
+        for rid, rel in part.rels.items():
+            if rel.is_external or part_category(rel.target_part.partname.membername) in SHARED_CATEGORIES:
+                continue
+            if rel.reltype.endswith("/slide"):
+                continue
+            result[path + (rid,)] = (rel.reltype, rel.target_part)
+            pending.append((path + (rid,), rel.target_part))
+    return result
+
+
+def part_blob(part):
+    """Serialized part as the package writer stores it"""
+    blob = part.blob
+    return normalize_xlsx(blob) if part.partname.ext == "xlsx" else blob
+
+
+def slide_digest(slide):
+    digest = hashlib.sha256()
+    for path, (reltype, part) in sorted(slide_parts(slide).items()):
+        digest.update(repr((path, reltype)).encode("utf-8"))
+        digest.update(part_blob(part))
+    return digest.hexdigest()
+
+
+class SectionRecorder:
+    """Records the slide indexes each section fills and its first slide number"""
+
+    def __init__(self, presentation, sections):
+        self.spans = {}     # method -> (first index, end index, slide_count at start)
+        for method in sections:
+            setattr(presentation, method, self._wrap(presentation, method, getattr(presentation, method)))
+
+    def _wrap(self, presentation, method, bound):
+        def wrapper(*args, **kwargs):
+            first, count = len(presentation.prs.slides), presentation.slide_count
+            try:
+                return bound(*args, **kwargs)
+            finally:
+                self.spans[method] = (first, len(presentation.prs.slides), count)
+        return wrapper
+
+
+def build_full(params):
+    """(MassiveSDVPresentation, section spans) for one parameter set"""
+    from create_massive_sdv_presentation import MassiveSDVPresentation
+    from sdv_shards import chapters
+
+    presentation = MassiveSDVPresentation(params=params)
+    recorder = SectionRecorder(presentation, [method for _, method, _, _ in chapters()])
+    with contextlib.redirect_stdout(io.StringIO()):
+        presentation.create_presentation()
+    return presentation, recorder.spans
+
+
+def build_sections(params, sections, spans):
+    """Render only `sections`; returns {baseline slide index: slide}
+
+    Returns None if a section comes out with another slide count than in the
+    baseline, since its slides would no longer line up with the baseline's.
+    """
+    from create_massive_sdv_presentation import MassiveSDVPresentation
+
+    rendered = {}
+    for method in sections:
+        presentation = MassiveSDVPresentation(params=params)
+        first_index, end_index, presentation.slide_count = spans[method]
+        getattr(presentation, method)()
+        if len(presentation.prs.slides) != end_index - first_index:
+            return None
+        for offset, slide in enumerate(presentation.prs.slides):
+            rendered[first_index + offset] = slide
+    return rendered
+
+
+class Sweep:
+    def __init__(self, grid, output_dir=".", writer=None):
+        self.grid = grid
+        self.output_dir = output_dir
+        self.writer = writer or PackageWriter()
+        self.variants = combinations(grid)
+        self.base = self.variants[0]
+        self.dependencies = {}      # parameter -> [slide numbers]
+        self.sections = {}          # section method -> [slide indexes]
+
+    def analyze(self):
+        """Build the baseline and find the slides each swept parameter changes"""
+        self.baseline, self.spans = build_full(self.base)
+        slides = list(self.baseline.prs.slides)
+        self.digests = [slide_digest(slide) for slide in slides]
+        section_of = {index: method for method, (first, end, _) in self.spans.items() for index in range(first, end)}
+
+        for name, values in self.grid.items():
+            alternative = next((value for value in values if value != self.base[name]), None)
+            if alternative is None:
+                continue
+            probe, _ = build_full(dict(self.base, **{name: alternative}))
+            changed = [index for index, slide in enumerate(probe.prs.slides)
+                       if index >= len(self.digests) or slide_digest(slide) != self.digests[index]]
+            if len(probe.prs.slides) != len(slides):
+                raise ValueError(f"{name} changes the slide count; sweep it with separate full builds")
+            if any(index not in section_of for index in changed):
+                raise ValueError(f"{name} changes slides outside the create_section_* methods")
+            self.dependencies[name] = [index + 1 for index in changed]
+            for index in changed:
+                self.sections.setdefault(section_of[index], []).append(index)
+
+        start = time.perf_counter()
+        self.items = list(iter_package_items(self.baseline.prs))
+        self.members = self.writer.compress(self.items)
+        self.positions = {member.name: position for position, member in enumerate(self.members)}
+        self.compress_seconds = time.perf_counter() - start
+        return self.dependencies
+
+    def replacements(self, params):
+        """[(member name, blob)] turning the baseline into `params`, or None if it has to be built in full"""
+        rendered = build_sections(params, sorted(self.sections), self.spans)
+        if rendered is None:
+            return None
+        baseline_slides = self.baseline.prs.slides
+        result = []
+        for index, slide in sorted(rendered.items()):
+            if slide_digest(slide) == self.digests[index]:
+                continue
+            old, new = slide_parts(baseline_slides[index]), slide_parts(slide)
+            if {path: reltype for path, (reltype, _) in old.items()} != \
+                    {path: reltype for path, (reltype, _) in new.items()}:
+                return None
+            for path, (_, part) in new.items():
+                result.append((old[path][1].partname.membername, part_blob(part)))
+        return result
+
+    def write_variant(self, number, params):
+        path = os.path.join(self.output_dir, f"{PREFIX}_{number:02d}.pptx")
+        replacements = self.replacements(params) if params != self.base else []
+        if replacements is None:
+            from sdv_package import save_presentation
+            presentation, _ = build_full(params)
+            save_presentation(presentation.prs, path, self.writer.compression)
+            return path, "full build"
+        members = list(self.members)
+        for name, blob in replacements:
+            members[self.positions[name]] = compress_member(name, blob, self.writer.level)
+        with open(path, "wb") as stream:
+            write_zip(stream, members, zip_timestamp())
+        return path, f"{len(replacements)} part(s) replaced"
+
+    def run(self):
+        start = time.perf_counter()
+        self.analyze()
+        print(f"🔍 Baseline and {len(self.dependencies)} probe build(s) in {time.perf_counter() - start:.2f}s")
+        for name, slides in self.dependencies.items():
+            print(f"   {name}: slide(s) {', '.join(map(str, slides)) or '-'}")
+        print(f"   Re-rendered per variant: {', '.join(sorted(self.sections)) or 'nothing'}")
+
+        manifest = []
+        start = time.perf_counter()
+        for number, params in enumerate(self.variants, 1):
+            path, how = self.write_variant(number, params)
+            manifest.append({"file": os.path.basename(path), "params": dict(params), "build": how})
+        elapsed = time.perf_counter() - start
+        with open(os.path.join(self.output_dir, MANIFEST_NAME), "w", encoding="utf-8") as f:
+            json.dump({"grid": self.grid, "dependencies": self.dependencies, "variants": manifest},
+                      f, ensure_ascii=False, indent=1)
+        print(f"✓ {len(manifest)} variant(s) in {elapsed:.2f}s ({elapsed * 1000 / len(manifest):.0f} ms each)")
+        return manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build variants of the Complete Analysis deck over a parameter grid")
+    parser.add_argument("-p", "--param", action="append", metavar="NAME=V1,V2",
+                        help="values of one STRATEGY_PARAMS entry")
+    parser.add_argument("--grid", help="JSON file {parameter: [values]}")
+    parser.add_argument("-o", "--output-dir", default="sweep")
+    args = parser.parse_args(argv)
+
+    grid = parse_grid(args.param, args.grid)
+    if not grid:
+        parser.error("give at least one -p NAME=V1,V2 or --grid")
+    os.makedirs(args.output_dir, exist_ok=True)
+    Sweep(grid, args.output_dir).run()
+    print(f"📁 {os.path.join(args.output_dir, MANIFEST_NAME)} lists the parameters of every file")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Template master cache for the deck generators.
+
+`Presentation()` unzips and parses python-pptx's bundled template on every
+call, and the generators then reapply their slide size. The cache below
+loads each configured master and layout package once per process, applies
+its slide size once, and hands out clones: XML parts are deep-copied (they
+are edited by the generators) while binary parts such as the theme and
+thumbnail share the cached bytes.
+
+Templates:
+    default    python-pptx default, 4:3
+    corporate  corporate 16:9 master (13.333" x 7.5")
+    wide       16" x 9"
+    compact    10" x 5.625"
+
+SDV_CORPORATE_TEMPLATE may point at a .pptx whose masters and layouts replace
+the built-in ones for the corporate template.
+"""
+
+import copy
+import os
+
+from pptx import Presentation
+from pptx.util import Inches
+
+
+class TemplateSpec:
+    """Where a template comes from and the slide size applied to it"""
+
+    def __init__(self, path=None, width=None, height=None, env=None):
+        self.path = path
+        self.width = width
+        self.height = height
+        self.env = env
+
+    def source(self):
+        """Path of the template package, or None for the python-pptx default"""
+        if self.env and os.environ.get(self.env):
+            return os.environ[self.env]
+        return self.path
+
+
+TEMPLATES = {
+    "default": TemplateSpec(),
+    "corporate": TemplateSpec(width=Inches(13.333), height=Inches(7.5), env="SDV_CORPORATE_TEMPLATE"),
+    "wide": TemplateSpec(width=Inches(16), height=Inches(9)),
+    "compact": TemplateSpec(width=Inches(10), height=Inches(5.625)),
+}
+
+
+class TemplateCache:
+    """Parsed template packages, loaded once and cloned per deck"""
+
+    def __init__(self, templates=None):
+        self.templates = dict(TEMPLATES if templates is None else templates)
+        self._packages = {}
+
+    def register(self, name, path=None, width=None, height=None):
+        """Add or replace a template; a cached copy of the old one is dropped"""
+        self.templates[name] = TemplateSpec(path, width, height)
+        self._packages.pop(name, None)
+
+    def _load(self, name):
+        key = (name, self.templates[name].source())
+        if key not in self._packages:
+            spec = self.templates[name]
+            prs = Presentation(key[1])
+            if spec.width is not None:
+                prs.slide_width = spec.width
+                prs.slide_height = spec.height
+            self._packages[key] = prs.part.package
+        return self._packages[key]
+
+    def warm(self, names=None):
+        """Load templates ahead of time, e.g. before forking build workers"""
+        for name in names or self.templates:
+            self._load(name)
+
+    def get(self, name="default"):
+        """Return a new Presentation cloned from the cached template `name`"""
+        if name not in self.templates:
+            raise KeyError(f"Unknown template: {name}")
+        package = copy.deepcopy(self._load(name))
+        return package.main_document_part.presentation
+
+    def clear(self):
+        self._packages.clear()
+
+
+TEMPLATE_CACHE = TemplateCache()
+
+
+def new_presentation(name="default"):
+    """Fresh Presentation from the process-wide template cache"""
+    return TEMPLATE_CACHE.get(name)
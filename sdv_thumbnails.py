@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Slide thumbnails and contact sheets without an office suite.
+
+Every slide is drawn to SVG by sdv_render and cached under .sdv_thumbs/
+by the hash of its slide XML, relationships, charts and layout and the
+deck's slide size and theme (see sdv_html_export.slide_hashes). A contact sheet is one SVG with all slides
+of a deck in a grid; regenerating it only renders slides whose hash is not
+in the cache, and python-pptx is not loaded at all when every slide is.
+
+Usage:
+    python sdv_thumbnails.py                                  # every generated deck
+    python sdv_thumbnails.py SDV_Ultimate_Comprehensive_200_Slides.pptx -c 8
+    python sdv_thumbnails.py --prune                          # drop thumbnails no deck uses
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+from sdv_html_export import deck_slug, generated_decks, slide_hashes
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(BASE_DIR, ".sdv_thumbs")
+
+_VIEWBOX_RE = re.compile(r'viewBox="0 0 ([\d.]+) ([\d.]+)"')
+
+
+def _cache_path(cache_dir, digest):
+    return os.path.join(cache_dir, digest[:2], digest + ".svg")
+
+
+def thumbnails(path, cache_dir=CACHE_DIR):
+    """SVG of every slide of a deck, from the cache where possible
+
+    Returns (svgs, rendered) where rendered is the number of cache misses.
+    """
+    hashes = slide_hashes(path)
+    svgs = [None] * len(hashes)
+    missing = []
+    for index, digest in enumerate(hashes):
+        try:
+            with open(_cache_path(cache_dir, digest), encoding="utf-8") as f:
+                svgs[index] = f.read()
+        except OSError:
+            missing.append(index)
+    if missing:
+        from pptx import Presentation
+        from sdv_render import SlideRenderer
+
+        prs = Presentation(path)
+        renderer = SlideRenderer(prs)
+        slides = prs.slides
+        for index in missing:
+            svgs[index] = renderer.render(slides[index])
+            target = _cache_path(cache_dir, hashes[index])
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            # Write then rename so parallel builds never read a partial file
+            tmp = f"{target}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(svgs[index])
+            os.replace(tmp, target)
+    return svgs, len(missing)
+
+
+def contact_sheet(svgs, columns=6, thumb_width=240, title=""):
+    """One SVG with the slide SVGs nested in a grid, numbered"""
+    match = _VIEWBOX_RE.search(svgs[0]) if svgs else None
+    slide_w, slide_h = (float(match.group(1)), float(match.group(2))) if match else (720.0, 540.0)
+    thumb_height = thumb_width * slide_h / slide_w
+    gap, label, header = 12, 14, 30 if title else 0
+    columns = max(1, min(columns, len(svgs) or 1))
+    rows = (len(svgs) + columns - 1) // columns
+    width = gap + columns * (thumb_width + gap)
+    height = header + gap + rows * (thumb_height + label + gap)
+
+    out = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{width:g}" height="{height:g}" '
+           f'viewBox="0 0 {width:g} {height:g}">',
+           '<rect width="100%" height="100%" fill="#F2F3F5"/>']
+    if title:
+        from xml.sax.saxutils import escape
+
+        out.append(f'<text x="{gap}" y="22" font-size="16" font-weight="bold" font-family="sans-serif">'
+                   f'{escape(title)} ({len(svgs)} slides)</text>')
+    for index, svg in enumerate(svgs):
+        row, column = divmod(index, columns)
+        x = gap + column * (thumb_width + gap)
+        y = header + gap + row * (thumb_height + label + gap)
+        out.append(f'<rect x="{x - 0.5:g}" y="{y - 0.5:g}" width="{thumb_width + 1:g}" '
+                   f'height="{thumb_height + 1:g}" fill="none" stroke="#BBBBBB"/>')
+        # A nested <svg> with its own viewBox scales the whole slide into the cell
+        out.append(svg.replace("<svg ", f'<svg x="{x:g}" y="{y:g}" width="{thumb_width:g}" '
+                                        f'height="{thumb_height:.1f}" ', 1))
+        out.append(f'<text x="{x:g}" y="{y + thumb_height + label - 3:.1f}" font-size="10" '
+                   f'font-family="sans-serif" fill="#555555">{index + 1}</text>')
+    out.append("</svg>")
+    return "\n".join(out)
+
+
+def prune(decks, cache_dir=CACHE_DIR):
+    """Remove cached thumbnails no deck in `decks` uses; returns the count removed"""
+    keep = set()
+    for path in decks:
+        keep.update(slide_hashes(path))
+    removed = 0
+    if not os.path.isdir(cache_dir):
+        return 0
+    for bucket in os.listdir(cache_dir):
+        bucket_dir = os.path.join(cache_dir, bucket)
+        for name in os.listdir(bucket_dir):
+            if name[:-len(".svg")] not in keep:
+                os.remove(os.path.join(bucket_dir, name))
+                removed += 1
+    return removed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cached SVG thumbnails and contact sheets")
+    parser.add_argument("decks", nargs="*", help=".pptx files (default: every generated deck)")
+    parser.add_argument("-o", "--output-dir", default=".", help="where contact sheets are written")
+    parser.add_argument("-c", "--columns", type=int, default=6)
+    parser.add_argument("-w", "--thumb-width", type=int, default=240)
+    parser.add_argument("--cache-dir", default=CACHE_DIR)
+    parser.add_argument("--prune", action="store_true", help="remove thumbnails the decks no longer use")
+    args = parser.parse_args(argv)
+
+    decks = args.decks or [path for path in generated_decks() if os.path.exists(path)]
+    if args.prune:
+        print(f"🧹 Removed {prune(decks, args.cache_dir)} unused thumbnails")
+        return 0
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    for path in decks:
+        start = time.perf_counter()
+        svgs, rendered = thumbnails(path, args.cache_dir)
+        target = os.path.join(args.output_dir, f"{deck_slug(path)}_contact_sheet.svg")
+        with open(target, "w", encoding="utf-8") as f:
+            f.write(contact_sheet(svgs, args.columns, args.thumb_width, os.path.basename(path)))
+        print(f"✓ {target}: {len(svgs)} slides, {rendered} rendered, {len(svgs) - rendered} cached "
+              f"({time.perf_counter() - start:.2f}s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
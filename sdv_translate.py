@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Offline Chinese -> Korean translation of the SDV specifications.
+
+No network and no language model: the text is split into segments (lines
+and sentences), and every segment is translated with the SDV glossary in
+i18n/glossary/. Terms are found with an Aho-Corasick automaton and the
+longest match wins, so "高压电池信息查询服务" is one term rather than five.
+Verbs such as 设置/上报 move to the end of their clause to follow Korean word
+order; characters the glossary does not know stay in Chinese.
+
+Translated segments are kept in a translation memory keyed by the hash of
+the normalized segment (.sdv_build/translation_memory.json). A new beta of a
+specification only translates the segments that changed, and the memory is
+reset when the glossary changes.
+
+Usage:
+    python sdv_translate.py                    # translate the Chinese PDFs to *.ko.txt
+    python sdv_translate.py spec.pdf -o out/   # one document
+    python sdv_translate.py --missing 30       # most frequent untranslated phrases
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from collections import deque
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+GLOSSARY_DIR = os.path.join(BASE_DIR, "i18n", "glossary")
+MEMORY_FILE = os.path.join(BASE_DIR, ".sdv_build", "translation_memory.json")
+MEMORY_VERSION = 1
+
+_HAN = "一-鿿"
+_HAN_RE = re.compile(f"[{_HAN}]")
+# PDF extraction puts spaces between CJK characters
+_CJK_GAP_RE = re.compile(f"(?<=[{_HAN}，。：；、（）])[ \\t]+(?=[{_HAN}，。：；、（）])")
+_LEADER_RE = re.compile(r"\s*(?:\.{2,}\s*)+")
+_SPACE_RE = re.compile(r"\s+")
+_SEGMENT_END_RE = re.compile(r"(?<=[。；])")
+PUNCTUATION = {"，": ", ", "。": ". ", "：": ": ", "；": "; ", "、": ", ", "（": " (", "）": ") ", "(": " ("}
+# A clause ends here; deferred verbs are placed before it
+_CLAUSE_BREAKS = set("，。：；、（）,;:()")
+_TOKEN_RE = re.compile(r"[，。：；、（）,;:()]|\s+|[^\s，。：；、（）,;:()]+")
+
+
+def close_cjk_gaps(text):
+    """Drop the spaces PDF extraction puts between Chinese characters"""
+    return _CJK_GAP_RE.sub("", text)
+
+
+def normalize_segment(text):
+    """Segment text as used for hashing: PDF spacing, TOC leaders and whitespace removed"""
+    text = close_cjk_gaps(text)
+    text = _LEADER_RE.sub(" ", text)
+    return _SPACE_RE.sub(" ", text).strip()
+
+
+def split_segments(text):
+    """Normalized segments (lines, and sentences within lines) of a document"""
+    segments = []
+    for line in text.splitlines():
+        for part in _SEGMENT_END_RE.split(line):
+            part = normalize_segment(part)
+            if part:
+                segments.append(part)
+    return segments
+
+
+def segment_hash(segment):
+    return hashlib.sha1(segment.encode("utf-8")).hexdigest()[:16]
+
+
+class AhoCorasick:
+    """Multi-pattern matcher returning leftmost-longest non-overlapping matches"""
+
+    def __init__(self, keys):
+        self.goto = [{}]
+        self.fail = [0]
+        self.length = [0]    # length of the key ending at this state, 0 if none
+        self.suffix = [0]    # nearest state on the fail chain that ends a key
+        for key in keys:
+            state = 0
+            for char in key:
+                if char not in self.goto[state]:
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.length.append(0)
+                    self.suffix.append(0)
+                    self.goto[state][char] = len(self.goto) - 1
+                state = self.goto[state][char]
+            self.length[state] = len(key)
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self.goto[state].items():
+                queue.append(child)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(char, 0)
+                self.fail[child] = target if target != child else 0
+                self.suffix[child] = target if self.length[target] else self.suffix[target]
+
+    def longest_at(self, text):
+        """{start: length of the longest key starting there}"""
+        best = {}
+        state = 0
+        for end, char in enumerate(text, 1):
+            while state and char not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(char, 0)
+            match = state if self.length[state] else self.suffix[state]
+            while match:
+                length = self.length[match]
+                start = end - length
+                if length > best.get(start, 0):
+                    best[start] = length
+                match = self.suffix[match]
+        return best
+
+    def find(self, text):
+        """[(start, end)] of the leftmost-longest matches, left to right"""
+        best = self.longest_at(text)
+        matches = []
+        index = 0
+        while index < len(text):
+            length = best.get(index)
+            if length:
+                matches.append((index, index + length))
+                index += length
+            else:
+                index += 1
+        return matches
+
+
+class Glossary:
+    """Chinese -> Korean terms, verbs (moved to the clause end) and particles (attached)"""
+
+    def __init__(self, terms=None, verbs=None, particles=None):
+        self.entries = {}
+        for kind, table in (("term", terms), ("verb", verbs), ("particle", particles)):
+            for source, target in (table or {}).items():
+                self.entries[source] = (kind, target)
+        self.digest = hashlib.sha1(json.dumps(sorted(self.entries.items()), ensure_ascii=False)
+                                   .encode("utf-8")).hexdigest()[:16]
+        self.matcher = AhoCorasick(self.entries)
+
+    @classmethod
+    def load(cls, paths=None):
+        """Merge the glossaries in `paths` (default: i18n/glossary/*.json)"""
+        tables = {"terms": {}, "verbs": {}, "particles": {}}
+        for path in paths or sorted(glob.glob(os.path.join(GLOSSARY_DIR, "*.json"))):
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            for name, table in tables.items():
+                table.update(data.get(name, {}))
+        return cls(tables["terms"], tables["verbs"], tables["particles"])
+
+    def translate(self, segment):
+        """(Korean text, Han characters covered, Han characters total) for one segment"""
+        words = []      # (text, attach to the previous word)
+        verbs = []
+        covered = 0
+        position = 0
+
+        def flush_verbs():
+            words.extend((verb, False) for verb in verbs)
+            verbs.clear()
+
+        def plain(text):
+            for token in _TOKEN_RE.findall(text):
+                if token in _CLAUSE_BREAKS:
+                    flush_verbs()
+                    words.append((PUNCTUATION.get(token, token), True))
+                elif not token.isspace():
+                    words.append((token, False))
+
+        for start, end in self.matcher.find(segment):
+            plain(segment[position:start])
+            kind, target = self.entries[segment[start:end]]
+            covered += end - start
+            if kind == "verb":
+                verbs.append(target)
+            elif kind == "particle":
+                if target:
+                    words.append((target, True))
+            else:
+                words.append((target, False))
+            position = end
+        plain(segment[position:])
+        flush_verbs()
+
+        out = []
+        for text, attach in words:
+            if out and not attach and not out[-1].endswith((" ", "(", "\"")):
+                out.append(" ")
+            out.append(text)
+        text = _SPACE_RE.sub(" ", "".join(out)).strip()
+        return text, covered, len(_HAN_RE.findall(segment))
+
+
+class TranslationMemory:
+    """Translated segments by normalized-segment hash, persisted as JSON"""
+
+    def __init__(self, path=MEMORY_FILE, glossary_digest=""):
+        self.path = path
+        self.glossary_digest = glossary_digest
+        self.segments = {}
+        self.dirty = False
+        if path and os.path.exists(path):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                data = {}
+            # Entries made with another glossary would keep its old terms
+            if data.get("version") == MEMORY_VERSION and data.get("glossary") == glossary_digest:
+                self.segments = data.get("segments", {})
+
+    def get(self, key):
+        return self.segments.get(key)
+
+    def put(self, key, entry):
+        self.segments[key] = entry
+        self.dirty = True
+
+    def save(self):
+        if not self.path or not self.dirty:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": MEMORY_VERSION, "glossary": self.glossary_digest,
+                       "segments": self.segments}, f, ensure_ascii=False)
+        os.replace(tmp, self.path)
+        self.dirty = False
+
+
+class Translation:
+    """Result of translating one document"""
+
+    def __init__(self, segments, covered, total, reused, translated):
+        self.segments = segments        # [(source, korean)]
+        self.covered = covered
+        self.total = total
+        self.reused = reused            # segments found in the memory or earlier in the document
+        self.translated = translated    # segments translated now
+
+    @property
+    def text(self):
+        return "\n".join(korean for _, korean in self.segments)
+
+    @property
+    def coverage(self):
+        """Share of Han characters the glossary translated"""
+        return self.covered / self.total if self.total else 1.0
+
+    def preview(self, limit=500):
+        """The first translated lines, up to about `limit` characters"""
+        lines = []
+        size = 0
+        for _, korean in self.segments:
+            if size + len(korean) > limit and lines:
+                break
+            lines.append(korean)
+            size += len(korean) + 1
+        return "\n".join(lines)[:limit]
+
+
+class Translator:
+    def __init__(self, glossary=None, memory_path=MEMORY_FILE):
+        self.glossary = glossary or Glossary.load()
+        self.memory = TranslationMemory(memory_path, self.glossary.digest)
+
+    def translate(self, text):
+        """Translate a document; segments already in the memory are reused"""
+        results = []
+        covered = total = reused = translated = 0
+        for segment in split_segments(text):
+            key = segment_hash(segment)
+            entry = self.memory.get(key)
+            if entry is None:
+                entry = list(self.glossary.translate(segment))
+                self.memory.put(key, entry)
+                translated += 1
+            else:
+                reused += 1
+            korean, seg_covered, seg_total = entry
+            results.append((segment, korean))
+            covered += seg_covered
+            total += seg_total
+        self.memory.save()
+        return Translation(results, covered, total, reused, translated)
+
+    def untranslated(self, text):
+        """{Han run left in Chinese: count} for glossary maintenance"""
+        counts = {}
+        for segment in split_segments(text):
+            korean = self.glossary.translate(segment)[0]
+            for run in re.findall(f"[{_HAN}]+", korean):
+                counts[run] = counts.get(run, 0) + 1
+        return counts
+
+
+_translator = None
+
+
+def translate_document(text):
+    """Translate with the shared glossary and translation memory"""
+    global _translator
+    if _translator is None:
+        _translator = Translator()
+    return _translator.translate(text)
+
+
+def read_document(path):
+    if path.lower().endswith(".pdf"):
+        from create_presentation import extract_pdf_text
+
+        return extract_pdf_text(path)[0] or ""
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Glossary-based Chinese -> Korean translation")
+    parser.add_argument("documents", nargs="*", help=".pdf or .txt files (default: the Chinese specifications)")
+    parser.add_argument("-o", "--output-dir", default=".")
+    parser.add_argument("--no-memory", action="store_true", help="do not read or write the translation memory")
+    parser.add_argument("--missing", type=int, metavar="N", help="list the N most frequent untranslated phrases")
+    args = parser.parse_args(argv)
+
+    if args.documents:
+        documents = args.documents
+    else:
+        from create_presentation import CHINESE_PDFS, SOURCE_DIR
+
+        documents = [os.path.join(SOURCE_DIR, name) for name, _ in CHINESE_PDFS
+                     if os.path.exists(os.path.join(SOURCE_DIR, name))]
+    translator = Translator(memory_path=None if args.no_memory else MEMORY_FILE)
+    print(f"📖 Glossary: {len(translator.glossary.entries)} entries, "
+          f"memory: {len(translator.memory.segments)} segments")
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    for path in documents:
+        text = read_document(path)
+        start = time.perf_counter()
+        result = translator.translate(text)
+        elapsed = time.perf_counter() - start
+        name = os.path.splitext(os.path.basename(path))[0]
+        target = os.path.join(args.output_dir, f"{name}.ko.txt")
+        with open(target, "w", encoding="utf-8") as f:
+            f.write(result.text + "\n")
+        print(f"✓ {os.path.basename(target)}: {len(result.segments)} segments "
+              f"({result.translated} translated, {result.reused} reused), "
+              f"{result.coverage:.0%} of Han characters covered, {elapsed:.2f}s")
+        if args.missing:
+            counts = translator.untranslated(text)
+            for run, count in sorted(counts.items(), key=lambda item: -item[1])[:args.missing]:
+                print(f"  {count:>5}x {run}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
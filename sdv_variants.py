@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Korean, English and Chinese variants of a deck from one build.
+
+The deck is generated once: layout, shapes, tables, charts and media are
+computed a single time. Every text paragraph of every slide is looked up in
+the sdv_i18n catalogs once, and for each locale only the run text is swapped
+before saving. Parts that do not change between locales (layouts, masters,
+charts with their workbooks, media, relationships) are compressed for the
+first locale and copied into the others, so each extra locale costs one
+serialization of the slide XML.
+
+Chart titles and series names live in the shared chart parts and stay as
+generated.
+
+Usage:
+    python sdv_variants.py                          # SDV_Ultimate_..._{ko,en,zh}.pptx
+    python sdv_variants.py deck.pptx --locales en zh  # variants of an existing deck
+    python sdv_variants.py --check                  # list paragraphs without translations
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from pptx.oxml.ns import qn
+
+from sdv_i18n import LOCALES, Catalog
+from sdv_package import PackageWriter, part_category
+
+ULTIMATE_NAME = "SDV_Ultimate_Comprehensive_200_Slides"
+
+
+def variant_path(path, locale):
+    root, ext = os.path.splitext(path)
+    return f"{root}_{locale}{ext}"
+
+
+class LocalizedDeck:
+    """A built presentation with the per-locale text of its paragraphs precomputed"""
+
+    def __init__(self, prs, catalog=None, locales=LOCALES):
+        self.prs = prs
+        self.catalog = catalog or Catalog.load()
+        self.locales = tuple(locales)
+        self.paragraphs = []     # (first <a:t>, other <a:t>s, {locale: text})
+        self.untranslated = {}   # text -> number of paragraphs
+        for slide in prs.slides:
+            for paragraph in slide.part._element.iter(qn("a:p")):
+                self._add(paragraph)
+
+    def _add(self, paragraph):
+        # Line breaks inside a paragraph would be lost by joining the runs
+        if paragraph.find(qn("a:br")) is not None:
+            return
+        runs = [run.find(qn("a:t")) for run in paragraph.iterfind(qn("a:r"))]
+        runs = [t for t in runs if t is not None]
+        text = "".join(t.text or "" for t in runs)
+        if not text.strip():
+            return
+        texts = {}
+        for locale in self.locales:
+            translated = self.catalog.translate(text, locale)
+            if translated is None:
+                self.untranslated[text] = self.untranslated.get(text, 0) + 1
+                return
+            texts[locale] = translated
+        if any(value != text for value in texts.values()):
+            self.paragraphs.append((runs[0], runs[1:], texts))
+
+    def apply(self, locale):
+        """Switch every localized paragraph to `locale`"""
+        for first, others, texts in self.paragraphs:
+            first.text = texts[locale]
+            for t in others:
+                t.text = ""
+
+    def save(self, path, writer=None):
+        """Write one deck per locale next to `path`; returns [(locale, path, seconds)]"""
+        writer = writer or PackageWriter()
+        shared = None
+        results = []
+        for locale in self.locales:
+            start = time.perf_counter()
+            self.apply(locale)
+            target = variant_path(path, locale)
+            report = writer.write(self.prs, target, reuse=shared)
+            if shared is None:
+                # Only slide XML differs between locales
+                shared = {member.name: member for member in report.members
+                          if part_category(member.name) != "slide XML"}
+            results.append((locale, target, time.perf_counter() - start))
+        return results
+
+
+def build(output_dir="."):
+    """Build the ultimate deck once and write its ko/en/zh variants; returns the written paths"""
+    from create_ultimate_sdv_presentation import UltimateSDVPresentation
+
+    start = time.perf_counter()
+    prs = UltimateSDVPresentation().create_mega_presentation()
+    built = time.perf_counter() - start
+    deck = LocalizedDeck(prs)
+    results = deck.save(os.path.join(output_dir, ULTIMATE_NAME + ".pptx"))
+    print(f"\n🏗️  Built {len(prs.slides)} slides once in {built:.2f}s, "
+          f"{len(deck.paragraphs)} paragraphs localized")
+    for locale, path, seconds in results:
+        print(f"✅ {locale}: {os.path.basename(path)} in {seconds:.2f}s")
+    if deck.untranslated:
+        print(f"⚠️  {len(deck.untranslated)} texts without a translation (see --check)")
+    return [path for _, path, _ in results]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write locale variants of a deck from one build")
+    parser.add_argument("decks", nargs="*", help="existing .pptx files (default: build the ultimate deck)")
+    parser.add_argument("-l", "--locales", nargs="+", default=list(LOCALES), choices=LOCALES)
+    parser.add_argument("-o", "--output-dir", default=".")
+    parser.add_argument("--check", action="store_true", help="list texts the catalogs do not cover")
+    args = parser.parse_args(argv)
+
+    if not args.decks:
+        if args.check:
+            from create_ultimate_sdv_presentation import UltimateSDVPresentation
+            decks = [("ultimate", LocalizedDeck(UltimateSDVPresentation().create_mega_presentation(),
+                                               locales=args.locales))]
+        else:
+            build(args.output_dir)
+            return 0
+    else:
+        from pptx import Presentation
+        decks = [(path, LocalizedDeck(Presentation(path), locales=args.locales)) for path in args.decks]
+
+    for path, deck in decks:
+        if args.check:
+            print(f"📋 {os.path.basename(path)}: {len(deck.paragraphs)} localized, "
+                  f"{len(deck.untranslated)} untranslated")
+            for text, count in sorted(deck.untranslated.items(), key=lambda item: -item[1]):
+                print(f"  {count:>4}x {text[:100]}")
+            continue
+        target = os.path.join(args.output_dir, os.path.basename(path))
+        for locale, written, seconds in deck.save(target):
+            print(f"✅ {locale}: {written} in {seconds:.2f}s")
+    return 1 if args.check and any(deck.untranslated for _, deck in decks) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
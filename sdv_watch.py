@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Watch mode: rebuild the decks affected by each edit in a warm process.
+
+Polls the inputs sdv_build knows about (generator modules and the local
+modules they import, source PDFs, data files and templates). When files
+change, the edit is mapped to the decks that read them, changed local
+modules are reloaded in dependency order, and only those decks are rebuilt
+in this process. Templates, chart modules and parsed PDF text stay loaded
+between builds, so a rebuild costs about as much as generating the slides.
+
+For edited Python files the changed functions and methods are printed as
+well, so it is clear which slide sections an edit touches.
+
+Stamps are recorded like sdv_build does, so a later `python sdv_build.py`
+does not rebuild what the watcher already built.
+
+Usage:
+    python sdv_watch.py                   # watch every deck
+    python sdv_watch.py massive executive # watch some decks
+"""
+
+import argparse
+import ast
+import contextlib
+import importlib
+import io
+import os
+import sys
+import time
+import traceback
+
+import sdv_build
+
+POLL_SECONDS = 0.2
+# Editors save in several steps; wait this long for the files to settle
+SETTLE_SECONDS = 0.05
+# Re-expand source globs now and then to notice new PDFs and data files
+RESCAN_SECONDS = 5.0
+
+
+def definitions(source):
+    """{qualified name: AST dump} for top-level functions, classes and methods"""
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return None
+    result = {}
+    module_level = []
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            result[node.name] = ast.dump(node)
+        elif isinstance(node, ast.ClassDef):
+            others = []
+            for child in node.body:
+                if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    result[f"{node.name}.{child.name}"] = ast.dump(child)
+                else:
+                    others.append(ast.dump(child))
+            result[node.name] = repr(others) + repr([ast.dump(base) for base in node.bases])
+        else:
+            module_level.append(ast.dump(node))
+    result["<module>"] = repr(module_level)
+    return result
+
+
+def changed_definitions(old_source, new_source):
+    """Names of the functions/methods that differ between two versions of a module"""
+    old, new = definitions(old_source), definitions(new_source)
+    if old is None or new is None:
+        return ["<syntax error>"] if new is None else ["<module>"]
+    return sorted(name for name in old.keys() | new.keys() if old.get(name) != new.get(name))
+
+
+class Watcher:
+    def __init__(self, decks, output_dir=sdv_build.BASE_DIR, verbose=False):
+        self.decks = decks
+        self.output_dir = output_dir
+        os.makedirs(output_dir, exist_ok=True)
+        self.verbose = verbose
+        self.store = sdv_build.StampStore(os.path.join(output_dir, ".sdv_build", "stamps.json"))
+        self.files = {}      # path -> (mtime_ns, size)
+        self.owners = {}     # path -> decks that read it
+        self.sources = {}    # .py path -> text, for changed_definitions
+        self.scanned_at = 0.0
+
+    # Inputs ----------------------------------------------------------------
+
+    def scan_inputs(self):
+        """Refresh the watched file list and which decks read each file"""
+        sdv_build.module_deps.cache_clear()
+        owners = {}
+        try:
+            for deck in self.decks:
+                for paths in sdv_build.deck_inputs(deck).values():
+                    for path in paths:
+                        owners.setdefault(path, []).append(deck)
+        except SyntaxError:
+            # A module is mid-edit; keep the current file list until it parses again
+            self.scanned_at = time.monotonic()
+            return []
+        added = [path for path in owners if path not in self.files]
+        self.owners = owners
+        self.files = {path: self.files.get(path) or _stat(path) for path in owners}
+        for path in added:
+            if path.endswith(".py"):
+                self.sources[path] = _read(path)
+        self.scanned_at = time.monotonic()
+        return added
+
+    def poll(self):
+        """Paths whose size or mtime changed since the last poll"""
+        changed = []
+        for path, signature in self.files.items():
+            current = _stat(path)
+            if current != signature:
+                self.files[path] = current
+                changed.append(path)
+        if time.monotonic() - self.scanned_at > RESCAN_SECONDS:
+            changed.extend(self.scan_inputs())
+        return changed
+
+    # Rebuilds --------------------------------------------------------------
+
+    def reload_modules(self, changed):
+        """Reload changed local modules and every loaded module importing them, dependencies first"""
+        changed_names = {os.path.splitext(os.path.basename(path))[0] for path in changed if path.endswith(".py")}
+        if not changed_names:
+            return
+        # Repository modules by their own name (not __main__ or multiprocessing's __mp_main__ aliases)
+        local = {name for name, module in sys.modules.items()
+                 if getattr(module, "__file__", None)
+                 and os.path.abspath(module.__file__) == os.path.join(sdv_build.BASE_DIR, name + ".py")
+                 and name != __name__}
+        imports = {name: set(sdv_build.local_imports(name)) & local for name in local}
+        # Everything that (transitively) imports a changed module is stale too
+        stale = set(changed_names) & local
+        grew = True
+        while grew:
+            grew = False
+            for name, deps in imports.items():
+                if name not in stale and deps & stale:
+                    stale.add(name)
+                    grew = True
+        done = set()
+
+        def reload(name):
+            if name in done:
+                return
+            done.add(name)
+            for dep in imports[name] & stale:
+                reload(dep)
+            importlib.reload(sys.modules[name])
+
+        for name in sorted(stale):
+            if name != "sdv_build":
+                reload(name)
+        if "sdv_template" in stale:
+            sys.modules["sdv_template"].TEMPLATE_CACHE.warm()
+
+    def rebuild(self, decks):
+        """Build `decks` in this process; returns {deck name: seconds}"""
+        timings = {}
+        for deck in decks:
+            current = self.store.collect(deck, self.output_dir)
+            start = time.perf_counter()
+            log = io.StringIO()
+            try:
+                with contextlib.redirect_stdout(log):
+                    paths = sdv_build.build_module(deck.module, self.output_dir)
+            except Exception:
+                print(log.getvalue(), end="")
+                traceback.print_exc()
+                print(f"✗ {deck.name} failed; fix the error and save again")
+                continue
+            elapsed = time.perf_counter() - start
+            if self.verbose:
+                print(log.getvalue(), end="")
+            current["outputs"] = self.store.collect(deck, self.output_dir)["outputs"]
+            self.store.record(deck, current)
+            timings[deck.name] = elapsed
+            print(f"✓ {deck.name}: {', '.join(os.path.basename(path) for path in paths)} in {elapsed:.2f}s")
+        self.store.save()
+        return timings
+
+    def handle(self, changed, detected_at):
+        decks = []
+        for path in changed:
+            name = os.path.relpath(path, sdv_build.BASE_DIR)
+            detail = ""
+            if path.endswith(".py") and os.path.exists(path):
+                source = _read(path)
+                names = changed_definitions(self.sources.get(path, ""), source)
+                self.sources[path] = source
+                if names:
+                    detail = f" ({', '.join(names[:6])}{', ...' if len(names) > 6 else ''})"
+            print(f"📝 {name}{detail}")
+            for deck in self.owners.get(path, []):
+                if deck not in decks:
+                    decks.append(deck)
+        if not decks:
+            return
+        try:
+            self.reload_modules(changed)
+        except SyntaxError as exc:
+            print(f"✗ {os.path.basename(exc.filename or '?')}:{exc.lineno}: {exc.msg}; waiting for the next save")
+            return
+        except Exception:
+            traceback.print_exc()
+            print("✗ reload failed; fix the error and save again")
+            return
+        self.scan_inputs()
+        self.rebuild(decks)
+        print(f"⏱️  edit -> decks in {time.perf_counter() - detected_at:.2f}s "
+              f"({', '.join(deck.name for deck in decks)})")
+
+    def warm(self):
+        """Import the generators and load templates and chart modules once"""
+        start = time.perf_counter()
+        # PDF text is cached in this process; threads keep it here
+        os.environ.setdefault("SDV_PIPELINE_EXECUTOR", "thread")
+        for deck in self.decks:
+            importlib.import_module(deck.module)
+        importlib.import_module("pptx.chart.data")
+        importlib.import_module("sdv_template").TEMPLATE_CACHE.warm()
+        self.scan_inputs()
+        print(f"🔥 Warm in {time.perf_counter() - start:.2f}s, watching {len(self.files)} files "
+              f"for {len(self.decks)} decks")
+
+    def run(self, initial=True):
+        self.warm()
+        if initial:
+            stale = [deck for deck in self.decks
+                     if self.store.is_stale(deck, self.store.collect(deck, self.output_dir))]
+            self.store.save()
+            if stale:
+                self.rebuild(stale)
+        print("👀 Waiting for changes (Ctrl+C to stop)")
+        while True:
+            changed = self.poll()
+            if changed:
+                detected_at = time.perf_counter()
+                time.sleep(SETTLE_SECONDS)
+                changed.extend(path for path in self.poll() if path not in changed)
+                self.handle(changed, detected_at)
+            time.sleep(POLL_SECONDS)
+
+
+def _stat(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _read(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        return ""
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rebuild affected decks whenever their inputs change")
+    parser.add_argument("targets", nargs="*", help="deck names (default: all)")
+    parser.add_argument("-o", "--output-dir", default=sdv_build.BASE_DIR)
+    parser.add_argument("--no-initial", action="store_true", help="do not build stale decks on start")
+    parser.add_argument("-v", "--verbose", action="store_true", help="show generator output")
+    args = parser.parse_args(argv)
+
+    decks = [sdv_build.get_deck(name) for name in args.targets] or list(sdv_build.DECKS)
+    watcher = Watcher(decks, os.path.abspath(args.output_dir), args.verbose)
+    try:
+        watcher.run(initial=not args.no_initial)
+    except KeyboardInterrupt:
+        print("\n👋 Stopped")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""Regression checks for the incremental corpus ingest (sdv_corpus)"""
+
+import os
+import shutil
+import sys
+
+from pptx import Presentation
+from pptx.util import Inches
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sdv_corpus import Corpus  # noqa: E402
+
+
+def _deck(path, texts):
+    prs = Presentation()
+    for text in texts:
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        slide.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(1)).text_frame.text = text
+    prs.save(path)
+
+
+def _units(corpus, path):
+    return corpus.db.execute("SELECT units FROM documents WHERE path = ?", (os.path.abspath(path),)).fetchone()[0]
+
+
+def test_copy_of_a_source_rewritten_in_the_same_batch(tmp_path):
+    a, b = str(tmp_path / "a.pptx"), str(tmp_path / "b.pptx")
+    corpus = Corpus(str(tmp_path / "corpus.sqlite"))
+    _deck(a, [f"original {number}" for number in range(12)])
+    corpus.ingest([a])
+    shutil.copyfile(a, b)
+    _deck(a, [f"replacement {number}" for number in range(9)])
+    report = corpus.ingest([a, b])
+
+    assert (_units(corpus, a), _units(corpus, b)) == (9, 12)
+    assert report.counts == {"updated": 1, "added": 1}
+    assert {hit.path for hit in corpus.search("original", limit=50)} == {os.path.abspath(b)}
+    corpus.close()
+
+
+def test_copy_of_an_unchanged_document(tmp_path):
+    a, b = str(tmp_path / "a.pptx"), str(tmp_path / "b.pptx")
+    corpus = Corpus(str(tmp_path / "corpus.sqlite"))
+    _deck(a, ["AAA", "BBB"])
+    corpus.ingest([a])
+    shutil.copyfile(a, b)
+    report = corpus.ingest([a, b])
+
+    assert report.counts == {"unchanged": 1, "copied": 1}
+    assert _units(corpus, b) == 2
+    corpus.close()
+
+
+def test_older_extract_version_is_parsed_again(tmp_path):
+    a, db = str(tmp_path / "a.pptx"), str(tmp_path / "corpus.sqlite")
+    corpus = Corpus(db)
+    _deck(a, ["AAA", "BBB"])
+    corpus.ingest([a])
+    corpus.db.execute("PRAGMA user_version = 0")
+    corpus.close()
+
+    corpus = Corpus(db)
+    assert corpus.ingest([a]).counts == {"updated": 1}
+    assert corpus.ingest([a]).counts == {"unchanged": 1}
+    corpus.close()
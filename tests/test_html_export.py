@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""Regression checks for the incremental HTML export (sdv_html_export)"""
+
+import os
+import sys
+import zipfile
+
+from pptx import Presentation
+from pptx.util import Inches
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sdv_html_export import export_deck, slide_hashes  # noqa: E402
+
+
+def _deck(path, texts):
+    prs = Presentation()
+    for text in texts:
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        slide.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(1)).text_frame.text = text
+    prs.save(path)
+
+
+def _svgs(output_dir, count):
+    slides_dir = os.path.join(output_dir, "deck", "slides")
+    result = []
+    for number in range(1, count + 1):
+        with open(os.path.join(slides_dir, f"{number:03d}.svg"), encoding="utf-8") as f:
+            result.append(f.read())
+    return result
+
+
+def test_inserted_slide_keeps_the_following_slides(tmp_path):
+    deck, output = str(tmp_path / "deck.pptx"), str(tmp_path / "html")
+    _deck(deck, ["AAA", "BBB"])
+    export_deck(deck, output)
+    _deck(deck, ["XXX", "AAA", "BBB"])
+    rendered, reused = export_deck(deck, output)
+
+    assert (rendered, reused) == (1, 2)
+    texts = ["XXX", "AAA", "BBB"]
+    for text, svg in zip(texts, _svgs(output, 3)):
+        assert [word for word in texts if word in svg] == [text]
+
+
+def test_stray_svg_files_are_left_alone(tmp_path):
+    deck, output = str(tmp_path / "deck.pptx"), str(tmp_path / "html")
+    _deck(deck, ["AAA", "BBB"])
+    export_deck(deck, output)
+    stray = os.path.join(output, "deck", "slides", "foo.svg")
+    open(stray, "w").close()
+    _deck(deck, ["AAA"])
+    export_deck(deck, output)
+
+    assert os.path.exists(stray)
+    assert not os.path.exists(os.path.join(output, "deck", "slides", "002.svg"))
+
+
+def test_slide_size_and_theme_change_the_hashes(tmp_path):
+    deck = str(tmp_path / "deck.pptx")
+    _deck(deck, ["AAA", "BBB"])
+    before = slide_hashes(deck)
+
+    prs = Presentation(deck)
+    prs.slide_width = Inches(13.333)
+    prs.save(deck)
+    resized = slide_hashes(deck)
+    assert all(old != new for old, new in zip(before, resized))
+
+    with zipfile.ZipFile(deck) as zipf:
+        members = {name: zipf.read(name) for name in zipf.namelist()}
+    members["ppt/theme/theme1.xml"] = members["ppt/theme/theme1.xml"].replace(b"Calibri", b"Arial")
+    with zipfile.ZipFile(deck, "w", zipfile.ZIP_DEFLATED) as zipf:
+        for name, data in members.items():
+            zipf.writestr(name, data)
+    assert all(old != new for old, new in zip(resized, slide_hashes(deck)))
@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+"""Cold-start import budget of the generators (sdv_importtime)"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sdv_importtime import DEFAULT_BUDGET_MS, MODULES, check_module  # noqa: E402
+
+
+@pytest.mark.parametrize("module", MODULES)
+def test_generator_imports_within_budget(module):
+    own, total, loaded = check_module(module)
+
+    assert loaded == ()
+    assert own <= DEFAULT_BUDGET_MS, f"{module}: {own:.1f} ms on top of the baseline ({total:.1f} ms total)"